@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Compare binary and interpolation search of kmers in an unindexed Cortex graph
+
+A sorted graph of uniformly distributed random kmers is written to a temporary file and the same
+random kmers are looked up with each search strategy. Reads of the graph file are counted. Each
+lookup of a kmer that exists costs two reads in addition to the search probes: one to compare
+the found kmer and one to read its record.
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from cortexpy.graph.parser.random_access import RandomAccess
+from cortexpy.graph.parser.search import SearchStrategy
+from cortexpy.graph.serializer.kmer import ColorInformationBlock
+from cortexpy.graph.parser.header import Header
+
+
+class CountingFileIO(io.FileIO):
+    n_reads = 0
+
+    def read(self, *args):
+        self.n_reads += 1
+        return super().read(*args)
+
+
+def write_random_graph(path, n_kmers, kmer_size, seed):
+    rng = np.random.RandomState(seed)
+    header = Header(kmer_size=kmer_size, kmer_container_size=(kmer_size + 31) // 32, num_colors=1,
+                    mean_read_lengths=(0,), total_sequences=(0,), sample_names=(b'sample_0',),
+                    error_rates=(bytes(16),), color_info_blocks=[ColorInformationBlock()])
+    n_words = header.kmer_container_size
+    letters_in_first_word = kmer_size - 32 * (n_words - 1)
+    words = rng.randint(0, 2 ** 63, size=(n_kmers, n_words), dtype=np.uint64) * np.uint64(2) + \
+        rng.randint(0, 2, size=(n_kmers, n_words), dtype=np.uint64)
+    words[:, 0] >>= np.uint64(64 - 2 * letters_in_first_word)
+    words = np.unique(words, axis=0)
+    records = np.zeros((len(words), header.record_size), dtype=np.uint8)
+    records[:, :(8 * n_words)] = words.astype('<u8').view(np.uint8).reshape(len(words), -1)
+    records[:, 8 * n_words] = 1
+    with open(path, 'wb') as fh:
+        header.dump(fh)
+        fh.write(records.tobytes())
+    return words
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-kmers', type=int, default=10 ** 6)
+    parser.add_argument('--kmer-size', type=int, default=31)
+    parser.add_argument('--n-lookups', type=int, default=10 ** 4)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        graph_path = os.path.join(temp_dir, 'graph.ctx')
+        words = write_random_graph(graph_path, args.n_kmers, args.kmer_size, args.seed)
+        rng = np.random.RandomState(args.seed + 1)
+        with CountingFileIO(graph_path, 'r') as fh:
+            kmer_strings = list(RandomAccess(fh))
+        lookups = [kmer_strings[i] for i in rng.randint(0, len(words), size=args.n_lookups)]
+
+        print('{} kmers of size {}, {} lookups'.format(len(words), args.kmer_size,
+                                                       args.n_lookups))
+        for strategy in SearchStrategy:
+            with CountingFileIO(graph_path, 'r') as fh:
+                ra = RandomAccess(fh, kmer_cache_size=0, search_strategy=strategy)
+                fh.n_reads = 0
+                start = time.perf_counter()
+                for kmer_string in lookups:
+                    ra[kmer_string]
+                elapsed = time.perf_counter() - start
+            print('{:>13}: {:6.2f} probes/lookup {:8.1f} us/lookup'.format(
+                strategy.name, fh.n_reads / len(lookups) - 2, 10 ** 6 * elapsed / len(lookups)))
+
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,9 @@ def main(argv=sys.argv):
         'traverse': 'cortexpy.command.traverse.traverse',
         'subgraph': 'cortexpy.command.subgraph.subgraph',
         'prune': 'cortexpy.command.prune.prune',
+        'index': 'cortexpy.command.index.index',
+        'compress': 'cortexpy.command.compress.compress',
+        'merge': 'cortexpy.command.merge.merge',
     }
     parser = argparse.ArgumentParser(prog='cortexpy')
     parser.add_argument('--version', action='version',
@@ -0,0 +1,35 @@
+def compress(argv):
+    import argparse
+    from cortexpy.graph.parser.block_compressed import DEFAULT_RECORDS_PER_BLOCK
+    parser = argparse.ArgumentParser(
+        'cortexpy compress',
+        description="""
+        Write a sorted cortex graph as a block-compressed cortex graph.
+
+        Block-compressed graphs can be read by all cortexpy commands and support fast kmer
+        lookups. They are valid gzip files and can be decompressed with gunzip.
+        """
+    )
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('-v', '--verbose', help='Increase log level to debug', action='store_true')
+    group.add_argument('-s', '--silent', help='Decrease log level to warnings and errors',
+                       action='store_true')
+    parser.add_argument('-o', '--out', required=True, help="Output block-compressed graph")
+    parser.add_argument('--records-per-block', type=int, default=DEFAULT_RECORDS_PER_BLOCK,
+                        help='Number of records per compressed block.  [default: %(default)s]')
+    parser.add_argument('graph', help="Input cortex graph, which may be gzipped")
+    args = parser.parse_args(argv)
+
+    from cortexpy.logging_config import configure_logging_from_args_and_get_logger
+    logger = configure_logging_from_args_and_get_logger(args, 'cortexpy.compress')
+
+    if args.records_per_block < 1:
+        logger.error('--records-per-block (%s) needs to be greater than 0',
+                     args.records_per_block)
+        return 1
+
+    from cortexpy.graph.parser.block_compressed import compress_graph
+
+    logger.info('Writing block-compressed graph to %s', args.out)
+    with open(args.graph, 'rb') as fh, open(args.out, 'wb') as out:
+        compress_graph(fh, out, records_per_block=args.records_per_block)
@@ -0,0 +1,92 @@
+def index(argv):
+    import argparse
+    from cortexpy.graph.parser.bloom_filter import DEFAULT_BITS_PER_KMER
+    from cortexpy.graph.parser.fence_index import DEFAULT_FENCE_INTERVAL
+    parser = argparse.ArgumentParser(
+        'cortexpy index',
+        description="""
+        Write a fence index of a sorted cortex graph.
+
+        The index is automatically used by commands that look up kmers in the graph if it is
+        stored next to the graph as <graph>.idx.
+
+        With --bloom, a Bloom filter of the graph kmers is also written to <graph>.bloom. The filter
+        is automatically used to skip searches for kmers that are not in the graph. Block-compressed
+        graphs contain their own index, so only the Bloom filter is written for them.
+
+        With --components, the connected component of every kmer and the size of every component
+        are also written to <graph>.components. Subgraph traversals of all colors in both
+        orientations use the component sizes to reject start kmers whose components are larger
+        than --max-nodes before traversing the graph.
+
+        With --unitigs, the unitig of every kmer and the kmers of every unitig are also written to
+        <graph>.unitigs. Subgraph traversals with --jump-unitigs use it to add whole unitigs of a
+        single-color graph at once.
+        """
+    )
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('-v', '--verbose', help='Increase log level to debug', action='store_true')
+    group.add_argument('-s', '--silent', help='Decrease log level to warnings and errors',
+                       action='store_true')
+    parser.add_argument('-o', '--out', default=None,
+                        help="Output fence index.  [default: <graph>.idx]")
+    parser.add_argument('--interval', type=int, default=DEFAULT_FENCE_INTERVAL,
+                        help='Number of records between fence kmers.  [default: %(default)s]')
+    parser.add_argument('--bloom', action='store_true',
+                        help='Also write a Bloom filter of the graph kmers to <graph>.bloom')
+    parser.add_argument('--bloom-bits-per-kmer', type=int, default=DEFAULT_BITS_PER_KMER,
+                        help='Number of Bloom filter bits per kmer.  [default: %(default)s]')
+    parser.add_argument('--components', action='store_true',
+                        help='Also write a component index of the graph to <graph>.components')
+    parser.add_argument('--unitigs', action='store_true',
+                        help='Also write a unitig index of the graph to <graph>.unitigs')
+    parser.add_argument('graph', help="Input cortex graph")
+    args = parser.parse_args(argv)
+
+    from cortexpy.logging_config import configure_logging_from_args_and_get_logger
+    logger = configure_logging_from_args_and_get_logger(args, 'cortexpy.index')
+
+    if args.interval < 1:
+        logger.error('--interval (%s) needs to be greater than 0', args.interval)
+        return 1
+    if args.bloom_bits_per_kmer < 1:
+        logger.error('--bloom-bits-per-kmer (%s) needs to be greater than 0',
+                     args.bloom_bits_per_kmer)
+        return 1
+
+    from cortexpy.graph.parser import bloom_filter, components, unitigs
+    from cortexpy.graph.parser.block_compressed import is_block_compressed
+    from cortexpy.graph.parser.fence_index import FenceIndex, sidecar_path
+
+    if args.out is None:
+        args.out = sidecar_path(args.graph)
+
+    with open(args.graph, 'rb') as fh:
+        block_compressed = is_block_compressed(fh)
+        if block_compressed:
+            logger.info('Not writing fence index of block-compressed graph')
+        else:
+            fence_index = FenceIndex.from_graph_handle(fh, interval=args.interval)
+            logger.info('Writing %s fence kmers to %s', len(fence_index.fence_kmers), args.out)
+            with open(args.out, 'wb') as out_fh:
+                fence_index.dump(out_fh)
+        if args.bloom:
+            bloom = bloom_filter.BloomFilter.from_graph_handle(
+                fh, bits_per_kmer=args.bloom_bits_per_kmer)
+            bloom_path = bloom_filter.BloomFilter.sidecar_path(args.graph)
+            logger.info('Writing Bloom filter of %s bits to %s', bloom.n_bits, bloom_path)
+            with open(bloom_path, 'wb') as out_fh:
+                bloom.dump(out_fh)
+        if args.components:
+            component_index = components.ComponentIndex.from_graph_handle(fh)
+            components_path = components.ComponentIndex.sidecar_path(args.graph)
+            logger.info('Writing %s components to %s', component_index.n_components,
+                        components_path)
+            with open(components_path, 'wb') as out_fh:
+                component_index.dump(out_fh)
+        if args.unitigs:
+            unitig_index = unitigs.UnitigIndex.from_graph_handle(fh)
+            unitigs_path = unitigs.UnitigIndex.sidecar_path(args.graph)
+            logger.info('Writing %s unitigs to %s', unitig_index.n_unitigs, unitigs_path)
+            with open(unitigs_path, 'wb') as out_fh:
+                unitig_index.dump(out_fh)
@@ -0,0 +1,47 @@
+def merge(argv):
+    import argparse
+    from .shared import get_shared_argparse
+    from cortexpy.graph.serializer.merge import DEFAULT_MAX_OPEN_FILES
+    shared_parser = get_shared_argparse()
+    parser = argparse.ArgumentParser(
+        'cortexpy merge', parents=[shared_parser],
+        description="""
+        Merge sorted cortex graphs into one multi-color cortex graph.
+
+        The colors of the output graph are the colors of the input graphs in input order.
+        Memory use is proportional to the number of input graphs.
+        """
+    )
+    parser.add_argument('graphs', nargs='+', help="Input cortex graphs, which may be gzipped")
+    parser.add_argument('--max-open-files', type=int, default=DEFAULT_MAX_OPEN_FILES,
+                        help='Maximum number of files to open at the same time, including the '
+                             'output graph.  If there are more input graphs, then they are '
+                             'merged via temporary graphs.  '
+                             '[default: %(default)s]')
+    parser.add_argument('--temp-dir', default=None,
+                        help='Directory for temporary graphs.  [default: system temp dir]')
+    parser.add_argument('--block-compress', action='store_true',
+                        help='Write a block-compressed cortex graph')
+    args = parser.parse_args(argv)
+
+    from cortexpy.logging_config import configure_logging_from_args_and_get_logger
+    logger = configure_logging_from_args_and_get_logger(args, 'cortexpy.merge')
+
+    if args.max_open_files < 4:
+        logger.error('--max-open-files (%s) needs to be at least 4', args.max_open_files)
+        return 1
+
+    import sys
+    from contextlib import ExitStack
+    from cortexpy.graph.serializer.merge import merge_graph_files
+    with ExitStack() as stack:
+        if args.out == '-':
+            output = sys.stdout.buffer
+        else:
+            output = stack.enter_context(open(args.out, 'wb'))
+        logger.info('Merging %s graphs', len(args.graphs))
+        n_kmers = merge_graph_files(args.graphs, output,
+                                    max_open_files=args.max_open_files,
+                                    temp_dir=args.temp_dir,
+                                    block_compressed=args.block_compress)
+        logger.info('Wrote %s kmers', n_kmers)
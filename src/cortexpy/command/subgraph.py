@@ -33,23 +33,62 @@ def subgraph(argv):
     parser.add_argument('--max-nodes', type=int, default=None,
                         help='Maximum number of nodes to traverse (int).'
                              '  Die without output if max nodes is exceeded')
+    parser.add_argument('--frontier', action='store_true',
+                        help='Expand all kmers of each traversal level with one batched kmer '
+                             'lookup instead of traversing one branch at a time.  Dies as soon '
+                             'as a level exceeds max nodes')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of processes that traverse the start kmers of '
+                             '--initial-fasta.  0 uses one process per CPU.  Not used with '
+                             '--frontier.  Cannot be used with --slurp, because each process '
+                             'would slurp the graphs.  [default: %(default)s]')
+    parser.add_argument('--jump-unitigs', action='store_true',
+                        help='Jump over the unitigs of a single-color graph with its unitig '
+                             'index (see cortexpy index --unitigs).  Not used with --frontier')
     parser.add_argument('--logging-interval', type=int, default=90,
                         help='Logging interval.  [default: %(default)s]')
     parser.add_argument('--cache-size', type=int, default=0, help='Number of kmers to cache')
     parser.add_argument('--binary-search-cache-size', type=int, default=0,
                         help='Number of kmers to cache for binary search')
     parser.add_argument('--slurp', action='store_true',
-                        help='Slurp all cortex graphs before traversal')
+                        help='Slurp all cortex graphs into memory as sorted columnar arrays '
+                             'before traversal')
+    parser.add_argument('--memory-map', action='store_true',
+                        help='Memory-map cortex graphs instead of reading kmers from file')
+    parser.add_argument('--prefetch-workers', type=int, default=0,
+                        help='Number of threads that prefetch the records of neighboring kmers '
+                             'into the page cache.  [default: %(default)s]')
+    parser.add_argument('--record-cache-bytes', type=int, default=None,
+                        help='Memory budget in bytes of the cache of decoded kmer records of '
+                             'each cortex graph.  [default: no record cache]')
+    parser.add_argument('--block-cache-bytes', type=int, default=None,
+                        help='Memory budget in bytes of a block cache that is shared by all '
+                             'cortex graphs.  [default: no block cache]')
+    parser.add_argument('--search-strategy', choices=['binary', 'interpolation'],
+                        default='binary',
+                        help='Strategy for searching kmers in graphs without an index.  '
+                             '[default: %(default)s]')
     args = parser.parse_args(argv)
 
     from cortexpy.logging_config import configure_logging_from_args_and_get_logger
     logger = configure_logging_from_args_and_get_logger(args, 'cortexpy.traverse')
 
+    if args.jobs < 0:
+        logger.error('--jobs (%s) needs to be 0 or more', args.jobs)
+        return 1
+    if args.jobs != 1 and args.slurp and not args.frontier:
+        logger.error('--jobs (%s) cannot be used with --slurp, because each process would slurp '
+                     'the graphs', args.jobs)
+        return 1
+
     import sys
     from cortexpy.graph.serializer.kmer import dump_colored_de_bruijn_graph_to_cortex
     from cortexpy.graph.parser.random_access_collection import RandomAccessCollection
     from cortexpy.constants import EngineTraversalOrientation
-    from cortexpy.graph.traversal.engine import Engine
+    if args.frontier:
+        from cortexpy.graph.traversal.frontier import FrontierEngine as Engine
+    else:
+        from cortexpy.graph.traversal.engine import Engine
     from contextlib import ExitStack
     with ExitStack() as stack:
         if args.out == '-':
@@ -57,28 +96,51 @@ def subgraph(argv):
         else:
             output = stack.enter_context(open(args.out, 'wb'))
 
+        ra_parser_args = {'kmer_cache_size': args.cache_size}
         if args.slurp:
-            from cortexpy.graph.parser.random_access import SlurpedRandomAccess
-            RAClass = SlurpedRandomAccess.from_handle
+            from cortexpy.graph.parser.random_access import ColumnarRandomAccess
+            RAClass = ColumnarRandomAccess.from_handle
             logger.info("Slurping cortex graphs")
         else:
             from cortexpy.graph.parser.random_access import RandomAccess as RAClass
+            ra_parser_args['memory_map'] = args.memory_map
+            ra_parser_args['prefetch_workers'] = args.prefetch_workers
+            ra_parser_args['record_cache_bytes'] = args.record_cache_bytes
+            from cortexpy.graph.parser.search import SearchStrategy
+            ra_parser_args['search_strategy'] = SearchStrategy[args.search_strategy]
+            if args.block_cache_bytes is not None:
+                from cortexpy.graph.parser.block_cache import shared_block_cache
+                ra_parser_args['block_cache'] = shared_block_cache(args.block_cache_bytes)
 
-        if len(args.graphs) == 1:
-            ra_parser = RAClass(
-                stack.enter_context(open(args.graphs[0], 'rb')),
-                kmer_cache_size=args.cache_size
-            )
+        graph_parsers = [RAClass(stack.enter_context(open(graph_path, 'rb')), **ra_parser_args)
+                         for graph_path in args.graphs]
+        if not args.slurp:
+            for graph_parser in graph_parsers:
+                stack.enter_context(graph_parser)
+        if len(graph_parsers) == 1:
+            ra_parser = graph_parsers[0]
         else:
-            ra_parser = RandomAccessCollection(
-                [RAClass(stack.enter_context(open(graph_path, 'rb')),
-                         kmer_cache_size=args.cache_size)
-                 for graph_path in args.graphs])
+            ra_parser = RandomAccessCollection(graph_parsers)
+        engine_args = {}
+        if args.jump_unitigs:
+            if args.frontier:
+                logger.warning('Ignoring --jump-unitigs of frontier traversal')
+            else:
+                engine_args['jump_unitigs'] = True
+        if args.jobs != 1:
+            if args.frontier:
+                logger.warning('Ignoring --jobs (%s) of frontier traversal', args.jobs)
+            else:
+                from cortexpy.graph.traversal.engine import RandomAccessFactory
+                engine_args['n_workers'] = args.jobs
+                engine_args['ra_factory'] = RandomAccessFactory(args.graphs, RAClass,
+                                                                ra_parser_args)
         engine = Engine(
             ra_parser,
             orientation=EngineTraversalOrientation[args.orientation.name],
             max_nodes=args.max_nodes,
-            logging_interval=args.logging_interval
+            logging_interval=args.logging_interval,
+            **engine_args
         )
 
         if args.colors is not None:
@@ -91,5 +153,11 @@ def subgraph(argv):
             engine.traverse_from_each_kmer_in_fasta(args.initial_contig)
         else:
             engine.traverse_from_each_kmer_in(args.initial_contig)
+        if args.record_cache_bytes is not None and not args.slurp:
+            parsers = getattr(ra_parser, 'ra_parsers', [ra_parser])
+            for graph_path, graph_parser in zip(args.graphs, parsers):
+                logger.info('Record cache of %s: %s', graph_path, graph_parser.record_cache_stats)
+        if 'block_cache' in ra_parser_args:
+            logger.info('Block cache: %s', ra_parser_args['block_cache'].stats)
 
         dump_colored_de_bruijn_graph_to_cortex(engine.graph, output)
@@ -34,11 +34,19 @@ def traverse(argv):
                              'candidate transcript creation. '
                              'This argument may fail if not used together with --seed-strings.')
     parser.add_argument('--links-file', help='gzipped Mccortex-style links file for graph')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of processes used to make the connected components of the '
+                             'graph consistent.  0 uses one process per CPU.  '
+                             '[default: %(default)s]')
     args = parser.parse_args(argv)
 
     from cortexpy.logging_config import configure_logging_from_args_and_get_logger
     logger = configure_logging_from_args_and_get_logger(args, 'cortexpy.traverse')
 
+    if args.jobs < 0:
+        logger.error('--jobs (%s) needs to be 0 or more', args.jobs)
+        return 1
+
     import sys
     import gzip
     from cortexpy.graph.interactor import Interactor
@@ -68,7 +76,7 @@ def traverse(argv):
         logger.info(
             f'Making graph consistent with {len(seed_kmer_strings)} kmers from --seed-strings')
         consistent_graph = Interactor(graph) \
-            .make_graph_nodes_consistent(seed_kmer_strings) \
+            .make_graph_nodes_consistent(seed_kmer_strings, n_workers=args.jobs) \
             .graph
 
     if args.to_json:
@@ -81,7 +89,7 @@ def traverse(argv):
     if not consistent_graph:
         logger.info('Making graph consistent')
         consistent_graph = Interactor.from_graph(graph) \
-            .make_graph_nodes_consistent() \
+            .make_graph_nodes_consistent(n_workers=args.jobs) \
             .graph
 
     if args.extra_start_kmer:
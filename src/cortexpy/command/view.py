@@ -29,9 +29,16 @@ def view_graph(argv):
     parser = argparse.ArgumentParser(prog='cortexpy view graph')
     parser.add_argument('graph', help="cortex graph")
     parser.add_argument('--kmers', action='store_true')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of processes used to format an uncompressed graph.  '
+                             'Compressed graphs are formatted by one process.  '
+                             '[default: %(default)s]')
     args = parser.parse_args(argv)
 
     import sys
+    if args.jobs > 1 and not args.kmers and not is_compressed(args.graph):
+        print_cortex_file_in_parallel(args.graph, n_workers=args.jobs)
+        return
     with open(args.graph, 'rb') as fh:
         if args.kmers:
             write_kmer_strings(fh, sys.stdout)
@@ -71,10 +78,38 @@ def write_kmer_strings(input, output):
 
 
 def print_cortex_file(graph_handle):
-    from cortexpy.graph.parser.streaming import kmer_generator_from_stream
+    from cortexpy.graph.parser.block_compressed import decompressed_stream
+    from cortexpy.graph.parser.header import Header
+    from cortexpy.graph.parser.streaming import kmer_record_array_generator_from_stream_and_header
 
-    for kmer in kmer_generator_from_stream(graph_handle):
-        print(kmer_to_cortex_jdk_print_string(kmer))
+    graph_handle = decompressed_stream(graph_handle)
+    header = Header.from_stream(graph_handle)
+    for record_array in kmer_record_array_generator_from_stream_and_header(graph_handle, header):
+        print(format_record_array(record_array), end='')
+
+
+def is_compressed(graph_path):
+    from cortexpy.graph.parser.block_compressed import GZIP_MAGIC, peek
+    with open(graph_path, 'rb') as fh:
+        return peek(fh, len(GZIP_MAGIC)) == GZIP_MAGIC
+
+
+def print_cortex_file_in_parallel(graph_path, n_workers):
+    from cortexpy.graph.parser.parallel import map_ranges
+
+    for lines in map_ranges(graph_path, format_record_array, n_workers=n_workers):
+        print(lines, end='')
+
+
+def format_record_array(record_array):
+    """Format records like :py:func:`kmer_to_cortex_jdk_print_string`, one per line"""
+    from cortexpy.edge_set import EDGE_BYTE_TO_STR as edge_byte_strings
+    return ''.join('{} {} {}\n'.format(kmer_string,
+                                       ' '.join(map(str, coverage)),
+                                       ' '.join(edge_byte_strings[e] for e in edges))
+                   for kmer_string, coverage, edges in zip(record_array.kmer_strings(),
+                                                           record_array.coverage.tolist(),
+                                                           record_array.edges.tolist()))
 
 
 def print_contig(contig_retriever, contig):
@@ -1,3 +1,14 @@
+"""Edge sets
+============
+
+An :py:class:`EdgeSet` stores the edges of a kmer in one color as the edge byte of a Cortex
+record. The most significant bit is the incoming edge from ``A``, followed by the incoming
+edges from ``C``, ``G`` and ``T``, and the outgoing edges to ``T``, ``G``, ``C`` and ``A`` (see
+:py:data:`EDGE_SET_DATA_LETTER_ORDER`).
+
+Edge lookups, degrees, neighbor letters and string representations are read from tables with
+one entry per edge byte.
+"""
 import attr
 import numpy as np
 
@@ -9,82 +20,172 @@ HALF_EDGE_SET_LENGTH = 4
 EDGE_SET_DATA_LETTER_ORDER = 'acgtTGCA'
 EDGE_SET_REPR_LETTER_ORDER = 'acgtACGT'
 EDGE_SET_LETTER_LOOKUP = {letter: idx for idx, letter in enumerate(EDGE_SET_DATA_LETTER_ORDER)}
+EDGE_SET_LETTER_MASKS = {letter: 0x80 >> idx for letter, idx in EDGE_SET_LETTER_LOOKUP.items()}
 
 EDGE_IDX_TO_LETTER = ['A', 'C', 'G', 'T', 'T', 'G', 'C', 'A']
 
+N_EDGE_BYTES = 256
+
+
+def _edge_byte_to_data(edge_byte):
+    return tuple((edge_byte >> (EDGE_SET_LENGTH - 1 - idx)) & 1 for idx in range(EDGE_SET_LENGTH))
+
+
+def _edge_indices(half_data):
+    return tuple(idx for idx, edge in enumerate(half_data) if edge)
+
+
+def _edge_byte_to_str(edge_byte):
+    data = _edge_byte_to_data(edge_byte)
+    return ''.join(letter if data[EDGE_SET_LETTER_LOOKUP[letter]] else '.'
+                   for letter in EDGE_SET_REPR_LETTER_ORDER)
+
+
+EDGE_BYTE_TO_DATA = tuple(_edge_byte_to_data(b) for b in range(N_EDGE_BYTES))
+EDGE_BYTE_TO_INCOMING_INDICES = tuple(_edge_indices(d[:HALF_EDGE_SET_LENGTH])
+                                      for d in EDGE_BYTE_TO_DATA)
+EDGE_BYTE_TO_OUTGOING_INDICES = tuple(_edge_indices(d[HALF_EDGE_SET_LENGTH:])
+                                      for d in EDGE_BYTE_TO_DATA)
+EDGE_BYTE_TO_NUM_INCOMING = tuple(len(i) for i in EDGE_BYTE_TO_INCOMING_INDICES)
+EDGE_BYTE_TO_NUM_OUTGOING = tuple(len(i) for i in EDGE_BYTE_TO_OUTGOING_INDICES)
+EDGE_BYTE_TO_STR = tuple(_edge_byte_to_str(b) for b in range(N_EDGE_BYTES))
+EDGE_BYTE_TO_REVCOMP_STR = tuple(revcomp(s) for s in EDGE_BYTE_TO_STR)
+EDGE_BYTE_TO_BYTES = tuple(bytes((b,)) for b in range(N_EDGE_BYTES))
+
+# Edge indices and number of edges of edge bytes on the incoming and outgoing side of a kmer
+INCOMING_SIDE = 0
+OUTGOING_SIDE = 1
+SIDE_EDGE_INDICES = (range(HALF_EDGE_SET_LENGTH), range(HALF_EDGE_SET_LENGTH, EDGE_SET_LENGTH))
+SIDE_DEGREES = (np.array(EDGE_BYTE_TO_NUM_INCOMING, dtype=np.uint8),
+                np.array(EDGE_BYTE_TO_NUM_OUTGOING, dtype=np.uint8))
+
+# Letters of neighbors that are prepended to (incoming) or appended to (outgoing) a kmer string,
+# for kmers that are and are not lexlo
+INCOMING_LETTERS = {
+    True: tuple(tuple(EDGE_IDX_TO_LETTER[i] for i in indices)
+                for indices in EDGE_BYTE_TO_INCOMING_INDICES),
+    False: tuple(tuple(EDGE_IDX_TO_LETTER[i] for i in indices)
+                 for indices in EDGE_BYTE_TO_OUTGOING_INDICES),
+}
+OUTGOING_LETTERS = {
+    True: tuple(tuple(EDGE_IDX_TO_LETTER[i + HALF_EDGE_SET_LENGTH] for i in indices)
+                for indices in EDGE_BYTE_TO_OUTGOING_INDICES),
+    False: tuple(tuple(EDGE_IDX_TO_LETTER[i + HALF_EDGE_SET_LENGTH] for i in indices)
+                 for indices in EDGE_BYTE_TO_INCOMING_INDICES),
+}
+
+
+def to_edge_byte(value):
+    """Convert an edge byte or an array of eight edge flags to an edge byte"""
+    if isinstance(value, (int, np.integer)):
+        assert 0 <= value < N_EDGE_BYTES
+        return int(value)
+    assert len(value) == EDGE_SET_LENGTH
+    edge_byte = 0
+    for edge in value:
+        edge_byte = (edge_byte << 1) | bool(edge)
+    return edge_byte
+
+
+def neighbor_letter_matrix(letter_vals, edge_bytes, edge_indices=range(EDGE_SET_LENGTH)):
+    """Return the row indices and letter number matrix of the neighbors of lexlo kmers
+
+    Only the edges of edge_indices are followed (see :py:data:`EDGE_SET_DATA_LETTER_ORDER`).
+    Neighbors are not lexlo.
+    """
+    rows = []
+    neighbors = []
+    for edge_idx in edge_indices:
+        has_edge = np.nonzero(edge_bytes & (0x80 >> edge_idx))[0]
+        if len(has_edge) == 0:
+            continue
+        neighbor = np.empty_like(letter_vals[has_edge])
+        if edge_idx < HALF_EDGE_SET_LENGTH:
+            neighbor[:, 0] = edge_idx
+            neighbor[:, 1:] = letter_vals[has_edge, :-1]
+        else:
+            neighbor[:, :-1] = letter_vals[has_edge, 1:]
+            neighbor[:, -1] = EDGE_SET_LENGTH - 1 - edge_idx
+        rows.append(has_edge)
+        neighbors.append(neighbor)
+    if not rows:
+        return np.zeros(0, dtype=np.int64), letter_vals[:0]
+    return np.concatenate(rows), np.concatenate(neighbors)
+
 
 @attr.s(slots=True, cmp=False)
 class EdgeSet:
-    """Adds methods for accessing an edge set array (data)"""
-    data = attr.ib()
+    """Adds methods for accessing the edges of an edge byte
+
+    An edge set may also be created from an array of eight edge flags (data).
+    """
+    byte = attr.ib(converter=to_edge_byte)
 
-    @data.validator
-    def check(self, _, value):  # noqa
-        assert len(value) == EDGE_SET_LENGTH
+    @property
+    def data(self):
+        return EDGE_BYTE_TO_DATA[self.byte]
 
     def is_edge(self, letter):
-        return self.data[EDGE_SET_LETTER_LOOKUP[letter]] == 1
+        return bool(self.byte & EDGE_SET_LETTER_MASKS[letter])
 
     def add_edge(self, letter):
-        data = list(self.data)
-        data[EDGE_SET_LETTER_LOOKUP[letter]] = 1
-        self.data = tuple(data)
+        self.byte |= EDGE_SET_LETTER_MASKS[letter]
 
     def remove_edge(self, letter):
-        data = list(self.data)
-        data[EDGE_SET_LETTER_LOOKUP[letter]] = 0
-        self.data = tuple(data)
+        self.byte &= ~EDGE_SET_LETTER_MASKS[letter]
 
     def __getitem__(self, item):
-        return self.data[item]
+        return EDGE_BYTE_TO_DATA[self.byte][item]
 
     def __eq__(self, other):
-        return all(s == o for s, o in zip(self.data, other.data))
+        return self.byte == other.byte
 
     def __str__(self):
-        return self.to_str(as_revcomp=False)
+        return EDGE_BYTE_TO_STR[self.byte]
 
     @property
     def outgoing(self):
-        return self.data[HALF_EDGE_SET_LENGTH:]
+        return EDGE_BYTE_TO_DATA[self.byte][HALF_EDGE_SET_LENGTH:]
 
     @property
     def incoming(self):
-        return self.data[:HALF_EDGE_SET_LENGTH]
+        return EDGE_BYTE_TO_DATA[self.byte][:HALF_EDGE_SET_LENGTH]
 
     def num_outgoing(self):
-        return sum(self.outgoing)
+        return EDGE_BYTE_TO_NUM_OUTGOING[self.byte]
 
     def num_incoming(self):
-        return sum(self.incoming)
-
-    def _get_kmer_strings(self, sub_kmer_string, is_incoming, is_lexlo):
-        if is_incoming:
-            if is_lexlo:
-                edges = self.incoming
-            else:
-                edges = self.outgoing
-            for edge_idx, edge in enumerate(edges):
-                if edge:
-                    yield EDGE_IDX_TO_LETTER[edge_idx] + sub_kmer_string
-        else:
-            if is_lexlo:
-                edges = self.outgoing
-            else:
-                edges = self.incoming
-            for edge_idx, edge in enumerate(edges):
-                if edge:
-                    yield sub_kmer_string + EDGE_IDX_TO_LETTER[edge_idx + 4]
+        return EDGE_BYTE_TO_NUM_INCOMING[self.byte]
 
     def get_incoming_kmer_strings(self, kmer_string, is_lexlo=None):
         if is_lexlo is None:
             is_lexlo = bool(kmer_string == lexlo(kmer_string))
-        return self._get_kmer_strings(kmer_string[:-1], True, is_lexlo)
+        sub_kmer_string = kmer_string[:-1]
+        return (letter + sub_kmer_string for letter in INCOMING_LETTERS[is_lexlo][self.byte])
 
     def get_outgoing_kmer_strings(self, kmer_string, is_lexlo=None):
         if is_lexlo is None:
             is_lexlo = bool(kmer_string == lexlo(kmer_string))
-        return self._get_kmer_strings(kmer_string[1:], False, is_lexlo)
+        sub_kmer_string = kmer_string[1:]
+        return (sub_kmer_string + letter for letter in OUTGOING_LETTERS[is_lexlo][self.byte])
+
+    def get_incoming_kmer_ints(self, kmer_int, converter, is_lexlo):
+        """Return integer kmers of incoming edges (see :py:class:`IntKmerConverter`)"""
+        if is_lexlo:
+            indices = EDGE_BYTE_TO_INCOMING_INDICES[self.byte]
+        else:
+            indices = EDGE_BYTE_TO_OUTGOING_INDICES[self.byte]
+        for letter_num in indices:
+            yield converter.prepend(kmer_int, letter_num)
+
+    def get_outgoing_kmer_ints(self, kmer_int, converter, is_lexlo):
+        """Return integer kmers of outgoing edges (see :py:class:`IntKmerConverter`)"""
+        if is_lexlo:
+            indices = EDGE_BYTE_TO_OUTGOING_INDICES[self.byte]
+        else:
+            indices = EDGE_BYTE_TO_INCOMING_INDICES[self.byte]
+        for edge_idx in indices:
+            yield converter.append(kmer_int, HALF_EDGE_SET_LENGTH - 1 - edge_idx)
 
     def get_incoming_kmers(self, kmer_string):
         lexlo_string = lexlo(kmer_string)
@@ -99,28 +200,19 @@ class EdgeSet:
                 self.get_outgoing_kmer_strings(kmer_string, is_lexlo=True)]
 
     def to_str(self, *, as_revcomp=False):
-        es_letters = []
-        for letter in EDGE_SET_REPR_LETTER_ORDER:
-            if self.is_edge(letter):
-                es_letters.append(letter)
-            else:
-                es_letters.append('.')
-        es_letters = ''.join(es_letters)
         if as_revcomp:
-            es_letters = revcomp(es_letters)
-        return es_letters
+            return EDGE_BYTE_TO_REVCOMP_STR[self.byte]
+        return EDGE_BYTE_TO_STR[self.byte]
 
     def oriented(self, orientation):
         return OrientedEdgeSet(self, orientation)
 
     def dump(self, buffer):
-        binary = np.packbits(self.data)
-        assert 1 == len(binary)
-        buffer.write(binary[0])
+        buffer.write(EDGE_BYTE_TO_BYTES[self.byte])
 
 
 def empty():
-    return EdgeSet(np.zeros(EDGE_SET_LENGTH, dtype=np.uint8))
+    return EdgeSet(0)
 
 
 @attr.s(slots=True)
@@ -130,6 +222,7 @@ class OrientedEdgeSet(object):
     neighbor_kmers = attr.ib(init=False)
     neighbor = attr.ib(init=False)
     neighbor_kmer_strings = attr.ib(init=False)
+    neighbor_kmer_ints = attr.ib(init=False)
     _num_neighbor = attr.ib(init=False)
 
     def __attrs_post_init__(self):
@@ -138,18 +231,21 @@ class OrientedEdgeSet(object):
             self.neighbor = self.edge_set.outgoing
             self._num_neighbor = self.edge_set.num_outgoing
             self.neighbor_kmer_strings = self.edge_set.get_outgoing_kmer_strings
+            self.neighbor_kmer_ints = self.edge_set.get_outgoing_kmer_ints
         else:
             self.neighbor_kmers = self.edge_set.get_incoming_kmers
             self.neighbor = self.edge_set.incoming
             self._num_neighbor = self.edge_set.num_incoming
             self.neighbor_kmer_strings = self.edge_set.get_incoming_kmer_strings
+            self.neighbor_kmer_ints = self.edge_set.get_incoming_kmer_ints
 
     def other_orientation(self):
         return OrientedEdgeSet(self.edge_set, EdgeTraversalOrientation.other(self.orientation))
 
-    def num_neighbor(self, kmer_string):
-        lexlo_kmer_string = lexlo(kmer_string)
-        if lexlo_kmer_string != kmer_string:
-            return self.other_orientation().num_neighbor(lexlo(kmer_string))
+    def num_neighbor(self, kmer_string, is_lexlo=None):
+        if is_lexlo is None:
+            is_lexlo = bool(kmer_string == lexlo(kmer_string))
+        if not is_lexlo:
+            return self.other_orientation()._num_neighbor()
         else:
             return self._num_neighbor()
@@ -3,7 +3,7 @@ from collections import defaultdict
 import attr
 import networkx as nx
 
-from cortexpy.utils import lexlo
+from cortexpy.utils import lexlo, kmerize_contig
 from .parser.kmer import EmptyKmerBuilder, revcomp_target_to_match_ref, connect_kmers
 from .parser.random_access import RandomAccess
 
@@ -32,16 +32,19 @@ class ContigRetriever(object):
     def get_kmers(self, contig):
         kmer_size = self.graph_parser.kmer_size
         assert len(contig) >= kmer_size
+        kmer_strings = list(kmerize_contig(contig, kmer_size))
+        unseen_kmer_strings = [s for s in kmer_strings if lexlo(s) not in self.seen_kmer_strings]
+        batch = self.graph_parser.get_many(unseen_kmer_strings)
+        batch_kmers = {lexlo_string: batch_idx
+                       for batch_idx, lexlo_string in enumerate(batch.kmer_strings)}
         kmers = []
-        for kmer_start in range(len(contig) - kmer_size + 1):
-            kmer_string = contig[kmer_start:(kmer_start + kmer_size)]
+        for kmer_string in kmer_strings:
             lexlo_kmer_string = lexlo(kmer_string)
             if lexlo_kmer_string in self.seen_kmer_strings:
                 kmer = self.seen_kmer_strings[lexlo_kmer_string]
             else:
-                try:
-                    kmer = self.graph_parser.get_kmer_for_string(kmer_string)
-                except KeyError:
+                kmer = batch[batch_kmers[lexlo_kmer_string]]
+                if kmer is None:
                     kmer = self.empty_kmer_builder.build(kmer_string)
                 self.seen_kmer_strings[lexlo_kmer_string] = kmer
             kmer.increment_color_coverage(self.num_colors - 1)
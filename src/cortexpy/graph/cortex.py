@@ -14,6 +14,7 @@ import attr
 import networkx as nx
 
 from cortexpy.constants import EdgeTraversalOrientation
+from cortexpy.edge_set import EDGE_BYTE_TO_NUM_INCOMING, EDGE_BYTE_TO_NUM_OUTGOING
 from cortexpy.graph.parser.kmer import find_all_neighbors, disconnect_kmers
 from cortexpy.utils import lexlo
 
@@ -50,6 +51,42 @@ def build_cortex_graph(*, sample_names, kmer_size, num_colors, colors, kmer_gene
     return graph
 
 
+def kmer_degrees(kmer):
+    """Return the number of outgoing and incoming edges of a lexlo kmer summed over colors"""
+    n_outgoing = n_incoming = 0
+    for color in kmer.colors:
+        edge_byte = kmer.edges[color].byte
+        n_outgoing += EDGE_BYTE_TO_NUM_OUTGOING[edge_byte]
+        n_incoming += EDGE_BYTE_TO_NUM_INCOMING[edge_byte]
+    return n_outgoing, n_incoming
+
+
+def lexlo_neighbors_of(kmer):
+    """Yield the lexlo neighbor of each edge of a kmer in each color"""
+    for color in kmer.colors:
+        edge = kmer.edges[color]
+        yield from edge.get_outgoing_kmers(kmer.kmer)
+        yield from edge.get_incoming_kmers(kmer.kmer)
+
+
+def has_self_edge(kmer):
+    """Return True if a kmer has an edge to itself in any color"""
+    return any(neighbor == kmer.kmer for neighbor in lexlo_neighbors_of(kmer))
+
+
+def out_nodes_of(node, kmer):
+    """Yield the successor of a kmer string for each of its outgoing edges in each color"""
+    is_lexlo = kmer.kmer == node
+    for color in kmer.colors:
+        yield from kmer.edges[color].get_outgoing_kmer_strings(node, is_lexlo=is_lexlo)
+
+
+def lexlo_kmer_strings_next_to(kmer_string):
+    """Return the lexlo kmer strings that an edge of a kmer string could connect it to"""
+    return {lexlo(kmer) for letter in 'ACGT'
+            for kmer in (letter + kmer_string[:-1], kmer_string[1:] + letter)}
+
+
 @attr.s(slots=True)
 class CortexGraphMapping(MutableMapping):
     """Create a dict-like kmer mapping from a RandomAccess parser (ra_parser)
@@ -58,11 +95,15 @@ class CortexGraphMapping(MutableMapping):
     The new_kmers track kmers that have been added to the mapping.
     Kmers that exist in both new_kmers and ra_parser are considered overwritten. The kmers in
     new_kmers have precedence.
+
+    The number of edges is cached. Connecting, disconnecting, setting and deleting kmers update it
+    from the edges of the changed kmers and of their neighbors (see :py:class:`EdgeView`).
     """
     ra_parser = attr.ib()
     _exclusion_set = attr.ib(attr.Factory(set))
     _new_kmers = attr.ib(attr.Factory(dict))
     _n_duplicates = attr.ib(0)
+    n_edges = attr.ib(None, init=False)
 
     def __attrs_post_init__(self):
         if isinstance(self.ra_parser, type(self)):
@@ -79,16 +120,35 @@ class CortexGraphMapping(MutableMapping):
 
     def __setitem__(self, key, value):
         lexlo_key = lexlo(key)
-        if lexlo_key in self._exclusion_set:
+        if self.n_edges is not None:
+            old_value = self.get(lexlo_key)
+            if old_value is None:
+                self.n_edges += self._count_edges_from_lesser_neighbors(lexlo_key)
+            else:
+                self.n_edges -= self._count_edges_of(old_value)
+        self._set(lexlo_key, value)
+        if self.n_edges is not None:
+            self.n_edges += self._count_edges_of(value)
+
+    def _set(self, lexlo_key, value):
+        """Store a kmer and return True if the mapping contained its key"""
+        is_excluded = lexlo_key in self._exclusion_set
+        if is_excluded:
             self._exclusion_set.discard(lexlo_key)
-        if lexlo_key in self.ra_parser and lexlo_key not in self._new_kmers:
+        in_new_kmers = lexlo_key in self._new_kmers
+        in_ra_parser = lexlo_key in self.ra_parser
+        if in_ra_parser and not in_new_kmers:
             self._n_duplicates += 1
         self._new_kmers[lexlo_key] = value
+        return in_new_kmers or (in_ra_parser and not is_excluded)
 
     def __delitem__(self, item):
         lexlo_string = lexlo(item)
         if lexlo_string in self._exclusion_set:
             raise KeyError
+        if self.n_edges is not None:
+            self.n_edges -= self._count_edges_of(self[lexlo_string]) + \
+                self._count_edges_from_lesser_neighbors(lexlo_string)
         in_new_kmers = lexlo_string in self._new_kmers
         in_ra_parser = lexlo_string in self.ra_parser
         if in_new_kmers:
@@ -109,17 +169,24 @@ class CortexGraphMapping(MutableMapping):
         return len(self.ra_parser) + len(self._new_kmers) - len(
             self._exclusion_set) - self._n_duplicates
 
+    def degrees(self, kmer_string):
+        """Return the number of outgoing and incoming edges of a kmer string"""
+        lexlo_string = lexlo(kmer_string)
+        degrees = kmer_degrees(self[lexlo_string])
+        if lexlo_string != kmer_string:
+            return degrees[1], degrees[0]
+        return degrees
+
     def disconnect_kmers(self, first, second, colors):
         """Disconnect two kmers"""
         are_neighbors = False
         for ref_kmer, flip_kmer, ref_letter, flip_letter in find_all_neighbors(first, second):
             are_neighbors = True
             if colors:
-                self[ref_kmer.kmer] = ref_kmer
-                self[flip_kmer.kmer] = flip_kmer
+                self._store_edge_kmers(ref_kmer, flip_kmer)
             for color in colors:
-                ref_kmer.edges[color].remove_edge(ref_letter)
-                flip_kmer.edges[color].remove_edge(flip_letter)
+                self._change_edge(ref_kmer, flip_kmer, ref_letter, flip_letter, color,
+                                  is_added=False)
         if not are_neighbors:
             raise ValueError(
                 'first kmer ({}) cannot be connected to second kmer ({})'.format(first.kmer,
@@ -133,16 +200,63 @@ class CortexGraphMapping(MutableMapping):
         are_neighbors = False
         for ref_kmer, flip_kmer, ref_letter, flip_letter in find_all_neighbors(first, second):
             are_neighbors = True
-            self[ref_kmer.kmer] = ref_kmer
-            self[flip_kmer.kmer] = flip_kmer
-            ref_kmer.edges[color].add_edge(ref_letter)
-            flip_kmer.edges[color].add_edge(flip_letter)
+            self._store_edge_kmers(ref_kmer, flip_kmer)
+            self._change_edge(ref_kmer, flip_kmer, ref_letter, flip_letter, color, is_added=True)
         if not are_neighbors:
             raise ValueError(
                 'first kmer ({}) cannot be connected to second kmer ({})'.format(first.kmer,
                                                                                  second.kmer)
             )
 
+    def _store_edge_kmers(self, ref_kmer, flip_kmer):
+        for kmer in (ref_kmer, flip_kmer):
+            if not self._set(kmer.kmer, kmer) and self.n_edges is not None:
+                self.n_edges += self._count_edges_of(kmer) + \
+                    self._count_edges_from_lesser_neighbors(kmer.kmer)
+
+    def _count_edges_of(self, kmer):
+        """Count the edges that are counted on a kmer: edges to greater kmers and a self edge"""
+        n_edges = sum(1 for neighbor in lexlo_neighbors_of(kmer)
+                      if neighbor > kmer.kmer and neighbor in self)
+        return n_edges + has_self_edge(kmer)
+
+    def _count_edges_from_lesser_neighbors(self, lexlo_string):
+        """Count the edges that are counted on lesser kmers and connect them to a kmer string"""
+        n_edges = 0
+        for neighbor in lexlo_kmer_strings_next_to(lexlo_string):
+            if neighbor < lexlo_string:
+                neighbor_kmer = self.get(neighbor)
+                if neighbor_kmer is not None:
+                    n_edges += sum(1 for n in lexlo_neighbors_of(neighbor_kmer)
+                                   if n == lexlo_string)
+        return n_edges
+
+    def _change_edge(self, ref_kmer, flip_kmer, ref_letter, flip_letter, color, is_added):
+        """Add or remove an edge and update the number of edges
+
+        Edges are counted on their lexicographically lower kmer, and a kmer with self edges has one
+        self edge (see :py:class:`EdgeView`).
+        """
+        is_self_edge = ref_kmer.kmer == flip_kmer.kmer
+        if self.n_edges is not None:
+            if is_self_edge:
+                self.n_edges -= has_self_edge(ref_kmer)
+            else:
+                if ref_kmer.kmer < flip_kmer.kmer:
+                    lower_kmer, lower_letter = ref_kmer, ref_letter
+                else:
+                    lower_kmer, lower_letter = flip_kmer, flip_letter
+                if lower_kmer.edges[color].is_edge(lower_letter) != is_added:
+                    self.n_edges += 1 if is_added else -1
+        if is_added:
+            ref_kmer.edges[color].add_edge(ref_letter)
+            flip_kmer.edges[color].add_edge(flip_letter)
+        else:
+            ref_kmer.edges[color].remove_edge(ref_letter)
+            flip_kmer.edges[color].remove_edge(flip_letter)
+        if self.n_edges is not None and is_self_edge:
+            self.n_edges += has_self_edge(ref_kmer)
+
 
 @attr.s(slots=True)
 class CortexDiGraph(Collection):
@@ -220,10 +334,15 @@ class CortexDiGraph(Collection):
                     yield (in_node, node)
 
     def out_degree(self, node):
-        return len(list(self.out_edges(node)))
+        return self._kmer_mapping.degrees(node)[0]
 
     def in_degree(self, node):
-        return len(list(self.in_edges(node)))
+        return self._kmer_mapping.degrees(node)[1]
+
+    def number_of_edges(self):
+        if self._kmer_mapping.n_edges is None:
+            self._kmer_mapping.n_edges = sum(1 for _ in EdgeView(self)())
+        return self._kmer_mapping.n_edges
 
     def add_edge(self, first, second, *, key):
         """Note: edges can only be added to existing nodes"""
@@ -334,6 +453,7 @@ class ConsistentCortexDiGraph(Collection):
     """Graph that stores kmer strings that are consistent with each other"""
     _kmer_mapping = attr.ib(attr.Factory(dict))
     graph = attr.ib(attr.Factory(dict))  # refers to graph attribute of nx.Graph
+    _n_edges = attr.ib(None, init=False)
 
     def __attrs_post_init__(self):
         if isinstance(self._kmer_mapping, (CortexDiGraph, ConsistentCortexDiGraph)):
@@ -383,20 +503,59 @@ class ConsistentCortexDiGraph(Collection):
         return NodeView(self._kmer_mapping)
 
     def add_node(self, kmer_string, *, kmer):
+        if self._n_edges is not None:
+            if kmer_string in self._kmer_mapping:
+                self._n_edges -= self._count_out_edges(kmer_string,
+                                                       self._kmer_mapping[kmer_string])
+            else:
+                self._n_edges += self._count_in_edges_from_other_nodes(kmer_string)
         self._kmer_mapping[kmer_string] = kmer
+        if self._n_edges is not None:
+            self._n_edges += self._count_out_edges(kmer_string, kmer)
+
+    def _count_out_edges(self, node, kmer):
+        return sum(1 for out_node in out_nodes_of(node, kmer) if out_node in self._kmer_mapping)
+
+    def _count_in_edges_from_other_nodes(self, node):
+        n_edges = 0
+        for letter in 'ACGT':
+            in_node = letter + node[:-1]
+            if in_node != node and in_node in self._kmer_mapping:
+                n_edges += sum(1 for out_node in out_nodes_of(in_node, self._kmer_mapping[in_node])
+                               if out_node == node)
+        return n_edges
 
     def remove_edge(self, k, v, key):
+        if self._n_edges is not None:
+            self._n_edges -= self._count_out_edges_of_nodes({k, v})
         disconnect_kmers(self._kmer_mapping[k], self._kmer_mapping[v], [key])
+        if self._n_edges is not None:
+            self._n_edges += self._count_out_edges_of_nodes({k, v})
+
+    def _count_out_edges_of_nodes(self, nodes):
+        return sum(self._count_out_edges(node, self._kmer_mapping[node]) for node in nodes)
 
     @property
     def edges(self):
         return EdgeView(self)
 
+    def degrees(self, node):
+        kmer = self._kmer_mapping[node]
+        degrees = kmer_degrees(kmer)
+        if kmer.kmer != node:
+            return degrees[1], degrees[0]
+        return degrees
+
     def out_degree(self, node):
-        return len(list(self.out_edges(node)))
+        return self.degrees(node)[0]
 
     def in_degree(self, node):
-        return len(list(self.in_edges(node)))
+        return self.degrees(node)[1]
+
+    def number_of_edges(self):
+        if self._n_edges is None:
+            self._n_edges = sum(1 for _ in EdgeView(self)())
+        return self._n_edges
 
     def out_edges(self, node, keys=False, default=None, data=None):
         kmer = self._kmer_mapping[node]
@@ -473,7 +632,7 @@ class EdgeView(object):
                 yield from self._edge_iter(data=data, keys=keys)
 
     def __len__(self):
-        return len(list(self()))
+        return self.graph.number_of_edges()
 
     def __iter__(self):
         return self()
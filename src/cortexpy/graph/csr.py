@@ -0,0 +1,314 @@
+"""Compressed sparse row graphs
+===============================
+
+A :py:class:`CSRGraph` is a one-shot export of a :py:class:`~cortexpy.graph.cortex.CortexDiGraph`
+or :py:class:`~cortexpy.graph.cortex.ConsistentCortexDiGraph` into integer-indexed arrays.
+Nodes are numbered in the order in which the graph iterates them, and the edges of each color
+are stored as compressed sparse row (CSR) adjacency arrays: the neighbors of node ``i`` are
+``indices[indptr[i]:indptr[i + 1]]``. Only edges between nodes of the graph are exported.
+
+The export reads the edge bytes of each node once. Neighbors are derived from the edge bytes of
+all nodes at once and resolved to node indices with one sorted lookup per color and
+orientation, so no kmer strings are built for edges.
+
+The traversal, degree and component functions in this module operate on the arrays and do not
+decode kmers or edges, so graph-wide passes run at NumPy speed.
+"""
+import attr
+import numpy as np
+
+from cortexpy.constants import EdgeTraversalOrientation
+from cortexpy.edge_set import (
+    INCOMING_SIDE, OUTGOING_SIDE, SIDE_DEGREES, SIDE_EDGE_INDICES, neighbor_letter_matrix,
+)
+from cortexpy.graph.parser.constants import LETTER_TO_NUM
+from cortexpy.graph.parser.kmer import lexlo_letter_matrix
+
+INDEX_DTYPE = np.int64
+
+
+def letter_matrix_of(kmer_strings, kmer_size):
+    """Return the (number of kmers, kmer size) letter number matrix of kmer strings"""
+    letter_vals = np.frombuffer(''.join(kmer_strings).encode().translate(LETTER_TO_NUM),
+                                dtype=np.uint8)
+    return letter_vals.reshape(len(kmer_strings), kmer_size)
+
+
+def revcomp_edge_bytes(edge_bytes):
+    """Return the edge bytes of the reverse complements of kmers
+
+    The incoming edge of a kmer from letter x is the outgoing edge of its reverse complement to
+    the complement of x, so the two halves of each edge byte swap places.
+    """
+    return (edge_bytes << 4) | (edge_bytes >> 4)
+
+
+def row_keys(letter_vals):
+    """Return one sortable key per row of a letter number matrix"""
+    letter_vals = np.ascontiguousarray(letter_vals)
+    return letter_vals.view(np.dtype((np.void, letter_vals.shape[1]))).ravel()
+
+
+@attr.s(slots=True)
+class LetterMatrixIndex(object):
+    """Looks up the row indices of rows of a letter number matrix"""
+    order = attr.ib()
+    sorted_keys = attr.ib()
+
+    @classmethod
+    def from_letter_matrix(cls, letter_vals):
+        keys = row_keys(letter_vals)
+        order = np.argsort(keys, kind='mergesort')
+        return cls(order, keys[order])
+
+    def rows_of(self, letter_vals):
+        """Return the row index of each row of letter_vals and a mask of rows that were found"""
+        if len(self.order) == 0:
+            return np.zeros(len(letter_vals), dtype=INDEX_DTYPE), np.zeros(len(letter_vals),
+                                                                           dtype=bool)
+        keys = row_keys(letter_vals)
+        positions = np.minimum(np.searchsorted(self.sorted_keys, keys), len(self.order) - 1)
+        return self.order[positions], self.sorted_keys[positions] == keys
+
+
+def edges_to_csr(sources, targets, n_nodes):
+    """Return the indptr and indices arrays of the edges from sources to targets
+
+    The order of the neighbors of each node is the order of their edges.
+    """
+    sources = np.asarray(sources, dtype=INDEX_DTYPE)
+    targets = np.asarray(targets, dtype=INDEX_DTYPE)
+    indptr = np.zeros(n_nodes + 1, dtype=INDEX_DTYPE)
+    np.cumsum(np.bincount(sources, minlength=n_nodes), out=indptr[1:])
+    return indptr, targets[np.argsort(sources, kind='mergesort')]
+
+
+def neighbors_of(indptr, indices, nodes):
+    """Return the neighbors of all nodes, in the order of nodes"""
+    nodes = np.asarray(nodes, dtype=INDEX_DTYPE)
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return indices[:0]
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + \
+        np.arange(total, dtype=INDEX_DTYPE)
+    return indices[offsets]
+
+
+def unique_in_order(values):
+    """Return the unique values in the order of their first occurrence"""
+    _, first_indices = np.unique(values, return_index=True)
+    return values[np.sort(first_indices)]
+
+
+def breadth_first_order(indptr, indices, sources):
+    """Return the nodes reachable from sources in breadth-first order
+
+    Each level of the search is expanded in one vectorized step.
+    """
+    visited = np.zeros(len(indptr) - 1, dtype=bool)
+    frontier = unique_in_order(np.asarray(sources, dtype=INDEX_DTYPE))
+    visited[frontier] = True
+    levels = []
+    while len(frontier):
+        levels.append(frontier)
+        neighbors = neighbors_of(indptr, indices, frontier)
+        frontier = unique_in_order(neighbors[~visited[neighbors]])
+        visited[frontier] = True
+    if not levels:
+        return np.zeros(0, dtype=INDEX_DTYPE)
+    return np.concatenate(levels)
+
+
+def depth_first_order(indptr, indices, source):
+    """Return the nodes reachable from source in depth-first preorder"""
+    next_positions = indptr[:-1].tolist()
+    ends = indptr[1:].tolist()
+    indices = indices.tolist()
+    visited = bytearray(len(ends))
+    visited[source] = 1
+    order = [source]
+    stack = [source]
+    while stack:
+        node = stack[-1]
+        position = next_positions[node]
+        if position == ends[node]:
+            stack.pop()
+            continue
+        next_positions[node] = position + 1
+        child = indices[position]
+        if not visited[child]:
+            visited[child] = 1
+            order.append(child)
+            stack.append(child)
+    return np.array(order, dtype=INDEX_DTYPE)
+
+
+def connected_component_labels(indptr, indices):
+    """Return a component id for each node
+
+    The adjacency needs to contain each edge in both directions. Labels are propagated to the
+    lowest node index of each component with min-label hooking and pointer jumping. Components
+    are numbered in the order of their lowest node index.
+    """
+    n_nodes = len(indptr) - 1
+    labels = np.arange(n_nodes, dtype=INDEX_DTYPE)
+    has_neighbors = np.diff(indptr) > 0
+    starts = indptr[:-1][has_neighbors]
+    while len(indices):
+        new_labels = labels.copy()
+        new_labels[has_neighbors] = np.minimum(labels[has_neighbors],
+                                               np.minimum.reduceat(labels[indices], starts))
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+    return np.unique(labels, return_inverse=True)[1].astype(INDEX_DTYPE)
+
+
+@attr.s(slots=True)
+class CSRGraph(object):
+    """Integer-indexed edges of a Cortex graph with one edge list per color and orientation
+
+    Outgoing and incoming edges are exported separately, because the incoming edges of the
+    lexlo nodes of a CortexDiGraph are not the reverse of its outgoing edges. Adjacency arrays
+    are built from the edge lists on first use. An orientation of None returns the adjacency of
+    outgoing and incoming edges in both directions. Edge bytes are stored in the orientation of
+    each node.
+    """
+    nodes = attr.ib()
+    node_index = attr.ib()
+    out_edges = attr.ib()
+    in_edges = attr.ib()
+    edge_bytes = attr.ib()
+    graph = attr.ib(attr.Factory(dict))
+    _adjacencies = attr.ib(attr.Factory(dict), init=False)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Export the nodes and edges of a CortexDiGraph or ConsistentCortexDiGraph
+
+        Nodes of a CortexDiGraph are lexlo kmer strings, so edges of a CortexDiGraph are
+        exported to the lexlo representation of each neighbor.
+        """
+        nodes_and_kmers = list(graph.nodes(data=True))
+        nodes = [node for node, _ in nodes_and_kmers]
+        node_index = {node: idx for idx, node in enumerate(nodes)}
+        num_colors = max([graph.graph.get('num_colors', 0)] +
+                         [kmer.num_colors for _, kmer in nodes_and_kmers])
+        edge_bytes = np.zeros((len(nodes), num_colors), dtype=np.uint8)
+        is_lexlo = np.ones(len(nodes), dtype=bool)
+        for idx, (node, kmer) in enumerate(nodes_and_kmers):
+            edge_bytes[idx, :kmer.num_colors] = [edge_set.byte for edge_set in kmer.edges]
+            is_lexlo[idx] = kmer.kmer == node
+        edge_bytes[~is_lexlo] = revcomp_edge_bytes(edge_bytes[~is_lexlo])
+
+        kmer_size = len(nodes[0]) if nodes else graph.graph.get('kmer_size', 0)
+        letter_vals = letter_matrix_of(nodes, kmer_size)
+        node_lookup = LetterMatrixIndex.from_letter_matrix(letter_vals)
+
+        def export_edges(color, edge_indices):
+            sources, neighbors = neighbor_letter_matrix(letter_vals, edge_bytes[:, color],
+                                                        edge_indices)
+            if not graph.is_consistent():
+                neighbors = lexlo_letter_matrix(neighbors)
+            targets, found = node_lookup.rows_of(neighbors)
+            sources, targets = sources[found], targets[found]
+            order = np.argsort(sources, kind='mergesort')
+            return sources[order].astype(INDEX_DTYPE), targets[order].astype(INDEX_DTYPE)
+
+        return cls(nodes, node_index,
+                   [export_edges(color, SIDE_EDGE_INDICES[OUTGOING_SIDE])
+                    for color in range(num_colors)],
+                   [export_edges(color, SIDE_EDGE_INDICES[INCOMING_SIDE])
+                    for color in range(num_colors)],
+                   edge_bytes,
+                   graph=graph.graph)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def num_colors(self):
+        return len(self.out_edges)
+
+    @property
+    def num_edges(self):
+        return sum(len(sources) for sources, _ in self.out_edges)
+
+    def edges(self, color=None, orientation=EdgeTraversalOrientation.original):
+        """Return the node indices and neighbor node indices of edges in color or in all colors
+
+        Neighbors are successors in original orientation and predecessors in reverse
+        orientation.
+        """
+        if orientation == EdgeTraversalOrientation.original:
+            edges = self.out_edges
+        else:
+            edges = self.in_edges
+        if color is not None:
+            return edges[color]
+        if self.num_colors == 0:
+            empty = np.zeros(0, dtype=INDEX_DTYPE)
+            return empty, empty
+        return (np.concatenate([sources for sources, _ in edges]),
+                np.concatenate([targets for _, targets in edges]))
+
+    def adjacency(self, color=None, orientation=EdgeTraversalOrientation.original):
+        """Return the indptr and indices arrays of edges in color or in all colors"""
+        key = (color, orientation)
+        if key not in self._adjacencies:
+            if orientation is None:
+                sources, targets = zip(*(self.edges(color, o) for o in EdgeTraversalOrientation))
+                sources, targets = (np.concatenate(sources + targets),
+                                    np.concatenate(targets + sources))
+            else:
+                sources, targets = self.edges(color, orientation)
+            self._adjacencies[key] = edges_to_csr(sources, targets, len(self))
+        return self._adjacencies[key]
+
+    def out_degree(self, color=None):
+        return np.diff(self.adjacency(color, EdgeTraversalOrientation.original)[0])
+
+    def in_degree(self, color=None):
+        return np.diff(self.adjacency(color, EdgeTraversalOrientation.reverse)[0])
+
+    def kmer_degrees(self):
+        """Return the number of outgoing and incoming edges of each node summed over colors
+
+        Unlike :py:meth:`out_degree` and :py:meth:`in_degree`, edges to kmers that are not in
+        the graph are counted, as in :py:meth:`CortexDiGraph.out_degree`.
+        """
+        return (SIDE_DEGREES[OUTGOING_SIDE][self.edge_bytes].sum(axis=1, dtype=INDEX_DTYPE),
+                SIDE_DEGREES[INCOMING_SIDE][self.edge_bytes].sum(axis=1, dtype=INDEX_DTYPE))
+
+    def edge_nodes(self):
+        """Return each node without outgoing or incoming edges and the direction of its end
+
+        Nodes are returned in node order. A node without edges is returned once for each
+        direction.
+        """
+        out_degree, in_degree = self.kmer_degrees()
+        node_indices, ends = np.nonzero(np.stack([out_degree == 0, in_degree == 0], axis=1))
+        directions = (EdgeTraversalOrientation.original, EdgeTraversalOrientation.reverse)
+        return [(self.nodes[idx], directions[end])
+                for idx, end in zip(node_indices.tolist(), ends.tolist())]
+
+    def bfs(self, sources, color=None, orientation=EdgeTraversalOrientation.original):
+        """Return the indices of nodes reachable from the source nodes in breadth-first order"""
+        if isinstance(sources, str):
+            sources = [sources]
+        return breadth_first_order(*self.adjacency(color, orientation),
+                                   [self.node_index[s] for s in sources])
+
+    def dfs(self, source, color=None, orientation=EdgeTraversalOrientation.original):
+        """Return the indices of nodes reachable from the source node in depth-first preorder"""
+        return depth_first_order(*self.adjacency(color, orientation), self.node_index[source])
+
+    def components(self, color=None):
+        """Return the weakly connected component id of each node"""
+        return connected_component_labels(*self.adjacency(color, None))
+
+    def node_strings(self, node_indices):
+        return [self.nodes[idx] for idx in node_indices]
@@ -5,15 +5,18 @@ This module contains classes and functions for inspecting, manipulating, and tra
 """
 import collections
 import logging
+import multiprocessing
 from collections import OrderedDict
 
 import attr
 import networkx as nx
+import numpy as np
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
 
 from cortexpy.constants import EdgeTraversalOrientation
 from cortexpy.graph.cortex import CortexDiGraph, ConsistentCortexDiGraph
+from cortexpy.graph.csr import CSRGraph
 from cortexpy.graph.parser.kmer import revcomp_target_to_match_ref
 from cortexpy.graph.serializer.unitig import UnitigCollapser
 from cortexpy.links import UnitigLinkWalker, LinkedGraphTraverser
@@ -79,39 +82,60 @@ class Interactor(object):
         self.graph.remove_nodes_from(nodes_to_prune)
         return self
 
-    def make_graph_nodes_consistent(self, seed_kmer_strings=None):
+    def make_graph_nodes_consistent(self, seed_kmer_strings=None, n_workers=1):
         """
         Take a Cortex graph and make all nodes have kmer_strings that are consistent with each
         other. If a seed kmer string is provided, then start with that seed kmer.
+
+        If n_workers is not 1, then the connected components of the graph are made consistent
+        independently by a pool of n_workers processes (0 or None: number of CPUs).
         """
         if self.graph.is_consistent():
             return self
         if seed_kmer_strings is None:
             seed_kmer_strings = []
-        graph = CortexDiGraph(self.graph)
+        if n_workers != 1:
+            return self._make_components_consistent(list(seed_kmer_strings), n_workers)
         new_graph = ConsistentCortexDiGraph(graph=self.graph.graph)
+        for kmer_string, lexlo_kmer_string in consistent_kmer_strings(self.graph,
+                                                                      seed_kmer_strings):
+            new_graph.add_node(kmer_string, kmer=self.graph.node[lexlo_kmer_string])
+        self.graph = new_graph
+        return self
 
-        seeds = SeedKmerStringIterator.from_all_kmer_strings_and_seeds(self.graph.nodes(),
-                                                                       seed_kmer_strings)
-
-        for seed, lexlo_seed in seeds:
-            new_graph.add_node(seed, kmer=self.graph.node[lexlo_seed])
-            seeds.remove(lexlo_seed)
-            for source, sink, key, direction in nx.edge_dfs(graph, lexlo_seed, 'ignore'):
-                if direction == 'forward':
-                    rc_after_ref_kmer = True
-                    ref, target = source, sink
-                elif direction == 'reverse':
-                    ref, target = sink, source
-                    rc_after_ref_kmer = False
-                else:
-                    raise Exception("unknown direction: {}".format(direction))
-                if ref not in new_graph.node:
-                    ref = revcomp(ref)
-                    rc_after_ref_kmer = not rc_after_ref_kmer
-                matched_target, _ = revcomp_target_to_match_ref(target, ref, rc_after_ref_kmer)
-                new_graph.add_node(matched_target, kmer=graph.node[matched_target])
-                seeds.remove(lexlo(matched_target))
+    def _make_components_consistent(self, seed_kmer_strings, n_workers):
+        kmer_mapping = dict(self.graph.nodes(data=True))
+        csr = CSRGraph.from_graph(CortexDiGraph(kmer_mapping, graph=self.graph.graph))
+        labels = csr.components()
+        component_sizes = np.bincount(labels)
+        n_components = len(component_sizes)
+        components = np.split(np.argsort(labels, kind='mergesort'),
+                              np.cumsum(component_sizes)[:-1])
+        component_seeds = [[] for _ in range(n_components)]
+        for seed in seed_kmer_strings:
+            node_idx = csr.node_index.get(lexlo(seed))
+            if node_idx is not None:
+                component_seeds[int(labels[node_idx])].append(seed)
+
+        # Components are stitched together in the order in which they are reached when the graph
+        # is made consistent in one process: components of seeds first, last seed first.
+        component_order = OrderedDict()
+        for seed in reversed(seed_kmer_strings):
+            node_idx = csr.node_index.get(lexlo(seed))
+            if node_idx is not None:
+                component_order[int(labels[node_idx])] = None
+        for label in range(n_components):
+            component_order.setdefault(label, None)
+        logger.info('Making %s components consistent', n_components)
+
+        work = [({node: kmer_mapping[node] for node in csr.node_strings(components[label])},
+                 self.graph.graph,
+                 component_seeds[label]) for label in component_order]
+        new_graph = ConsistentCortexDiGraph(graph=self.graph.graph)
+        for kmer_strings in map_components(_consistent_kmer_strings_of_component, work,
+                                           n_workers):
+            for kmer_string, lexlo_kmer_string in kmer_strings:
+                new_graph.add_node(kmer_string, kmer=kmer_mapping[lexlo_kmer_string])
         self.graph = new_graph
         return self
 
@@ -234,6 +258,61 @@ class SeedKmerStringIterator:
         self._seen_lexlo_kmer_strings.add(lexlo_kmer_string)
 
 
+def consistent_kmer_strings(graph, seed_kmer_strings):
+    """Yield kmer strings of a graph that are consistent with each other and their lexlo strings
+
+    Each connected component is oriented by the first seed that is in the component or by its
+    first kmer.
+    """
+    graph = CortexDiGraph(graph)
+    seen = set()
+    seeds = SeedKmerStringIterator.from_all_kmer_strings_and_seeds(graph.nodes(),
+                                                                   seed_kmer_strings)
+    for seed, lexlo_seed in seeds:
+        seen.add(seed)
+        yield seed, lexlo_seed
+        seeds.remove(lexlo_seed)
+        for source, sink, key, direction in nx.edge_dfs(graph, lexlo_seed, 'ignore'):
+            if direction == 'forward':
+                rc_after_ref_kmer = True
+                ref, target = source, sink
+            elif direction == 'reverse':
+                ref, target = sink, source
+                rc_after_ref_kmer = False
+            else:
+                raise Exception("unknown direction: {}".format(direction))
+            if ref not in seen:
+                ref = revcomp(ref)
+                rc_after_ref_kmer = not rc_after_ref_kmer
+            matched_target, _ = revcomp_target_to_match_ref(target, ref, rc_after_ref_kmer)
+            lexlo_target = lexlo(matched_target)
+            seen.add(matched_target)
+            yield matched_target, lexlo_target
+            seeds.remove(lexlo_target)
+
+
+def _consistent_kmer_strings_of_component(component):
+    kmer_mapping, graph_attributes, seed_kmer_strings = component
+    graph = CortexDiGraph(kmer_mapping, graph=graph_attributes)
+    return list(consistent_kmer_strings(graph, seed_kmer_strings))
+
+
+def map_components(function, components, n_workers):
+    """Apply function to each component and yield the results in order
+
+    If n_workers is 1, then all components are processed in this process. Otherwise, components
+    are processed by a pool of n_workers processes (0 or None: number of CPUs).
+    """
+    if not n_workers:
+        n_workers = multiprocessing.cpu_count()
+    if n_workers == 1 or len(components) < 2:
+        yield from map(function, components)
+        return
+    chunksize = max(1, len(components) // (4 * n_workers))
+    with multiprocessing.Pool(n_workers) as pool:
+        yield from pool.imap(function, components, chunksize=chunksize)
+
+
 def node_generator_from_edges(edge_generator):
     for edge in edge_generator:
         if len(edge) == 2:
@@ -312,8 +391,12 @@ def out_nodes_of(graph):
 def edge_nodes_of(graph):
     """Find all edge nodes of a graph
 
-    Second return value is direction of edge.
+    Second return value is direction of edge. The edge nodes of Cortex graphs are found in the
+    edge bytes of a :py:class:`CSRGraph` export.
     """
+    if isinstance(graph, (CortexDiGraph, ConsistentCortexDiGraph)):
+        yield from CSRGraph.from_graph(graph).edge_nodes()
+        return
     for node in graph.nodes():
         if graph.out_degree(node) == 0:
             yield (node, EdgeTraversalOrientation.original)
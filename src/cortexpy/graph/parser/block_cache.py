@@ -0,0 +1,104 @@
+"""Shared block cache
+=====================
+
+Several :py:class:`RandomAccess` objects of the same process often read the same regions of the
+same graph files, for example when a graph is opened once per request, or when many graphs
+are traversed together. A :py:class:`BlockCache` holds fixed-size, aligned blocks of graph
+files in one byte-budgeted cache that all of these objects read through.
+
+Blocks are keyed by the identity of a file (device, inode, size and modification time) and the
+index of the block, so handles of the same file share blocks and blocks of a file that has
+changed are not reused. Handles without a file descriptor are read directly.
+"""
+import os
+import threading
+
+import attr
+
+from .record_cache import RecordCache
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+DEFAULT_BLOCK_CACHE_BYTES = 256 * 1024 * 1024
+
+_shared_block_cache = None
+
+
+def file_identity(graph_handle):
+    """Return a key that identifies the file of a handle or None if it has no file descriptor"""
+    try:
+        stat = os.fstat(graph_handle.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def shared_block_cache(max_bytes=None, block_size=DEFAULT_BLOCK_SIZE):
+    """Return the block cache of this process
+
+    The cache is created on first use with max_bytes or the default budget. If max_bytes is
+    given later, then the budget of the existing cache is changed.
+    """
+    global _shared_block_cache
+    if _shared_block_cache is None:
+        if max_bytes is None:
+            max_bytes = DEFAULT_BLOCK_CACHE_BYTES
+        _shared_block_cache = BlockCache(max_bytes, block_size=block_size)
+    elif max_bytes is not None:
+        _shared_block_cache.resize(max_bytes)
+    return _shared_block_cache
+
+
+@attr.s(slots=True)
+class BlockCache(object):
+    """A byte-budgeted cache of aligned blocks of files"""
+    max_bytes = attr.ib()
+    block_size = attr.ib(DEFAULT_BLOCK_SIZE)
+    _blocks = attr.ib(init=False)
+    _lock = attr.ib(attr.Factory(threading.Lock), init=False)
+
+    def __attrs_post_init__(self):
+        if self.block_size < 1:
+            raise ValueError('Block size ({}) has to be greater than 0'.format(self.block_size))
+        self._blocks = RecordCache(self.max_bytes)
+
+    def resize(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._blocks.resize(max_bytes)
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+
+    @property
+    def stats(self):
+        return self._blocks.stats
+
+    def read(self, graph_handle, file_key, offset, length):
+        """Read length bytes at offset of a graph handle through the cache
+
+        file_key is the :py:func:`file_identity` of the handle. If it is None, then the handle is
+        read directly.
+        """
+        if file_key is None:
+            graph_handle.seek(offset)
+            return graph_handle.read(length)
+        first_block = offset // self.block_size
+        last_block = (offset + max(length, 1) - 1) // self.block_size
+        start = offset - first_block * self.block_size
+        if first_block == last_block:
+            return self._block(graph_handle, file_key, first_block)[start:(start + length)]
+        data = b''.join(self._block(graph_handle, file_key, block_idx)
+                        for block_idx in range(first_block, last_block + 1))
+        return data[start:(start + length)]
+
+    def _block(self, graph_handle, file_key, block_idx):
+        key = (file_key, block_idx)
+        with self._lock:
+            block = self._blocks.get(key)
+        if block is None:
+            graph_handle.seek(block_idx * self.block_size)
+            block = graph_handle.read(self.block_size)
+            with self._lock:
+                self._blocks.put(key, block, len(block))
+        return block
@@ -0,0 +1,337 @@
+"""Block-compressed Cortex graphs
+=================================
+
+A block-compressed Cortex graph is a Cortex graph that is stored as a series of independently
+compressed gzip members, in the spirit of BGZF. The first member contains the graph header and
+every following member contains a fixed number of sorted records (the last member may contain
+fewer). Concatenated gzip members are valid gzip, so ``zcat graph.ctx.gz`` restores the original
+Cortex graph.
+
+The gzip header of every member has an extra ``CX`` subfield that stores the size of the member,
+the number of records in the member and the kmer of its first record. A block index of the graph
+is built from these subfields by hopping from member to member without decompressing any
+records. The block index is a :py:class:`FenceIndex` with one fence kmer per block, so a kmer
+lookup costs a search of the fence kmers and the decompression of one block.
+"""
+import gzip
+import io
+import struct
+import zlib
+
+import attr
+import numpy as np
+
+from .constants import UINT64_T
+from .fence_index import FenceIndex
+from .header import Header
+from .record_array import KmerRecordArray
+
+DEFAULT_RECORDS_PER_BLOCK = 4096
+DEFAULT_COMPRESSION_LEVEL = 6
+GZIP_MAGIC = b'\x1f\x8b'
+GZIP_FEXTRA = 4
+BLOCK_SUBFIELD_ID = b'CX'
+MEMBER_HEADER_FORMAT = '<2sBBIBBH'
+SUBFIELD_HEADER_FORMAT = '<2sH'
+BLOCK_SUBFIELD_FORMAT = '<II'
+MEMBER_TRAILER_SIZE = 8
+
+
+def peek(stream, size):
+    """Return the next size bytes of a stream without consuming them"""
+    if hasattr(stream, 'peek'):
+        return stream.peek(size)[:size]
+    if hasattr(stream, 'getbuffer'):
+        position = stream.tell()
+        return bytes(stream.getbuffer()[position:(position + size)])
+    if stream.seekable():
+        position = stream.tell()
+        data = stream.read(size)
+        stream.seek(position)
+        return data
+    return b''
+
+
+def is_block_compressed(stream):
+    """Return True if the stream is positioned at the start of a block-compressed graph"""
+    member_header_size = struct.calcsize(MEMBER_HEADER_FORMAT)
+    start = peek(stream, member_header_size + len(BLOCK_SUBFIELD_ID))
+    return (start[:len(GZIP_MAGIC)] == GZIP_MAGIC
+            and len(start) > 3 and start[3] & GZIP_FEXTRA
+            and start[member_header_size:] == BLOCK_SUBFIELD_ID)
+
+
+def decompressed_stream(stream):
+    """Return a stream of the decompressed graph if the stream contains gzipped data
+
+    Both block-compressed and plain gzipped Cortex graphs are decompressed.
+    """
+    if peek(stream, len(GZIP_MAGIC)) == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=stream, mode='rb')
+    return stream
+
+
+def compress_block(data, n_records=0, first_kmer=b'', level=DEFAULT_COMPRESSION_LEVEL):
+    """Return a gzip member that contains data and a ``CX`` subfield"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    deflated = compressor.compress(data) + compressor.flush()
+    subfield_size = struct.calcsize(BLOCK_SUBFIELD_FORMAT) + len(first_kmer)
+    extra_size = struct.calcsize(SUBFIELD_HEADER_FORMAT) + subfield_size
+    block_size = (struct.calcsize(MEMBER_HEADER_FORMAT) + extra_size + len(deflated)
+                  + MEMBER_TRAILER_SIZE)
+    return b''.join((
+        struct.pack(MEMBER_HEADER_FORMAT, GZIP_MAGIC, zlib.DEFLATED, GZIP_FEXTRA, 0, 0, 255,
+                    extra_size),
+        struct.pack(SUBFIELD_HEADER_FORMAT, BLOCK_SUBFIELD_ID, subfield_size),
+        struct.pack(BLOCK_SUBFIELD_FORMAT, block_size, n_records),
+        first_kmer,
+        deflated,
+        struct.pack('<II', zlib.crc32(data), len(data) & 0xffffffff),
+    ))
+
+
+@attr.s(slots=True)
+class BlockHeader(object):
+    """The gzip header of one block of a block-compressed graph"""
+    block_size = attr.ib()
+    n_records = attr.ib()
+    first_kmer = attr.ib()
+    data_offset = attr.ib()
+
+    @classmethod
+    def from_stream(cls, stream):
+        """Read a block header and return None at the end of the stream"""
+        member_header_size = struct.calcsize(MEMBER_HEADER_FORMAT)
+        member_header = stream.read(member_header_size)
+        if member_header == b'':
+            return None
+        if len(member_header) != member_header_size:
+            raise ValueError('Block-compressed graph ends with a truncated block')
+        magic, _, flags, _, _, _, extra_size = struct.unpack(MEMBER_HEADER_FORMAT, member_header)
+        if magic != GZIP_MAGIC or not flags & GZIP_FEXTRA:
+            raise ValueError('Block does not start with a gzip header with extra fields')
+        extra = stream.read(extra_size)
+        subfield_header_size = struct.calcsize(SUBFIELD_HEADER_FORMAT)
+        offset = 0
+        while offset + subfield_header_size <= len(extra):
+            subfield_id, subfield_size = struct.unpack_from(SUBFIELD_HEADER_FORMAT, extra, offset)
+            offset += subfield_header_size
+            if subfield_id == BLOCK_SUBFIELD_ID:
+                block_size, n_records = struct.unpack_from(BLOCK_SUBFIELD_FORMAT, extra, offset)
+                first_kmer = extra[(offset + struct.calcsize(BLOCK_SUBFIELD_FORMAT)):
+                                   (offset + subfield_size)]
+                return cls(block_size=block_size,
+                           n_records=n_records,
+                           first_kmer=first_kmer,
+                           data_offset=member_header_size + extra_size)
+            offset += subfield_size
+        raise ValueError('Block has no {} subfield'.format(BLOCK_SUBFIELD_ID.decode()))
+
+
+def decompress_block(block, block_header):
+    return zlib.decompress(block[block_header.data_offset:-MEMBER_TRAILER_SIZE], -zlib.MAX_WBITS)
+
+
+@attr.s(slots=True)
+class BlockCompressedGraph(object):
+    """The header and block index of a block-compressed graph"""
+    graph_handle = attr.ib()
+    header = attr.ib()
+    n_records = attr.ib()
+    block_offsets = attr.ib()
+    fence_index = attr.ib()
+    end_offset = attr.ib()
+
+    @classmethod
+    def from_handle(cls, graph_handle):
+        graph_handle.seek(0)
+        header_block_header = BlockHeader.from_stream(graph_handle)
+        if header_block_header is None:
+            raise ValueError('Block-compressed graph is empty')
+        graph_handle.seek(0)
+        header_bytes = decompress_block(graph_handle.read(header_block_header.block_size),
+                                        header_block_header)
+        header = Header.from_stream(io.BytesIO(header_bytes))
+
+        block_offsets = []
+        block_n_records = []
+        first_kmers = []
+        offset = header_block_header.block_size
+        graph_handle.seek(offset)
+        block_header = BlockHeader.from_stream(graph_handle)
+        while block_header is not None:
+            block_offsets.append(offset)
+            block_n_records.append(block_header.n_records)
+            first_kmers.append(block_header.first_kmer)
+            offset += block_header.block_size
+            graph_handle.seek(offset)
+            block_header = BlockHeader.from_stream(graph_handle)
+
+        records_per_block = block_n_records[0] if block_n_records else DEFAULT_RECORDS_PER_BLOCK
+        if any(n != records_per_block for n in block_n_records[:-1]) or \
+                any(n < 1 or n > records_per_block for n in block_n_records[-1:]):
+            raise ValueError('All blocks except the last need to contain the same number of '
+                             'records')
+        n_records = sum(block_n_records)
+        fence_kmers = np.frombuffer(b''.join(first_kmers), dtype='<u8') \
+            .reshape(len(first_kmers), header.kmer_container_size)
+        fence_index = FenceIndex(interval=records_per_block,
+                                 body_size=n_records * header.record_size,
+                                 header_checksum=zlib.crc32(header_bytes),
+                                 fence_kmers=fence_kmers)
+        return cls(graph_handle=graph_handle,
+                   header=header,
+                   n_records=n_records,
+                   block_offsets=block_offsets,
+                   fence_index=fence_index,
+                   end_offset=offset)
+
+    @property
+    def body_offset(self):
+        """The offset of the first block of records"""
+        if self.block_offsets:
+            return self.block_offsets[0]
+        return self.end_offset
+
+    def block_reader(self):
+        return CompressedBlockReader(self)
+
+    def body_stream(self):
+        """Return a stream of the decompressed records"""
+        from .streaming import OffsetStream
+        return gzip.GzipFile(fileobj=OffsetStream(self.graph_handle, self.body_offset), mode='rb')
+
+
+@attr.s(slots=True)
+class CompressedBlockReader(object):
+    """Decompresses blocks of records and keeps the last block read
+
+    Drop-in replacement for :py:class:`FencedBlockReader`.
+    """
+    graph = attr.ib()
+    header = attr.ib(init=False)
+    n_records = attr.ib(init=False)
+    interval = attr.ib(init=False)
+    _block_idx = attr.ib(None, init=False)
+    _block = attr.ib(None, init=False)
+
+    def __attrs_post_init__(self):
+        self.header = self.graph.header
+        self.n_records = self.graph.n_records
+        self.interval = self.graph.fence_index.interval
+
+    def block(self, block_idx):
+        if block_idx != self._block_idx:
+            graph_handle = self.graph.graph_handle
+            graph_handle.seek(self.graph.block_offsets[block_idx])
+            block_header = BlockHeader.from_stream(graph_handle)
+            graph_handle.seek(self.graph.block_offsets[block_idx])
+            records = decompress_block(graph_handle.read(block_header.block_size), block_header)
+            self._block = KmerRecordArray.from_buffer(
+                records,
+                kmer_size=self.header.kmer_size,
+                kmer_container_size=self.header.kmer_container_size,
+                num_colors=self.header.num_colors)
+            self._block_idx = block_idx
+        return self._block
+
+    def block_and_offset_of_record(self, item):
+        return self.block(item // self.interval), item % self.interval
+
+    def location_of_block(self, block_idx):
+        """Return the byte offset and length of a compressed block in the graph"""
+        block_offsets = self.graph.block_offsets
+        if block_idx + 1 < len(block_offsets):
+            return block_offsets[block_idx], block_offsets[block_idx + 1] - block_offsets[block_idx]
+        return block_offsets[block_idx], self.graph.end_offset - block_offsets[block_idx]
+
+
+@attr.s(slots=True)
+class BlockCompressedWriter(object):
+    """Writes a block-compressed graph
+
+    The header is written on creation. If header_bytes is given, then it is written instead of a
+    dump of the header. Records are passed to :py:meth:`write` in sorted order and are compressed
+    each time a block is full.
+    """
+    output = attr.ib()
+    header = attr.ib()
+    header_bytes = attr.ib(None)
+    records_per_block = attr.ib(DEFAULT_RECORDS_PER_BLOCK)
+    level = attr.ib(DEFAULT_COMPRESSION_LEVEL)
+    _records = attr.ib(attr.Factory(bytearray), init=False)
+    _last_kmer = attr.ib(None, init=False)
+
+    def __attrs_post_init__(self):
+        if self.records_per_block < 1:
+            raise ValueError(
+                'Records per block ({}) has to be greater than 0'.format(self.records_per_block))
+        if self.header_bytes is None:
+            header_buffer = io.BytesIO()
+            self.header.dump(header_buffer)
+            self.header_bytes = header_buffer.getvalue()
+        self.output.write(compress_block(self.header_bytes, level=self.level))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write(self, data):
+        self._records += memoryview(data)
+        block_size = self.records_per_block * self.header.record_size
+        while len(self._records) >= block_size:
+            self._write_block(self._records[:block_size])
+            del self._records[:block_size]
+
+    def close(self):
+        if len(self._records) % self.header.record_size != 0:
+            raise ValueError('Records end with a truncated record')
+        if self._records:
+            self._write_block(self._records)
+            self._records = bytearray()
+
+    def _write_block(self, records):
+        record_array = KmerRecordArray.from_buffer(
+            bytes(records),
+            kmer_size=self.header.kmer_size,
+            kmer_container_size=self.header.kmer_container_size,
+            num_colors=self.header.num_colors)
+        kmer_words = record_array.kmer_words
+        if not record_array.is_sorted() or \
+                (self._last_kmer is not None and not self._last_kmer < kmer_words[0].tolist()):
+            raise ValueError('Graph records are not sorted by kmer')
+        self._last_kmer = kmer_words[-1].tolist()
+        first_kmer = bytes(records[:self.header.kmer_container_size * UINT64_T])
+        self.output.write(compress_block(bytes(records), n_records=len(record_array),
+                                         first_kmer=first_kmer, level=self.level))
+
+
+@attr.s(slots=True)
+class RecordingStream(object):
+    """Keeps a copy of all data read from a stream"""
+    stream = attr.ib()
+    data = attr.ib(attr.Factory(bytearray))
+
+    def read(self, size=-1):
+        data = self.stream.read(size)
+        self.data += data
+        return data
+
+
+def compress_graph(graph_stream, output, records_per_block=DEFAULT_RECORDS_PER_BLOCK,
+                   level=DEFAULT_COMPRESSION_LEVEL):
+    """Write the sorted Cortex graph in graph_stream as a block-compressed graph to output
+
+    graph_stream may be gzipped.
+    """
+    from .streaming import record_chunk_generator_from_stream_and_header
+
+    graph_stream = decompressed_stream(graph_stream)
+    header_stream = RecordingStream(graph_stream)
+    header = Header.from_stream(header_stream)
+    with BlockCompressedWriter(output, header, header_bytes=bytes(header_stream.data),
+                               records_per_block=records_per_block, level=level) as writer:
+        for chunk in record_chunk_generator_from_stream_and_header(graph_stream, header):
+            writer.write(chunk)
@@ -0,0 +1,165 @@
+"""Cortex graph Bloom filters
+=============================
+
+A Bloom filter sidecar file (``<graph>.bloom``) records which kmers may exist in a Cortex graph.
+:py:class:`RandomAccess` consults the filter before searching a graph for a kmer, so that most
+lookups of kmers that do not exist in the graph cost a few hash probes instead of a search of the
+graph.
+
+The filter is memory-mapped when it is opened (see :py:mod:`~cortexpy.graph.parser.sidecar`).
+"""
+import math
+import struct
+import zlib
+from io import SEEK_END
+
+import attr
+import numpy as np
+
+from .block_compressed import (
+    BlockCompressedGraph, GZIP_MAGIC, RecordingStream, decompressed_stream,
+    is_block_compressed, peek,
+)
+from .header import Header
+from .sidecar import MappedSidecar, map_sidecar
+from .streaming import kmer_record_array_generator_from_stream_and_header
+
+BLOOM_FILTER_MAGIC = b'CTXBLOOM'
+BLOOM_FILTER_VERSION = 1
+BLOOM_FILTER_SUFFIX = '.bloom'
+BLOOM_FILTER_HEADER_FORMAT = '<8sIIQQI4x'
+DEFAULT_BITS_PER_KMER = 10
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+MIX_MULTIPLIER_1 = 0xBF58476D1CE4E5B9
+MIX_MULTIPLIER_2 = 0x94D049BB133111EB
+SECOND_HASH_SEED = 0x9E3779B97F4A7C15
+
+
+def _mix(value):
+    """The splitmix64 finalizer of a Python int"""
+    value = ((value ^ (value >> 30)) * MIX_MULTIPLIER_1) & MASK_64
+    value = ((value ^ (value >> 27)) * MIX_MULTIPLIER_2) & MASK_64
+    return value ^ (value >> 31)
+
+
+def _mix_many(values):
+    """The splitmix64 finalizer of a uint64 array"""
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(MIX_MULTIPLIER_1)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(MIX_MULTIPLIER_2)
+    return values ^ (values >> np.uint64(31))
+
+
+def kmer_hashes(uints):
+    """Return the two hashes of the kmer words of one kmer that probes are derived from"""
+    first = 0
+    for word in uints:
+        first = _mix(first ^ int(word))
+    return first, _mix(first ^ SECOND_HASH_SEED) | 1
+
+
+def kmer_hashes_many(uint_matrix):
+    """Return the two hashes of every row of a kmer word matrix"""
+    first = np.zeros(len(uint_matrix), dtype=np.uint64)
+    for word_idx in range(uint_matrix.shape[1]):
+        first = _mix_many(first ^ uint_matrix[:, word_idx].astype(np.uint64))
+    return first, _mix_many(first ^ np.uint64(SECOND_HASH_SEED)) | np.uint64(1)
+
+
+@attr.s(slots=True)
+class BloomFilter(MappedSidecar):
+    """A Bloom filter of the kmers of a Cortex graph"""
+    SUFFIX = BLOOM_FILTER_SUFFIX
+    DESCRIPTION = 'Bloom filter'
+
+    n_hashes = attr.ib()
+    n_bits = attr.ib()
+    body_size = attr.ib()
+    header_checksum = attr.ib()
+    bits = attr.ib()
+
+    @classmethod
+    def empty(cls, n_kmers, bits_per_kmer=DEFAULT_BITS_PER_KMER, body_size=0,
+              header_checksum=0):
+        n_bits = max(64, math.ceil(n_kmers * bits_per_kmer / 64) * 64)
+        n_hashes = max(1, round(bits_per_kmer * math.log(2)))
+        return cls(n_hashes=n_hashes,
+                   n_bits=n_bits,
+                   body_size=body_size,
+                   header_checksum=header_checksum,
+                   bits=np.zeros(n_bits // 8, dtype=np.uint8))
+
+    @classmethod
+    def from_graph_handle(cls, graph_handle, bits_per_kmer=DEFAULT_BITS_PER_KMER):
+        """Build a Bloom filter of the kmers of an uncompressed or block-compressed graph"""
+        graph_handle.seek(0)
+        n_records = None
+        if is_block_compressed(graph_handle):
+            n_records = BlockCompressedGraph.from_handle(graph_handle).n_records
+            graph_handle.seek(0)
+        elif peek(graph_handle, len(GZIP_MAGIC)) == GZIP_MAGIC:
+            raise ValueError('Bloom filters of gzipped graphs need to be block-compressed')
+        stream = decompressed_stream(graph_handle)
+        recording_stream = RecordingStream(stream)
+        header = Header.from_stream(recording_stream)
+        if n_records is None:
+            body_start = graph_handle.tell()
+            n_records = (graph_handle.seek(0, SEEK_END) - body_start) // header.record_size
+            graph_handle.seek(body_start)
+        bloom_filter = cls.empty(n_records, bits_per_kmer,
+                                 body_size=n_records * header.record_size,
+                                 header_checksum=zlib.crc32(recording_stream.data))
+        for record_array in kmer_record_array_generator_from_stream_and_header(stream, header):
+            bloom_filter.add_many(record_array.kmer_words)
+        return bloom_filter
+
+    @classmethod
+    def from_path(cls, path):
+        """Memory-map a Bloom filter file"""
+        buffer, (n_hashes, n_bits, body_size, header_checksum) = map_sidecar(
+            path, BLOOM_FILTER_HEADER_FORMAT, BLOOM_FILTER_MAGIC, BLOOM_FILTER_VERSION,
+            cls.DESCRIPTION)
+        bits = np.frombuffer(buffer, dtype=np.uint8, count=n_bits // 8,
+                             offset=struct.calcsize(BLOOM_FILTER_HEADER_FORMAT))
+        return cls(n_hashes=n_hashes,
+                   n_bits=n_bits,
+                   body_size=body_size,
+                   header_checksum=header_checksum,
+                   bits=bits)
+
+    def dump(self, buffer):
+        buffer.write(struct.pack(BLOOM_FILTER_HEADER_FORMAT,
+                                 BLOOM_FILTER_MAGIC,
+                                 BLOOM_FILTER_VERSION,
+                                 self.n_hashes,
+                                 self.n_bits,
+                                 self.body_size,
+                                 self.header_checksum))
+        buffer.write(self.bits.tobytes())
+
+    def add_many(self, uint_matrix):
+        first, second = kmer_hashes_many(uint_matrix)
+        n_bits = np.uint64(self.n_bits)
+        for hash_idx in range(self.n_hashes):
+            positions = (first + np.uint64(hash_idx) * second) % n_bits
+            np.bitwise_or.at(self.bits, positions >> np.uint64(3),
+                             np.left_shift(1, positions & np.uint64(7)).astype(np.uint8))
+
+    def might_contain(self, uints):
+        """Return False if the kmer is not in the graph"""
+        first, second = kmer_hashes(uints)
+        for hash_idx in range(self.n_hashes):
+            position = ((first + hash_idx * second) & MASK_64) % self.n_bits
+            if not self.bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def might_contain_many(self, uint_matrix):
+        """Return a mask of the kmers that may be in the graph"""
+        first, second = kmer_hashes_many(uint_matrix)
+        n_bits = np.uint64(self.n_bits)
+        maybe = np.ones(len(uint_matrix), dtype=bool)
+        for hash_idx in range(self.n_hashes):
+            positions = (first + np.uint64(hash_idx) * second) % n_bits
+            maybe &= (self.bits[positions >> np.uint64(3)]
+                      & np.left_shift(1, positions & np.uint64(7)).astype(np.uint8)) != 0
+        return maybe
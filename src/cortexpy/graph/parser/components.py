@@ -0,0 +1,155 @@
+"""Cortex graph component indexes
+================================
+
+A component index sidecar file (``<graph>.components``) stores the weakly connected component
+of every record of a Cortex graph and the number of records in each component. Two records are
+in the same component if an edge in any color connects them.
+
+The index is built in a single pass over the graph body. The neighbors of each chunk of records
+are derived from their edge bytes, resolved to record indices with one batched lookup per chunk,
+and merged with a union-find over record indices. Components are numbered in the order of their
+first record.
+
+Component sizes bound the number of kmers that a traversal of all colors in both orientations
+can reach from a set of seed kmers, so that such traversals can be rejected before they start
+(see :py:class:`~cortexpy.graph.traversal.engine.Engine`). The records of each component can be
+processed independently of the other components.
+
+Like a Bloom filter, the index is memory-mapped when it is opened.
+"""
+import struct
+
+import attr
+import numpy as np
+
+from cortexpy.edge_set import neighbor_letter_matrix
+from .kmer import lexlo_letter_matrix, uint_matrix_to_letter_matrix
+from .sidecar import MappedSidecar, map_sidecar
+from .streaming import DEFAULT_CHUNK_SIZE
+
+COMPONENT_INDEX_MAGIC = b'CTXCOMPS'
+COMPONENT_INDEX_VERSION = 1
+COMPONENT_INDEX_SUFFIX = '.components'
+COMPONENT_INDEX_HEADER_FORMAT = '<8sIIQQQ'
+INDEX_DTYPE = np.dtype('<i8')
+
+
+def find_roots(parents, nodes):
+    """Return the union-find roots of nodes"""
+    roots = parents[nodes]
+    while True:
+        next_roots = parents[roots]
+        if np.array_equal(next_roots, roots):
+            return roots
+        roots = next_roots
+
+
+def union_many(parents, first, second):
+    """Merge the union-find trees of each pair of nodes in first and second
+
+    Each root is attached to the lowest root it is merged with, so that the root of every tree
+    is its lowest node.
+    """
+    while len(first):
+        first_roots = find_roots(parents, first)
+        second_roots = find_roots(parents, second)
+        parents[first] = first_roots
+        parents[second] = second_roots
+        differ = first_roots != second_roots
+        first = np.minimum(first_roots[differ], second_roots[differ])
+        second = np.maximum(first_roots[differ], second_roots[differ])
+        np.minimum.at(parents, second, first)
+
+
+@attr.s(slots=True)
+class ComponentIndex(MappedSidecar):
+    """The weakly connected component of each record of a Cortex graph"""
+    SUFFIX = COMPONENT_INDEX_SUFFIX
+    DESCRIPTION = 'component index'
+
+    body_size = attr.ib()
+    header_checksum = attr.ib()
+    component_ids = attr.ib()
+    component_sizes = attr.ib()
+
+    @classmethod
+    def from_random_access(cls, ra_parser, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Label the components of the graph of a :py:class:`RandomAccess`
+
+        Neighbors are looked up with :py:meth:`RandomAccess.index_many`, so a memory-mapped
+        graph or a graph with an index or a Bloom filter is labeled fastest.
+        """
+        n_records = len(ra_parser)
+        kmer_size = ra_parser.kmer_size
+        converter = ra_parser.graph_kmer_sequence.kmer_string_converter
+        parents = np.arange(n_records, dtype=np.int64)
+        start = 0
+        for record_array in ra_parser.record_arrays(chunk_size):
+            letter_vals = uint_matrix_to_letter_matrix(record_array.kmer_words, kmer_size)
+            edge_bytes = np.bitwise_or.reduce(record_array.edges, axis=1)
+            rows, neighbors = neighbor_letter_matrix(letter_vals, edge_bytes)
+            if len(rows):
+                neighbor_uints = converter.letter_matrix_to_uint_matrix(
+                    lexlo_letter_matrix(neighbors))
+                indices, found = ra_parser.index_many(neighbor_uints)
+                union_many(parents, rows[found] + start, indices[found])
+            start += len(record_array)
+        roots = find_roots(parents, np.arange(n_records))
+        component_ids = (np.cumsum(roots == np.arange(n_records)) - 1)[roots]
+        return cls(body_size=n_records * ra_parser.header.record_size,
+                   header_checksum=ra_parser.header_checksum(),
+                   component_ids=component_ids.astype(INDEX_DTYPE),
+                   component_sizes=np.bincount(component_ids).astype(INDEX_DTYPE))
+
+    @classmethod
+    def from_graph_handle(cls, graph_handle, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Label the components of an uncompressed or block-compressed graph"""
+        from .block_compressed import is_block_compressed
+        from .random_access import RandomAccess
+        graph_handle.seek(0)
+        memory_map = not is_block_compressed(graph_handle)
+        ra_parser = RandomAccess(graph_handle, kmer_cache_size=0, memory_map=memory_map)
+        return cls.from_random_access(ra_parser, chunk_size=chunk_size)
+
+    @classmethod
+    def from_path(cls, path):
+        """Memory-map a component index file"""
+        buffer, (header_checksum, n_records, n_components, body_size) = map_sidecar(
+            path, COMPONENT_INDEX_HEADER_FORMAT, COMPONENT_INDEX_MAGIC, COMPONENT_INDEX_VERSION,
+            cls.DESCRIPTION)
+        offset = struct.calcsize(COMPONENT_INDEX_HEADER_FORMAT)
+        component_ids = np.frombuffer(buffer, dtype=INDEX_DTYPE, count=n_records, offset=offset)
+        offset += n_records * INDEX_DTYPE.itemsize
+        component_sizes = np.frombuffer(buffer, dtype=INDEX_DTYPE, count=n_components,
+                                        offset=offset)
+        return cls(body_size=body_size,
+                   header_checksum=header_checksum,
+                   component_ids=component_ids,
+                   component_sizes=component_sizes)
+
+    def dump(self, buffer):
+        buffer.write(struct.pack(COMPONENT_INDEX_HEADER_FORMAT,
+                                 COMPONENT_INDEX_MAGIC,
+                                 COMPONENT_INDEX_VERSION,
+                                 self.header_checksum,
+                                 len(self.component_ids),
+                                 len(self.component_sizes),
+                                 self.body_size))
+        buffer.write(self.component_ids.astype(INDEX_DTYPE).tobytes())
+        buffer.write(self.component_sizes.astype(INDEX_DTYPE).tobytes())
+
+    @property
+    def n_components(self):
+        return len(self.component_sizes)
+
+    def n_records_in_components_of(self, record_indices):
+        """Return the number of records in the components of the records of record_indices"""
+        components = np.unique(self.component_ids[np.asarray(record_indices, dtype=np.int64)])
+        return int(self.component_sizes[components].sum())
+
+    def records_of_components(self):
+        """Return the record indices of each component, in the order of the components"""
+        if self.n_components == 0:
+            return []
+        order = np.argsort(self.component_ids, kind='mergesort')
+        return np.split(order, np.cumsum(self.component_sizes)[:-1])
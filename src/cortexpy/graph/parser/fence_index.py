@@ -0,0 +1,224 @@
+"""Cortex graph fence indexes
+=============================
+
+A fence index is a sidecar file (``<graph>.idx``) that stores the kmer of every Nth record of a
+sorted Cortex graph. Looking up a kmer with a fence index costs one in-memory search over the
+fence kmers and one read of the block of at most N records that may contain the kmer.
+
+The index also stores the size of the graph body and a checksum of the graph header. These and
+the first and last fence kmers are used to reject an index that does not belong to a graph.
+"""
+import zlib
+from collections.abc import Sequence
+from io import SEEK_END
+
+import attr
+import numpy as np
+
+from .header import Header
+from .kmer import KmerUintComparator, StringKmerConverter
+from .record_array import KmerRecordArray, bisect_kmer_words
+from .sidecar import existing_sidecar_path
+
+FENCE_INDEX_VERSION = 1
+DEFAULT_FENCE_INTERVAL = 1024
+FENCE_INDEX_SUFFIX = '.idx'
+
+
+def header_checksum(graph_handle, body_start):
+    """Return the CRC32 checksum of the header of a Cortex graph"""
+    graph_handle.seek(0)
+    return zlib.crc32(graph_handle.read(body_start))
+
+
+def sidecar_path(graph_path):
+    return graph_path + FENCE_INDEX_SUFFIX
+
+
+@attr.s(slots=True)
+class FenceIndex(object):
+    """The kmers of every `interval`-th record of a sorted Cortex graph"""
+    interval = attr.ib()
+    body_size = attr.ib()
+    header_checksum = attr.ib()
+    fence_kmers = attr.ib()
+
+    @classmethod
+    def from_graph_handle(cls, graph_handle, interval=DEFAULT_FENCE_INTERVAL):
+        """Build a fence index by reading the first kmer of every `interval` records"""
+        if interval < 1:
+            raise ValueError('Fence interval ({}) has to be greater than 0'.format(interval))
+        graph_handle.seek(0)
+        header = Header.from_stream(graph_handle)
+        body_start = graph_handle.tell()
+        graph_handle.seek(0, SEEK_END)
+        body_size = graph_handle.tell() - body_start
+        if body_size % header.record_size != 0:
+            raise ValueError(
+                "Body size ({}) % Record size ({}) != 0".format(body_size, header.record_size))
+        n_records = body_size // header.record_size
+        fence_kmers = np.zeros((len(range(0, n_records, interval)), header.kmer_container_size),
+                               dtype='<u8')
+        kmer_bytes = header.kmer_container_size * fence_kmers.itemsize
+        previous_kmer = None
+        for fence_idx, record_idx in enumerate(range(0, n_records, interval)):
+            graph_handle.seek(body_start + header.record_size * record_idx)
+            fence_kmers[fence_idx] = np.frombuffer(graph_handle.read(kmer_bytes), dtype='<u8')
+            if previous_kmer is not None and not previous_kmer < fence_kmers[fence_idx].tolist():
+                raise ValueError('Graph records are not sorted by kmer')
+            previous_kmer = fence_kmers[fence_idx].tolist()
+        return cls(interval=interval,
+                   body_size=body_size,
+                   header_checksum=header_checksum(graph_handle, body_start),
+                   fence_kmers=fence_kmers)
+
+    @classmethod
+    def from_stream(cls, stream):
+        with np.load(stream) as index:
+            if int(index['version']) != FENCE_INDEX_VERSION:
+                raise ValueError(
+                    'Unsupported fence index version ({})'.format(int(index['version'])))
+            return cls(interval=int(index['interval']),
+                       body_size=int(index['body_size']),
+                       header_checksum=int(index['header_checksum']),
+                       fence_kmers=index['fence_kmers'])
+
+    @classmethod
+    def from_sidecar(cls, graph_handle):
+        """Load the fence index of a graph file handle if its sidecar file exists"""
+        path = existing_sidecar_path(graph_handle, FENCE_INDEX_SUFFIX)
+        if path is None:
+            return None
+        with open(path, 'rb') as fh:
+            return cls.from_stream(fh)
+
+    def dump(self, buffer):
+        np.savez(buffer,
+                 version=FENCE_INDEX_VERSION,
+                 interval=self.interval,
+                 body_size=self.body_size,
+                 header_checksum=self.header_checksum,
+                 fence_kmers=self.fence_kmers)
+
+    def matches(self, graph_handle, header, body_start, body_size):
+        """Return True if this index was built from the graph in graph_handle
+
+        The body size and header checksum are compared, as are the first and last fence kmers
+        with the kmers they were sampled from.
+        """
+        if self.body_size != body_size or \
+                self.header_checksum != header_checksum(graph_handle, body_start):
+            return False
+        kmer_bytes = header.kmer_container_size * self.fence_kmers.itemsize
+        for fence_idx in {0, len(self.fence_kmers) - 1} & set(range(len(self.fence_kmers))):
+            graph_handle.seek(body_start + header.record_size * self.interval * fence_idx)
+            kmer_words = np.frombuffer(graph_handle.read(kmer_bytes), dtype='<u8')
+            if kmer_words.tolist() != self.fence_kmers[fence_idx].tolist():
+                return False
+        return True
+
+    def block_of(self, uints):
+        """Return the index of the block of records that may contain a kmer"""
+        fence_idx = bisect_kmer_words(self.fence_kmers, uints)
+        if fence_idx < len(self.fence_kmers) and \
+                self.fence_kmers[fence_idx].tolist() == [int(u) for u in uints]:
+            return fence_idx
+        return max(0, fence_idx - 1)
+
+
+@attr.s(slots=True)
+class FencedBlockReader(object):
+    """Reads blocks of `interval` records from a graph and keeps the last block read"""
+    graph_handle = attr.ib()
+    header = attr.ib()
+    body_start = attr.ib()
+    n_records = attr.ib()
+    interval = attr.ib()
+    _block_idx = attr.ib(None, init=False)
+    _block = attr.ib(None, init=False)
+
+    def block(self, block_idx):
+        if block_idx != self._block_idx:
+            first_record = block_idx * self.interval
+            n_block_records = min(self.interval, self.n_records - first_record)
+            self.graph_handle.seek(self.body_start + self.header.record_size * first_record)
+            self._block = KmerRecordArray.from_buffer(
+                self.graph_handle.read(self.header.record_size * n_block_records),
+                kmer_size=self.header.kmer_size,
+                kmer_container_size=self.header.kmer_container_size,
+                num_colors=self.header.num_colors)
+            self._block_idx = block_idx
+        return self._block
+
+    def block_and_offset_of_record(self, item):
+        return self.block(item // self.interval), item % self.interval
+
+    def location_of_block(self, block_idx):
+        """Return the byte offset and length of a block in the graph"""
+        first_record = block_idx * self.interval
+        n_block_records = min(self.interval, self.n_records - first_record)
+        return (self.body_start + self.header.record_size * first_record,
+                self.header.record_size * n_block_records)
+
+
+@attr.s(slots=True)
+class FencedKmerRecordSequence(Sequence):
+    """A sequence of :py:class:`KmerData` objects read one block of records at a time"""
+    block_reader = attr.ib()
+
+    def __getitem__(self, item):
+        if item >= len(self) or item < 0:
+            raise IndexError("Index ({}) is out of range".format(item))
+        block, offset = self.block_reader.block_and_offset_of_record(item)
+        return block[offset]
+
+    def __len__(self):
+        return max(0, self.block_reader.n_records)
+
+
+@attr.s(slots=True)
+class FencedKmerUintSequence(Sequence):
+    """Drop-in replacement for :py:class:`KmerUintSequence` that searches with a fence index
+
+    A kmer is found by searching the in-memory fence kmers and then the one block of records
+    that may contain the kmer.
+    """
+    block_reader = attr.ib()
+    fence_index = attr.ib()
+    kmer_string_converter = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        self.kmer_string_converter = StringKmerConverter(self.block_reader.header.kmer_size)
+
+    def __getitem__(self, item):
+        if item >= len(self) or item < 0:
+            raise IndexError("Index ({}) is out of range".format(item))
+        block, offset = self.block_reader.block_and_offset_of_record(item)
+        return KmerUintComparator(kmer_uints=block.kmer_words[offset])
+
+    def __len__(self):
+        return max(0, self.block_reader.n_records)
+
+    def index_kmer_string(self, kmer_string):
+        uints = self.kmer_string_converter.to_uints(kmer_string)
+        return self.index_uint_vector(uints)
+
+    def index_uint_vector(self, uints):
+        if len(self) == 0:
+            return 0
+        block_idx = self.fence_index.block_of(uints)
+        block = self.block_reader.block(block_idx)
+        return block_idx * self.fence_index.interval + bisect_kmer_words(block.kmer_words, uints)
+
+    def index_uint_matrix(self, uint_matrix):
+        """Return record indices of many kmers and a mask of the kmers that exist
+
+        Kmers are searched for in sorted order so that kmers in the same block share one read.
+        """
+        indices = np.zeros(len(uint_matrix), dtype=np.int64)
+        found = np.zeros(len(uint_matrix), dtype=bool)
+        for row_idx in np.lexsort(uint_matrix.T[::-1]):
+            comparator = KmerUintComparator(uint_matrix[row_idx])
+            indices[row_idx] = self.index_uint_vector(uint_matrix[row_idx])
+            found[row_idx] = indices[row_idx] < len(self) and comparator == self[indices[row_idx]]
+        return indices, found
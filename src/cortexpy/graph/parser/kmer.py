@@ -14,10 +14,12 @@ import numpy as np
 import cortexpy.edge_set
 from cortexpy.utils import revcomp, lexlo
 from .constants import (
-    UINT64_T, UINT32_T, LETTER_TO_NUM,
+    UINT64_T, UINT32_T, LETTER_TO_NUM, LETTERS_PER_BYTE,
     NUM_LETTERS_PER_UINT, NUM_TO_BITS,
 )
-from .kmer_ext import raw_kmer_to_string, raw_edges_to_list, raw_to_coverage
+from .kmer_ext import raw_kmer_to_string, raw_to_coverage
+
+LETTER_SHIFTS = np.arange(NUM_LETTERS_PER_UINT - 1, -1, -1, dtype=np.uint64) * np.uint64(2)
 
 
 def check_kmer_string(kmer_string):
@@ -215,12 +217,126 @@ class StringKmerConverter(object):
         letter_val_bits = NUM_TO_BITS[letter_vals]
         return np.packbits(letter_val_bits).view('uint64').newbyteorder()
 
+    def to_uint_matrix(self, kmer_strings):
+        """Converts kmer strings to a (number of kmers, kmer container size) uint64 matrix"""
+        n_kmers = len(kmer_strings)
+        encoded_kmer_strings = ''.join(kmer_strings).encode()
+        translated_kmer_strings = encoded_kmer_strings.translate(LETTER_TO_NUM)
+        letter_vals = np.frombuffer(translated_kmer_strings, dtype=np.uint8)
+        return self.letter_matrix_to_uint_matrix(letter_vals.reshape(n_kmers, self.kmer_size))
+
+    def letter_matrix_to_uint_matrix(self, letter_vals):
+        """Converts a (number of kmers, kmer size) matrix of letter numbers to a uint64 matrix"""
+        n_kmers = len(letter_vals)
+        padded_letter_vals = np.zeros(
+            (n_kmers, self._kmer_container_size_in_uint64ts * NUM_LETTERS_PER_UINT),
+            dtype=np.uint64
+        )
+        padded_letter_vals[:, padded_letter_vals.shape[1] - self.kmer_size:] = letter_vals
+        padded_letter_vals = padded_letter_vals.reshape(n_kmers,
+                                                        self._kmer_container_size_in_uint64ts,
+                                                        NUM_LETTERS_PER_UINT)
+        return np.bitwise_or.reduce(padded_letter_vals << LETTER_SHIFTS, axis=2)
+
     def to_raw(self, kmer_string):
         uints = self.to_uints(kmer_string)
         little_endian_uints = uints.astype('<u8')
         return little_endian_uints.tobytes()
 
 
+LETTER_TO_DIGIT = str.maketrans('ACGT', '0123')
+HEX_DIGIT_TO_LETTERS = str.maketrans({
+    '{:x}'.format(val): 'ACGT'[val >> 2] + 'ACGT'[val & 3] for val in range(16)
+})
+REVCOMP_BYTE = bytes(
+    sum(((3 - ((val >> shift) & 3)) << (6 - shift)) for shift in range(0, 8, 2))
+    for val in range(256)
+)
+
+
+def uint_matrix_to_letter_matrix(uint_matrix, kmer_size):
+    """Converts a kmer uint64 matrix to a (number of kmers, kmer size) matrix of letter numbers"""
+    letter_vals = (uint_matrix[:, :, np.newaxis] >> LETTER_SHIFTS) & np.uint64(3)
+    return letter_vals.reshape(len(uint_matrix), -1)[:, -kmer_size:].astype(np.uint8)
+
+
+def lexlo_letter_matrix(letter_vals):
+    """Return the lexicographically lowest versions of the kmers of a letter number matrix"""
+    revcomps = 3 - letter_vals[:, ::-1]
+    rows = np.arange(len(letter_vals))
+    first_difference = np.argmax(letter_vals != revcomps, axis=1)
+    is_revcomp_lower = revcomps[rows, first_difference] < letter_vals[rows, first_difference]
+    return np.where(is_revcomp_lower[:, np.newaxis], revcomps, letter_vals)
+
+
+@attr.s(slots=True)
+class IntKmerConverter(object):
+    """Converts kmer strings to and from 2-bit packed integers
+
+    Letters are encoded as A=0, C=1, G=2 and T=3 with the first letter in the most significant
+    bits, so that integers sort in the same order as kmer strings and lexlo is a single comparison.
+    Reverse complements and neighbors are computed with bit operations on the integers.
+
+    >>> converter = IntKmerConverter(3)
+    >>> converter.to_int('ACT')
+    7
+    >>> converter.to_string(converter.revcomp(7))
+    'AGT'
+    """
+    kmer_size = attr.ib()
+    _mask = attr.ib(init=False)
+    _first_letter_shift = attr.ib(init=False)
+    _n_bytes = attr.ib(init=False)
+    _revcomp_shift = attr.ib(init=False)
+    _n_hex_digits = attr.ib(init=False)
+    _kmer_container_size = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        self._mask = (1 << (2 * self.kmer_size)) - 1
+        self._first_letter_shift = 2 * (self.kmer_size - 1)
+        self._n_bytes = math.ceil(self.kmer_size / LETTERS_PER_BYTE)
+        self._revcomp_shift = 2 * (self._n_bytes * LETTERS_PER_BYTE - self.kmer_size)
+        self._n_hex_digits = math.ceil(self.kmer_size / 2)
+        self._kmer_container_size = calc_kmer_container_size(self.kmer_size)
+
+    def to_int(self, kmer_string):
+        return int(kmer_string.translate(LETTER_TO_DIGIT), 4)
+
+    def to_string(self, kmer_int):
+        letters = '{:0{}x}'.format(kmer_int, self._n_hex_digits).translate(HEX_DIGIT_TO_LETTERS)
+        return letters[len(letters) - self.kmer_size:]
+
+    def to_uints(self, kmer_int):
+        """Converts kmer_int to the big-endian uint64 array of :py:class:`StringKmerConverter`"""
+        return np.array([(kmer_int >> (64 * word_idx)) & 0xFFFFFFFFFFFFFFFF
+                         for word_idx in range(self._kmer_container_size - 1, -1, -1)],
+                        dtype=np.uint64)
+
+    def from_uints(self, uints):
+        kmer_int = 0
+        for uint in uints:
+            kmer_int = (kmer_int << 64) | int(uint)
+        return kmer_int
+
+    def revcomp(self, kmer_int):
+        reversed_bytes = kmer_int.to_bytes(self._n_bytes, 'little').translate(REVCOMP_BYTE)
+        return (int.from_bytes(reversed_bytes, 'big') >> self._revcomp_shift) & self._mask
+
+    def lexlo(self, kmer_int):
+        return min(kmer_int, self.revcomp(kmer_int))
+
+    def is_lexlo(self, kmer_int):
+        return kmer_int <= self.revcomp(kmer_int)
+
+    def append(self, kmer_int, letter_num):
+        """Return the kmer that follows kmer_int with letter_num added to its end"""
+        return ((kmer_int << 2) & self._mask) | letter_num
+
+    def prepend(self, kmer_int, letter_num):
+        """Return the kmer that precedes kmer_int with letter_num added to its start"""
+        return (kmer_int >> 2) | (letter_num << self._first_letter_shift)
+
+
 @attr.s(slots=True, cmp=False)
 class KmerData(object):
     _data = attr.ib()
@@ -257,8 +373,8 @@ class KmerData(object):
             start = (
                 self.kmer_container_size_in_uint64ts * UINT64_T + self.num_colors * UINT32_T
             )
-            tuples = raw_edges_to_list(self._data[start:])
-            self._edges = [cortexpy.edge_set.EdgeSet(t) for t in tuples]
+            self._edges = [cortexpy.edge_set.EdgeSet(edge_byte) for edge_byte in
+                           bytes(self._data[start:])]
         return self._edges
 
     @edges.setter
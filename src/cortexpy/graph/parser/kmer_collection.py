@@ -31,7 +31,6 @@ class KmerDataCollection(object):
     def coverage(self):
         if self._coverage is None:
             coverage = [c for c in chain.from_iterable(k.coverage for k in self._kmers_data)]
-            print(coverage)
             self._coverage = tuple(coverage)
         return self._coverage
 
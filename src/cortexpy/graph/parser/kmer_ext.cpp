@@ -1317,6 +1317,9 @@ static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
 #define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
 #endif
 
+/* None.proto */
+static CYTHON_INLINE long __Pyx_div_long(long, long);
+
 /* ListCompAppend.proto */
 #if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
 static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
@@ -1552,9 +1555,6 @@ static CYTHON_INLINE int __Pyx_PyList_Extend(PyObject* L, PyObject* v) {
 /* None.proto */
 static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname);
 
-/* None.proto */
-static CYTHON_INLINE long __Pyx_div_long(long, long);
-
 /* WriteUnraisableException.proto */
 static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int lineno, const char *filename,
@@ -1672,6 +1672,9 @@ static int __Pyx_ValidateAndInit_memviewslice(
 /* ObjectToMemviewSlice.proto */
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(PyObject *, int writable_flag);
 
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char__const__(PyObject *, int writable_flag);
+
 /* CppExceptionConversion.proto */
 #ifndef __Pyx_CppExn2PyErr
 #include <new>
@@ -1748,6 +1751,12 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 /* CIntFromPy.proto */
 static CYTHON_INLINE char __Pyx_PyInt_As_char(PyObject *);
 
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char(PyObject *, int writable_flag);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_int(PyObject *, int writable_flag);
+
 /* CheckBinaryVersion.proto */
 static int __Pyx_check_binary_version(void);
 
@@ -1765,6 +1774,10 @@ static PyObject *__pyx_memoryview_assign_item_from_object(struct __pyx_memoryvie
 static PyObject *__pyx_memoryviewslice_convert_item_to_object(struct __pyx_memoryviewslice_obj *__pyx_v_self, char *__pyx_v_itemp); /* proto*/
 static PyObject *__pyx_memoryviewslice_assign_item_from_object(struct __pyx_memoryviewslice_obj *__pyx_v_self, char *__pyx_v_itemp, PyObject *__pyx_v_value); /* proto*/
 
+/* Module declarations from 'cython.view' */
+
+/* Module declarations from 'cython' */
+
 /* Module declarations from 'libc.string' */
 
 /* Module declarations from 'libcpp.string' */
@@ -1823,6 +1836,8 @@ static void __pyx_memoryview_slice_assign_scalar(__Pyx_memviewslice *, int, size
 static void __pyx_memoryview__slice_assign_scalar(char *, Py_ssize_t *, Py_ssize_t *, int, size_t, void *); /*proto*/
 static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *, PyObject *); /*proto*/
 static __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_char__const__ = { "const unsigned char", NULL, sizeof(unsigned char const ), { 0 }, 0, IS_UNSIGNED(unsigned char const ) ? 'U' : 'I', IS_UNSIGNED(unsigned char const ), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_char = { "unsigned char", NULL, sizeof(unsigned char), { 0 }, 0, IS_UNSIGNED(unsigned char) ? 'U' : 'I', IS_UNSIGNED(unsigned char), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_int = { "unsigned int", NULL, sizeof(unsigned int), { 0 }, 0, IS_UNSIGNED(unsigned int) ? 'U' : 'I', IS_UNSIGNED(unsigned int), 0 };
 #define __Pyx_MODULE_NAME "cortexpy.graph.parser.kmer_ext"
 extern int __pyx_module_is_main_cortexpy__graph__parser__kmer_ext;
 int __pyx_module_is_main_cortexpy__graph__parser__kmer_ext = 0;
@@ -1838,9 +1853,11 @@ static PyObject *__pyx_builtin_Ellipsis;
 static PyObject *__pyx_builtin_id;
 static PyObject *__pyx_builtin_IndexError;
 static const char __pyx_k_O[] = "O";
+static const char __pyx_k_S[] = "S{}";
 static const char __pyx_k_c[] = "c";
 static const char __pyx_k_i[] = "i";
 static const char __pyx_k_id[] = "id";
+static const char __pyx_k_np[] = "np";
 static const char __pyx_k_new[] = "__new__";
 static const char __pyx_k_obj[] = "obj";
 static const char __pyx_k_ACGT[] = "ACGT";
@@ -1856,14 +1873,21 @@ static const char __pyx_k_step[] = "step";
 static const char __pyx_k_stop[] = "stop";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_utf8[] = "utf8";
+static const char __pyx_k_view[] = "view";
 static const char __pyx_k_ASCII[] = "ASCII";
 static const char __pyx_k_class[] = "__class__";
 static const char __pyx_k_color[] = "color";
+static const char __pyx_k_dtype[] = "dtype";
+static const char __pyx_k_edges[] = "edges";
 static const char __pyx_k_error[] = "error";
 static const char __pyx_k_flags[] = "flags";
+static const char __pyx_k_kmers[] = "kmers";
+static const char __pyx_k_numpy[] = "numpy";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_shape[] = "shape";
 static const char __pyx_k_start[] = "start";
+static const char __pyx_k_uint8[] = "uint8";
+static const char __pyx_k_zeros[] = "zeros";
 static const char __pyx_k_buffer[] = "buffer";
 static const char __pyx_k_decode[] = "decode";
 static const char __pyx_k_e_byte[] = "e_byte";
@@ -1876,11 +1900,14 @@ static const char __pyx_k_pickle[] = "pickle";
 static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_struct[] = "struct";
 static const char __pyx_k_tuples[] = "tuples";
+static const char __pyx_k_uint32[] = "uint32";
 static const char __pyx_k_unpack[] = "unpack";
 static const char __pyx_k_update[] = "update";
 static const char __pyx_k_fortran[] = "fortran";
 static const char __pyx_k_letters[] = "letters";
 static const char __pyx_k_memview[] = "memview";
+static const char __pyx_k_records[] = "records";
+static const char __pyx_k_reshape[] = "reshape";
 static const char __pyx_k_Ellipsis[] = "Ellipsis";
 static const char __pyx_k_coverage[] = "coverage";
 static const char __pyx_k_edge_set[] = "edge_set";
@@ -1895,6 +1922,7 @@ static const char __pyx_k_coverages[] = "coverages";
 static const char __pyx_k_enumerate[] = "enumerate";
 static const char __pyx_k_kmer_byte[] = "kmer_byte";
 static const char __pyx_k_kmer_size[] = "kmer_size";
+static const char __pyx_k_n_records[] = "n_records";
 static const char __pyx_k_pyx_state[] = "__pyx_state";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_ulong_idx[] = "ulong_idx";
@@ -1902,18 +1930,23 @@ static const char __pyx_k_IndexError[] = "IndexError";
 static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_e_byte_idx[] = "e_byte_idx";
 static const char __pyx_k_edge_bytes[] = "edge_bytes";
+static const char __pyx_k_edges_view[] = "edges_view";
 static const char __pyx_k_kmer_bytes[] = "kmer_bytes";
+static const char __pyx_k_letter_idx[] = "letter_idx";
 static const char __pyx_k_num_colors[] = "num_colors";
 static const char __pyx_k_pyx_result[] = "__pyx_result";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_record_idx[] = "record_idx";
 static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_PickleError[] = "PickleError";
 static const char __pyx_k_byte_offset[] = "byte_offset";
 static const char __pyx_k_pair_offset[] = "pair_offset";
 static const char __pyx_k_four_letters[] = "four_letters";
+static const char __pyx_k_n_kmer_bytes[] = "n_kmer_bytes";
 static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
 static const char __pyx_k_stringsource[] = "stringsource";
 static const char __pyx_k_ulong_offset[] = "ulong_offset";
+static const char __pyx_k_coverage_view[] = "coverage_view";
 static const char __pyx_k_pyx_getbuffer[] = "__pyx_getbuffer";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_View_MemoryView[] = "View.MemoryView";
@@ -1923,6 +1956,7 @@ static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
 static const char __pyx_k_raw_to_coverage[] = "raw_to_coverage";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_raw_kmer_to_list[] = "raw_kmer_to_list";
+static const char __pyx_k_n_padding_letters[] = "n_padding_letters";
 static const char __pyx_k_pyx_unpickle_Enum[] = "__pyx_unpickle_Enum";
 static const char __pyx_k_raw_edges_to_list[] = "raw_edges_to_list";
 static const char __pyx_k_raw_kmer_to_bytes[] = "raw_kmer_to_bytes";
@@ -1934,8 +1968,11 @@ static const char __pyx_k_contiguous_and_direct[] = "<contiguous and direct>";
 static const char __pyx_k_MemoryView_of_r_object[] = "<MemoryView of %r object>";
 static const char __pyx_k_MemoryView_of_r_at_0x_x[] = "<MemoryView of %r at 0x%x>";
 static const char __pyx_k_contiguous_and_indirect[] = "<contiguous and indirect>";
+static const char __pyx_k_raw_records_to_coverage[] = "raw_records_to_coverage";
 static const char __pyx_k_Cannot_index_with_type_s[] = "Cannot index with type '%s'";
 static const char __pyx_k_Invalid_shape_in_axis_d_d[] = "Invalid shape in axis %d: %d.";
+static const char __pyx_k_raw_records_to_edge_bytes[] = "raw_records_to_edge_bytes";
+static const char __pyx_k_raw_records_to_kmer_bytes[] = "raw_records_to_kmer_bytes";
 static const char __pyx_k_itemsize_0_for_cython_array[] = "itemsize <= 0 for cython.array";
 static const char __pyx_k_unable_to_allocate_array_data[] = "unable to allocate array data.";
 static const char __pyx_k_cortexpy_graph_parser_kmer_ext[] = "cortexpy.graph.parser.kmer_ext";
@@ -1974,6 +2011,7 @@ static PyObject *__pyx_kp_s_MemoryView_of_r_object;
 static PyObject *__pyx_n_b_O;
 static PyObject *__pyx_kp_s_Out_of_bounds_on_buffer_access_a;
 static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_kp_s_S;
 static PyObject *__pyx_n_s_TypeError;
 static PyObject *__pyx_kp_s_Unable_to_convert_item_to_object;
 static PyObject *__pyx_n_s_ValueError;
@@ -1991,14 +2029,18 @@ static PyObject *__pyx_kp_s_contiguous_and_direct;
 static PyObject *__pyx_kp_s_contiguous_and_indirect;
 static PyObject *__pyx_n_s_cortexpy_graph_parser_kmer_ext;
 static PyObject *__pyx_n_s_coverage;
+static PyObject *__pyx_n_s_coverage_view;
 static PyObject *__pyx_n_s_coverages;
 static PyObject *__pyx_n_s_decode;
 static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_dtype;
 static PyObject *__pyx_n_s_dtype_is_object;
 static PyObject *__pyx_n_s_e_byte;
 static PyObject *__pyx_n_s_e_byte_idx;
 static PyObject *__pyx_n_s_edge_bytes;
 static PyObject *__pyx_n_s_edge_set;
+static PyObject *__pyx_n_s_edges;
+static PyObject *__pyx_n_s_edges_view;
 static PyObject *__pyx_n_s_encode;
 static PyObject *__pyx_n_s_enumerate;
 static PyObject *__pyx_n_s_error;
@@ -2017,16 +2059,23 @@ static PyObject *__pyx_kp_s_itemsize_0_for_cython_array;
 static PyObject *__pyx_n_s_kmer_byte;
 static PyObject *__pyx_n_s_kmer_bytes;
 static PyObject *__pyx_n_s_kmer_size;
+static PyObject *__pyx_n_s_kmers;
+static PyObject *__pyx_n_s_letter_idx;
 static PyObject *__pyx_n_s_letters;
 static PyObject *__pyx_n_s_main;
 static PyObject *__pyx_n_s_memview;
 static PyObject *__pyx_n_s_mode;
+static PyObject *__pyx_n_s_n_kmer_bytes;
+static PyObject *__pyx_n_s_n_padding_letters;
+static PyObject *__pyx_n_s_n_records;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_name_2;
 static PyObject *__pyx_n_s_ndim;
 static PyObject *__pyx_n_s_new;
 static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
+static PyObject *__pyx_n_s_np;
 static PyObject *__pyx_n_s_num_colors;
+static PyObject *__pyx_n_s_numpy;
 static PyObject *__pyx_n_s_obj;
 static PyObject *__pyx_n_s_offset;
 static PyObject *__pyx_n_s_pack;
@@ -2046,10 +2095,16 @@ static PyObject *__pyx_n_s_raw_edges_to_list;
 static PyObject *__pyx_n_s_raw_kmer_to_bytes;
 static PyObject *__pyx_n_s_raw_kmer_to_list;
 static PyObject *__pyx_n_s_raw_kmer_to_string;
+static PyObject *__pyx_n_s_raw_records_to_coverage;
+static PyObject *__pyx_n_s_raw_records_to_edge_bytes;
+static PyObject *__pyx_n_s_raw_records_to_kmer_bytes;
 static PyObject *__pyx_n_s_raw_to_coverage;
+static PyObject *__pyx_n_s_record_idx;
+static PyObject *__pyx_n_s_records;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_reshape;
 static PyObject *__pyx_n_s_reversed;
 static PyObject *__pyx_n_s_setstate;
 static PyObject *__pyx_n_s_setstate_cython;
@@ -2066,6 +2121,8 @@ static PyObject *__pyx_kp_s_stringsource;
 static PyObject *__pyx_n_s_struct;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_tuples;
+static PyObject *__pyx_n_s_uint32;
+static PyObject *__pyx_n_s_uint8;
 static PyObject *__pyx_n_s_ulong_idx;
 static PyObject *__pyx_n_s_ulong_offset;
 static PyObject *__pyx_kp_s_unable_to_allocate_array_data;
@@ -2073,11 +2130,16 @@ static PyObject *__pyx_kp_s_unable_to_allocate_shape_and_str;
 static PyObject *__pyx_n_s_unpack;
 static PyObject *__pyx_n_s_update;
 static PyObject *__pyx_n_s_utf8;
+static PyObject *__pyx_n_s_view;
+static PyObject *__pyx_n_s_zeros;
 static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(CYTHON_UNUSED PyObject *__pyx_self, unsigned int __pyx_v_kmer_size, __Pyx_memviewslice __pyx_v_kmer_bytes); /* proto */
 static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_2raw_kmer_to_string(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_kmer_size, PyObject *__pyx_v_kmer_bytes); /* proto */
 static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_4raw_kmer_to_list(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_kmer_size, PyObject *__pyx_v_kmer_bytes); /* proto */
 static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_edge_bytes); /* proto */
 static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_8raw_to_coverage(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_buffer, size_t __pyx_v_offset, size_t __pyx_v_num_colors); /* proto */
+static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_10raw_records_to_kmer_bytes(CYTHON_UNUSED PyObject *__pyx_self, unsigned int __pyx_v_kmer_size, __Pyx_memviewslice __pyx_v_records); /* proto */
+static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_12raw_records_to_coverage(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_records, size_t __pyx_v_offset, size_t __pyx_v_num_colors); /* proto */
+static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_14raw_records_to_edge_bytes(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_records, size_t __pyx_v_offset, size_t __pyx_v_num_colors); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __pyx_array_obj *__pyx_v_self, PyObject *__pyx_v_shape, Py_ssize_t __pyx_v_itemsize, PyObject *__pyx_v_format, PyObject *__pyx_v_mode, int __pyx_v_allocate_buffer); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array_2__getbuffer__(struct __pyx_array_obj *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_array___pyx_pf_15View_dot_MemoryView_5array_4__dealloc__(struct __pyx_array_obj *__pyx_v_self); /* proto */
@@ -2152,20 +2214,26 @@ static PyObject *__pyx_tuple__23;
 static PyObject *__pyx_tuple__25;
 static PyObject *__pyx_tuple__27;
 static PyObject *__pyx_tuple__29;
-static PyObject *__pyx_tuple__30;
 static PyObject *__pyx_tuple__31;
-static PyObject *__pyx_tuple__32;
 static PyObject *__pyx_tuple__33;
-static PyObject *__pyx_tuple__34;
+static PyObject *__pyx_tuple__35;
+static PyObject *__pyx_tuple__36;
+static PyObject *__pyx_tuple__37;
+static PyObject *__pyx_tuple__38;
+static PyObject *__pyx_tuple__39;
+static PyObject *__pyx_tuple__40;
 static PyObject *__pyx_codeobj__20;
 static PyObject *__pyx_codeobj__22;
 static PyObject *__pyx_codeobj__24;
 static PyObject *__pyx_codeobj__26;
 static PyObject *__pyx_codeobj__28;
-static PyObject *__pyx_codeobj__35;
+static PyObject *__pyx_codeobj__30;
+static PyObject *__pyx_codeobj__32;
+static PyObject *__pyx_codeobj__34;
+static PyObject *__pyx_codeobj__41;
 /* Late includes */
 
-/* "cortexpy/graph/parser/kmer_ext.pyx":9
+/* "cortexpy/graph/parser/kmer_ext.pyx":12
  * cdef string NUM_TO_LETTER_LIST = b'ACGT'
  * 
  * def raw_kmer_to_bytes(unsigned kmer_size, const unsigned char[:] kmer_bytes not None):             # <<<<<<<<<<<<<<
@@ -2205,11 +2273,11 @@ static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_1raw_kmer_to_bytes(
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_kmer_bytes)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("raw_kmer_to_bytes", 1, 2, 2, 1); __PYX_ERR(0, 9, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("raw_kmer_to_bytes", 1, 2, 2, 1); __PYX_ERR(0, 12, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_kmer_to_bytes") < 0)) __PYX_ERR(0, 9, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_kmer_to_bytes") < 0)) __PYX_ERR(0, 12, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -2217,19 +2285,19 @@ static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_1raw_kmer_to_bytes(
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
-    __pyx_v_kmer_size = __Pyx_PyInt_As_unsigned_int(values[0]); if (unlikely((__pyx_v_kmer_size == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 9, __pyx_L3_error)
-    __pyx_v_kmer_bytes = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(values[1], 0); if (unlikely(!__pyx_v_kmer_bytes.memview)) __PYX_ERR(0, 9, __pyx_L3_error)
+    __pyx_v_kmer_size = __Pyx_PyInt_As_unsigned_int(values[0]); if (unlikely((__pyx_v_kmer_size == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 12, __pyx_L3_error)
+    __pyx_v_kmer_bytes = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(values[1], 0); if (unlikely(!__pyx_v_kmer_bytes.memview)) __PYX_ERR(0, 12, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("raw_kmer_to_bytes", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 9, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("raw_kmer_to_bytes", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 12, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_kmer_to_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
   if (unlikely(((PyObject *)__pyx_v_kmer_bytes.memview) == Py_None)) {
-    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "kmer_bytes"); __PYX_ERR(0, 9, __pyx_L1_error)
+    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "kmer_bytes"); __PYX_ERR(0, 12, __pyx_L1_error)
   }
   __pyx_r = __pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(__pyx_self, __pyx_v_kmer_size, __pyx_v_kmer_bytes);
 
@@ -2265,7 +2333,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
   PyObject *__pyx_t_11 = NULL;
   __Pyx_RefNannySetupContext("raw_kmer_to_bytes", 0);
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":10
+  /* "cortexpy/graph/parser/kmer_ext.pyx":13
  * 
  * def raw_kmer_to_bytes(unsigned kmer_size, const unsigned char[:] kmer_bytes not None):
  *     assert kmer_size > 0             # <<<<<<<<<<<<<<
@@ -2276,12 +2344,12 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
   if (unlikely(!Py_OptimizeFlag)) {
     if (unlikely(!((__pyx_v_kmer_size > 0) != 0))) {
       PyErr_SetNone(PyExc_AssertionError);
-      __PYX_ERR(0, 10, __pyx_L1_error)
+      __PYX_ERR(0, 13, __pyx_L1_error)
     }
   }
   #endif
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":11
+  /* "cortexpy/graph/parser/kmer_ext.pyx":14
  * def raw_kmer_to_bytes(unsigned kmer_size, const unsigned char[:] kmer_bytes not None):
  *     assert kmer_size > 0
  *     assert kmer_size <= kmer_bytes.shape[0] * 4             # <<<<<<<<<<<<<<
@@ -2292,12 +2360,12 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
   if (unlikely(!Py_OptimizeFlag)) {
     if (unlikely(!((__pyx_v_kmer_size <= ((__pyx_v_kmer_bytes.shape[0]) * 4)) != 0))) {
       PyErr_SetNone(PyExc_AssertionError);
-      __PYX_ERR(0, 11, __pyx_L1_error)
+      __PYX_ERR(0, 14, __pyx_L1_error)
     }
   }
   #endif
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":14
+  /* "cortexpy/graph/parser/kmer_ext.pyx":17
  *     cdef vector[char] letters
  *     cdef vector[char] four_letters
  *     four_letters.resize(4,0)             # <<<<<<<<<<<<<<
@@ -2308,10 +2376,10 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
     __pyx_v_four_letters.resize(4, 0);
   } catch(...) {
     __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 14, __pyx_L1_error)
+    __PYX_ERR(0, 17, __pyx_L1_error)
   }
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":17
+  /* "cortexpy/graph/parser/kmer_ext.pyx":20
  *     cdef char kmer_byte
  *     cdef size_t ulong_idx, ulong_offset, byte_offset, pair_offset, pair_idx
  *     for ulong_idx in range(kmer_bytes.shape[0]//SIZE_OF_INT64):             # <<<<<<<<<<<<<<
@@ -2320,14 +2388,14 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
  */
   if (unlikely(__pyx_v_8cortexpy_5graph_6parser_8kmer_ext_SIZE_OF_INT64 == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-    __PYX_ERR(0, 17, __pyx_L1_error)
+    __PYX_ERR(0, 20, __pyx_L1_error)
   }
   __pyx_t_1 = ((__pyx_v_kmer_bytes.shape[0]) / __pyx_v_8cortexpy_5graph_6parser_8kmer_ext_SIZE_OF_INT64);
   __pyx_t_2 = __pyx_t_1;
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_ulong_idx = __pyx_t_3;
 
-    /* "cortexpy/graph/parser/kmer_ext.pyx":18
+    /* "cortexpy/graph/parser/kmer_ext.pyx":21
  *     cdef size_t ulong_idx, ulong_offset, byte_offset, pair_offset, pair_idx
  *     for ulong_idx in range(kmer_bytes.shape[0]//SIZE_OF_INT64):
  *         ulong_offset = ulong_idx*SIZE_OF_INT64             # <<<<<<<<<<<<<<
@@ -2336,7 +2404,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
  */
     __pyx_v_ulong_offset = (__pyx_v_ulong_idx * __pyx_v_8cortexpy_5graph_6parser_8kmer_ext_SIZE_OF_INT64);
 
-    /* "cortexpy/graph/parser/kmer_ext.pyx":19
+    /* "cortexpy/graph/parser/kmer_ext.pyx":22
  *     for ulong_idx in range(kmer_bytes.shape[0]//SIZE_OF_INT64):
  *         ulong_offset = ulong_idx*SIZE_OF_INT64
  *         for byte_offset in reversed(range(SIZE_OF_INT64)):             # <<<<<<<<<<<<<<
@@ -2346,7 +2414,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
     for (__pyx_t_4 = __pyx_v_8cortexpy_5graph_6parser_8kmer_ext_SIZE_OF_INT64-1 + 1; __pyx_t_4 >= 0 + 1; ) { __pyx_t_4-=1;
       __pyx_v_byte_offset = __pyx_t_4;
 
-      /* "cortexpy/graph/parser/kmer_ext.pyx":20
+      /* "cortexpy/graph/parser/kmer_ext.pyx":23
  *         ulong_offset = ulong_idx*SIZE_OF_INT64
  *         for byte_offset in reversed(range(SIZE_OF_INT64)):
  *             kmer_byte = kmer_bytes[ulong_offset + byte_offset]             # <<<<<<<<<<<<<<
@@ -2358,11 +2426,11 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
       if (unlikely(__pyx_t_5 >= (size_t)__pyx_v_kmer_bytes.shape[0])) __pyx_t_6 = 0;
       if (unlikely(__pyx_t_6 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_6);
-        __PYX_ERR(0, 20, __pyx_L1_error)
+        __PYX_ERR(0, 23, __pyx_L1_error)
       }
       __pyx_v_kmer_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_kmer_bytes.data + __pyx_t_5 * __pyx_v_kmer_bytes.strides[0]) )));
 
-      /* "cortexpy/graph/parser/kmer_ext.pyx":21
+      /* "cortexpy/graph/parser/kmer_ext.pyx":24
  *         for byte_offset in reversed(range(SIZE_OF_INT64)):
  *             kmer_byte = kmer_bytes[ulong_offset + byte_offset]
  *             for pair_idx in range(4):             # <<<<<<<<<<<<<<
@@ -2372,7 +2440,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
       for (__pyx_t_7 = 0; __pyx_t_7 < 4; __pyx_t_7+=1) {
         __pyx_v_pair_idx = __pyx_t_7;
 
-        /* "cortexpy/graph/parser/kmer_ext.pyx":22
+        /* "cortexpy/graph/parser/kmer_ext.pyx":25
  *             kmer_byte = kmer_bytes[ulong_offset + byte_offset]
  *             for pair_idx in range(4):
  *                 four_letters[3-pair_idx] = NUM_TO_LETTER_LIST[kmer_byte & 0x3]             # <<<<<<<<<<<<<<
@@ -2381,7 +2449,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
  */
         (__pyx_v_four_letters[(3 - __pyx_v_pair_idx)]) = (__pyx_v_8cortexpy_5graph_6parser_8kmer_ext_NUM_TO_LETTER_LIST[(__pyx_v_kmer_byte & 0x3)]);
 
-        /* "cortexpy/graph/parser/kmer_ext.pyx":23
+        /* "cortexpy/graph/parser/kmer_ext.pyx":26
  *             for pair_idx in range(4):
  *                 four_letters[3-pair_idx] = NUM_TO_LETTER_LIST[kmer_byte & 0x3]
  *                 kmer_byte >>= 2             # <<<<<<<<<<<<<<
@@ -2391,7 +2459,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
         __pyx_v_kmer_byte = (__pyx_v_kmer_byte >> 2);
       }
 
-      /* "cortexpy/graph/parser/kmer_ext.pyx":24
+      /* "cortexpy/graph/parser/kmer_ext.pyx":27
  *                 four_letters[3-pair_idx] = NUM_TO_LETTER_LIST[kmer_byte & 0x3]
  *                 kmer_byte >>= 2
  *             for kmer_byte in four_letters:             # <<<<<<<<<<<<<<
@@ -2405,7 +2473,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
         ++__pyx_t_8;
         __pyx_v_kmer_byte = __pyx_t_9;
 
-        /* "cortexpy/graph/parser/kmer_ext.pyx":25
+        /* "cortexpy/graph/parser/kmer_ext.pyx":28
  *                 kmer_byte >>= 2
  *             for kmer_byte in four_letters:
  *                 letters.push_back(kmer_byte)             # <<<<<<<<<<<<<<
@@ -2416,10 +2484,10 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
           __pyx_v_letters.push_back(__pyx_v_kmer_byte);
         } catch(...) {
           __Pyx_CppExn2PyErr();
-          __PYX_ERR(0, 25, __pyx_L1_error)
+          __PYX_ERR(0, 28, __pyx_L1_error)
         }
 
-        /* "cortexpy/graph/parser/kmer_ext.pyx":24
+        /* "cortexpy/graph/parser/kmer_ext.pyx":27
  *                 four_letters[3-pair_idx] = NUM_TO_LETTER_LIST[kmer_byte & 0x3]
  *                 kmer_byte >>= 2
  *             for kmer_byte in four_letters:             # <<<<<<<<<<<<<<
@@ -2430,7 +2498,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
     }
   }
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":26
+  /* "cortexpy/graph/parser/kmer_ext.pyx":29
  *             for kmer_byte in four_letters:
  *                 letters.push_back(kmer_byte)
  *     return bytes(letters[(letters.size() - kmer_size):])             # <<<<<<<<<<<<<<
@@ -2438,19 +2506,19 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
  *     # the above code was reimplemented from this
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_10 = __pyx_convert_vector_to_py_char(__pyx_v_letters); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_10 = __pyx_convert_vector_to_py_char(__pyx_v_letters); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 29, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_10);
-  __pyx_t_11 = __Pyx_PyObject_GetSlice(__pyx_t_10, (__pyx_v_letters.size() - __pyx_v_kmer_size), 0, NULL, NULL, NULL, 1, 0, 1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_PyObject_GetSlice(__pyx_t_10, (__pyx_v_letters.size() - __pyx_v_kmer_size), 0, NULL, NULL, NULL, 1, 0, 1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 29, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_11);
   __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-  __pyx_t_10 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyBytes_Type)), __pyx_t_11); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_10 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyBytes_Type)), __pyx_t_11); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 29, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_10);
   __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
   __pyx_r = __pyx_t_10;
   __pyx_t_10 = 0;
   goto __pyx_L0;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":9
+  /* "cortexpy/graph/parser/kmer_ext.pyx":12
  * cdef string NUM_TO_LETTER_LIST = b'ACGT'
  * 
  * def raw_kmer_to_bytes(unsigned kmer_size, const unsigned char[:] kmer_bytes not None):             # <<<<<<<<<<<<<<
@@ -2471,7 +2539,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_raw_kmer_to_bytes(C
   return __pyx_r;
 }
 
-/* "cortexpy/graph/parser/kmer_ext.pyx":35
+/* "cortexpy/graph/parser/kmer_ext.pyx":38
  *     # return NUM_TO_LETTER[kmer[(len(kmer) - self.kmer_size):]]
  * 
  * def raw_kmer_to_string(int kmer_size, kmer_bytes):             # <<<<<<<<<<<<<<
@@ -2511,11 +2579,11 @@ static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_3raw_kmer_to_string
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_kmer_bytes)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("raw_kmer_to_string", 1, 2, 2, 1); __PYX_ERR(0, 35, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("raw_kmer_to_string", 1, 2, 2, 1); __PYX_ERR(0, 38, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_kmer_to_string") < 0)) __PYX_ERR(0, 35, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_kmer_to_string") < 0)) __PYX_ERR(0, 38, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -2523,12 +2591,12 @@ static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_3raw_kmer_to_string
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
-    __pyx_v_kmer_size = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_kmer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 35, __pyx_L3_error)
+    __pyx_v_kmer_size = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_kmer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 38, __pyx_L3_error)
     __pyx_v_kmer_bytes = values[1];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("raw_kmer_to_string", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 35, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("raw_kmer_to_string", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 38, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_kmer_to_string", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -2553,7 +2621,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_2raw_kmer_to_string
   PyObject *__pyx_t_7 = NULL;
   __Pyx_RefNannySetupContext("raw_kmer_to_string", 0);
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":36
+  /* "cortexpy/graph/parser/kmer_ext.pyx":39
  * 
  * def raw_kmer_to_string(int kmer_size, kmer_bytes):
  *     return raw_kmer_to_bytes(kmer_size, kmer_bytes).decode('utf8')             # <<<<<<<<<<<<<<
@@ -2561,9 +2629,9 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_2raw_kmer_to_string
  * def raw_kmer_to_list(int kmer_size, kmer_bytes):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_raw_kmer_to_bytes); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_raw_kmer_to_bytes); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_kmer_size); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_kmer_size); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_5 = NULL;
   __pyx_t_6 = 0;
@@ -2580,7 +2648,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_2raw_kmer_to_string
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_3)) {
     PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_4, __pyx_v_kmer_bytes};
-    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 36, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -2589,14 +2657,14 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_2raw_kmer_to_string
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
     PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_4, __pyx_v_kmer_bytes};
-    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 36, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   } else
   #endif
   {
-    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 36, __pyx_L1_error)
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 39, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     if (__pyx_t_5) {
       __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
@@ -2607,12 +2675,12 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_2raw_kmer_to_string
     __Pyx_GIVEREF(__pyx_v_kmer_bytes);
     PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_v_kmer_bytes);
     __pyx_t_4 = 0;
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 36, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_decode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_decode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -2627,14 +2695,14 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_2raw_kmer_to_string
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_n_s_utf8) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_s_utf8);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 36, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":35
+  /* "cortexpy/graph/parser/kmer_ext.pyx":38
  *     # return NUM_TO_LETTER[kmer[(len(kmer) - self.kmer_size):]]
  * 
  * def raw_kmer_to_string(int kmer_size, kmer_bytes):             # <<<<<<<<<<<<<<
@@ -2658,7 +2726,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_2raw_kmer_to_string
   return __pyx_r;
 }
 
-/* "cortexpy/graph/parser/kmer_ext.pyx":38
+/* "cortexpy/graph/parser/kmer_ext.pyx":41
  *     return raw_kmer_to_bytes(kmer_size, kmer_bytes).decode('utf8')
  * 
  * def raw_kmer_to_list(int kmer_size, kmer_bytes):             # <<<<<<<<<<<<<<
@@ -2698,11 +2766,11 @@ static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_5raw_kmer_to_list(P
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_kmer_bytes)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("raw_kmer_to_list", 1, 2, 2, 1); __PYX_ERR(0, 38, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("raw_kmer_to_list", 1, 2, 2, 1); __PYX_ERR(0, 41, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_kmer_to_list") < 0)) __PYX_ERR(0, 38, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_kmer_to_list") < 0)) __PYX_ERR(0, 41, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -2710,12 +2778,12 @@ static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_5raw_kmer_to_list(P
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
-    __pyx_v_kmer_size = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_kmer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 38, __pyx_L3_error)
+    __pyx_v_kmer_size = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_kmer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 41, __pyx_L3_error)
     __pyx_v_kmer_bytes = values[1];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("raw_kmer_to_list", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 38, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("raw_kmer_to_list", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 41, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_kmer_to_list", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -2739,7 +2807,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_4raw_kmer_to_list(C
   PyObject *__pyx_t_6 = NULL;
   __Pyx_RefNannySetupContext("raw_kmer_to_list", 0);
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":39
+  /* "cortexpy/graph/parser/kmer_ext.pyx":42
  * 
  * def raw_kmer_to_list(int kmer_size, kmer_bytes):
  *     return list(raw_kmer_to_string(kmer_size, kmer_bytes))             # <<<<<<<<<<<<<<
@@ -2747,9 +2815,9 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_4raw_kmer_to_list(C
  * def raw_edges_to_list(const unsigned char[:] edge_bytes not None):
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_raw_kmer_to_string); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_raw_kmer_to_string); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_kmer_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_kmer_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -2766,7 +2834,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_4raw_kmer_to_list(C
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_3, __pyx_v_kmer_bytes};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 42, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2775,14 +2843,14 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_4raw_kmer_to_list(C
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_3, __pyx_v_kmer_bytes};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 42, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   } else
   #endif
   {
-    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 39, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 42, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
@@ -2793,19 +2861,19 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_4raw_kmer_to_list(C
     __Pyx_GIVEREF(__pyx_v_kmer_bytes);
     PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_kmer_bytes);
     __pyx_t_3 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 42, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PySequence_List(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __pyx_t_2 = PySequence_List(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 42, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":38
+  /* "cortexpy/graph/parser/kmer_ext.pyx":41
  *     return raw_kmer_to_bytes(kmer_size, kmer_bytes).decode('utf8')
  * 
  * def raw_kmer_to_list(int kmer_size, kmer_bytes):             # <<<<<<<<<<<<<<
@@ -2828,7 +2896,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_4raw_kmer_to_list(C
   return __pyx_r;
 }
 
-/* "cortexpy/graph/parser/kmer_ext.pyx":41
+/* "cortexpy/graph/parser/kmer_ext.pyx":44
  *     return list(raw_kmer_to_string(kmer_size, kmer_bytes))
  * 
  * def raw_edges_to_list(const unsigned char[:] edge_bytes not None):             # <<<<<<<<<<<<<<
@@ -2845,7 +2913,7 @@ static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_7raw_edges_to_list(
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("raw_edges_to_list (wrapper)", 0);
   assert(__pyx_arg_edge_bytes); {
-    __pyx_v_edge_bytes = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(__pyx_arg_edge_bytes, 0); if (unlikely(!__pyx_v_edge_bytes.memview)) __PYX_ERR(0, 41, __pyx_L3_error)
+    __pyx_v_edge_bytes = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(__pyx_arg_edge_bytes, 0); if (unlikely(!__pyx_v_edge_bytes.memview)) __PYX_ERR(0, 44, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -2854,7 +2922,7 @@ static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_7raw_edges_to_list(
   return NULL;
   __pyx_L4_argument_unpacking_done:;
   if (unlikely(((PyObject *)__pyx_v_edge_bytes.memview) == Py_None)) {
-    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "edge_bytes"); __PYX_ERR(0, 41, __pyx_L1_error)
+    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "edge_bytes"); __PYX_ERR(0, 44, __pyx_L1_error)
   }
   __pyx_r = __pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(__pyx_self, __pyx_v_edge_bytes);
 
@@ -2885,7 +2953,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(
   int __pyx_t_8;
   __Pyx_RefNannySetupContext("raw_edges_to_list", 0);
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":45
+  /* "cortexpy/graph/parser/kmer_ext.pyx":48
  *     cdef int i, e_byte_idx
  *     cdef vector[int] edge_set
  *     edge_set.resize(8, 0)             # <<<<<<<<<<<<<<
@@ -2896,22 +2964,22 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(
     __pyx_v_edge_set.resize(8, 0);
   } catch(...) {
     __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 45, __pyx_L1_error)
+    __PYX_ERR(0, 48, __pyx_L1_error)
   }
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":46
+  /* "cortexpy/graph/parser/kmer_ext.pyx":49
  *     cdef vector[int] edge_set
  *     edge_set.resize(8, 0)
  *     tuples = []             # <<<<<<<<<<<<<<
  *     for e_byte_idx in range(edge_bytes.shape[0]):
  *         e_byte = edge_bytes[e_byte_idx]
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 49, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_tuples = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":47
+  /* "cortexpy/graph/parser/kmer_ext.pyx":50
  *     edge_set.resize(8, 0)
  *     tuples = []
  *     for e_byte_idx in range(edge_bytes.shape[0]):             # <<<<<<<<<<<<<<
@@ -2923,7 +2991,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(
   for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
     __pyx_v_e_byte_idx = __pyx_t_4;
 
-    /* "cortexpy/graph/parser/kmer_ext.pyx":48
+    /* "cortexpy/graph/parser/kmer_ext.pyx":51
  *     tuples = []
  *     for e_byte_idx in range(edge_bytes.shape[0]):
  *         e_byte = edge_bytes[e_byte_idx]             # <<<<<<<<<<<<<<
@@ -2938,11 +3006,11 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(
     } else if (unlikely(__pyx_t_5 >= __pyx_v_edge_bytes.shape[0])) __pyx_t_6 = 0;
     if (unlikely(__pyx_t_6 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_6);
-      __PYX_ERR(0, 48, __pyx_L1_error)
+      __PYX_ERR(0, 51, __pyx_L1_error)
     }
     __pyx_v_e_byte = (*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_edge_bytes.data + __pyx_t_5 * __pyx_v_edge_bytes.strides[0]) )));
 
-    /* "cortexpy/graph/parser/kmer_ext.pyx":49
+    /* "cortexpy/graph/parser/kmer_ext.pyx":52
  *     for e_byte_idx in range(edge_bytes.shape[0]):
  *         e_byte = edge_bytes[e_byte_idx]
  *         for i in range(8):             # <<<<<<<<<<<<<<
@@ -2952,7 +3020,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(
     for (__pyx_t_6 = 0; __pyx_t_6 < 8; __pyx_t_6+=1) {
       __pyx_v_i = __pyx_t_6;
 
-      /* "cortexpy/graph/parser/kmer_ext.pyx":50
+      /* "cortexpy/graph/parser/kmer_ext.pyx":53
  *         e_byte = edge_bytes[e_byte_idx]
  *         for i in range(8):
  *             edge_set[7-i] = e_byte & 0x1             # <<<<<<<<<<<<<<
@@ -2961,7 +3029,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(
  */
       (__pyx_v_edge_set[(7 - __pyx_v_i)]) = (__pyx_v_e_byte & 0x1);
 
-      /* "cortexpy/graph/parser/kmer_ext.pyx":51
+      /* "cortexpy/graph/parser/kmer_ext.pyx":54
  *         for i in range(8):
  *             edge_set[7-i] = e_byte & 0x1
  *             e_byte >>= 1             # <<<<<<<<<<<<<<
@@ -2971,23 +3039,23 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(
       __pyx_v_e_byte = (__pyx_v_e_byte >> 1);
     }
 
-    /* "cortexpy/graph/parser/kmer_ext.pyx":52
+    /* "cortexpy/graph/parser/kmer_ext.pyx":55
  *             edge_set[7-i] = e_byte & 0x1
  *             e_byte >>= 1
  *         tuples.append(tuple(edge_set))             # <<<<<<<<<<<<<<
  *     return tuples
  * 
  */
-    __pyx_t_1 = __pyx_convert_vector_to_py_int(__pyx_v_edge_set); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 52, __pyx_L1_error)
+    __pyx_t_1 = __pyx_convert_vector_to_py_int(__pyx_v_edge_set); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_7 = __Pyx_PySequence_Tuple(__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 52, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PySequence_Tuple(__pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_tuples, __pyx_t_7); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 52, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_tuples, __pyx_t_7); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 55, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   }
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":53
+  /* "cortexpy/graph/parser/kmer_ext.pyx":56
  *             e_byte >>= 1
  *         tuples.append(tuple(edge_set))
  *     return tuples             # <<<<<<<<<<<<<<
@@ -2999,7 +3067,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(
   __pyx_r = __pyx_v_tuples;
   goto __pyx_L0;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":41
+  /* "cortexpy/graph/parser/kmer_ext.pyx":44
  *     return list(raw_kmer_to_string(kmer_size, kmer_bytes))
  * 
  * def raw_edges_to_list(const unsigned char[:] edge_bytes not None):             # <<<<<<<<<<<<<<
@@ -3021,7 +3089,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_6raw_edges_to_list(
   return __pyx_r;
 }
 
-/* "cortexpy/graph/parser/kmer_ext.pyx":61
+/* "cortexpy/graph/parser/kmer_ext.pyx":64
  *     # self._edges = edge_sets
  * 
  * def raw_to_coverage(const unsigned char[:] buffer not None, size_t offset, size_t num_colors):             # <<<<<<<<<<<<<<
@@ -3064,17 +3132,17 @@ static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_9raw_to_coverage(Py
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("raw_to_coverage", 1, 3, 3, 1); __PYX_ERR(0, 61, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("raw_to_coverage", 1, 3, 3, 1); __PYX_ERR(0, 64, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_colors)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("raw_to_coverage", 1, 3, 3, 2); __PYX_ERR(0, 61, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("raw_to_coverage", 1, 3, 3, 2); __PYX_ERR(0, 64, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_to_coverage") < 0)) __PYX_ERR(0, 61, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_to_coverage") < 0)) __PYX_ERR(0, 64, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -3083,20 +3151,20 @@ static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_9raw_to_coverage(Py
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
     }
-    __pyx_v_buffer = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(values[0], 0); if (unlikely(!__pyx_v_buffer.memview)) __PYX_ERR(0, 61, __pyx_L3_error)
-    __pyx_v_offset = __Pyx_PyInt_As_size_t(values[1]); if (unlikely((__pyx_v_offset == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L3_error)
-    __pyx_v_num_colors = __Pyx_PyInt_As_size_t(values[2]); if (unlikely((__pyx_v_num_colors == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L3_error)
+    __pyx_v_buffer = __Pyx_PyObject_to_MemoryviewSlice_ds_unsigned_char__const__(values[0], 0); if (unlikely(!__pyx_v_buffer.memview)) __PYX_ERR(0, 64, __pyx_L3_error)
+    __pyx_v_offset = __Pyx_PyInt_As_size_t(values[1]); if (unlikely((__pyx_v_offset == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 64, __pyx_L3_error)
+    __pyx_v_num_colors = __Pyx_PyInt_As_size_t(values[2]); if (unlikely((__pyx_v_num_colors == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 64, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("raw_to_coverage", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 61, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("raw_to_coverage", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 64, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_to_coverage", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
   if (unlikely(((PyObject *)__pyx_v_buffer.memview) == Py_None)) {
-    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "buffer"); __PYX_ERR(0, 61, __pyx_L1_error)
+    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "buffer"); __PYX_ERR(0, 64, __pyx_L1_error)
   }
   __pyx_r = __pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_8raw_to_coverage(__pyx_self, __pyx_v_buffer, __pyx_v_offset, __pyx_v_num_colors);
 
@@ -3127,7 +3195,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_8raw_to_coverage(CY
   PyObject *__pyx_t_10 = NULL;
   __Pyx_RefNannySetupContext("raw_to_coverage", 0);
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":64
+  /* "cortexpy/graph/parser/kmer_ext.pyx":67
  *     cdef unsigned coverage
  *     cdef vector[unsigned] coverages
  *     coverages.reserve(num_colors)             # <<<<<<<<<<<<<<
@@ -3136,7 +3204,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_8raw_to_coverage(CY
  */
   __pyx_v_coverages.reserve(__pyx_v_num_colors);
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":65
+  /* "cortexpy/graph/parser/kmer_ext.pyx":68
  *     cdef vector[unsigned] coverages
  *     coverages.reserve(num_colors)
  *     for color in range(num_colors):             # <<<<<<<<<<<<<<
@@ -3148,7 +3216,7 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_8raw_to_coverage(CY
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_color = __pyx_t_3;
 
-    /* "cortexpy/graph/parser/kmer_ext.pyx":66
+    /* "cortexpy/graph/parser/kmer_ext.pyx":69
  *     coverages.reserve(num_colors)
  *     for color in range(num_colors):
  *         coverage = (buffer[offset]<<0) | (buffer[offset+1]<<8) | (buffer[offset+2]<<16) | (buffer[offset+3]<<24)             # <<<<<<<<<<<<<<
@@ -3160,88 +3228,1222 @@ static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_8raw_to_coverage(CY
     if (unlikely(__pyx_t_4 >= (size_t)__pyx_v_buffer.shape[0])) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 66, __pyx_L1_error)
+      __PYX_ERR(0, 69, __pyx_L1_error)
     }
     __pyx_t_6 = (__pyx_v_offset + 1);
     __pyx_t_5 = -1;
     if (unlikely(__pyx_t_6 >= (size_t)__pyx_v_buffer.shape[0])) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 66, __pyx_L1_error)
+      __PYX_ERR(0, 69, __pyx_L1_error)
     }
     __pyx_t_7 = (__pyx_v_offset + 2);
     __pyx_t_5 = -1;
     if (unlikely(__pyx_t_7 >= (size_t)__pyx_v_buffer.shape[0])) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 66, __pyx_L1_error)
+      __PYX_ERR(0, 69, __pyx_L1_error)
     }
     __pyx_t_8 = (__pyx_v_offset + 3);
     __pyx_t_5 = -1;
     if (unlikely(__pyx_t_8 >= (size_t)__pyx_v_buffer.shape[0])) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 66, __pyx_L1_error)
+      __PYX_ERR(0, 69, __pyx_L1_error)
     }
     __pyx_v_coverage = (((((*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_buffer.data + __pyx_t_4 * __pyx_v_buffer.strides[0]) ))) << 0) | ((*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_buffer.data + __pyx_t_6 * __pyx_v_buffer.strides[0]) ))) << 8)) | ((*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_buffer.data + __pyx_t_7 * __pyx_v_buffer.strides[0]) ))) << 16)) | ((*((unsigned char const  *) ( /* dim=0 */ (__pyx_v_buffer.data + __pyx_t_8 * __pyx_v_buffer.strides[0]) ))) << 24));
 
-    /* "cortexpy/graph/parser/kmer_ext.pyx":67
- *     for color in range(num_colors):
- *         coverage = (buffer[offset]<<0) | (buffer[offset+1]<<8) | (buffer[offset+2]<<16) | (buffer[offset+3]<<24)
- *         coverages.push_back(coverage)             # <<<<<<<<<<<<<<
- *         offset += 4
- *     return tuple(coverages)
- */
-    try {
-      __pyx_v_coverages.push_back(__pyx_v_coverage);
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 67, __pyx_L1_error)
+    /* "cortexpy/graph/parser/kmer_ext.pyx":70
+ *     for color in range(num_colors):
+ *         coverage = (buffer[offset]<<0) | (buffer[offset+1]<<8) | (buffer[offset+2]<<16) | (buffer[offset+3]<<24)
+ *         coverages.push_back(coverage)             # <<<<<<<<<<<<<<
+ *         offset += 4
+ *     return tuple(coverages)
+ */
+    try {
+      __pyx_v_coverages.push_back(__pyx_v_coverage);
+    } catch(...) {
+      __Pyx_CppExn2PyErr();
+      __PYX_ERR(0, 70, __pyx_L1_error)
+    }
+
+    /* "cortexpy/graph/parser/kmer_ext.pyx":71
+ *         coverage = (buffer[offset]<<0) | (buffer[offset+1]<<8) | (buffer[offset+2]<<16) | (buffer[offset+3]<<24)
+ *         coverages.push_back(coverage)
+ *         offset += 4             # <<<<<<<<<<<<<<
+ *     return tuple(coverages)
+ * 
+ */
+    __pyx_v_offset = (__pyx_v_offset + 4);
+  }
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":72
+ *         coverages.push_back(coverage)
+ *         offset += 4
+ *     return tuple(coverages)             # <<<<<<<<<<<<<<
+ * 
+ *     # originally:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_9 = __pyx_convert_vector_to_py_unsigned_int(__pyx_v_coverages); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 72, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_10 = __Pyx_PySequence_Tuple(__pyx_t_9); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 72, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_r = __pyx_t_10;
+  __pyx_t_10 = 0;
+  goto __pyx_L0;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":64
+ *     # self._edges = edge_sets
+ * 
+ * def raw_to_coverage(const unsigned char[:] buffer not None, size_t offset, size_t num_colors):             # <<<<<<<<<<<<<<
+ *     cdef unsigned coverage
+ *     cdef vector[unsigned] coverages
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_to_coverage", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_buffer, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cortexpy/graph/parser/kmer_ext.pyx":83
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_kmer_bytes(unsigned kmer_size, const unsigned char[:, :] records not None):             # <<<<<<<<<<<<<<
+ *     """Decode the kmers of a (number of records, record size) array of raw records
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_11raw_records_to_kmer_bytes(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8cortexpy_5graph_6parser_8kmer_ext_10raw_records_to_kmer_bytes[] = "Decode the kmers of a (number of records, record size) array of raw records\n\n    Returns an array of kmer bytes objects with one element per record.\n    ";
+static PyMethodDef __pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_11raw_records_to_kmer_bytes = {"raw_records_to_kmer_bytes", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_11raw_records_to_kmer_bytes, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8cortexpy_5graph_6parser_8kmer_ext_10raw_records_to_kmer_bytes};
+static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_11raw_records_to_kmer_bytes(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  unsigned int __pyx_v_kmer_size;
+  __Pyx_memviewslice __pyx_v_records = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("raw_records_to_kmer_bytes (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_kmer_size,&__pyx_n_s_records,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_kmer_size)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_records)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("raw_records_to_kmer_bytes", 1, 2, 2, 1); __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_records_to_kmer_bytes") < 0)) __PYX_ERR(0, 83, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_kmer_size = __Pyx_PyInt_As_unsigned_int(values[0]); if (unlikely((__pyx_v_kmer_size == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+    __pyx_v_records = __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char__const__(values[1], 0); if (unlikely(!__pyx_v_records.memview)) __PYX_ERR(0, 83, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("raw_records_to_kmer_bytes", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 83, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_records_to_kmer_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(((PyObject *)__pyx_v_records.memview) == Py_None)) {
+    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "records"); __PYX_ERR(0, 83, __pyx_L1_error)
+  }
+  __pyx_r = __pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_10raw_records_to_kmer_bytes(__pyx_self, __pyx_v_kmer_size, __pyx_v_records);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_10raw_records_to_kmer_bytes(CYTHON_UNUSED PyObject *__pyx_self, unsigned int __pyx_v_kmer_size, __Pyx_memviewslice __pyx_v_records) {
+  size_t __pyx_v_n_records;
+  size_t __pyx_v_n_kmer_bytes;
+  PyObject *__pyx_v_kmers = NULL;
+  __Pyx_memviewslice __pyx_v_letters = { 0, 0, { 0 }, { 0 }, { 0 } };
+  size_t __pyx_v_n_padding_letters;
+  size_t __pyx_v_record_idx;
+  size_t __pyx_v_ulong_offset;
+  size_t __pyx_v_byte_offset;
+  size_t __pyx_v_pair_idx;
+  size_t __pyx_v_letter_idx;
+  unsigned char __pyx_v_kmer_byte;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  size_t __pyx_t_10;
+  size_t __pyx_t_11;
+  size_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  PyObject *(*__pyx_t_14)(PyObject *);
+  size_t __pyx_t_15;
+  size_t __pyx_t_16;
+  size_t __pyx_t_17;
+  size_t __pyx_t_18;
+  int __pyx_t_19;
+  size_t __pyx_t_20;
+  size_t __pyx_t_21;
+  __Pyx_RefNannySetupContext("raw_records_to_kmer_bytes", 0);
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":88
+ *     Returns an array of kmer bytes objects with one element per record.
+ *     """
+ *     cdef size_t n_records = records.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef size_t n_kmer_bytes = ((kmer_size + 31) // 32) * SIZE_OF_INT64
+ *     assert kmer_size > 0
+ */
+  __pyx_v_n_records = (__pyx_v_records.shape[0]);
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":89
+ *     """
+ *     cdef size_t n_records = records.shape[0]
+ *     cdef size_t n_kmer_bytes = ((kmer_size + 31) // 32) * SIZE_OF_INT64             # <<<<<<<<<<<<<<
+ *     assert kmer_size > 0
+ *     assert n_kmer_bytes <= <size_t> records.shape[1]
+ */
+  __pyx_v_n_kmer_bytes = (__Pyx_div_long((__pyx_v_kmer_size + 31), 32) * __pyx_v_8cortexpy_5graph_6parser_8kmer_ext_SIZE_OF_INT64);
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":90
+ *     cdef size_t n_records = records.shape[0]
+ *     cdef size_t n_kmer_bytes = ((kmer_size + 31) // 32) * SIZE_OF_INT64
+ *     assert kmer_size > 0             # <<<<<<<<<<<<<<
+ *     assert n_kmer_bytes <= <size_t> records.shape[1]
+ *     kmers = np.zeros(n_records, dtype='S{}'.format(kmer_size))
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(!Py_OptimizeFlag)) {
+    if (unlikely(!((__pyx_v_kmer_size > 0) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 90, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":91
+ *     cdef size_t n_kmer_bytes = ((kmer_size + 31) // 32) * SIZE_OF_INT64
+ *     assert kmer_size > 0
+ *     assert n_kmer_bytes <= <size_t> records.shape[1]             # <<<<<<<<<<<<<<
+ *     kmers = np.zeros(n_records, dtype='S{}'.format(kmer_size))
+ *     cdef unsigned char[:, :] letters = kmers.view(np.uint8).reshape(n_records, kmer_size)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(!Py_OptimizeFlag)) {
+    if (unlikely(!((__pyx_v_n_kmer_bytes <= ((size_t)(__pyx_v_records.shape[1]))) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 91, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":92
+ *     assert kmer_size > 0
+ *     assert n_kmer_bytes <= <size_t> records.shape[1]
+ *     kmers = np.zeros(n_records, dtype='S{}'.format(kmer_size))             # <<<<<<<<<<<<<<
+ *     cdef unsigned char[:, :] letters = kmers.view(np.uint8).reshape(n_records, kmer_size)
+ *     cdef size_t n_padding_letters = n_kmer_bytes * 4 - kmer_size
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_n_records); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_kp_s_S, __pyx_n_s_format); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyInt_From_unsigned_int(__pyx_v_kmer_size); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_7, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_kmers = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":93
+ *     assert n_kmer_bytes <= <size_t> records.shape[1]
+ *     kmers = np.zeros(n_records, dtype='S{}'.format(kmer_size))
+ *     cdef unsigned char[:, :] letters = kmers.view(np.uint8).reshape(n_records, kmer_size)             # <<<<<<<<<<<<<<
+ *     cdef size_t n_padding_letters = n_kmer_bytes * 4 - kmer_size
+ *     cdef size_t record_idx, ulong_offset, byte_offset, pair_idx, letter_idx
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_kmers, __pyx_n_s_view); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_uint8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_reshape); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_n_records); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyInt_From_unsigned_int(__pyx_v_kmer_size); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_t_1, __pyx_t_5};
+    __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 93, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_2, __pyx_t_1, __pyx_t_5};
+    __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_8, 2+__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 93, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 93, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (__pyx_t_2) {
+      __Pyx_GIVEREF(__pyx_t_2); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2); __pyx_t_2 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_8, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_8, __pyx_t_5);
+    __pyx_t_1 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 93, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char(__pyx_t_4, PyBUF_WRITABLE); if (unlikely(!__pyx_t_9.memview)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_letters = __pyx_t_9;
+  __pyx_t_9.memview = NULL;
+  __pyx_t_9.data = NULL;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":94
+ *     kmers = np.zeros(n_records, dtype='S{}'.format(kmer_size))
+ *     cdef unsigned char[:, :] letters = kmers.view(np.uint8).reshape(n_records, kmer_size)
+ *     cdef size_t n_padding_letters = n_kmer_bytes * 4 - kmer_size             # <<<<<<<<<<<<<<
+ *     cdef size_t record_idx, ulong_offset, byte_offset, pair_idx, letter_idx
+ *     cdef unsigned char kmer_byte
+ */
+  __pyx_v_n_padding_letters = ((__pyx_v_n_kmer_bytes * 4) - __pyx_v_kmer_size);
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":97
+ *     cdef size_t record_idx, ulong_offset, byte_offset, pair_idx, letter_idx
+ *     cdef unsigned char kmer_byte
+ *     for record_idx in range(n_records):             # <<<<<<<<<<<<<<
+ *         letter_idx = 0
+ *         for ulong_offset in range(0, n_kmer_bytes, SIZE_OF_INT64):
+ */
+  __pyx_t_10 = __pyx_v_n_records;
+  __pyx_t_11 = __pyx_t_10;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+    __pyx_v_record_idx = __pyx_t_12;
+
+    /* "cortexpy/graph/parser/kmer_ext.pyx":98
+ *     cdef unsigned char kmer_byte
+ *     for record_idx in range(n_records):
+ *         letter_idx = 0             # <<<<<<<<<<<<<<
+ *         for ulong_offset in range(0, n_kmer_bytes, SIZE_OF_INT64):
+ *             for byte_offset in reversed(range(SIZE_OF_INT64)):
+ */
+    __pyx_v_letter_idx = 0;
+
+    /* "cortexpy/graph/parser/kmer_ext.pyx":99
+ *     for record_idx in range(n_records):
+ *         letter_idx = 0
+ *         for ulong_offset in range(0, n_kmer_bytes, SIZE_OF_INT64):             # <<<<<<<<<<<<<<
+ *             for byte_offset in reversed(range(SIZE_OF_INT64)):
+ *                 kmer_byte = records[record_idx, ulong_offset + byte_offset]
+ */
+    __pyx_t_4 = __Pyx_PyInt_FromSize_t(__pyx_v_n_kmer_bytes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 99, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_8cortexpy_5graph_6parser_8kmer_ext_SIZE_OF_INT64); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 99, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_int_0);
+    __Pyx_GIVEREF(__pyx_int_0);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_int_0);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_3);
+    __pyx_t_4 = 0;
+    __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (likely(PyList_CheckExact(__pyx_t_3)) || PyTuple_CheckExact(__pyx_t_3)) {
+      __pyx_t_6 = __pyx_t_3; __Pyx_INCREF(__pyx_t_6); __pyx_t_13 = 0;
+      __pyx_t_14 = NULL;
+    } else {
+      __pyx_t_13 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 99, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_14 = Py_TYPE(__pyx_t_6)->tp_iternext; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 99, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_14)) {
+        if (likely(PyList_CheckExact(__pyx_t_6))) {
+          if (__pyx_t_13 >= PyList_GET_SIZE(__pyx_t_6)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_13); __Pyx_INCREF(__pyx_t_3); __pyx_t_13++; if (unlikely(0 < 0)) __PYX_ERR(0, 99, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_6, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        } else {
+          if (__pyx_t_13 >= PyTuple_GET_SIZE(__pyx_t_6)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_13); __Pyx_INCREF(__pyx_t_3); __pyx_t_13++; if (unlikely(0 < 0)) __PYX_ERR(0, 99, __pyx_L1_error)
+          #else
+          __pyx_t_3 = PySequence_ITEM(__pyx_t_6, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          #endif
+        }
+      } else {
+        __pyx_t_3 = __pyx_t_14(__pyx_t_6);
+        if (unlikely(!__pyx_t_3)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 99, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __pyx_t_15 = __Pyx_PyInt_As_size_t(__pyx_t_3); if (unlikely((__pyx_t_15 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 99, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_v_ulong_offset = __pyx_t_15;
+
+      /* "cortexpy/graph/parser/kmer_ext.pyx":100
+ *         letter_idx = 0
+ *         for ulong_offset in range(0, n_kmer_bytes, SIZE_OF_INT64):
+ *             for byte_offset in reversed(range(SIZE_OF_INT64)):             # <<<<<<<<<<<<<<
+ *                 kmer_byte = records[record_idx, ulong_offset + byte_offset]
+ *                 for pair_idx in range(4):
+ */
+      for (__pyx_t_15 = __pyx_v_8cortexpy_5graph_6parser_8kmer_ext_SIZE_OF_INT64-1 + 1; __pyx_t_15 >= 0 + 1; ) { __pyx_t_15-=1;
+        __pyx_v_byte_offset = __pyx_t_15;
+
+        /* "cortexpy/graph/parser/kmer_ext.pyx":101
+ *         for ulong_offset in range(0, n_kmer_bytes, SIZE_OF_INT64):
+ *             for byte_offset in reversed(range(SIZE_OF_INT64)):
+ *                 kmer_byte = records[record_idx, ulong_offset + byte_offset]             # <<<<<<<<<<<<<<
+ *                 for pair_idx in range(4):
+ *                     if letter_idx >= n_padding_letters:
+ */
+        __pyx_t_16 = __pyx_v_record_idx;
+        __pyx_t_17 = (__pyx_v_ulong_offset + __pyx_v_byte_offset);
+        __pyx_v_kmer_byte = (*((unsigned char const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_records.data + __pyx_t_16 * __pyx_v_records.strides[0]) ) + __pyx_t_17 * __pyx_v_records.strides[1]) )));
+
+        /* "cortexpy/graph/parser/kmer_ext.pyx":102
+ *             for byte_offset in reversed(range(SIZE_OF_INT64)):
+ *                 kmer_byte = records[record_idx, ulong_offset + byte_offset]
+ *                 for pair_idx in range(4):             # <<<<<<<<<<<<<<
+ *                     if letter_idx >= n_padding_letters:
+ *                         letters[record_idx, letter_idx - n_padding_letters] = \
+ */
+        for (__pyx_t_18 = 0; __pyx_t_18 < 4; __pyx_t_18+=1) {
+          __pyx_v_pair_idx = __pyx_t_18;
+
+          /* "cortexpy/graph/parser/kmer_ext.pyx":103
+ *                 kmer_byte = records[record_idx, ulong_offset + byte_offset]
+ *                 for pair_idx in range(4):
+ *                     if letter_idx >= n_padding_letters:             # <<<<<<<<<<<<<<
+ *                         letters[record_idx, letter_idx - n_padding_letters] = \
+ *                             NUM_TO_LETTER_LIST[(kmer_byte >> (6 - 2 * pair_idx)) & 0x3]
+ */
+          __pyx_t_19 = ((__pyx_v_letter_idx >= __pyx_v_n_padding_letters) != 0);
+          if (__pyx_t_19) {
+
+            /* "cortexpy/graph/parser/kmer_ext.pyx":104
+ *                 for pair_idx in range(4):
+ *                     if letter_idx >= n_padding_letters:
+ *                         letters[record_idx, letter_idx - n_padding_letters] = \             # <<<<<<<<<<<<<<
+ *                             NUM_TO_LETTER_LIST[(kmer_byte >> (6 - 2 * pair_idx)) & 0x3]
+ *                     letter_idx += 1
+ */
+            __pyx_t_20 = __pyx_v_record_idx;
+            __pyx_t_21 = (__pyx_v_letter_idx - __pyx_v_n_padding_letters);
+            *((unsigned char *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_letters.data + __pyx_t_20 * __pyx_v_letters.strides[0]) ) + __pyx_t_21 * __pyx_v_letters.strides[1]) )) = (__pyx_v_8cortexpy_5graph_6parser_8kmer_ext_NUM_TO_LETTER_LIST[((__pyx_v_kmer_byte >> (6 - (2 * __pyx_v_pair_idx))) & 0x3)]);
+
+            /* "cortexpy/graph/parser/kmer_ext.pyx":103
+ *                 kmer_byte = records[record_idx, ulong_offset + byte_offset]
+ *                 for pair_idx in range(4):
+ *                     if letter_idx >= n_padding_letters:             # <<<<<<<<<<<<<<
+ *                         letters[record_idx, letter_idx - n_padding_letters] = \
+ *                             NUM_TO_LETTER_LIST[(kmer_byte >> (6 - 2 * pair_idx)) & 0x3]
+ */
+          }
+
+          /* "cortexpy/graph/parser/kmer_ext.pyx":106
+ *                         letters[record_idx, letter_idx - n_padding_letters] = \
+ *                             NUM_TO_LETTER_LIST[(kmer_byte >> (6 - 2 * pair_idx)) & 0x3]
+ *                     letter_idx += 1             # <<<<<<<<<<<<<<
+ *     return kmers
+ * 
+ */
+          __pyx_v_letter_idx = (__pyx_v_letter_idx + 1);
+        }
+      }
+
+      /* "cortexpy/graph/parser/kmer_ext.pyx":99
+ *     for record_idx in range(n_records):
+ *         letter_idx = 0
+ *         for ulong_offset in range(0, n_kmer_bytes, SIZE_OF_INT64):             # <<<<<<<<<<<<<<
+ *             for byte_offset in reversed(range(SIZE_OF_INT64)):
+ *                 kmer_byte = records[record_idx, ulong_offset + byte_offset]
+ */
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":107
+ *                             NUM_TO_LETTER_LIST[(kmer_byte >> (6 - 2 * pair_idx)) & 0x3]
+ *                     letter_idx += 1
+ *     return kmers             # <<<<<<<<<<<<<<
+ * 
+ * @cython.boundscheck(False)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_kmers);
+  __pyx_r = __pyx_v_kmers;
+  goto __pyx_L0;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":83
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_kmer_bytes(unsigned kmer_size, const unsigned char[:, :] records not None):             # <<<<<<<<<<<<<<
+ *     """Decode the kmers of a (number of records, record size) array of raw records
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_9, 1);
+  __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_records_to_kmer_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_kmers);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_letters, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_records, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cortexpy/graph/parser/kmer_ext.pyx":111
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_coverage(const unsigned char[:, :] records not None, size_t offset,             # <<<<<<<<<<<<<<
+ *                             size_t num_colors):
+ *     """Decode the coverage of raw records into a (number of records, num_colors) array"""
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_13raw_records_to_coverage(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8cortexpy_5graph_6parser_8kmer_ext_12raw_records_to_coverage[] = "Decode the coverage of raw records into a (number of records, num_colors) array";
+static PyMethodDef __pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_13raw_records_to_coverage = {"raw_records_to_coverage", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_13raw_records_to_coverage, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8cortexpy_5graph_6parser_8kmer_ext_12raw_records_to_coverage};
+static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_13raw_records_to_coverage(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_records = { 0, 0, { 0 }, { 0 }, { 0 } };
+  size_t __pyx_v_offset;
+  size_t __pyx_v_num_colors;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("raw_records_to_coverage (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_records,&__pyx_n_s_offset,&__pyx_n_s_num_colors,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_records)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("raw_records_to_coverage", 1, 3, 3, 1); __PYX_ERR(0, 111, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_colors)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("raw_records_to_coverage", 1, 3, 3, 2); __PYX_ERR(0, 111, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_records_to_coverage") < 0)) __PYX_ERR(0, 111, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_records = __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char__const__(values[0], 0); if (unlikely(!__pyx_v_records.memview)) __PYX_ERR(0, 111, __pyx_L3_error)
+    __pyx_v_offset = __Pyx_PyInt_As_size_t(values[1]); if (unlikely((__pyx_v_offset == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 111, __pyx_L3_error)
+    __pyx_v_num_colors = __Pyx_PyInt_As_size_t(values[2]); if (unlikely((__pyx_v_num_colors == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 112, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("raw_records_to_coverage", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 111, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_records_to_coverage", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(((PyObject *)__pyx_v_records.memview) == Py_None)) {
+    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "records"); __PYX_ERR(0, 111, __pyx_L1_error)
+  }
+  __pyx_r = __pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_12raw_records_to_coverage(__pyx_self, __pyx_v_records, __pyx_v_offset, __pyx_v_num_colors);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_12raw_records_to_coverage(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_records, size_t __pyx_v_offset, size_t __pyx_v_num_colors) {
+  size_t __pyx_v_n_records;
+  PyObject *__pyx_v_coverage = NULL;
+  __Pyx_memviewslice __pyx_v_coverage_view = { 0, 0, { 0 }, { 0 }, { 0 } };
+  size_t __pyx_v_record_idx;
+  size_t __pyx_v_color;
+  size_t __pyx_v_byte_offset;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  size_t __pyx_t_7;
+  size_t __pyx_t_8;
+  size_t __pyx_t_9;
+  size_t __pyx_t_10;
+  size_t __pyx_t_11;
+  size_t __pyx_t_12;
+  size_t __pyx_t_13;
+  size_t __pyx_t_14;
+  size_t __pyx_t_15;
+  size_t __pyx_t_16;
+  size_t __pyx_t_17;
+  size_t __pyx_t_18;
+  size_t __pyx_t_19;
+  size_t __pyx_t_20;
+  size_t __pyx_t_21;
+  size_t __pyx_t_22;
+  __Pyx_RefNannySetupContext("raw_records_to_coverage", 0);
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":114
+ *                             size_t num_colors):
+ *     """Decode the coverage of raw records into a (number of records, num_colors) array"""
+ *     cdef size_t n_records = records.shape[0]             # <<<<<<<<<<<<<<
+ *     assert offset + 4 * num_colors <= <size_t> records.shape[1]
+ *     coverage = np.zeros((n_records, num_colors), dtype=np.uint32)
+ */
+  __pyx_v_n_records = (__pyx_v_records.shape[0]);
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":115
+ *     """Decode the coverage of raw records into a (number of records, num_colors) array"""
+ *     cdef size_t n_records = records.shape[0]
+ *     assert offset + 4 * num_colors <= <size_t> records.shape[1]             # <<<<<<<<<<<<<<
+ *     coverage = np.zeros((n_records, num_colors), dtype=np.uint32)
+ *     cdef unsigned[:, :] coverage_view = coverage
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(!Py_OptimizeFlag)) {
+    if (unlikely(!(((__pyx_v_offset + (4 * __pyx_v_num_colors)) <= ((size_t)(__pyx_v_records.shape[1]))) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 115, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":116
+ *     cdef size_t n_records = records.shape[0]
+ *     assert offset + 4 * num_colors <= <size_t> records.shape[1]
+ *     coverage = np.zeros((n_records, num_colors), dtype=np.uint32)             # <<<<<<<<<<<<<<
+ *     cdef unsigned[:, :] coverage_view = coverage
+ *     cdef size_t record_idx, color, byte_offset
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_n_records); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_num_colors); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  __pyx_t_1 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_uint32); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_coverage = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":117
+ *     assert offset + 4 * num_colors <= <size_t> records.shape[1]
+ *     coverage = np.zeros((n_records, num_colors), dtype=np.uint32)
+ *     cdef unsigned[:, :] coverage_view = coverage             # <<<<<<<<<<<<<<
+ *     cdef size_t record_idx, color, byte_offset
+ *     for record_idx in range(n_records):
+ */
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_int(__pyx_v_coverage, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __pyx_v_coverage_view = __pyx_t_6;
+  __pyx_t_6.memview = NULL;
+  __pyx_t_6.data = NULL;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":119
+ *     cdef unsigned[:, :] coverage_view = coverage
+ *     cdef size_t record_idx, color, byte_offset
+ *     for record_idx in range(n_records):             # <<<<<<<<<<<<<<
+ *         for color in range(num_colors):
+ *             byte_offset = offset + 4 * color
+ */
+  __pyx_t_7 = __pyx_v_n_records;
+  __pyx_t_8 = __pyx_t_7;
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_record_idx = __pyx_t_9;
+
+    /* "cortexpy/graph/parser/kmer_ext.pyx":120
+ *     cdef size_t record_idx, color, byte_offset
+ *     for record_idx in range(n_records):
+ *         for color in range(num_colors):             # <<<<<<<<<<<<<<
+ *             byte_offset = offset + 4 * color
+ *             coverage_view[record_idx, color] = (
+ */
+    __pyx_t_10 = __pyx_v_num_colors;
+    __pyx_t_11 = __pyx_t_10;
+    for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+      __pyx_v_color = __pyx_t_12;
+
+      /* "cortexpy/graph/parser/kmer_ext.pyx":121
+ *     for record_idx in range(n_records):
+ *         for color in range(num_colors):
+ *             byte_offset = offset + 4 * color             # <<<<<<<<<<<<<<
+ *             coverage_view[record_idx, color] = (
+ *                 (records[record_idx, byte_offset] << 0)
+ */
+      __pyx_v_byte_offset = (__pyx_v_offset + (4 * __pyx_v_color));
+
+      /* "cortexpy/graph/parser/kmer_ext.pyx":123
+ *             byte_offset = offset + 4 * color
+ *             coverage_view[record_idx, color] = (
+ *                 (records[record_idx, byte_offset] << 0)             # <<<<<<<<<<<<<<
+ *                 | (records[record_idx, byte_offset + 1] << 8)
+ *                 | (records[record_idx, byte_offset + 2] << 16)
+ */
+      __pyx_t_13 = __pyx_v_record_idx;
+      __pyx_t_14 = __pyx_v_byte_offset;
+
+      /* "cortexpy/graph/parser/kmer_ext.pyx":124
+ *             coverage_view[record_idx, color] = (
+ *                 (records[record_idx, byte_offset] << 0)
+ *                 | (records[record_idx, byte_offset + 1] << 8)             # <<<<<<<<<<<<<<
+ *                 | (records[record_idx, byte_offset + 2] << 16)
+ *                 | (<unsigned> records[record_idx, byte_offset + 3] << 24)
+ */
+      __pyx_t_15 = __pyx_v_record_idx;
+      __pyx_t_16 = (__pyx_v_byte_offset + 1);
+
+      /* "cortexpy/graph/parser/kmer_ext.pyx":125
+ *                 (records[record_idx, byte_offset] << 0)
+ *                 | (records[record_idx, byte_offset + 1] << 8)
+ *                 | (records[record_idx, byte_offset + 2] << 16)             # <<<<<<<<<<<<<<
+ *                 | (<unsigned> records[record_idx, byte_offset + 3] << 24)
+ *             )
+ */
+      __pyx_t_17 = __pyx_v_record_idx;
+      __pyx_t_18 = (__pyx_v_byte_offset + 2);
+
+      /* "cortexpy/graph/parser/kmer_ext.pyx":126
+ *                 | (records[record_idx, byte_offset + 1] << 8)
+ *                 | (records[record_idx, byte_offset + 2] << 16)
+ *                 | (<unsigned> records[record_idx, byte_offset + 3] << 24)             # <<<<<<<<<<<<<<
+ *             )
+ *     return coverage
+ */
+      __pyx_t_19 = __pyx_v_record_idx;
+      __pyx_t_20 = (__pyx_v_byte_offset + 3);
+
+      /* "cortexpy/graph/parser/kmer_ext.pyx":122
+ *         for color in range(num_colors):
+ *             byte_offset = offset + 4 * color
+ *             coverage_view[record_idx, color] = (             # <<<<<<<<<<<<<<
+ *                 (records[record_idx, byte_offset] << 0)
+ *                 | (records[record_idx, byte_offset + 1] << 8)
+ */
+      __pyx_t_21 = __pyx_v_record_idx;
+      __pyx_t_22 = __pyx_v_color;
+      *((unsigned int *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_coverage_view.data + __pyx_t_21 * __pyx_v_coverage_view.strides[0]) ) + __pyx_t_22 * __pyx_v_coverage_view.strides[1]) )) = (((((*((unsigned char const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_records.data + __pyx_t_13 * __pyx_v_records.strides[0]) ) + __pyx_t_14 * __pyx_v_records.strides[1]) ))) << 0) | ((*((unsigned char const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_records.data + __pyx_t_15 * __pyx_v_records.strides[0]) ) + __pyx_t_16 * __pyx_v_records.strides[1]) ))) << 8)) | ((*((unsigned char const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_records.data + __pyx_t_17 * __pyx_v_records.strides[0]) ) + __pyx_t_18 * __pyx_v_records.strides[1]) ))) << 16)) | (((unsigned int)(*((unsigned char const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_records.data + __pyx_t_19 * __pyx_v_records.strides[0]) ) + __pyx_t_20 * __pyx_v_records.strides[1]) )))) << 24));
+    }
+  }
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":128
+ *                 | (<unsigned> records[record_idx, byte_offset + 3] << 24)
+ *             )
+ *     return coverage             # <<<<<<<<<<<<<<
+ * 
+ * @cython.boundscheck(False)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_coverage);
+  __pyx_r = __pyx_v_coverage;
+  goto __pyx_L0;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":111
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_coverage(const unsigned char[:, :] records not None, size_t offset,             # <<<<<<<<<<<<<<
+ *                             size_t num_colors):
+ *     """Decode the coverage of raw records into a (number of records, num_colors) array"""
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_6, 1);
+  __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_records_to_coverage", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_coverage);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_coverage_view, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_records, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cortexpy/graph/parser/kmer_ext.pyx":132
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_edge_bytes(const unsigned char[:, :] records not None, size_t offset,             # <<<<<<<<<<<<<<
+ *                               size_t num_colors):
+ *     """Copy the edge bytes of raw records into a (number of records, num_colors) array"""
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_15raw_records_to_edge_bytes(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_8cortexpy_5graph_6parser_8kmer_ext_14raw_records_to_edge_bytes[] = "Copy the edge bytes of raw records into a (number of records, num_colors) array";
+static PyMethodDef __pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_15raw_records_to_edge_bytes = {"raw_records_to_edge_bytes", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_15raw_records_to_edge_bytes, METH_VARARGS|METH_KEYWORDS, __pyx_doc_8cortexpy_5graph_6parser_8kmer_ext_14raw_records_to_edge_bytes};
+static PyObject *__pyx_pw_8cortexpy_5graph_6parser_8kmer_ext_15raw_records_to_edge_bytes(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_records = { 0, 0, { 0 }, { 0 }, { 0 } };
+  size_t __pyx_v_offset;
+  size_t __pyx_v_num_colors;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("raw_records_to_edge_bytes (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_records,&__pyx_n_s_offset,&__pyx_n_s_num_colors,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_records)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("raw_records_to_edge_bytes", 1, 3, 3, 1); __PYX_ERR(0, 132, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_colors)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("raw_records_to_edge_bytes", 1, 3, 3, 2); __PYX_ERR(0, 132, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "raw_records_to_edge_bytes") < 0)) __PYX_ERR(0, 132, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_records = __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char__const__(values[0], 0); if (unlikely(!__pyx_v_records.memview)) __PYX_ERR(0, 132, __pyx_L3_error)
+    __pyx_v_offset = __Pyx_PyInt_As_size_t(values[1]); if (unlikely((__pyx_v_offset == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 132, __pyx_L3_error)
+    __pyx_v_num_colors = __Pyx_PyInt_As_size_t(values[2]); if (unlikely((__pyx_v_num_colors == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 133, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("raw_records_to_edge_bytes", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 132, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_records_to_edge_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(((PyObject *)__pyx_v_records.memview) == Py_None)) {
+    PyErr_Format(PyExc_TypeError, "Argument '%.200s' must not be None", "records"); __PYX_ERR(0, 132, __pyx_L1_error)
+  }
+  __pyx_r = __pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_14raw_records_to_edge_bytes(__pyx_self, __pyx_v_records, __pyx_v_offset, __pyx_v_num_colors);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_8cortexpy_5graph_6parser_8kmer_ext_14raw_records_to_edge_bytes(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_records, size_t __pyx_v_offset, size_t __pyx_v_num_colors) {
+  size_t __pyx_v_n_records;
+  PyObject *__pyx_v_edges = NULL;
+  __Pyx_memviewslice __pyx_v_edges_view = { 0, 0, { 0 }, { 0 }, { 0 } };
+  size_t __pyx_v_record_idx;
+  size_t __pyx_v_color;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  size_t __pyx_t_7;
+  size_t __pyx_t_8;
+  size_t __pyx_t_9;
+  size_t __pyx_t_10;
+  size_t __pyx_t_11;
+  size_t __pyx_t_12;
+  size_t __pyx_t_13;
+  size_t __pyx_t_14;
+  size_t __pyx_t_15;
+  size_t __pyx_t_16;
+  __Pyx_RefNannySetupContext("raw_records_to_edge_bytes", 0);
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":135
+ *                               size_t num_colors):
+ *     """Copy the edge bytes of raw records into a (number of records, num_colors) array"""
+ *     cdef size_t n_records = records.shape[0]             # <<<<<<<<<<<<<<
+ *     assert offset + num_colors <= <size_t> records.shape[1]
+ *     edges = np.zeros((n_records, num_colors), dtype=np.uint8)
+ */
+  __pyx_v_n_records = (__pyx_v_records.shape[0]);
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":136
+ *     """Copy the edge bytes of raw records into a (number of records, num_colors) array"""
+ *     cdef size_t n_records = records.shape[0]
+ *     assert offset + num_colors <= <size_t> records.shape[1]             # <<<<<<<<<<<<<<
+ *     edges = np.zeros((n_records, num_colors), dtype=np.uint8)
+ *     cdef unsigned char[:, :] edges_view = edges
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(!Py_OptimizeFlag)) {
+    if (unlikely(!(((__pyx_v_offset + __pyx_v_num_colors) <= ((size_t)(__pyx_v_records.shape[1]))) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 136, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":137
+ *     cdef size_t n_records = records.shape[0]
+ *     assert offset + num_colors <= <size_t> records.shape[1]
+ *     edges = np.zeros((n_records, num_colors), dtype=np.uint8)             # <<<<<<<<<<<<<<
+ *     cdef unsigned char[:, :] edges_view = edges
+ *     cdef size_t record_idx, color
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_n_records); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_num_colors); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  __pyx_t_1 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_uint8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_5) < 0) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_edges = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":138
+ *     assert offset + num_colors <= <size_t> records.shape[1]
+ *     edges = np.zeros((n_records, num_colors), dtype=np.uint8)
+ *     cdef unsigned char[:, :] edges_view = edges             # <<<<<<<<<<<<<<
+ *     cdef size_t record_idx, color
+ *     for record_idx in range(n_records):
+ */
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char(__pyx_v_edges, PyBUF_WRITABLE); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_v_edges_view = __pyx_t_6;
+  __pyx_t_6.memview = NULL;
+  __pyx_t_6.data = NULL;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":140
+ *     cdef unsigned char[:, :] edges_view = edges
+ *     cdef size_t record_idx, color
+ *     for record_idx in range(n_records):             # <<<<<<<<<<<<<<
+ *         for color in range(num_colors):
+ *             edges_view[record_idx, color] = records[record_idx, offset + color]
+ */
+  __pyx_t_7 = __pyx_v_n_records;
+  __pyx_t_8 = __pyx_t_7;
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_record_idx = __pyx_t_9;
+
+    /* "cortexpy/graph/parser/kmer_ext.pyx":141
+ *     cdef size_t record_idx, color
+ *     for record_idx in range(n_records):
+ *         for color in range(num_colors):             # <<<<<<<<<<<<<<
+ *             edges_view[record_idx, color] = records[record_idx, offset + color]
+ *     return edges
+ */
+    __pyx_t_10 = __pyx_v_num_colors;
+    __pyx_t_11 = __pyx_t_10;
+    for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+      __pyx_v_color = __pyx_t_12;
+
+      /* "cortexpy/graph/parser/kmer_ext.pyx":142
+ *     for record_idx in range(n_records):
+ *         for color in range(num_colors):
+ *             edges_view[record_idx, color] = records[record_idx, offset + color]             # <<<<<<<<<<<<<<
+ *     return edges
+ */
+      __pyx_t_13 = __pyx_v_record_idx;
+      __pyx_t_14 = (__pyx_v_offset + __pyx_v_color);
+      __pyx_t_15 = __pyx_v_record_idx;
+      __pyx_t_16 = __pyx_v_color;
+      *((unsigned char *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_edges_view.data + __pyx_t_15 * __pyx_v_edges_view.strides[0]) ) + __pyx_t_16 * __pyx_v_edges_view.strides[1]) )) = (*((unsigned char const  *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_records.data + __pyx_t_13 * __pyx_v_records.strides[0]) ) + __pyx_t_14 * __pyx_v_records.strides[1]) )));
     }
-
-    /* "cortexpy/graph/parser/kmer_ext.pyx":68
- *         coverage = (buffer[offset]<<0) | (buffer[offset+1]<<8) | (buffer[offset+2]<<16) | (buffer[offset+3]<<24)
- *         coverages.push_back(coverage)
- *         offset += 4             # <<<<<<<<<<<<<<
- *     return tuple(coverages)
- * 
- */
-    __pyx_v_offset = (__pyx_v_offset + 4);
   }
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":69
- *         coverages.push_back(coverage)
- *         offset += 4
- *     return tuple(coverages)             # <<<<<<<<<<<<<<
- * 
- *     # originally:
+  /* "cortexpy/graph/parser/kmer_ext.pyx":143
+ *         for color in range(num_colors):
+ *             edges_view[record_idx, color] = records[record_idx, offset + color]
+ *     return edges             # <<<<<<<<<<<<<<
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_9 = __pyx_convert_vector_to_py_unsigned_int(__pyx_v_coverages); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 69, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  __pyx_t_10 = __Pyx_PySequence_Tuple(__pyx_t_9); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 69, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_10);
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_r = __pyx_t_10;
-  __pyx_t_10 = 0;
+  __Pyx_INCREF(__pyx_v_edges);
+  __pyx_r = __pyx_v_edges;
   goto __pyx_L0;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":61
- *     # self._edges = edge_sets
- * 
- * def raw_to_coverage(const unsigned char[:] buffer not None, size_t offset, size_t num_colors):             # <<<<<<<<<<<<<<
- *     cdef unsigned coverage
- *     cdef vector[unsigned] coverages
+  /* "cortexpy/graph/parser/kmer_ext.pyx":132
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_edge_bytes(const unsigned char[:, :] records not None, size_t offset,             # <<<<<<<<<<<<<<
+ *                               size_t num_colors):
+ *     """Copy the edge bytes of raw records into a (number of records, num_colors) array"""
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_to_coverage", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_6, 1);
+  __Pyx_AddTraceback("cortexpy.graph.parser.kmer_ext.raw_records_to_edge_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __PYX_XDEC_MEMVIEW(&__pyx_v_buffer, 1);
+  __Pyx_XDECREF(__pyx_v_edges);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_edges_view, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_records, 1);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -16981,6 +18183,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_b_O, __pyx_k_O, sizeof(__pyx_k_O), 0, 0, 0, 1},
   {&__pyx_kp_s_Out_of_bounds_on_buffer_access_a, __pyx_k_Out_of_bounds_on_buffer_access_a, sizeof(__pyx_k_Out_of_bounds_on_buffer_access_a), 0, 0, 1, 0},
   {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_kp_s_S, __pyx_k_S, sizeof(__pyx_k_S), 0, 0, 1, 0},
   {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
   {&__pyx_kp_s_Unable_to_convert_item_to_object, __pyx_k_Unable_to_convert_item_to_object, sizeof(__pyx_k_Unable_to_convert_item_to_object), 0, 0, 1, 0},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
@@ -16998,14 +18201,18 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_contiguous_and_indirect, __pyx_k_contiguous_and_indirect, sizeof(__pyx_k_contiguous_and_indirect), 0, 0, 1, 0},
   {&__pyx_n_s_cortexpy_graph_parser_kmer_ext, __pyx_k_cortexpy_graph_parser_kmer_ext, sizeof(__pyx_k_cortexpy_graph_parser_kmer_ext), 0, 0, 1, 1},
   {&__pyx_n_s_coverage, __pyx_k_coverage, sizeof(__pyx_k_coverage), 0, 0, 1, 1},
+  {&__pyx_n_s_coverage_view, __pyx_k_coverage_view, sizeof(__pyx_k_coverage_view), 0, 0, 1, 1},
   {&__pyx_n_s_coverages, __pyx_k_coverages, sizeof(__pyx_k_coverages), 0, 0, 1, 1},
   {&__pyx_n_s_decode, __pyx_k_decode, sizeof(__pyx_k_decode), 0, 0, 1, 1},
   {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
   {&__pyx_n_s_dtype_is_object, __pyx_k_dtype_is_object, sizeof(__pyx_k_dtype_is_object), 0, 0, 1, 1},
   {&__pyx_n_s_e_byte, __pyx_k_e_byte, sizeof(__pyx_k_e_byte), 0, 0, 1, 1},
   {&__pyx_n_s_e_byte_idx, __pyx_k_e_byte_idx, sizeof(__pyx_k_e_byte_idx), 0, 0, 1, 1},
   {&__pyx_n_s_edge_bytes, __pyx_k_edge_bytes, sizeof(__pyx_k_edge_bytes), 0, 0, 1, 1},
   {&__pyx_n_s_edge_set, __pyx_k_edge_set, sizeof(__pyx_k_edge_set), 0, 0, 1, 1},
+  {&__pyx_n_s_edges, __pyx_k_edges, sizeof(__pyx_k_edges), 0, 0, 1, 1},
+  {&__pyx_n_s_edges_view, __pyx_k_edges_view, sizeof(__pyx_k_edges_view), 0, 0, 1, 1},
   {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
   {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
   {&__pyx_n_s_error, __pyx_k_error, sizeof(__pyx_k_error), 0, 0, 1, 1},
@@ -17024,16 +18231,23 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_kmer_byte, __pyx_k_kmer_byte, sizeof(__pyx_k_kmer_byte), 0, 0, 1, 1},
   {&__pyx_n_s_kmer_bytes, __pyx_k_kmer_bytes, sizeof(__pyx_k_kmer_bytes), 0, 0, 1, 1},
   {&__pyx_n_s_kmer_size, __pyx_k_kmer_size, sizeof(__pyx_k_kmer_size), 0, 0, 1, 1},
+  {&__pyx_n_s_kmers, __pyx_k_kmers, sizeof(__pyx_k_kmers), 0, 0, 1, 1},
+  {&__pyx_n_s_letter_idx, __pyx_k_letter_idx, sizeof(__pyx_k_letter_idx), 0, 0, 1, 1},
   {&__pyx_n_s_letters, __pyx_k_letters, sizeof(__pyx_k_letters), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
   {&__pyx_n_s_memview, __pyx_k_memview, sizeof(__pyx_k_memview), 0, 0, 1, 1},
   {&__pyx_n_s_mode, __pyx_k_mode, sizeof(__pyx_k_mode), 0, 0, 1, 1},
+  {&__pyx_n_s_n_kmer_bytes, __pyx_k_n_kmer_bytes, sizeof(__pyx_k_n_kmer_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_n_padding_letters, __pyx_k_n_padding_letters, sizeof(__pyx_k_n_padding_letters), 0, 0, 1, 1},
+  {&__pyx_n_s_n_records, __pyx_k_n_records, sizeof(__pyx_k_n_records), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
   {&__pyx_n_s_ndim, __pyx_k_ndim, sizeof(__pyx_k_ndim), 0, 0, 1, 1},
   {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
   {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+  {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
   {&__pyx_n_s_num_colors, __pyx_k_num_colors, sizeof(__pyx_k_num_colors), 0, 0, 1, 1},
+  {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
   {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
   {&__pyx_n_s_offset, __pyx_k_offset, sizeof(__pyx_k_offset), 0, 0, 1, 1},
   {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
@@ -17053,10 +18267,16 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_raw_kmer_to_bytes, __pyx_k_raw_kmer_to_bytes, sizeof(__pyx_k_raw_kmer_to_bytes), 0, 0, 1, 1},
   {&__pyx_n_s_raw_kmer_to_list, __pyx_k_raw_kmer_to_list, sizeof(__pyx_k_raw_kmer_to_list), 0, 0, 1, 1},
   {&__pyx_n_s_raw_kmer_to_string, __pyx_k_raw_kmer_to_string, sizeof(__pyx_k_raw_kmer_to_string), 0, 0, 1, 1},
+  {&__pyx_n_s_raw_records_to_coverage, __pyx_k_raw_records_to_coverage, sizeof(__pyx_k_raw_records_to_coverage), 0, 0, 1, 1},
+  {&__pyx_n_s_raw_records_to_edge_bytes, __pyx_k_raw_records_to_edge_bytes, sizeof(__pyx_k_raw_records_to_edge_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_raw_records_to_kmer_bytes, __pyx_k_raw_records_to_kmer_bytes, sizeof(__pyx_k_raw_records_to_kmer_bytes), 0, 0, 1, 1},
   {&__pyx_n_s_raw_to_coverage, __pyx_k_raw_to_coverage, sizeof(__pyx_k_raw_to_coverage), 0, 0, 1, 1},
+  {&__pyx_n_s_record_idx, __pyx_k_record_idx, sizeof(__pyx_k_record_idx), 0, 0, 1, 1},
+  {&__pyx_n_s_records, __pyx_k_records, sizeof(__pyx_k_records), 0, 0, 1, 1},
   {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_reshape, __pyx_k_reshape, sizeof(__pyx_k_reshape), 0, 0, 1, 1},
   {&__pyx_n_s_reversed, __pyx_k_reversed, sizeof(__pyx_k_reversed), 0, 0, 1, 1},
   {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
   {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
@@ -17073,6 +18293,8 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_struct, __pyx_k_struct, sizeof(__pyx_k_struct), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_tuples, __pyx_k_tuples, sizeof(__pyx_k_tuples), 0, 0, 1, 1},
+  {&__pyx_n_s_uint32, __pyx_k_uint32, sizeof(__pyx_k_uint32), 0, 0, 1, 1},
+  {&__pyx_n_s_uint8, __pyx_k_uint8, sizeof(__pyx_k_uint8), 0, 0, 1, 1},
   {&__pyx_n_s_ulong_idx, __pyx_k_ulong_idx, sizeof(__pyx_k_ulong_idx), 0, 0, 1, 1},
   {&__pyx_n_s_ulong_offset, __pyx_k_ulong_offset, sizeof(__pyx_k_ulong_offset), 0, 0, 1, 1},
   {&__pyx_kp_s_unable_to_allocate_array_data, __pyx_k_unable_to_allocate_array_data, sizeof(__pyx_k_unable_to_allocate_array_data), 0, 0, 1, 0},
@@ -17080,11 +18302,13 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
   {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
   {&__pyx_n_s_utf8, __pyx_k_utf8, sizeof(__pyx_k_utf8), 0, 0, 1, 1},
+  {&__pyx_n_s_view, __pyx_k_view, sizeof(__pyx_k_view), 0, 0, 1, 1},
+  {&__pyx_n_s_zeros, __pyx_k_zeros, sizeof(__pyx_k_zeros), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 17, __pyx_L1_error)
-  __pyx_builtin_reversed = __Pyx_GetBuiltinName(__pyx_n_s_reversed); if (!__pyx_builtin_reversed) __PYX_ERR(0, 19, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_builtin_reversed = __Pyx_GetBuiltinName(__pyx_n_s_reversed); if (!__pyx_builtin_reversed) __PYX_ERR(0, 22, __pyx_L1_error)
   __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 133, __pyx_L1_error)
   __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(1, 148, __pyx_L1_error)
   __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(1, 151, __pyx_L1_error)
@@ -17293,65 +18517,101 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__18);
   __Pyx_GIVEREF(__pyx_tuple__18);
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":9
+  /* "cortexpy/graph/parser/kmer_ext.pyx":12
  * cdef string NUM_TO_LETTER_LIST = b'ACGT'
  * 
  * def raw_kmer_to_bytes(unsigned kmer_size, const unsigned char[:] kmer_bytes not None):             # <<<<<<<<<<<<<<
  *     assert kmer_size > 0
  *     assert kmer_size <= kmer_bytes.shape[0] * 4
  */
-  __pyx_tuple__19 = PyTuple_Pack(10, __pyx_n_s_kmer_size, __pyx_n_s_kmer_bytes, __pyx_n_s_letters, __pyx_n_s_four_letters, __pyx_n_s_kmer_byte, __pyx_n_s_ulong_idx, __pyx_n_s_ulong_offset, __pyx_n_s_byte_offset, __pyx_n_s_pair_offset, __pyx_n_s_pair_idx); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __pyx_tuple__19 = PyTuple_Pack(10, __pyx_n_s_kmer_size, __pyx_n_s_kmer_bytes, __pyx_n_s_letters, __pyx_n_s_four_letters, __pyx_n_s_kmer_byte, __pyx_n_s_ulong_idx, __pyx_n_s_ulong_offset, __pyx_n_s_byte_offset, __pyx_n_s_pair_offset, __pyx_n_s_pair_idx); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__19);
   __Pyx_GIVEREF(__pyx_tuple__19);
-  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(2, 0, 10, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_kmer_to_bytes, 9, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(2, 0, 10, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_kmer_to_bytes, 12, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 12, __pyx_L1_error)
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":35
+  /* "cortexpy/graph/parser/kmer_ext.pyx":38
  *     # return NUM_TO_LETTER[kmer[(len(kmer) - self.kmer_size):]]
  * 
  * def raw_kmer_to_string(int kmer_size, kmer_bytes):             # <<<<<<<<<<<<<<
  *     return raw_kmer_to_bytes(kmer_size, kmer_bytes).decode('utf8')
  * 
  */
-  __pyx_tuple__21 = PyTuple_Pack(2, __pyx_n_s_kmer_size, __pyx_n_s_kmer_bytes); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __pyx_tuple__21 = PyTuple_Pack(2, __pyx_n_s_kmer_size, __pyx_n_s_kmer_bytes); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 38, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__21);
   __Pyx_GIVEREF(__pyx_tuple__21);
-  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_kmer_to_string, 35, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_kmer_to_string, 38, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 38, __pyx_L1_error)
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":38
+  /* "cortexpy/graph/parser/kmer_ext.pyx":41
  *     return raw_kmer_to_bytes(kmer_size, kmer_bytes).decode('utf8')
  * 
  * def raw_kmer_to_list(int kmer_size, kmer_bytes):             # <<<<<<<<<<<<<<
  *     return list(raw_kmer_to_string(kmer_size, kmer_bytes))
  * 
  */
-  __pyx_tuple__23 = PyTuple_Pack(2, __pyx_n_s_kmer_size, __pyx_n_s_kmer_bytes); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_tuple__23 = PyTuple_Pack(2, __pyx_n_s_kmer_size, __pyx_n_s_kmer_bytes); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__23);
   __Pyx_GIVEREF(__pyx_tuple__23);
-  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_kmer_to_list, 38, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_kmer_to_list, 41, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 41, __pyx_L1_error)
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":41
+  /* "cortexpy/graph/parser/kmer_ext.pyx":44
  *     return list(raw_kmer_to_string(kmer_size, kmer_bytes))
  * 
  * def raw_edges_to_list(const unsigned char[:] edge_bytes not None):             # <<<<<<<<<<<<<<
  *     cdef char e_byte
  *     cdef int i, e_byte_idx
  */
-  __pyx_tuple__25 = PyTuple_Pack(7, __pyx_n_s_edge_bytes, __pyx_n_s_edge_bytes, __pyx_n_s_e_byte, __pyx_n_s_i, __pyx_n_s_e_byte_idx, __pyx_n_s_edge_set, __pyx_n_s_tuples); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __pyx_tuple__25 = PyTuple_Pack(7, __pyx_n_s_edge_bytes, __pyx_n_s_edge_bytes, __pyx_n_s_e_byte, __pyx_n_s_i, __pyx_n_s_e_byte_idx, __pyx_n_s_edge_set, __pyx_n_s_tuples); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__25);
   __Pyx_GIVEREF(__pyx_tuple__25);
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_edges_to_list, 41, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(1, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_edges_to_list, 44, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 44, __pyx_L1_error)
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":61
+  /* "cortexpy/graph/parser/kmer_ext.pyx":64
  *     # self._edges = edge_sets
  * 
  * def raw_to_coverage(const unsigned char[:] buffer not None, size_t offset, size_t num_colors):             # <<<<<<<<<<<<<<
  *     cdef unsigned coverage
  *     cdef vector[unsigned] coverages
  */
-  __pyx_tuple__27 = PyTuple_Pack(6, __pyx_n_s_buffer, __pyx_n_s_offset, __pyx_n_s_num_colors, __pyx_n_s_coverage, __pyx_n_s_coverages, __pyx_n_s_color); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_tuple__27 = PyTuple_Pack(6, __pyx_n_s_buffer, __pyx_n_s_offset, __pyx_n_s_num_colors, __pyx_n_s_coverage, __pyx_n_s_coverages, __pyx_n_s_color); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 64, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__27);
   __Pyx_GIVEREF(__pyx_tuple__27);
-  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(3, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_to_coverage, 61, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(3, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_to_coverage, 64, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 64, __pyx_L1_error)
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":83
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_kmer_bytes(unsigned kmer_size, const unsigned char[:, :] records not None):             # <<<<<<<<<<<<<<
+ *     """Decode the kmers of a (number of records, record size) array of raw records
+ * 
+ */
+  __pyx_tuple__29 = PyTuple_Pack(13, __pyx_n_s_kmer_size, __pyx_n_s_records, __pyx_n_s_n_records, __pyx_n_s_n_kmer_bytes, __pyx_n_s_kmers, __pyx_n_s_letters, __pyx_n_s_n_padding_letters, __pyx_n_s_record_idx, __pyx_n_s_ulong_offset, __pyx_n_s_byte_offset, __pyx_n_s_pair_idx, __pyx_n_s_letter_idx, __pyx_n_s_kmer_byte); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(2, 0, 13, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_records_to_kmer_bytes, 83, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 83, __pyx_L1_error)
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":111
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_coverage(const unsigned char[:, :] records not None, size_t offset,             # <<<<<<<<<<<<<<
+ *                             size_t num_colors):
+ *     """Decode the coverage of raw records into a (number of records, num_colors) array"""
+ */
+  __pyx_tuple__31 = PyTuple_Pack(9, __pyx_n_s_records, __pyx_n_s_offset, __pyx_n_s_num_colors, __pyx_n_s_n_records, __pyx_n_s_coverage, __pyx_n_s_coverage_view, __pyx_n_s_record_idx, __pyx_n_s_color, __pyx_n_s_byte_offset); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
+  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(3, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_records_to_coverage, 111, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 111, __pyx_L1_error)
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":132
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_edge_bytes(const unsigned char[:, :] records not None, size_t offset,             # <<<<<<<<<<<<<<
+ *                               size_t num_colors):
+ *     """Copy the edge bytes of raw records into a (number of records, num_colors) array"""
+ */
+  __pyx_tuple__33 = PyTuple_Pack(8, __pyx_n_s_records, __pyx_n_s_offset, __pyx_n_s_num_colors, __pyx_n_s_n_records, __pyx_n_s_edges, __pyx_n_s_edges_view, __pyx_n_s_record_idx, __pyx_n_s_color); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 132, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__33);
+  __Pyx_GIVEREF(__pyx_tuple__33);
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(3, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_src_cortexpy_graph_parser_kmer_e, __pyx_n_s_raw_records_to_edge_bytes, 132, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 132, __pyx_L1_error)
 
   /* "View.MemoryView":286
  *         return self.name
@@ -17360,9 +18620,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(1, 286, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
+  __pyx_tuple__35 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(1, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__35);
+  __Pyx_GIVEREF(__pyx_tuple__35);
 
   /* "View.MemoryView":287
  * 
@@ -17371,9 +18631,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_tuple__30 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(1, 287, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__30);
-  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_tuple__36 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(1, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
 
   /* "View.MemoryView":288
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -17382,9 +18642,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__31 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(1, 288, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__31);
-  __Pyx_GIVEREF(__pyx_tuple__31);
+  __pyx_tuple__37 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(1, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__37);
+  __Pyx_GIVEREF(__pyx_tuple__37);
 
   /* "View.MemoryView":291
  * 
@@ -17393,9 +18653,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_tuple__32 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(1, 291, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__32);
-  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_tuple__38 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(1, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
 
   /* "View.MemoryView":292
  * 
@@ -17404,19 +18664,19 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__33 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(1, 292, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__33);
-  __Pyx_GIVEREF(__pyx_tuple__33);
+  __pyx_tuple__39 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(1, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__39);
+  __Pyx_GIVEREF(__pyx_tuple__39);
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_Enum(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_tuple__34 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__34);
-  __Pyx_GIVEREF(__pyx_tuple__34);
-  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__40 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
+  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -17642,8 +18902,8 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_kmer_ext(PyObject *__pyx_pyinit_mo
 #endif
 #endif
 {
-  std::string __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  std::string __pyx_t_2;
   static PyThread_type_lock __pyx_t_3[8];
   __Pyx_RefNannyDeclarations
   #if CYTHON_PEP489_MULTI_PHASE_INIT
@@ -17749,94 +19009,142 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":6
+  /* "cortexpy/graph/parser/kmer_ext.pyx":7
  * from libcpp.vector cimport vector
  * 
+ * import numpy as np             # <<<<<<<<<<<<<<
+ * 
+ * cdef size_t SIZE_OF_INT64 = 8
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":9
+ * import numpy as np
+ * 
  * cdef size_t SIZE_OF_INT64 = 8             # <<<<<<<<<<<<<<
  * cdef string NUM_TO_LETTER_LIST = b'ACGT'
  * 
  */
   __pyx_v_8cortexpy_5graph_6parser_8kmer_ext_SIZE_OF_INT64 = 8;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":7
+  /* "cortexpy/graph/parser/kmer_ext.pyx":10
  * 
  * cdef size_t SIZE_OF_INT64 = 8
  * cdef string NUM_TO_LETTER_LIST = b'ACGT'             # <<<<<<<<<<<<<<
  * 
  * def raw_kmer_to_bytes(unsigned kmer_size, const unsigned char[:] kmer_bytes not None):
  */
-  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_n_b_ACGT); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 7, __pyx_L1_error)
-  __pyx_v_8cortexpy_5graph_6parser_8kmer_ext_NUM_TO_LETTER_LIST = __pyx_t_1;
+  __pyx_t_2 = __pyx_convert_string_from_py_std__in_string(__pyx_n_b_ACGT); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 10, __pyx_L1_error)
+  __pyx_v_8cortexpy_5graph_6parser_8kmer_ext_NUM_TO_LETTER_LIST = __pyx_t_2;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":9
+  /* "cortexpy/graph/parser/kmer_ext.pyx":12
  * cdef string NUM_TO_LETTER_LIST = b'ACGT'
  * 
  * def raw_kmer_to_bytes(unsigned kmer_size, const unsigned char[:] kmer_bytes not None):             # <<<<<<<<<<<<<<
  *     assert kmer_size > 0
  *     assert kmer_size <= kmer_bytes.shape[0] * 4
  */
-  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_1raw_kmer_to_bytes, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_kmer_to_bytes, __pyx_t_2) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_1raw_kmer_to_bytes, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_kmer_to_bytes, __pyx_t_1) < 0) __PYX_ERR(0, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":35
+  /* "cortexpy/graph/parser/kmer_ext.pyx":38
  *     # return NUM_TO_LETTER[kmer[(len(kmer) - self.kmer_size):]]
  * 
  * def raw_kmer_to_string(int kmer_size, kmer_bytes):             # <<<<<<<<<<<<<<
  *     return raw_kmer_to_bytes(kmer_size, kmer_bytes).decode('utf8')
  * 
  */
-  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_3raw_kmer_to_string, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 35, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_kmer_to_string, __pyx_t_2) < 0) __PYX_ERR(0, 35, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_3raw_kmer_to_string, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_kmer_to_string, __pyx_t_1) < 0) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":38
+  /* "cortexpy/graph/parser/kmer_ext.pyx":41
  *     return raw_kmer_to_bytes(kmer_size, kmer_bytes).decode('utf8')
  * 
  * def raw_kmer_to_list(int kmer_size, kmer_bytes):             # <<<<<<<<<<<<<<
  *     return list(raw_kmer_to_string(kmer_size, kmer_bytes))
  * 
  */
-  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_5raw_kmer_to_list, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_kmer_to_list, __pyx_t_2) < 0) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_5raw_kmer_to_list, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_kmer_to_list, __pyx_t_1) < 0) __PYX_ERR(0, 41, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":41
+  /* "cortexpy/graph/parser/kmer_ext.pyx":44
  *     return list(raw_kmer_to_string(kmer_size, kmer_bytes))
  * 
  * def raw_edges_to_list(const unsigned char[:] edge_bytes not None):             # <<<<<<<<<<<<<<
  *     cdef char e_byte
  *     cdef int i, e_byte_idx
  */
-  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_7raw_edges_to_list, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 41, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_edges_to_list, __pyx_t_2) < 0) __PYX_ERR(0, 41, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_7raw_edges_to_list, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_edges_to_list, __pyx_t_1) < 0) __PYX_ERR(0, 44, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "cortexpy/graph/parser/kmer_ext.pyx":61
+  /* "cortexpy/graph/parser/kmer_ext.pyx":64
  *     # self._edges = edge_sets
  * 
  * def raw_to_coverage(const unsigned char[:] buffer not None, size_t offset, size_t num_colors):             # <<<<<<<<<<<<<<
  *     cdef unsigned coverage
  *     cdef vector[unsigned] coverages
  */
-  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_9raw_to_coverage, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 61, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_to_coverage, __pyx_t_2) < 0) __PYX_ERR(0, 61, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_9raw_to_coverage, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_to_coverage, __pyx_t_1) < 0) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":83
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_kmer_bytes(unsigned kmer_size, const unsigned char[:, :] records not None):             # <<<<<<<<<<<<<<
+ *     """Decode the kmers of a (number of records, record size) array of raw records
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_11raw_records_to_kmer_bytes, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_records_to_kmer_bytes, __pyx_t_1) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":111
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_coverage(const unsigned char[:, :] records not None, size_t offset,             # <<<<<<<<<<<<<<
+ *                             size_t num_colors):
+ *     """Decode the coverage of raw records into a (number of records, num_colors) array"""
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_13raw_records_to_coverage, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_records_to_coverage, __pyx_t_1) < 0) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "cortexpy/graph/parser/kmer_ext.pyx":132
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def raw_records_to_edge_bytes(const unsigned char[:, :] records not None, size_t offset,             # <<<<<<<<<<<<<<
+ *                               size_t num_colors):
+ *     """Copy the edge bytes of raw records into a (number of records, num_colors) array"""
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_8cortexpy_5graph_6parser_8kmer_ext_15raw_records_to_edge_bytes, NULL, __pyx_n_s_cortexpy_graph_parser_kmer_ext); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_raw_records_to_edge_bytes, __pyx_t_1) < 0) __PYX_ERR(0, 132, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "cortexpy/graph/parser/kmer_ext.pyx":1
  * # distutils: language=c++             # <<<<<<<<<<<<<<
  * 
- * from libcpp.string cimport string
+ * cimport cython
  */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "View.MemoryView":209
  *         info.obj = self
@@ -17845,10 +19153,10 @@ if (!__Pyx_RefNanny) {
  * 
  *     def __dealloc__(array self):
  */
-  __pyx_t_2 = __pyx_capsule_create(((void *)(&__pyx_array_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 209, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem((PyObject *)__pyx_array_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_2) < 0) __PYX_ERR(1, 209, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __pyx_capsule_create(((void *)(&__pyx_array_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 209, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem((PyObject *)__pyx_array_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_1) < 0) __PYX_ERR(1, 209, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   PyType_Modified(__pyx_array_type);
 
   /* "View.MemoryView":286
@@ -17858,12 +19166,12 @@ if (!__Pyx_RefNanny) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__29, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 286, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__35, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(generic);
-  __Pyx_DECREF_SET(generic, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
+  __Pyx_DECREF_SET(generic, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
 
   /* "View.MemoryView":287
  * 
@@ -17872,12 +19180,12 @@ if (!__Pyx_RefNanny) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__30, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 287, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__36, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(strided);
-  __Pyx_DECREF_SET(strided, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
+  __Pyx_DECREF_SET(strided, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
 
   /* "View.MemoryView":288
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -17886,12 +19194,12 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__31, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 288, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__37, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(indirect);
-  __Pyx_DECREF_SET(indirect, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
+  __Pyx_DECREF_SET(indirect, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
 
   /* "View.MemoryView":291
  * 
@@ -17900,12 +19208,12 @@ if (!__Pyx_RefNanny) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__32, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 291, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__38, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 291, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(contiguous);
-  __Pyx_DECREF_SET(contiguous, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
+  __Pyx_DECREF_SET(contiguous, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
 
   /* "View.MemoryView":292
  * 
@@ -17914,12 +19222,12 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__33, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 292, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__39, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(indirect_contiguous);
-  __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
+  __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_t_1 = 0;
 
   /* "View.MemoryView":316
  * 
@@ -17954,10 +19262,10 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_2 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 545, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem((PyObject *)__pyx_memoryview_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_2) < 0) __PYX_ERR(1, 545, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 545, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem((PyObject *)__pyx_memoryview_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_1) < 0) __PYX_ERR(1, 545, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   PyType_Modified(__pyx_memoryview_type);
 
   /* "View.MemoryView":991
@@ -17967,10 +19275,10 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_2 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 991, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem((PyObject *)__pyx_memoryviewslice_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_2) < 0) __PYX_ERR(1, 991, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __pyx_capsule_create(((void *)(&__pyx_memoryview_getbuffer)), ((char *)"getbuffer(obj, view, flags)")); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 991, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem((PyObject *)__pyx_memoryviewslice_type->tp_dict, __pyx_n_s_pyx_getbuffer, __pyx_t_1) < 0) __PYX_ERR(1, 991, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   PyType_Modified(__pyx_memoryviewslice_type);
 
   /* "(tree fragment)":1
@@ -17978,10 +19286,10 @@ if (!__Pyx_RefNanny) {
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_15View_dot_MemoryView_1__pyx_unpickle_Enum, NULL, __pyx_n_s_View_MemoryView); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Enum, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_15View_dot_MemoryView_1__pyx_unpickle_Enum, NULL, __pyx_n_s_View_MemoryView); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_Enum, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "(tree fragment)":11
  *         __pyx_unpickle_Enum__set_state(<Enum> __pyx_result, __pyx_state)
@@ -17995,7 +19303,7 @@ if (!__Pyx_RefNanny) {
 
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_1);
   if (__pyx_m) {
     if (__pyx_d) {
       __Pyx_AddTraceback("init cortexpy.graph.parser.kmer_ext", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -18752,6 +20060,14 @@ done:
     return result;
 }
 
+/* None */
+static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
+    long q = a / b;
+    long r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
 /* ArgTypeTest */
 static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
 {
@@ -19805,14 +21121,6 @@ static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
     PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
 }
 
-/* None */
-static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
-    long q = a / b;
-    long r = a - q*b;
-    q -= ((r != 0) & ((r ^ b) < 0));
-    return q;
-}
-
 /* WriteUnraisableException */
 static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
                                   CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
@@ -21112,6 +22420,29 @@ __pyx_fail:
     return result;
 }
 
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char__const__(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                 PyBUF_RECORDS_RO | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_unsigned_char__const__, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
 /* CIntToPy */
   static CYTHON_INLINE PyObject* __Pyx_PyInt_From_char(char value) {
     const char neg_one = (char) ((char) 0 - (char) 1), const_zero = (char) 0;
@@ -22248,6 +23579,52 @@ raise_neg_overflow:
     return (char) -1;
 }
 
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                 PyBUF_RECORDS_RO | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_unsigned_char, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_int(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                 PyBUF_RECORDS_RO | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_unsigned_int, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
 /* CheckBinaryVersion */
   static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
@@ -1,8 +1,11 @@
 # distutils: language=c++
 
+cimport cython
 from libcpp.string cimport string
 from libcpp.vector cimport vector
 
+import numpy as np
+
 cdef size_t SIZE_OF_INT64 = 8
 cdef string NUM_TO_LETTER_LIST = b'ACGT'
 
@@ -73,3 +76,68 @@ def raw_to_coverage(const unsigned char[:] buffer not None, size_t offset, size_
     # coverage_raw = self._data[start:(start + self.num_colors * UINT32_T)]
     # fmt_string = ''.join(['I' for _ in range(self.num_colors)])
     # self._coverage = unpack(fmt_string, coverage_raw)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def raw_records_to_kmer_bytes(unsigned kmer_size, const unsigned char[:, :] records not None):
+    """Decode the kmers of a (number of records, record size) array of raw records
+
+    Returns an array of kmer bytes objects with one element per record.
+    """
+    cdef size_t n_records = records.shape[0]
+    cdef size_t n_kmer_bytes = ((kmer_size + 31) // 32) * SIZE_OF_INT64
+    assert kmer_size > 0
+    assert n_kmer_bytes <= <size_t> records.shape[1]
+    kmers = np.zeros(n_records, dtype='S{}'.format(kmer_size))
+    cdef unsigned char[:, :] letters = kmers.view(np.uint8).reshape(n_records, kmer_size)
+    cdef size_t n_padding_letters = n_kmer_bytes * 4 - kmer_size
+    cdef size_t record_idx, ulong_offset, byte_offset, pair_idx, letter_idx
+    cdef unsigned char kmer_byte
+    for record_idx in range(n_records):
+        letter_idx = 0
+        for ulong_offset in range(0, n_kmer_bytes, SIZE_OF_INT64):
+            for byte_offset in reversed(range(SIZE_OF_INT64)):
+                kmer_byte = records[record_idx, ulong_offset + byte_offset]
+                for pair_idx in range(4):
+                    if letter_idx >= n_padding_letters:
+                        letters[record_idx, letter_idx - n_padding_letters] = \
+                            NUM_TO_LETTER_LIST[(kmer_byte >> (6 - 2 * pair_idx)) & 0x3]
+                    letter_idx += 1
+    return kmers
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def raw_records_to_coverage(const unsigned char[:, :] records not None, size_t offset,
+                            size_t num_colors):
+    """Decode the coverage of raw records into a (number of records, num_colors) array"""
+    cdef size_t n_records = records.shape[0]
+    assert offset + 4 * num_colors <= <size_t> records.shape[1]
+    coverage = np.zeros((n_records, num_colors), dtype=np.uint32)
+    cdef unsigned[:, :] coverage_view = coverage
+    cdef size_t record_idx, color, byte_offset
+    for record_idx in range(n_records):
+        for color in range(num_colors):
+            byte_offset = offset + 4 * color
+            coverage_view[record_idx, color] = (
+                (records[record_idx, byte_offset] << 0)
+                | (records[record_idx, byte_offset + 1] << 8)
+                | (records[record_idx, byte_offset + 2] << 16)
+                | (<unsigned> records[record_idx, byte_offset + 3] << 24)
+            )
+    return coverage
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def raw_records_to_edge_bytes(const unsigned char[:, :] records not None, size_t offset,
+                              size_t num_colors):
+    """Copy the edge bytes of raw records into a (number of records, num_colors) array"""
+    cdef size_t n_records = records.shape[0]
+    assert offset + num_colors <= <size_t> records.shape[1]
+    edges = np.zeros((n_records, num_colors), dtype=np.uint8)
+    cdef unsigned char[:, :] edges_view = edges
+    cdef size_t record_idx, color
+    for record_idx in range(n_records):
+        for color in range(num_colors):
+            edges_view[record_idx, color] = records[record_idx, offset + color]
+    return edges
@@ -0,0 +1,161 @@
+"""Parallel scans of Cortex graphs
+===================================
+
+Cortex graph records have a fixed size, so the body of a graph can be split into ranges of
+records that are scanned independently. Each worker process memory-maps the graph and applies a
+function to the :py:class:`KmerRecordArray` of its range, without copying the records.
+
+:py:func:`scan` combines the results of all ranges with a reducer. A reducer has a ``map`` method
+that is applied to the record array of each range and a ``reduce`` method that combines the
+results of all ranges in the parent process. Functions and reducers are sent to the worker
+processes and therefore need to be picklable (for example, defined at module level).
+
+Only uncompressed graphs on disk can be scanned in parallel.
+"""
+import multiprocessing
+from collections import Counter
+from io import SEEK_END
+
+import attr
+import numpy as np
+
+from .block_compressed import GZIP_MAGIC, peek
+from .header import Header
+from .record_array import KmerRecordArray, map_graph_body, record_dtype
+
+DEFAULT_RECORDS_PER_RANGE = 2 ** 20
+
+
+@attr.s(slots=True, frozen=True)
+class GraphRange(object):
+    """A range of records in the body of a Cortex graph file"""
+    graph_path = attr.ib()
+    header = attr.ib()
+    body_start = attr.ib()
+    start = attr.ib()
+    stop = attr.ib()
+
+    def record_array(self):
+        """Memory-map the records of this range"""
+        with open(self.graph_path, 'rb') as fh:
+            return map_graph_body(fh,
+                                  header=self.header,
+                                  body_start=self.body_start + self.start * self.header.record_size,
+                                  n_records=self.stop - self.start)
+
+
+def graph_ranges(graph_path, records_per_range=DEFAULT_RECORDS_PER_RANGE):
+    """Return the header of a Cortex graph file and the ranges of records of its body"""
+    if records_per_range < 1:
+        raise ValueError(
+            'Records per range ({}) has to be greater than 0'.format(records_per_range))
+    with open(graph_path, 'rb') as fh:
+        if peek(fh, len(GZIP_MAGIC)) == GZIP_MAGIC:
+            raise ValueError('Compressed graphs cannot be scanned in parallel: ' + graph_path)
+        header = Header.from_stream(fh)
+        body_start = fh.tell()
+        body_size = fh.seek(0, SEEK_END) - body_start
+    if body_size % header.record_size != 0:
+        raise ValueError(
+            "Body size ({}) % Record size ({}) != 0".format(body_size, header.record_size))
+    n_records = body_size // header.record_size
+    return header, [GraphRange(graph_path, header=header, body_start=body_start, start=start,
+                               stop=min(n_records, start + records_per_range))
+                    for start in range(0, n_records, records_per_range)]
+
+
+def _apply_to_range(function_and_range):
+    function, graph_range = function_and_range
+    return function(graph_range.record_array())
+
+
+def map_ranges(graph_path, function, n_workers=None,
+               records_per_range=DEFAULT_RECORDS_PER_RANGE):
+    """Apply function to the record array of every range of a graph and yield results in order
+
+    If n_workers is 1, then all ranges are processed in this process. Otherwise, ranges are
+    processed by a pool of n_workers processes (default: number of CPUs).
+    """
+    _, ranges = graph_ranges(graph_path, records_per_range)
+    return _map_ranges(ranges, function, n_workers)
+
+
+def _map_ranges(ranges, function, n_workers):
+    work = [(function, graph_range) for graph_range in ranges]
+    if n_workers == 1 or len(work) < 2:
+        yield from map(_apply_to_range, work)
+        return
+    with multiprocessing.Pool(n_workers) as pool:
+        yield from pool.imap(_apply_to_range, work)
+
+
+def scan(graph_path, reducer, n_workers=None, records_per_range=DEFAULT_RECORDS_PER_RANGE):
+    """Apply reducer to all records of a graph and return its combined result"""
+    header, ranges = graph_ranges(graph_path, records_per_range)
+    return reducer.reduce(list(_map_ranges(ranges, reducer.map, n_workers)), header)
+
+
+@attr.s(slots=True)
+class FunctionReducer(object):
+    """Applies a function to each record array and combines the results with combine
+
+    If combine is None, then the list of results is returned.
+    """
+    function = attr.ib()
+    combine = attr.ib(None)
+
+    def map(self, record_array):
+        return self.function(record_array)
+
+    def reduce(self, results, header):
+        if self.combine is None:
+            return results
+        return self.combine(results)
+
+
+@attr.s(slots=True)
+class KmerCounter(object):
+    """Counts the kmers of a graph"""
+
+    def map(self, record_array):
+        return len(record_array)
+
+    def reduce(self, results, header):
+        return sum(results)
+
+
+@attr.s(slots=True)
+class CoverageHistogram(object):
+    """Counts the number of kmers with each coverage in a color"""
+    color = attr.ib(0)
+
+    def map(self, record_array):
+        coverages, counts = np.unique(record_array.coverage[:, self.color], return_counts=True)
+        return Counter(dict(zip(coverages.tolist(), counts.tolist())))
+
+    def reduce(self, results, header):
+        histogram = Counter()
+        for result in results:
+            histogram.update(result)
+        return histogram
+
+
+@attr.s(slots=True)
+class RecordFilter(object):
+    """Keeps the records for which predicate is True
+
+    predicate takes a :py:class:`KmerRecordArray` and returns a boolean mask of the records to
+    keep. The kept records are returned as a :py:class:`KmerRecordArray` in graph order.
+    """
+    predicate = attr.ib()
+
+    def map(self, record_array):
+        return record_array.records[self.predicate(record_array)]
+
+    def reduce(self, results, header):
+        if results:
+            records = np.concatenate(results)
+        else:
+            records = np.zeros(0, dtype=record_dtype(header.kmer_container_size,
+                                                     header.num_colors))
+        return KmerRecordArray(records, kmer_size=header.kmer_size, num_colors=header.num_colors)
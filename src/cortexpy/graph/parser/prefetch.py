@@ -0,0 +1,122 @@
+"""Prefetching of neighbor records
+==================================
+
+When a kmer is read from a graph on disk, its neighbors are likely to be read next. A
+:py:class:`NeighborPrefetcher` asks the operating system to read the records of these neighbors
+into the page cache while the current kmer is processed.
+
+If the location of a record is known without reading the graph, which is the case for graphs
+with a fence index and for block-compressed graphs, then the kernel is told that the block of the
+record will be needed with ``posix_fadvise``. Otherwise, the binary search for the record is
+replayed in a background thread with ``os.pread``, which leaves the position of the graph handle
+untouched.
+"""
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import attr
+
+from cortexpy.utils import lexlo
+from .constants import UINT64_T
+from .kmer import StringKmerConverter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING_PER_WORKER = 16
+SEEN_KMER_CACHE_SIZE = 2 ** 12
+
+
+def neighbor_kmer_strings(kmer):
+    """Return the lexlo strings of all neighbors of a kmer in any color"""
+    neighbors = set()
+    for edge_set in kmer.edges:
+        neighbors.update(edge_set.get_incoming_kmer_strings(kmer.kmer))
+        neighbors.update(edge_set.get_outgoing_kmer_strings(kmer.kmer))
+    return {lexlo(neighbor) for neighbor in neighbors}
+
+
+@attr.s(slots=True)
+class NeighborPrefetcher(object):
+    """Warms the page cache for the records of the neighbors of kmers
+
+    block_location is a function that returns the byte offset and length of the block that may
+    contain a kmer. If it is None, then records are found by binary search in n_workers
+    background threads.
+    """
+    fileno = attr.ib()
+    header = attr.ib()
+    body_start = attr.ib()
+    n_records = attr.ib()
+    block_location = attr.ib(None)
+    n_workers = attr.ib(1)
+    max_pending = attr.ib(None)
+    kmer_string_converter = attr.ib(init=False)
+    _executor = attr.ib(None, init=False)
+    _pending = attr.ib(attr.Factory(set), init=False)
+    _seen = attr.ib(attr.Factory(OrderedDict), init=False)
+
+    def __attrs_post_init__(self):
+        self.kmer_string_converter = StringKmerConverter(self.header.kmer_size)
+        if self.max_pending is None:
+            self.max_pending = DEFAULT_MAX_PENDING_PER_WORKER * self.n_workers
+        if self.block_location is None or not hasattr(os, 'posix_fadvise'):
+            self._executor = ThreadPoolExecutor(max_workers=self.n_workers)
+
+    @classmethod
+    def from_graph_handle(cls, graph_handle, **kwargs):
+        """Return a prefetcher if graph_handle is a file, else None"""
+        try:
+            fileno = graph_handle.fileno()
+        except (AttributeError, OSError):
+            logger.debug('Not prefetching records of graph handle without file descriptor')
+            return None
+        return cls(fileno, **kwargs)
+
+    def prefetch_neighbors(self, kmer):
+        self.prefetch(neighbor_kmer_strings(kmer))
+
+    def prefetch(self, lexlo_strings):
+        for lexlo_string in lexlo_strings:
+            if lexlo_string in self._seen:
+                continue
+            self._seen[lexlo_string] = None
+            if len(self._seen) > SEEN_KMER_CACHE_SIZE:
+                self._seen.popitem(last=False)
+            uints = self.kmer_string_converter.to_uints(lexlo_string)
+            if self._executor is None:
+                offset, length = self.block_location(uints)
+                os.posix_fadvise(self.fileno, offset, length, os.POSIX_FADV_WILLNEED)
+            elif len(self._pending) < self.max_pending:
+                future = self._executor.submit(self._warm, uints)
+                self._pending.add(future)
+                future.add_done_callback(self._pending.discard)
+
+    def _warm(self, uints):
+        if self.block_location is not None:
+            offset, length = self.block_location(uints)
+            os.pread(self.fileno, length, offset)
+        else:
+            self._search(uints)
+
+    def _search(self, uints):
+        """Binary search for a kmer with positional reads and return the index of its record"""
+        key = [int(u) for u in uints]
+        kmer_bytes = self.header.kmer_container_size * UINT64_T
+        lo = 0
+        hi = self.n_records
+        while lo < hi:
+            mid = (lo + hi) // 2
+            raw_kmer = os.pread(self.fileno, kmer_bytes,
+                                self.body_start + mid * self.header.record_size)
+            if [int.from_bytes(raw_kmer[start:(start + UINT64_T)], 'little')
+                    for start in range(0, kmer_bytes, UINT64_T)] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
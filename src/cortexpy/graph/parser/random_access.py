@@ -3,6 +3,7 @@
 
 This module contains classes for inspecting Cortex graphs with random access to their kmers.
 """
+import logging
 from bisect import bisect_left
 from collections import Sequence, Mapping
 from functools import lru_cache
@@ -11,19 +12,66 @@ from io import SEEK_END
 import attr
 import numpy as np
 
+import cortexpy.edge_set
 import cortexpy.graph.cortex
 import cortexpy.graph.parser.header
-from cortexpy.utils import lexlo
+from cortexpy.utils import lexlo, lexlo_many
+from .block_cache import file_identity
+from .block_compressed import BlockCompressedGraph, decompressed_stream, is_block_compressed
+from .bloom_filter import BloomFilter
+from .components import ComponentIndex
 from .constants import UINT64_T
+from .fence_index import (
+    FenceIndex, FencedBlockReader, FencedKmerRecordSequence,
+    FencedKmerUintSequence, header_checksum,
+)
 from .kmer import (
     Kmer, KmerData, KmerUintComparator,
     StringKmerConverter,
 )
+from .prefetch import NeighborPrefetcher
+from .record_cache import RecordCache, kmer_record_entry_size, missing_kmer_entry_size
+from .search import SearchStrategy, interpolation_search_left, max_kmer_key
+from .unitigs import UnitigIndex
+from .record_array import map_graph_body, raw_kmers_to_strings, KmerRecordArray, KmerWordSequence
 from .streaming import (
+    DEFAULT_CHUNK_SIZE,
+    OffsetStream,
     kmer_generator_from_stream_and_header,
+    kmer_record_array_generator_from_stream_and_header,
     kmer_string_generator_from_stream_and_header,
 )
 
+logger = logging.getLogger(__name__)
+
+NOT_CACHED = object()
+
+
+@attr.s(slots=True)
+class KmerBatch(Sequence):
+    """The result of looking up a batch of kmer strings in a graph
+
+    Kmers are only built when they are accessed. Kmers that do not exist in the graph are None.
+    """
+    kmer_strings = attr.ib()
+    found = attr.ib()
+    indices = attr.ib(None)
+    _kmer_builder = attr.ib(None)
+    _kmers = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        self._kmers = [None for _ in range(len(self.kmer_strings))]
+
+    def __getitem__(self, item):
+        if not self.found[item]:
+            return None
+        if self._kmers[item] is None:
+            self._kmers[item] = self._kmer_builder(item)
+        return self._kmers[item]
+
+    def __len__(self):
+        return len(self.kmer_strings)
+
 
 @attr.s(slots=True)
 class SlurpedRandomAccess(Mapping):
@@ -36,6 +84,7 @@ class SlurpedRandomAccess(Mapping):
         Slurp the whole mccortex file and serve in O(1) time complexity.
         kmer_cache_size is ignored
         """
+        graph_handle = decompressed_stream(graph_handle)
         header = cortexpy.graph.parser.header.Header.from_stream(graph_handle)
         kmer_dict = {k.kmer: k for k in kmer_generator_from_stream_and_header(graph_handle, header)}
         return cls(header, kmer_dict)
@@ -53,6 +102,114 @@ class SlurpedRandomAccess(Mapping):
         """Will compute the revcomp of kmer string before getting a kmer"""
         return self[lexlo(string)]
 
+    def get_many(self, kmer_strings):
+        """Look up a batch of kmer strings after computing their lexlo representations"""
+        lexlo_strings = lexlo_many(kmer_strings)
+        found = np.array([s in self.kmer_dict for s in lexlo_strings], dtype=bool)
+        return KmerBatch(lexlo_strings, found,
+                         kmer_builder=lambda item: self.kmer_dict[lexlo_strings[item]])
+
+    @property
+    def num_colors(self):
+        return self.header.num_colors
+
+    @property
+    def colors(self):
+        return self.header.colors
+
+    @property
+    def sample_names(self):
+        return self.header.sample_names
+
+    @property
+    def kmer_size(self):
+        return self.header.kmer_size
+
+
+@attr.s(slots=True)
+class ColumnarRandomAccess(Mapping):
+    """Serve kmers from a Cortex graph that is held in memory as columnar NumPy arrays
+
+    All records are stored sorted by kmer in a single contiguous structured array of kmer words,
+    coverage and edges, which costs one Cortex record size per kmer. Kmers are found by binary
+    search and are only built when they are requested.
+    """
+    header = attr.ib()
+    graph_sequence = attr.ib()
+    iter_batch_size = attr.ib(2 ** 16)
+    graph_kmer_sequence = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        self.graph_kmer_sequence = KmerWordSequence(self.graph_sequence.kmer_words,
+                                                    kmer_size=self.header.kmer_size)
+
+    @classmethod
+    def from_handle(cls, graph_handle, kmer_cache_size=None):
+        """
+        Slurp the whole mccortex file into sorted columnar arrays and serve in log(n) time.
+        kmer_cache_size is ignored
+        """
+        graph_handle = decompressed_stream(graph_handle)
+        header = cortexpy.graph.parser.header.Header.from_stream(graph_handle)
+        body = graph_handle.read()
+        if len(body) % header.record_size != 0:
+            raise ValueError(
+                "Body size ({}) % Record size ({}) != 0".format(len(body), header.record_size))
+        graph_sequence = KmerRecordArray.from_buffer(body,
+                                                     kmer_size=header.kmer_size,
+                                                     kmer_container_size=header.kmer_container_size,
+                                                     num_colors=header.num_colors)
+        if not graph_sequence.is_sorted():
+            graph_sequence = graph_sequence.sorted()
+        return cls(header, graph_sequence)
+
+    def _build_kmer(self, index, lexlo_string):
+        kmer_data = KmerData(self.graph_sequence.raw_records[index].tobytes(),
+                             kmer_size=self.header.kmer_size,
+                             num_colors=self.header.num_colors)
+        kmer_data._kmer = lexlo_string
+        return Kmer.from_kmer_data(kmer_data)
+
+    def __getitem__(self, lexlo_string):
+        uints = self.graph_kmer_sequence.kmer_string_converter.to_uints(lexlo_string)
+        index = self.graph_kmer_sequence.index_uint_vector(uints)
+        if index < len(self):
+            if KmerUintComparator(uints) == self.graph_kmer_sequence[index]:
+                return self._build_kmer(index, lexlo_string)
+        raise KeyError('Could not retrieve kmer: ' + lexlo_string)
+
+    def __len__(self):
+        return len(self.graph_sequence)
+
+    def __iter__(self):
+        """Iterate over kmer strings in sorted order"""
+        raw_kmers = self.graph_sequence.raw_kmers
+        for start in range(0, len(self), self.iter_batch_size):
+            yield from raw_kmers_to_strings(raw_kmers[start:(start + self.iter_batch_size)],
+                                            self.header.kmer_size)
+
+    def items(self):
+        """Iterate over kmer strings and kmers in sorted order"""
+        return ((k_string, self._build_kmer(index, k_string)) for index, k_string in
+                enumerate(self))
+
+    def values(self):
+        """Iterate over kmers in sorted order"""
+        return (k for _, k in self.items())
+
+    def get_kmer_for_string(self, string):
+        """Will compute the revcomp of kmer string before getting a kmer"""
+        return self[lexlo(string)]
+
+    def get_many(self, kmer_strings):
+        """Look up a batch of kmer strings after computing their lexlo representations"""
+        lexlo_strings = lexlo_many(kmer_strings)
+        uint_matrix = self.graph_kmer_sequence.kmer_string_converter.to_uint_matrix(lexlo_strings)
+        indices, found = self.graph_kmer_sequence.index_uint_matrix(uint_matrix)
+        return KmerBatch(lexlo_strings, found, indices=indices,
+                         kmer_builder=lambda item: self._build_kmer(indices[item],
+                                                                    lexlo_strings[item]))
+
     @property
     def num_colors(self):
         return self.header.num_colors
@@ -72,50 +229,235 @@ class SlurpedRandomAccess(Mapping):
 
 @attr.s(slots=True, repr=False)
 class RandomAccess(Mapping):
-    """Provide fast k-mer access to Cortex graph in log(n) time (n = number of kmers in graph)"""
+    """Provide fast k-mer access to Cortex graph in log(n) time (n = number of kmers in graph)
+
+    If memory_map is True, then the graph body is memory-mapped and kmers are returned as views
+    into the mapped buffer instead of being read from the graph handle.
+
+    Otherwise, kmers are searched for with a :py:class:`FenceIndex` if one is given or if the
+    graph file has a sidecar index (``<graph>.idx``) that was built from it. A fence index
+    lookup costs a single bounded read instead of one read per binary search step.
+
+    Block-compressed graphs (see :py:mod:`cortexpy.graph.parser.block_compressed`) are searched
+    with their block index and cannot be memory-mapped.
+
+    If prefetch_workers is greater than 0, then the records of the neighbors of each kmer that is
+    returned are prefetched into the page cache (see :py:class:`NeighborPrefetcher`).
+    Memory-mapped graphs are not prefetched. Prefetch threads are stopped by :py:meth:`close` or
+    at the end of a ``with`` block.
+
+    Lookups of kmers that are not in the graph are short-circuited with a :py:class:`BloomFilter`
+    if one is given or if the graph file has a sidecar filter (``<graph>.bloom``) that was built
+    from it.
+
+    If record_cache_bytes is given, then the records of up to that many bytes of kmers are kept
+    in a :py:class:`RecordCache` together with their decoded kmer strings, coverage and edges.
+    Kmers that are not in the graph are cached as well, so kmer_cache_size defaults to 0 in this
+    case. Cache counters are available from :py:attr:`record_cache_stats`.
+
+    If a :py:class:`BlockCache` is given, such as the one returned by
+    :py:func:`shared_block_cache`, then records that are searched for without an index are read
+    through it, so that RandomAccess objects of the same files share reads.
+
+    A :py:class:`ComponentIndex` is loaded if one is given or if the graph file has a sidecar
+    component index (``<graph>.components``) that was built from it. The same holds for a
+    :py:class:`UnitigIndex` and its sidecar (``<graph>.unitigs``).
+
+    search_strategy selects how records are searched for without an index. Interpolation search
+    (see :py:mod:`cortexpy.graph.parser.search`) needs fewer reads per lookup than binary search
+    because graph kmers are close to uniformly distributed.
+    """
     graph_handle = attr.ib()
     kmer_cache_size = attr.ib(None)
+    memory_map = attr.ib(False)
+    fence_index = attr.ib(None)
+    prefetch_workers = attr.ib(0)
+    bloom_filter = attr.ib(None)
+    record_cache_bytes = attr.ib(None)
+    block_cache = attr.ib(None)
+    search_strategy = attr.ib(SearchStrategy.binary)
+    component_index = attr.ib(None)
+    unitig_index = attr.ib(None)
     header = attr.ib(init=False)
     graph_sequence = attr.ib(init=False)
     graph_kmer_sequence = attr.ib(init=False)
+    body_start = attr.ib(init=False)
     n_records = attr.ib(init=False)
+    block_compressed_graph = attr.ib(None, init=False)
+    prefetcher = attr.ib(None, init=False)
+    record_cache = attr.ib(None, init=False)
     _cached_get_uints_index_for_string = attr.ib(init=False)
 
     def __attrs_post_init__(self):
         assert self.graph_handle.seekable()
         self.graph_handle.seek(0)
+        if is_block_compressed(self.graph_handle):
+            self._init_block_compressed()
+        else:
+            self._init_uncompressed()
+        self._load_mapped_sidecars()
+        if self.record_cache_bytes is not None:
+            self.record_cache = RecordCache(self.record_cache_bytes)
+        if self.kmer_cache_size is None:
+            self.kmer_cache_size = self.n_records if self.record_cache is None else 0
+        self._cached_get_uints_index_for_string = lru_cache(maxsize=self.kmer_cache_size)(
+            self._get_uints_and_index_for_string)
+        if self.prefetch_workers > 0 and not self.memory_map:
+            self._init_prefetcher()
+
+    def _init_prefetcher(self):
+        block_location = None
+        if isinstance(self.graph_kmer_sequence, FencedKmerUintSequence):
+            block_reader = self.graph_kmer_sequence.block_reader
+            fence_index = self.fence_index
+
+            def block_location(uints):
+                return block_reader.location_of_block(fence_index.block_of(uints))
+
+        self.prefetcher = NeighborPrefetcher.from_graph_handle(self.graph_handle,
+                                                               header=self.header,
+                                                               body_start=self.body_start,
+                                                               n_records=self.n_records,
+                                                               block_location=block_location,
+                                                               n_workers=self.prefetch_workers)
+
+    def close(self):
+        """Stop prefetching records"""
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+            self.prefetcher = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _init_block_compressed(self):
+        if self.memory_map:
+            raise ValueError('Block-compressed graphs cannot be memory-mapped')
+        self.block_compressed_graph = BlockCompressedGraph.from_handle(self.graph_handle)
+        self.header = self.block_compressed_graph.header
+        self.body_start = None
+        self.n_records = self.block_compressed_graph.n_records
+        self.fence_index = self.block_compressed_graph.fence_index
+        block_reader = self.block_compressed_graph.block_reader()
+        self.graph_sequence = FencedKmerRecordSequence(block_reader)
+        self.graph_kmer_sequence = FencedKmerUintSequence(block_reader, self.fence_index)
+
+    def _init_uncompressed(self):
         self.header = cortexpy.graph.parser.header.Header.from_stream(self.graph_handle)
-        body_start_stream_position = self.graph_handle.tell()
+        self.body_start = self.graph_handle.tell()
 
         self.graph_handle.seek(0, SEEK_END)
-        body_size = self.graph_handle.tell() - body_start_stream_position
+        body_size = self.graph_handle.tell() - self.body_start
         if body_size % self.header.record_size != 0:
             raise ValueError(
                 "Body size ({}) % Record size ({}) != 0".format(body_size,
                                                                 self.header.record_size))
         self.n_records = body_size // self.header.record_size
-        if self.kmer_cache_size is None:
-            self.kmer_cache_size = self.n_records
-        self.graph_sequence = KmerRecordSequence(graph_handle=self.graph_handle,
-                                                 body_start=body_start_stream_position,
+        if self.memory_map:
+            self.graph_sequence = map_graph_body(self.graph_handle,
                                                  header=self.header,
+                                                 body_start=self.body_start,
                                                  n_records=self.n_records)
-        self.graph_kmer_sequence = KmerUintSequence(
-            graph_handle=self.graph_handle,
-            body_start=body_start_stream_position,
-            header=self.header,
-            n_records=self.n_records
-        )
-
-        self._cached_get_uints_index_for_string = lru_cache(maxsize=self.kmer_cache_size)(
-            self._get_uints_and_index_for_string)
+            self.graph_kmer_sequence = KmerWordSequence(self.graph_sequence.kmer_words,
+                                                        kmer_size=self.header.kmer_size)
+        elif self._load_fence_index(body_size):
+            block_reader = FencedBlockReader(graph_handle=self.graph_handle,
+                                             header=self.header,
+                                             body_start=self.body_start,
+                                             n_records=self.n_records,
+                                             interval=self.fence_index.interval)
+            self.graph_sequence = FencedKmerRecordSequence(block_reader)
+            self.graph_kmer_sequence = FencedKmerUintSequence(block_reader, self.fence_index)
+        else:
+            self.graph_sequence = KmerRecordSequence(graph_handle=self.graph_handle,
+                                                     body_start=self.body_start,
+                                                     header=self.header,
+                                                     n_records=self.n_records,
+                                                     block_cache=self.block_cache)
+            self.graph_kmer_sequence = KmerUintSequence(
+                graph_handle=self.graph_handle,
+                body_start=self.body_start,
+                header=self.header,
+                n_records=self.n_records,
+                block_cache=self.block_cache,
+                search_strategy=self.search_strategy
+            )
+
+    def _load_fence_index(self, body_size):
+        """Load the sidecar fence index if none was given and return True if an index is used"""
+        if self.fence_index is None:
+            self.fence_index = FenceIndex.from_sidecar(self.graph_handle)
+            if self.fence_index is None:
+                return False
+        if not self.fence_index.matches(self.graph_handle, self.header, self.body_start,
+                                        body_size):
+            logger.warning('Ignoring fence index that was not built from graph %s',
+                           getattr(self.graph_handle, 'name', self.graph_handle))
+            self.fence_index = None
+            return False
+        return True
+
+    def _load_mapped_sidecars(self):
+        """Load the sidecars that were not given and drop those that do not match the graph"""
+        body_size = self.n_records * self.header.record_size
+        checksum = None
+        for attribute, sidecar_class in (('bloom_filter', BloomFilter),
+                                         ('component_index', ComponentIndex),
+                                         ('unitig_index', UnitigIndex)):
+            sidecar = getattr(self, attribute)
+            if sidecar is None:
+                sidecar = sidecar_class.from_sidecar(self.graph_handle)
+                if sidecar is None:
+                    continue
+            if checksum is None:
+                checksum = self.header_checksum()
+            if not sidecar.matches(body_size, checksum):
+                logger.warning('Ignoring %s that was not built from graph %s',
+                               sidecar_class.DESCRIPTION,
+                               getattr(self.graph_handle, 'name', self.graph_handle))
+                sidecar = None
+            setattr(self, attribute, sidecar)
+
+    def header_checksum(self):
+        """Return the CRC32 checksum of the graph header"""
+        if self.block_compressed_graph is not None:
+            return self.block_compressed_graph.fence_index.header_checksum
+        return header_checksum(self.graph_handle, self.body_start)
 
     def _get_uints_and_index_for_string(self, kmer_string):
         uints = self.graph_kmer_sequence.kmer_string_converter.to_uints(kmer_string)
+        if self.bloom_filter is not None and not self.bloom_filter.might_contain(uints):
+            return uints, self.n_records
         index = self.graph_kmer_sequence.index_uint_vector(uints)
         return uints, index
 
     def _get_kmer_data_for_string(self, lexlo_string):
+        if self.record_cache is None:
+            return self._read_kmer_data_for_string(lexlo_string)
+        entry = self.record_cache.get(lexlo_string, NOT_CACHED)
+        if entry is NOT_CACHED:
+            try:
+                kmer_data = self._read_kmer_data_for_string(lexlo_string)
+            except KeyError:
+                self.record_cache.put(lexlo_string, None, missing_kmer_entry_size(self.header))
+                raise
+            entry = (bytes(kmer_data._data), kmer_data.coverage,
+                     tuple(edge_set.byte for edge_set in kmer_data.edges))
+            self.record_cache.put(lexlo_string, entry, kmer_record_entry_size(self.header))
+        elif entry is None:
+            raise KeyError('Could not retrieve kmer: ' + lexlo_string)
+        data, coverage, edge_bytes = entry
+        kmer_data = KmerData(data, kmer_size=self.header.kmer_size,
+                             num_colors=self.header.num_colors)
+        kmer_data._kmer = lexlo_string
+        kmer_data.coverage = coverage
+        kmer_data.edges = [cortexpy.edge_set.EdgeSet(edge_byte) for edge_byte in edge_bytes]
+        return kmer_data
+
+    def _read_kmer_data_for_string(self, lexlo_string):
         uints, index = self._cached_get_uints_index_for_string(lexlo_string)
         if index < self.n_records:
             if KmerUintComparator(uints) == self.graph_kmer_sequence[index]:
@@ -131,31 +473,85 @@ class RandomAccess(Mapping):
         kmer string. Use :py:func:`get_kmer_for_string` in order to convert a kmer string to its lexlo
         form before retrieving it from the cortex object.
         """
-        return Kmer.from_kmer_data(self._get_kmer_data_for_string(lexlo_string))
+        kmer = Kmer.from_kmer_data(self._get_kmer_data_for_string(lexlo_string))
+        if self.prefetcher is not None:
+            self.prefetcher.prefetch_neighbors(kmer)
+        return kmer
 
     def __len__(self):
         return max(0, self.n_records)
 
+    def _body_stream(self):
+        if self.block_compressed_graph is not None:
+            return self.block_compressed_graph.body_stream()
+        return OffsetStream(self.graph_handle, self.body_start)
+
     def __iter__(self):
         """Iterate over kmer strings in graph in order stored in graph"""
-        self.graph_handle.seek(self.graph_sequence.body_start)
-        return kmer_string_generator_from_stream_and_header(self.graph_handle, self.header)
+        return kmer_string_generator_from_stream_and_header(self._body_stream(), self.header)
 
     def items(self):
         """Iterate over kmer strings and kmers in graph in order stored in graph"""
-        self.graph_handle.seek(self.graph_sequence.body_start)
         return ((k.kmer, k) for k in
-                kmer_generator_from_stream_and_header(self.graph_handle, self.header))
+                kmer_generator_from_stream_and_header(self._body_stream(), self.header))
+
+    def record_arrays(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Iterate over chunks of records in graph as :py:class:`KmerRecordArray`"""
+        return kmer_record_array_generator_from_stream_and_header(self._body_stream(),
+                                                                  self.header, chunk_size)
 
     def values(self):
         """Iterate over kmers in cortex graph"""
-        self.graph_handle.seek(self.graph_sequence.body_start)
-        return kmer_generator_from_stream_and_header(self.graph_handle, self.header)
+        return kmer_generator_from_stream_and_header(self._body_stream(), self.header)
 
     def get_kmer_for_string(self, string):
         """Will compute the revcomp of kmer string before getting a kmer"""
         return self[lexlo(string)]
 
+    def index_of(self, lexlo_string):
+        """Return the record index of a lexlo kmer string"""
+        uints, index = self._cached_get_uints_index_for_string(lexlo_string)
+        if index < self.n_records:
+            if KmerUintComparator(uints) == self.graph_kmer_sequence[index]:
+                return index
+        raise KeyError('Could not retrieve kmer: ' + lexlo_string)
+
+    def get_kmer_at(self, index):
+        """Return the kmer of a record index without searching for it"""
+        return Kmer.from_kmer_data(self.graph_sequence[index])
+
+    def index_many(self, uint_matrix):
+        """Return the record indices of a kmer uint matrix and a mask of kmers found in graph
+
+        Use :py:meth:`StringKmerConverter.to_uint_matrix` to create a uint matrix from lexlo kmer
+        strings.
+        """
+        if self.bloom_filter is None:
+            return self.graph_kmer_sequence.index_uint_matrix(uint_matrix)
+        maybe = self.bloom_filter.might_contain_many(uint_matrix)
+        indices = np.full(len(uint_matrix), self.n_records, dtype=np.int64)
+        found = np.zeros(len(uint_matrix), dtype=bool)
+        if maybe.any():
+            indices[maybe], found[maybe] = self.graph_kmer_sequence.index_uint_matrix(
+                uint_matrix[maybe])
+        return indices, found
+
+    def get_many(self, kmer_strings):
+        """Look up a batch of kmer strings after computing their lexlo representations
+
+        All kmers are encoded into a single uint matrix and resolved in one pass.
+        """
+        lexlo_strings = lexlo_many(kmer_strings)
+        uint_matrix = self.graph_kmer_sequence.kmer_string_converter.to_uint_matrix(lexlo_strings)
+        indices, found = self.index_many(uint_matrix)
+
+        def build_kmer(item):
+            kmer_data = self.graph_sequence[indices[item]]
+            kmer_data._kmer = lexlo_strings[item]
+            return Kmer.from_kmer_data(kmer_data)
+
+        return KmerBatch(lexlo_strings, found, indices=indices, kmer_builder=build_kmer)
+
     @property
     def num_colors(self):
         return self.header.num_colors
@@ -172,6 +568,13 @@ class RandomAccess(Mapping):
     def kmer_size(self):
         return self.header.kmer_size
 
+    @property
+    def record_cache_stats(self):
+        """Return the counters of the record cache or None if records are not cached"""
+        if self.record_cache is None:
+            return None
+        return self.record_cache.stats
+
 
 @attr.s(slots=True)
 class KmerRecordSequence(Sequence):
@@ -179,16 +582,20 @@ class KmerRecordSequence(Sequence):
     header = attr.ib()
     body_start = attr.ib()
     n_records = attr.ib()
+    block_cache = attr.ib(None)
     record_size = attr.ib(init=False)
     num_colors = attr.ib(init=False)
     kmer_size = attr.ib(init=False)
     kmer_container_size = attr.ib(init=False)
+    file_key = attr.ib(None, init=False)
 
     def __attrs_post_init__(self):
         self.record_size = self.header.record_size
         self.kmer_size = self.header.kmer_size
         self.num_colors = self.header.num_colors
         self.kmer_container_size = self.header.kmer_container_size
+        if self.block_cache is not None:
+            self.file_key = file_identity(self.graph_handle)
 
     def __getitem__(self, item):
         if item >= self.n_records or item < 0:
@@ -199,8 +606,13 @@ class KmerRecordSequence(Sequence):
         return max(0, self.n_records)
 
     def _get_kmer_data_for_item(self, item):
-        self.graph_handle.seek(self.body_start + self.record_size * item)
-        kmer_bytes = self.graph_handle.read(self.record_size)
+        offset = self.body_start + self.record_size * item
+        if self.block_cache is not None:
+            kmer_bytes = self.block_cache.read(self.graph_handle, self.file_key, offset,
+                                               self.record_size)
+        else:
+            self.graph_handle.seek(offset)
+            kmer_bytes = self.graph_handle.read(self.record_size)
         return KmerData(
             kmer_bytes,
             kmer_size=self.kmer_size,
@@ -214,14 +626,23 @@ class KmerUintSequence(Sequence):
     header = attr.ib()
     body_start = attr.ib()
     n_records = attr.ib()
+    block_cache = attr.ib(None)
+    search_strategy = attr.ib(SearchStrategy.binary)
     record_size = attr.ib(init=False)
     kmer_container_size = attr.ib(init=False)
     kmer_string_converter = attr.ib(init=False)
+    file_key = attr.ib(None, init=False)
+    max_key = attr.ib(None, init=False)
 
     def __attrs_post_init__(self):
         self.record_size = self.header.record_size
         self.kmer_container_size = self.header.kmer_container_size
         self.kmer_string_converter = StringKmerConverter(self.header.kmer_size)
+        if self.block_cache is not None:
+            self.file_key = file_identity(self.graph_handle)
+        self.search_strategy = SearchStrategy(self.search_strategy)
+        if self.search_strategy == SearchStrategy.interpolation:
+            self.max_key = max_kmer_key(self.header.kmer_size)
 
     def __getitem__(self, item):
         if item >= self.n_records or item < 0:
@@ -233,8 +654,13 @@ class KmerUintSequence(Sequence):
         return max(0, self.n_records)
 
     def _get_kmer_data_for_item(self, item):
-        self.graph_handle.seek(self.body_start + self.record_size * item)
-        kmer_bytes = self.graph_handle.read(self.kmer_container_size * UINT64_T)
+        offset = self.body_start + self.record_size * item
+        if self.block_cache is not None:
+            kmer_bytes = self.block_cache.read(self.graph_handle, self.file_key, offset,
+                                               self.kmer_container_size * UINT64_T)
+        else:
+            self.graph_handle.seek(offset)
+            kmer_bytes = self.graph_handle.read(self.kmer_container_size * UINT64_T)
         return np.frombuffer(kmer_bytes, dtype='<u8')
 
     def index_kmer_string(self, kmer_string):
@@ -242,7 +668,29 @@ class KmerUintSequence(Sequence):
         return self.index_uint_vector(uints)
 
     def index_uint_vector(self, uints):
-        return bisect_left(self, KmerUintComparator(uints))
+        return self._search_left(uints)
+
+    def _search_left(self, uints, lo=0):
+        if self.search_strategy == SearchStrategy.interpolation:
+            return interpolation_search_left(self._get_kmer_data_for_item, uints, lo,
+                                             self.n_records, self.max_key)
+        return bisect_left(self, KmerUintComparator(uints), lo)
+
+    def index_uint_matrix(self, uint_matrix):
+        """Return record indices of many kmers and a mask of the kmers that exist
+
+        Kmers are searched for in sorted order so that each search starts where the previous
+        search ended.
+        """
+        indices = np.zeros(len(uint_matrix), dtype=np.int64)
+        found = np.zeros(len(uint_matrix), dtype=bool)
+        lo = 0
+        for row_idx in np.lexsort(uint_matrix.T[::-1]):
+            comparator = KmerUintComparator(uint_matrix[row_idx])
+            lo = self._search_left(uint_matrix[row_idx], lo)
+            indices[row_idx] = lo
+            found[row_idx] = lo < self.n_records and comparator == self[lo]
+        return indices, found
 
 
 def load_ra_cortex_graph(file_handle, ra_parser_args=None):
@@ -1,15 +1,34 @@
 from collections import Mapping
-from itertools import chain
+from heapq import merge
+from itertools import chain, groupby
+from operator import itemgetter
 
 import attr
+import numpy as np
 
-from cortexpy.utils import lexlo
+from cortexpy.utils import lexlo, lexlo_many
 from .kmer import Kmer, EmptyKmerBuilder
 from .kmer_collection import KmerDataCollection
+from .random_access import KmerBatch
+
+
+def sorted_items(ra_parser, parser_idx):
+    """Yield (kmer string, parser index, kmer) tuples of a parser and check that they are sorted"""
+    previous_kmer_string = None
+    for kmer_string, kmer in ra_parser.items():
+        if previous_kmer_string is not None and not previous_kmer_string < kmer_string:
+            raise ValueError('Kmers of graph {} are not sorted'.format(parser_idx))
+        previous_kmer_string = kmer_string
+        yield kmer_string, parser_idx, kmer
 
 
 @attr.s(slots=True)
 class RandomAccessCollection(Mapping):
+    """Combines the colors of several graphs
+
+    Iteration streams the union of the kmers of all graphs in sorted order with a k-way merge of
+    the kmers of each graph. All graphs need to be sorted.
+    """
     ra_parsers = attr.ib()
     empty_kmer_builders = attr.ib(init=False)
     num_colors = attr.ib(init=False)
@@ -41,12 +60,53 @@ class RandomAccessCollection(Mapping):
         return max(0, max((parser.n_records for parser in self.ra_parsers)))
 
     def __iter__(self):
-        raise NotImplementedError
+        """Iterate over the kmer strings of all graphs in sorted order"""
+        return (kmer_string for kmer_string, _ in self.items())
+
+    def items(self):
+        """Iterate over the kmer strings and kmers of all graphs in sorted order
+
+        The kmers of each graph are read in chunks of records, and kmers that are missing from a
+        graph get zero coverage and no edges in that graph's colors.
+        """
+        merged_items = merge(*(sorted_items(ra, idx) for idx, ra in enumerate(self.ra_parsers)),
+                             key=itemgetter(0))
+        for kmer_string, kmer_items in groupby(merged_items, key=itemgetter(0)):
+            kmers = [None for _ in range(len(self.ra_parsers))]
+            for _, parser_idx, kmer in kmer_items:
+                kmers[parser_idx] = kmer
+            for parser_idx, kmer in enumerate(kmers):
+                if kmer is None:
+                    kmers[parser_idx] = self.empty_kmer_builders[parser_idx].build(kmer_string)
+            yield kmer_string, Kmer.from_kmer_data(KmerDataCollection(kmers))
+
+    def values(self):
+        """Iterate over the kmers of all graphs in sorted order"""
+        return (kmer for _, kmer in self.items())
 
     def get_kmer_for_string(self, string):
         """Will compute the revcomp of string before getting a kmer"""
         return self[lexlo(string)]
 
+    def get_many(self, kmer_strings):
+        """Look up a batch of kmer strings after computing their lexlo representations"""
+        lexlo_strings = lexlo_many(kmer_strings)
+        batches = [parser.get_many(lexlo_strings) for parser in self.ra_parsers]
+        found = np.zeros(len(lexlo_strings), dtype=bool)
+        for batch in batches:
+            found |= batch.found
+
+        def build_kmer(item):
+            kmers = []
+            for parser_idx, batch in enumerate(batches):
+                kmer = batch[item]
+                if kmer is None:
+                    kmer = self.empty_kmer_builders[parser_idx].build_or_get(lexlo_strings[item])
+                kmers.append(kmer)
+            return Kmer.from_kmer_data(KmerDataCollection(kmers))
+
+        return KmerBatch(lexlo_strings, found, kmer_builder=build_kmer)
+
     @property
     def sample_names(self):
         return chain.from_iterable(ra.sample_names for ra in self.ra_parsers)
@@ -0,0 +1,194 @@
+"""Cortex kmer record arrays
+============================
+
+This module provides a columnar view of the records in a Cortex graph body. The records are
+exposed as a NumPy structured array with one uint64 column per kmer container word, one uint32
+column per color coverage and one uint8 column per color edge set.
+"""
+import io
+import mmap
+from collections.abc import Sequence
+
+import attr
+import numpy as np
+
+from .kmer import KmerData, KmerUintComparator, StringKmerConverter
+from .kmer_ext import raw_records_to_kmer_bytes
+
+
+def record_dtype(kmer_container_size, num_colors):
+    """Return the NumPy structured dtype of a Cortex graph record"""
+    return np.dtype([('kmer', '<u8', (kmer_container_size,)),
+                     ('coverage', '<u4', (num_colors,)),
+                     ('edges', 'u1', (num_colors,))])
+
+
+def map_graph_body(graph_handle, header, body_start, n_records):
+    """Memory-map the body of a Cortex graph without copying it
+
+    File handles are mapped with :py:mod:`mmap`. In-memory handles that provide a ``getbuffer``
+    method, such as :py:class:`io.BytesIO`, are viewed directly.
+    """
+    try:
+        buffer = mmap.mmap(graph_handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, io.UnsupportedOperation):
+        try:
+            buffer = graph_handle.getbuffer()
+        except AttributeError:
+            raise ValueError('Graph handle ({}) cannot be memory-mapped'.format(graph_handle))
+    return KmerRecordArray.from_buffer(buffer,
+                                       kmer_size=header.kmer_size,
+                                       kmer_container_size=header.kmer_container_size,
+                                       num_colors=header.num_colors,
+                                       offset=body_start,
+                                       count=n_records)
+
+
+def raw_kmers_to_strings(raw_kmers, kmer_size):
+    """Decode a (number of kmers, kmer container bytes) array of raw kmers to kmer strings"""
+    n_kmers = len(raw_kmers)
+    if n_kmers == 0:
+        return []
+    kmer_strings = raw_records_to_kmer_bytes(kmer_size, raw_kmers).tobytes().decode()
+    return [kmer_strings[start:(start + kmer_size)]
+            for start in range(0, n_kmers * kmer_size, kmer_size)]
+
+
+def bisect_kmer_words(kmer_words, uints):
+    """Return the insertion point of a kmer in a sorted two-dimensional array of kmer words"""
+    key = [int(u) for u in uints]
+    lo = 0
+    hi = len(kmer_words)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if kmer_words[mid].tolist() < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def kmer_rows_less_than(first, second):
+    """Compare two kmer word matrices row by row in lexicographic order"""
+    less = np.zeros(len(first), dtype=bool)
+    undecided = np.ones(len(first), dtype=bool)
+    for word_idx in range(first.shape[1]):
+        less |= undecided & (first[:, word_idx] < second[:, word_idx])
+        undecided &= first[:, word_idx] == second[:, word_idx]
+    return less
+
+
+def bisect_kmer_words_many(kmer_words, uint_matrix):
+    """Return the insertion points of many kmers in a sorted array of kmer words
+
+    All kmers are searched for at the same time. Only the kmer words probed by the search are
+    accessed, so kmer_words may be a memory-mapped column.
+    """
+    lo = np.zeros(len(uint_matrix), dtype=np.int64)
+    hi = np.full(len(uint_matrix), len(kmer_words), dtype=np.int64)
+    active = np.nonzero(lo < hi)[0]
+    while len(active) > 0:
+        mid = (lo[active] + hi[active]) // 2
+        less = kmer_rows_less_than(kmer_words[mid], uint_matrix[active])
+        lo[active[less]] = mid[less] + 1
+        hi[active[~less]] = mid[~less]
+        active = active[lo[active] < hi[active]]
+    return lo
+
+
+@attr.s(slots=True)
+class KmerRecordArray(Sequence):
+    """A sequence of :py:class:`KmerData` views over a structured array of Cortex records
+
+    No record data is copied when a :py:class:`KmerData` object is returned.
+    """
+    records = attr.ib()
+    kmer_size = attr.ib()
+    num_colors = attr.ib()
+    raw_records = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        self.raw_records = self.records.view(np.uint8).reshape(len(self.records),
+                                                               self.records.dtype.itemsize)
+
+    @classmethod
+    def from_buffer(cls, buffer, *, kmer_size, kmer_container_size, num_colors, offset=0,
+                    count=-1):
+        records = np.frombuffer(buffer,
+                                dtype=record_dtype(kmer_container_size, num_colors),
+                                count=count,
+                                offset=offset)
+        records.flags.writeable = False
+        return cls(records, kmer_size=kmer_size, num_colors=num_colors)
+
+    @property
+    def kmer_words(self):
+        return self.records['kmer']
+
+    @property
+    def raw_kmers(self):
+        return self.raw_records[:, :self.records.dtype['kmer'].itemsize]
+
+    def kmer_strings(self):
+        """Decode the kmer strings of all records"""
+        return raw_kmers_to_strings(self.raw_kmers, self.kmer_size)
+
+    @property
+    def coverage(self):
+        return self.records['coverage']
+
+    @property
+    def edges(self):
+        return self.records['edges']
+
+    def is_sorted(self):
+        """Return True if the records are sorted by kmer"""
+        kmer_words = self.kmer_words
+        return not np.any(kmer_rows_less_than(kmer_words[1:], kmer_words[:-1]))
+
+    def sorted(self):
+        """Return a copy of this record array with its records sorted by kmer"""
+        order = np.lexsort(self.kmer_words.T[::-1])
+        return type(self)(self.records[order], kmer_size=self.kmer_size, num_colors=self.num_colors)
+
+    def __getitem__(self, item):
+        if item >= len(self.records) or item < 0:
+            raise IndexError("Index ({}) is out of range".format(item))
+        return KmerData(self.raw_records[item], kmer_size=self.kmer_size,
+                        num_colors=self.num_colors)
+
+    def __len__(self):
+        return len(self.records)
+
+
+@attr.s(slots=True)
+class KmerWordSequence(Sequence):
+    """Drop-in replacement for :py:class:`KmerUintSequence` backed by a kmer word array"""
+    kmer_words = attr.ib()
+    kmer_size = attr.ib()
+    kmer_string_converter = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        self.kmer_string_converter = StringKmerConverter(self.kmer_size)
+
+    def __getitem__(self, item):
+        if item >= len(self.kmer_words) or item < 0:
+            raise IndexError("Index ({}) is out of range".format(item))
+        return KmerUintComparator(kmer_uints=self.kmer_words[item])
+
+    def __len__(self):
+        return len(self.kmer_words)
+
+    def index_kmer_string(self, kmer_string):
+        uints = self.kmer_string_converter.to_uints(kmer_string)
+        return self.index_uint_vector(uints)
+
+    def index_uint_vector(self, uints):
+        return bisect_kmer_words(self.kmer_words, uints)
+
+    def index_uint_matrix(self, uint_matrix):
+        """Return record indices of many kmers and a mask of the kmers that exist"""
+        indices = bisect_kmer_words_many(self.kmer_words, uint_matrix)
+        found = indices < len(self.kmer_words)
+        found[found] = np.all(self.kmer_words[indices[found]] == uint_matrix[found], axis=1)
+        return indices, found
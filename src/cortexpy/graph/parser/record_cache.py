@@ -0,0 +1,92 @@
+"""Byte-budgeted caches
+=======================
+
+Traversals look up the same kmers and their neighbors many times. A :py:class:`RecordCache`
+keeps recently used values in memory up to a budget in bytes and evicts the least recently used
+values when the budget is exceeded, so that memory use per worker is capped.
+"""
+from collections import OrderedDict
+
+import attr
+
+ENTRY_OVERHEAD_BYTES = 256
+COLOR_OVERHEAD_BYTES = 128
+
+
+@attr.s(slots=True)
+class RecordCache(object):
+    """A least recently used cache with a memory budget in bytes
+
+    The size of each value is given when the value is stored. Hits, misses and evictions are
+    counted.
+    """
+    max_bytes = attr.ib()
+    n_bytes = attr.ib(0, init=False)
+    hits = attr.ib(0, init=False)
+    misses = attr.ib(0, init=False)
+    evictions = attr.ib(0, init=False)
+    _entries = attr.ib(attr.Factory(OrderedDict), init=False)
+
+    @max_bytes.validator
+    def check(self, attribute, value):
+        if value < 0:
+            raise ValueError('max_bytes ({}) has to be at least 0'.format(value))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Return the value of key and mark it as recently used"""
+        try:
+            value, _ = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value, size):
+        """Store a value of size bytes and evict least recently used values over budget"""
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.n_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, size)
+        self.n_bytes += size
+        self._evict()
+
+    def resize(self, max_bytes):
+        """Change the budget and evict least recently used values over the new budget"""
+        self.check(None, max_bytes)
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        while self.n_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.n_bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.n_bytes = 0
+
+    @property
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self), 'bytes': self.n_bytes, 'max_bytes': self.max_bytes}
+
+
+def kmer_record_entry_size(header):
+    """Estimate the bytes used by a cached record and its decoded kmer, coverage and edges"""
+    return header.record_size + header.kmer_size + ENTRY_OVERHEAD_BYTES + \
+        header.num_colors * COLOR_OVERHEAD_BYTES
+
+
+def missing_kmer_entry_size(header):
+    """Estimate the bytes used by a cached kmer that is not in a graph"""
+    return header.kmer_size + ENTRY_OVERHEAD_BYTES
@@ -0,0 +1,70 @@
+"""Kmer search strategies
+=========================
+
+Kmers in a sorted Cortex graph are searched for by binary search by default. Because the kmers
+of a graph are close to uniformly distributed over the space of kmers, the position of a kmer
+can also be estimated from its value. Interpolation search probes the estimated position and
+needs a few probes per lookup instead of the log2(n) probes of binary search.
+
+The value of a kmer is estimated from its leading kmer words. Because the first word only
+contains the letters that do not fit into the other words, the first two words are combined
+into a float for kmers of more than 32 letters. Interpolation probes are limited to about
+2 * log2(log2(n)), which is the number needed for uniformly distributed kmers. Any remaining
+search is by bisection, so that lookups in graphs with skewed kmers never need many more probes
+than binary search.
+"""
+from enum import Enum
+
+import numpy as np
+
+from .kmer import StringKmerConverter
+
+
+class SearchStrategy(Enum):
+    binary = 0
+    interpolation = 1
+
+
+def kmer_key(kmer_words):
+    """Return the value of the leading words of a kmer as a float"""
+    key = float(kmer_words[0])
+    if len(kmer_words) > 1:
+        key = key * 2.0 ** 64 + float(kmer_words[1])
+    return key
+
+
+def max_kmer_key(kmer_size):
+    """Return a key that is greater than the key of any kmer of size kmer_size"""
+    return kmer_key(StringKmerConverter(kmer_size).to_uints('T' * kmer_size)) + 1.0
+
+
+def interpolation_search_left(kmer_words_at, uints, lo, hi, max_key):
+    """Return the index of the first record in [lo, hi) that is not less than uints
+
+    kmer_words_at is a function that returns the kmer words of a record index. Records are
+    expected to be unique, so the search stops at the first record that equals uints.
+    """
+    target = [int(u) for u in uints]
+    target_key = kmer_key(target)
+    lo_key = 0.0
+    hi_key = max_key
+    n_interpolations = 2 * max(1, hi - lo).bit_length().bit_length()
+    while lo < hi:
+        if n_interpolations > 0 and lo_key < hi_key:
+            n_interpolations -= 1
+            fraction = (target_key - lo_key) / (hi_key - lo_key)
+            probe = min(max(lo + int(fraction * (hi - lo)), lo), hi - 1)
+        else:
+            probe = (lo + hi) // 2
+        kmer_words = kmer_words_at(probe)
+        if isinstance(kmer_words, np.ndarray):
+            kmer_words = kmer_words.tolist()
+        if kmer_words == target:
+            return probe
+        if kmer_words < target:
+            lo = probe + 1
+            lo_key = kmer_key(kmer_words)
+        else:
+            hi = probe
+            hi_key = kmer_key(kmer_words)
+    return lo
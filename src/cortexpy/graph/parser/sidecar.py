@@ -0,0 +1,56 @@
+"""Cortex graph sidecar files
+=============================
+
+A sidecar file stores an index of a Cortex graph at the path of the graph plus a suffix.
+Memory-mapped sidecars, such as Bloom filters, start with a header that stores the size of the
+graph body and a checksum of the graph header, which are used to reject a sidecar that does not
+belong to a graph.
+"""
+import mmap
+import os
+import struct
+
+
+def existing_sidecar_path(graph_handle, suffix):
+    """Return the path of the sidecar file of a graph file handle or None if it does not exist"""
+    graph_path = getattr(graph_handle, 'name', None)
+    if not isinstance(graph_path, str) or not os.path.isfile(graph_path + suffix):
+        return None
+    return graph_path + suffix
+
+
+def map_sidecar(path, header_format, magic, version, description):
+    """Memory-map a sidecar file and return the buffer and the header fields after the version"""
+    with open(path, 'rb') as fh:
+        buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    header = struct.unpack_from(header_format, buffer)
+    if header[0] != magic:
+        raise ValueError('File is not a Cortex graph {}: {}'.format(description, path))
+    if header[1] != version:
+        raise ValueError('Unsupported {} version ({})'.format(description, header[1]))
+    return buffer, header[2:]
+
+
+class MappedSidecar(object):
+    """Base class of memory-mapped sidecars with `body_size` and `header_checksum` attributes
+
+    Subclasses define the sidecar file SUFFIX, a DESCRIPTION for messages and `from_path`.
+    """
+    __slots__ = ()
+    SUFFIX = None
+    DESCRIPTION = None
+
+    @classmethod
+    def sidecar_path(cls, graph_path):
+        return graph_path + cls.SUFFIX
+
+    @classmethod
+    def from_sidecar(cls, graph_handle):
+        """Load the sidecar of a graph file handle if its sidecar file exists"""
+        path = existing_sidecar_path(graph_handle, cls.SUFFIX)
+        if path is None:
+            return None
+        return cls.from_path(path)
+
+    def matches(self, body_size, header_checksum):
+        return self.body_size == body_size and self.header_checksum == header_checksum
@@ -1,48 +1,100 @@
 import io
 
+import attr
+
+from cortexpy.graph.parser.block_compressed import decompressed_stream
 from cortexpy.graph.parser.constants import UINT64_T
 from cortexpy.graph.parser.header import Header
-from cortexpy.graph.parser.kmer import Kmer, KmerData, RawKmerConverter
+from cortexpy.graph.parser.kmer import Kmer, KmerData
+from cortexpy.graph.parser.record_array import KmerRecordArray
 from cortexpy.graph.cortex import build_cortex_graph_from_header
 
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+@attr.s(slots=True)
+class OffsetStream(object):
+    """Reads a handle from an offset of its own
+
+    Lookups that read the same handle while the stream is iterated do not move the offset of
+    the stream.
+    """
+    handle = attr.ib()
+    offset = attr.ib()
+
+    def read(self, size=-1):
+        self.handle.seek(self.offset)
+        data = self.handle.read(size)
+        self.offset += len(data)
+        return data
+
 
 def kmer_generator_from_stream(stream):
+    stream = decompressed_stream(stream)
     header = Header.from_stream(stream)
     return kmer_generator_from_stream_and_header(stream, header)
 
 
 def kmer_list_generator_from_stream(stream):
+    stream = decompressed_stream(stream)
     header = Header.from_stream(stream)
     return kmer_list_generator_from_stream_and_header(stream, header)
 
 
 def kmer_string_generator_from_stream(stream):
+    stream = decompressed_stream(stream)
     header = Header.from_stream(stream)
     return kmer_string_generator_from_stream_and_header(stream, header)
 
 
-def kmer_string_generator_from_stream_and_header(stream, header):
-    record_size = header.kmer_container_size * UINT64_T + 5 * header.num_colors
-    kmer_container_size = header.kmer_container_size * UINT64_T
-    assert record_size >= kmer_container_size
-    kmer_converter = RawKmerConverter(header.kmer_size)
-
-    raw_kmer = stream.read(record_size)
-    while raw_kmer != b'':
-        yield kmer_converter.to_string(raw_kmer[:kmer_container_size])
-        raw_kmer = stream.read(record_size)
+def record_chunk_generator_from_stream_and_header(stream, header, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Read a Cortex graph body in chunks of whole records
 
-
-def kmer_generator_from_stream_and_header(stream, header):
+    Each chunk is about chunk_size bytes long and contains at least one record.
+    """
+    record_size = header.kmer_container_size * UINT64_T + 5 * header.num_colors
+    read_size = max(1, chunk_size // record_size) * record_size
+    chunk = stream.read(read_size)
+    while chunk != b'':
+        while len(chunk) % record_size != 0:
+            rest = stream.read(record_size - len(chunk) % record_size)
+            if rest == b'':
+                raise ValueError('Graph body ends with a truncated record')
+            chunk += rest
+        yield chunk
+        chunk = stream.read(read_size)
+
+
+def kmer_record_array_generator_from_stream_and_header(stream, header,
+                                                       chunk_size=DEFAULT_CHUNK_SIZE):
+    """Decode a Cortex graph body into batches of :py:class:`KmerRecordArray`"""
+    for chunk in record_chunk_generator_from_stream_and_header(stream, header, chunk_size):
+        yield KmerRecordArray.from_buffer(chunk,
+                                          kmer_size=header.kmer_size,
+                                          kmer_container_size=header.kmer_container_size,
+                                          num_colors=header.num_colors)
+
+
+def kmer_string_generator_from_stream_and_header(stream, header, chunk_size=DEFAULT_CHUNK_SIZE):
+    record_arrays = kmer_record_array_generator_from_stream_and_header(stream, header, chunk_size)
+    for record_array in record_arrays:
+        yield from record_array.kmer_strings()
+
+
+def kmer_generator_from_stream_and_header(stream, header, chunk_size=DEFAULT_CHUNK_SIZE):
     record_size = header.kmer_container_size * UINT64_T + 5 * header.num_colors
-    raw_record = stream.read(record_size)
-    while raw_record != b'':
-        yield Kmer.from_kmer_data(
-            KmerData(raw_record,
-                     header.kmer_size,
-                     header.num_colors)
-        )
-        raw_record = stream.read(record_size)
+    for chunk in record_chunk_generator_from_stream_and_header(stream, header, chunk_size):
+        record_array = KmerRecordArray.from_buffer(chunk,
+                                                   kmer_size=header.kmer_size,
+                                                   kmer_container_size=header.kmer_container_size,
+                                                   num_colors=header.num_colors)
+        for start, kmer_string in zip(range(0, len(chunk), record_size),
+                                      record_array.kmer_strings()):
+            kmer_data = KmerData(chunk[start:(start + record_size)],
+                                 header.kmer_size,
+                                 header.num_colors)
+            kmer_data._kmer = kmer_string
+            yield Kmer.from_kmer_data(kmer_data)
 
 
 def kmer_list_generator_from_stream_and_header(stream, header):
@@ -50,6 +102,7 @@ def kmer_list_generator_from_stream_and_header(stream, header):
 
 
 def load_cortex_graph(stream):
+    stream = decompressed_stream(stream)
     header = Header.from_stream(stream)
     kmer_generator = kmer_generator_from_stream_and_header(stream, header)
     return build_cortex_graph_from_header(header, kmer_generator=kmer_generator)
@@ -0,0 +1,224 @@
+"""Cortex graph unitig indexes
+============================
+
+A unitig index sidecar file (``<graph>.unitigs``) stores the unitigs of a Cortex graph: the
+maximal paths of records in which consecutive records are each other's only neighbor on the
+sides that connect them. Each record is in exactly one unitig, and records without such a
+neighbor form unitigs of length one. Edges of all colors are combined.
+
+For each record, the index stores the id of its unitig, its position in the unitig, and whether
+the lexlo kmer of the record reads in the direction of the unitig (forward). The records of all
+unitigs are stored in unitig order, so that the start record, end record and length of each
+unitig, and the records between any two positions, are found without looking up kmers.
+:py:class:`~cortexpy.graph.traversal.branch.Traverser` uses the index to jump over unitigs.
+
+The index is built in a single pass over the graph body with one batched neighbor lookup per
+chunk of records, followed by a walk along the unitigs. Like a component index, the index is
+memory-mapped when it is opened.
+"""
+import struct
+
+import attr
+import numpy as np
+
+from cortexpy.edge_set import (
+    INCOMING_SIDE, OUTGOING_SIDE, SIDE_DEGREES, SIDE_EDGE_INDICES, neighbor_letter_matrix,
+)
+from .kmer import lexlo_letter_matrix, uint_matrix_to_letter_matrix
+from .sidecar import MappedSidecar, map_sidecar
+from .streaming import DEFAULT_CHUNK_SIZE
+
+UNITIG_INDEX_MAGIC = b'CTXUNITG'
+UNITIG_INDEX_VERSION = 1
+UNITIG_INDEX_SUFFIX = '.unitigs'
+UNITIG_INDEX_HEADER_FORMAT = '<8sIIQQQ'
+INDEX_DTYPE = np.dtype('<i8')
+
+
+def unique_neighbor_partners(ra_parser, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Return the partner side of every side of every record of a graph
+
+    Side ``2 * record + side`` of a record is its incoming (0) or outgoing (1) side. The partner
+    of a side with exactly one edge is the side of the neighbor record that the edge enters.
+    Sides without exactly one edge to a record of the graph have a partner of -1.
+    """
+    n_records = len(ra_parser)
+    converter = ra_parser.graph_kmer_sequence.kmer_string_converter
+    partners = np.full(2 * n_records, -1, dtype=np.int64)
+    start = 0
+    for record_array in ra_parser.record_arrays(chunk_size):
+        letter_vals = uint_matrix_to_letter_matrix(record_array.kmer_words, ra_parser.kmer_size)
+        edge_bytes = np.bitwise_or.reduce(record_array.edges, axis=1)
+        for side in (INCOMING_SIDE, OUTGOING_SIDE):
+            has_one_edge = np.nonzero(SIDE_DEGREES[side][edge_bytes] == 1)[0]
+            rows, neighbors = neighbor_letter_matrix(letter_vals[has_one_edge],
+                                                     edge_bytes[has_one_edge],
+                                                     SIDE_EDGE_INDICES[side])
+            if len(rows) == 0:
+                continue
+            lexlo_neighbors = lexlo_letter_matrix(neighbors)
+            indices, found = ra_parser.index_many(
+                converter.letter_matrix_to_uint_matrix(lexlo_neighbors))
+            # a lexlo neighbor is entered through the side that faces the side it was reached from
+            neighbor_sides = np.where(np.all(lexlo_neighbors == neighbors, axis=1),
+                                      1 - side, side)
+            records = has_one_edge[rows[found]] + start
+            partners[2 * records + side] = 2 * indices[found] + neighbor_sides[found]
+        start += len(record_array)
+    return partners
+
+
+def linked_sides(partners):
+    """Return a mask of the sides that are each other's partners and belong to different records"""
+    sides = np.arange(len(partners))
+    linked = partners >= 0
+    linked_partners = partners[linked]
+    linked[linked] = (partners[linked_partners] == sides[linked]) & \
+        (linked_partners >> 1 != sides[linked] >> 1)
+    return linked
+
+
+def walk_unitigs(partners, linked):
+    """Return the records of all unitigs in unitig order, their lengths and orientations
+
+    Unitigs are walked from their first end in record order. Records in circular paths are
+    unitigs of length one.
+    """
+    n_records = len(partners) // 2
+    record_order = np.empty(n_records, dtype=np.int64)
+    forward = np.ones(n_records, dtype=bool)
+    visited = np.zeros(n_records, dtype=bool)
+    lengths = []
+    partners_list = partners.tolist()
+    linked_list = linked.tolist()
+    n_linked = linked.reshape(n_records, 2).sum(axis=1)
+    position = 0
+    for record in np.nonzero(n_linked < 2)[0].tolist():
+        if visited[record]:
+            continue
+        exit_side = INCOMING_SIDE if linked_list[2 * record + INCOMING_SIDE] else OUTGOING_SIDE
+        forward[record] = exit_side == OUTGOING_SIDE
+        length = 0
+        while True:
+            visited[record] = True
+            record_order[position] = record
+            position += 1
+            length += 1
+            side = 2 * record + exit_side
+            if not linked_list[side]:
+                break
+            record, entry_side = partners_list[side] >> 1, partners_list[side] & 1
+            forward[record] = entry_side == INCOMING_SIDE
+            exit_side = 1 - entry_side
+        lengths.append(length)
+    circular = np.nonzero(~visited)[0]
+    record_order[position:] = circular
+    lengths.extend([1] * len(circular))
+    return record_order, np.array(lengths, dtype=np.int64), forward
+
+
+@attr.s(slots=True)
+class UnitigIndex(MappedSidecar):
+    """The unitig, position and orientation of each record of a Cortex graph"""
+    SUFFIX = UNITIG_INDEX_SUFFIX
+    DESCRIPTION = 'unitig index'
+
+    body_size = attr.ib()
+    header_checksum = attr.ib()
+    unitig_ids = attr.ib()
+    positions = attr.ib()
+    forward = attr.ib()
+    record_order = attr.ib()
+    unitig_offsets = attr.ib()
+
+    @classmethod
+    def from_random_access(cls, ra_parser, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Find the unitigs of the graph of a :py:class:`RandomAccess`"""
+        partners = unique_neighbor_partners(ra_parser, chunk_size)
+        record_order, lengths, forward = walk_unitigs(partners, linked_sides(partners))
+        unitig_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=unitig_offsets[1:])
+        unitig_ids = np.empty(len(record_order), dtype=np.int64)
+        unitig_ids[record_order] = np.repeat(np.arange(len(lengths)), lengths)
+        positions = np.empty(len(record_order), dtype=np.int64)
+        positions[record_order] = np.arange(len(record_order)) - np.repeat(unitig_offsets[:-1],
+                                                                           lengths)
+        return cls(body_size=len(record_order) * ra_parser.header.record_size,
+                   header_checksum=ra_parser.header_checksum(),
+                   unitig_ids=unitig_ids,
+                   positions=positions,
+                   forward=forward,
+                   record_order=record_order,
+                   unitig_offsets=unitig_offsets)
+
+    @classmethod
+    def from_graph_handle(cls, graph_handle, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Find the unitigs of an uncompressed or block-compressed graph"""
+        from .block_compressed import is_block_compressed
+        from .random_access import RandomAccess
+        graph_handle.seek(0)
+        memory_map = not is_block_compressed(graph_handle)
+        ra_parser = RandomAccess(graph_handle, kmer_cache_size=0, memory_map=memory_map)
+        return cls.from_random_access(ra_parser, chunk_size=chunk_size)
+
+    @classmethod
+    def from_path(cls, path):
+        """Memory-map a unitig index file"""
+        buffer, (header_checksum, n_records, n_unitigs, body_size) = map_sidecar(
+            path, UNITIG_INDEX_HEADER_FORMAT, UNITIG_INDEX_MAGIC, UNITIG_INDEX_VERSION,
+            cls.DESCRIPTION)
+        offset = struct.calcsize(UNITIG_INDEX_HEADER_FORMAT)
+        arrays = []
+        for count in (n_records, n_records, n_records, n_unitigs + 1):
+            arrays.append(np.frombuffer(buffer, dtype=INDEX_DTYPE, count=count, offset=offset))
+            offset += count * INDEX_DTYPE.itemsize
+        unitig_ids, positions, record_order, unitig_offsets = arrays
+        forward = np.frombuffer(buffer, dtype=bool, count=n_records, offset=offset)
+        return cls(body_size=body_size,
+                   header_checksum=header_checksum,
+                   unitig_ids=unitig_ids,
+                   positions=positions,
+                   forward=forward,
+                   record_order=record_order,
+                   unitig_offsets=unitig_offsets)
+
+    def dump(self, buffer):
+        buffer.write(struct.pack(UNITIG_INDEX_HEADER_FORMAT,
+                                 UNITIG_INDEX_MAGIC,
+                                 UNITIG_INDEX_VERSION,
+                                 self.header_checksum,
+                                 len(self.unitig_ids),
+                                 self.n_unitigs,
+                                 self.body_size))
+        for array in (self.unitig_ids, self.positions, self.record_order, self.unitig_offsets):
+            buffer.write(array.astype(INDEX_DTYPE).tobytes())
+        buffer.write(self.forward.astype(bool).tobytes())
+
+    @property
+    def n_unitigs(self):
+        return len(self.unitig_offsets) - 1
+
+    @property
+    def lengths(self):
+        return np.diff(self.unitig_offsets)
+
+    @property
+    def start_records(self):
+        return self.record_order[self.unitig_offsets[:-1]]
+
+    @property
+    def end_records(self):
+        return self.record_order[self.unitig_offsets[1:] - 1]
+
+    def records_after(self, record_idx, ascending):
+        """Return the records of the unitig of a record that follow it
+
+        Records follow in the direction of the unitig if ascending is True, else in the opposite
+        direction.
+        """
+        unitig_id = self.unitig_ids[record_idx]
+        start = self.unitig_offsets[unitig_id]
+        position = start + self.positions[record_idx]
+        if ascending:
+            return self.record_order[(position + 1):self.unitig_offsets[unitig_id + 1]]
+        return self.record_order[start:position][::-1]
@@ -2,6 +2,7 @@ import struct
 
 import attr
 
+from cortexpy.graph.parser.block_compressed import BlockCompressedWriter
 from cortexpy.graph.parser.header import Header
 from cortexpy.graph.parser.kmer import calc_kmer_container_size
 
@@ -16,6 +17,18 @@ class ColorInformationBlock(object):
     cov_threshold_on_kmers = attr.ib(0)
     name_of_graph_cleaned_against = attr.ib(b'')
 
+    @classmethod
+    def from_header_tuple(cls, color_info_block):
+        """Convert a color information block as parsed by :py:class:`Header`"""
+        if isinstance(color_info_block, cls):
+            return color_info_block
+        (flags_and_thresholds, name_of_graph_cleaned_against) = color_info_block
+        flags = [flag != b'\x00' for flag in flags_and_thresholds[:4]]
+        return cls(*flags,
+                   cov_threshold_on_unitigs=flags_and_thresholds[4],
+                   cov_threshold_on_kmers=flags_and_thresholds[5],
+                   name_of_graph_cleaned_against=name_of_graph_cleaned_against)
+
     def dump(self, buffer):
         assert isinstance(self.name_of_graph_cleaned_against, bytes)
         string_length = len(self.name_of_graph_cleaned_against)
@@ -67,8 +80,17 @@ class Kmers(object):
                       sample_names=self.sample_names,
                       color_info_blocks=color_info_blocks)
 
-    def dump(self, buffer):
-        """to a filehandle"""
+    def dump(self, buffer, block_compressed=False):
+        """to a filehandle
+
+        If block_compressed is True, then the kmers are written as a block-compressed graph (see
+        :py:mod:`cortexpy.graph.parser.block_compressed`).
+        """
+        if block_compressed:
+            with BlockCompressedWriter(buffer, self.header) as writer:
+                for kmer_string in self.keys:
+                    self.val_callable(kmer_string).dump(writer)
+            return
         self.header.dump(buffer)
         for kmer_string in self.keys:
             self.val_callable(kmer_string).dump(buffer)
@@ -0,0 +1,140 @@
+"""Merging of Cortex graphs
+===========================
+
+Sorted Cortex graphs are merged into one multi-color graph by streaming the records of all
+graphs through a k-way merge. Records are read in small chunks and written without building
+kmer objects, so memory use is proportional to the number of graphs, not to the number of kmers.
+
+If more graphs are merged than files may be open at the same time, then groups of graphs are
+first merged into temporary graphs. The colors of the merged graph are in the order of the input
+graphs.
+"""
+import os
+import tempfile
+from contextlib import ExitStack
+from heapq import merge
+from itertools import chain, groupby
+from operator import itemgetter
+
+from cortexpy.graph.parser.block_compressed import BlockCompressedWriter, decompressed_stream
+from cortexpy.graph.parser.constants import UINT32_T, UINT64_T
+from cortexpy.graph.parser.header import Header
+from cortexpy.graph.parser.streaming import kmer_record_array_generator_from_stream_and_header
+from .kmer import ColorInformationBlock
+
+DEFAULT_MAX_OPEN_FILES = 256
+DEFAULT_READ_CHUNK_SIZE = 64 * 1024
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def merge_headers(headers):
+    """Return the header of the graph that contains the colors of all headers"""
+    kmer_sizes = {header.kmer_size for header in headers}
+    if len(kmer_sizes) != 1:
+        raise ValueError('Graphs have different kmer sizes: {}'.format(sorted(kmer_sizes)))
+    return Header(kmer_size=headers[0].kmer_size,
+                  kmer_container_size=headers[0].kmer_container_size,
+                  num_colors=sum(header.num_colors for header in headers),
+                  mean_read_lengths=tuple(
+                      chain.from_iterable(header.mean_read_lengths for header in headers)),
+                  total_sequences=tuple(
+                      chain.from_iterable(header.total_sequences for header in headers)),
+                  sample_names=tuple(
+                      chain.from_iterable(header.sample_names for header in headers)),
+                  error_rates=tuple(chain.from_iterable(header.error_rates for header in headers)),
+                  color_info_blocks=[ColorInformationBlock.from_header_tuple(block)
+                                     for header in headers for block in header.color_info_blocks])
+
+
+def sorted_records(stream, header, graph_idx, chunk_size=DEFAULT_READ_CHUNK_SIZE):
+    """Yield (kmer words, graph index, raw record) tuples and check that records are sorted"""
+    record_size = header.record_size
+    previous_kmer_words = None
+    for record_array in kmer_record_array_generator_from_stream_and_header(stream, header,
+                                                                           chunk_size):
+        raw_records = record_array.raw_records.tobytes()
+        for record_idx, kmer_words in enumerate(record_array.kmer_words.tolist()):
+            kmer_words = tuple(kmer_words)
+            if previous_kmer_words is not None and not previous_kmer_words < kmer_words:
+                raise ValueError('Records of graph {} are not sorted by kmer'.format(graph_idx))
+            previous_kmer_words = kmer_words
+            start = record_idx * record_size
+            yield kmer_words, graph_idx, raw_records[start:(start + record_size)]
+
+
+def merge_graph_streams(graph_streams, output, block_compressed=False,
+                        chunk_size=DEFAULT_READ_CHUNK_SIZE):
+    """Merge sorted Cortex graph streams into output and return the number of kmers written"""
+    graph_streams = [decompressed_stream(stream) for stream in graph_streams]
+    headers = [Header.from_stream(stream) for stream in graph_streams]
+    header = merge_headers(headers)
+    if block_compressed:
+        writer = BlockCompressedWriter(output, header)
+    else:
+        header.dump(output)
+        writer = output
+
+    kmer_bytes = header.kmer_container_size * UINT64_T
+    empty_coverages = [bytes(UINT32_T * h.num_colors) for h in headers]
+    empty_edges = [bytes(h.num_colors) for h in headers]
+    edges_starts = [kmer_bytes + UINT32_T * h.num_colors for h in headers]
+    merged_records = merge(*(sorted_records(stream, graph_header, graph_idx, chunk_size)
+                             for graph_idx, (stream, graph_header)
+                             in enumerate(zip(graph_streams, headers))),
+                           key=itemgetter(0))
+    buffer = bytearray()
+    n_kmers = 0
+    for _, records in groupby(merged_records, key=itemgetter(0)):
+        coverages = list(empty_coverages)
+        edges = list(empty_edges)
+        for _, graph_idx, record in records:
+            coverages[graph_idx] = record[kmer_bytes:edges_starts[graph_idx]]
+            edges[graph_idx] = record[edges_starts[graph_idx]:]
+        buffer += record[:kmer_bytes]
+        buffer += b''.join(coverages)
+        buffer += b''.join(edges)
+        n_kmers += 1
+        if len(buffer) >= WRITE_BUFFER_SIZE:
+            writer.write(buffer)
+            buffer = bytearray()
+    writer.write(buffer)
+    if block_compressed:
+        writer.close()
+    return n_kmers
+
+
+def merge_graph_files(graph_paths, output, max_open_files=DEFAULT_MAX_OPEN_FILES,
+                      temp_dir=None, block_compressed=False):
+    """Merge sorted Cortex graph files into output
+
+    At most max_open_files files are open at the same time, including output and temporary
+    graphs. The last round merges up to max_open_files - 1 graphs into output. Earlier rounds
+    merge up to max_open_files - 2 graphs into a temporary graph while output is open.
+    """
+    if max_open_files < 4:
+        raise ValueError('Max open files ({}) has to be at least 4'.format(max_open_files))
+    max_inputs = max_open_files - 1
+    max_round_inputs = max_open_files - 2
+    with tempfile.TemporaryDirectory(dir=temp_dir) as merge_dir:
+        merge_round = 0
+        while len(graph_paths) > max_inputs:
+            merged_paths = []
+            for group_idx, start in enumerate(range(0, len(graph_paths), max_round_inputs)):
+                group = graph_paths[start:(start + max_round_inputs)]
+                merged_path = os.path.join(merge_dir,
+                                           'round_{}_group_{}.ctx'.format(merge_round, group_idx))
+                with open(merged_path, 'wb') as fh:
+                    _merge_graph_paths(group, fh)
+                merged_paths.append(merged_path)
+            for path in graph_paths:
+                if os.path.dirname(path) == merge_dir:
+                    os.remove(path)
+            graph_paths = merged_paths
+            merge_round += 1
+        return _merge_graph_paths(graph_paths, output, block_compressed=block_compressed)
+
+
+def _merge_graph_paths(graph_paths, output, block_compressed=False):
+    with ExitStack() as stack:
+        graph_streams = [stack.enter_context(open(path, 'rb')) for path in graph_paths]
+        return merge_graph_streams(graph_streams, output, block_compressed=block_compressed)
@@ -5,6 +5,8 @@ from cortexpy.graph.cortex import (
     build_empty_cortex_graph_from_ra_parser, ConsistentCortexDiGraph,
     CortexDiGraph,
 )
+from cortexpy.graph.parser.kmer import IntKmerConverter
+from cortexpy.utils import revcomp
 
 SERIALIZER_GRAPH = CortexDiGraph
 
@@ -15,19 +17,33 @@ class KmerStringAlreadySeen(Exception):
 
 @attr.s(slots=True)
 class Traverser(object):
+    """Traverses a branch of a graph
+
+    Kmers are stepped through as integers (see :py:class:`IntKmerConverter`), and kmer strings
+    are only created for graph nodes and kmer lookups.
+
+    If a :py:class:`~cortexpy.graph.parser.unitigs.UnitigIndex` of the traversal color is
+    given, then the rest of the unitig of a kmer is added in one step. Its kmers are read by
+    record index instead of being searched for one at a time.
+    """
     ra_parser = attr.ib()
     traversal_color = attr.ib(0)
     graph = attr.ib(attr.Factory(SERIALIZER_GRAPH))
     other_stopping_colors = attr.ib(attr.Factory(set))
+    unitig_index = attr.ib(None)
     kmer = attr.ib(init=False, default=None)
     kmer_string = attr.ib(init=False)
+    kmer_int = attr.ib(init=False)
+    is_lexlo = attr.ib(init=False)
     prev_kmer = attr.ib(init=False)
     prev_kmer_string = attr.ib(init=False)
     orientation = attr.ib(init=False)
     parent_graph = attr.ib(init=False)
+    kmer_int_converter = attr.ib(init=False)
 
     def __attrs_post_init__(self):
         assert self.traversal_color not in self.other_stopping_colors
+        self.kmer_int_converter = IntKmerConverter(self.ra_parser.kmer_size)
 
     def traverse_from(self, kmer_string, *,
                       orientation=EdgeTraversalOrientation.original,
@@ -37,7 +53,8 @@ class Traverser(object):
         self.parent_graph = parent_graph
         self.graph = ConsistentCortexDiGraph(
             graph=build_empty_cortex_graph_from_ra_parser(self.ra_parser).graph)
-        self.kmer_string = first_kmer_string = kmer_string
+        first_kmer_string = kmer_string
+        self._set_kmer_int(self.kmer_int_converter.to_int(kmer_string), kmer_string)
         self.orientation = orientation
         self.prev_kmer_string = None
 
@@ -78,32 +95,76 @@ class Traverser(object):
                     return traversal_edge_set
 
             try:
-                self._add_next_kmer_string_to_graph_and_get_next_kmer(traversal_edge_set)
+                if not self._jump_through_unitig():
+                    self._add_next_kmer_string_to_graph_and_get_next_kmer(traversal_edge_set)
             except KmerStringAlreadySeen:
-                return traversal_edge_set
+                return self.kmer.edges[self.traversal_color].oriented(self.orientation)
+
+    def _set_kmer_int(self, kmer_int, kmer_string=None):
+        if kmer_string is None:
+            kmer_string = self.kmer_int_converter.to_string(kmer_int)
+        self.kmer_int = kmer_int
+        self.kmer_string = kmer_string
+        self.is_lexlo = self.kmer_int_converter.is_lexlo(kmer_int)
 
     def _get_num_neighbors(self, oriented_edge_set):
-        return oriented_edge_set.num_neighbor(self.kmer_string)
+        return oriented_edge_set.num_neighbor(self.kmer_string, is_lexlo=self.is_lexlo)
 
     def _get_neighbors(self, oriented_edge_set):
-        return oriented_edge_set.neighbor_kmer_strings(self.kmer_string)
+        return oriented_edge_set.neighbor_kmer_strings(self.kmer_string, is_lexlo=self.is_lexlo)
 
     def _add_next_kmer_string_to_graph_and_get_next_kmer(self, oriented_edge_set):
-        next_kmer_string = next(oriented_edge_set.neighbor_kmer_strings(self.kmer_string))
+        next_kmer_int = next(oriented_edge_set.neighbor_kmer_ints(self.kmer_int,
+                                                                  self.kmer_int_converter,
+                                                                  is_lexlo=self.is_lexlo))
+        prev_kmer_int = self.kmer_int
         prev_kmer_string = self.kmer_string
         try:
-            self.kmer_string = next_kmer_string
+            self._set_kmer_int(next_kmer_int)
             self._get_kmer_and_add_kmer_string_to_graph()
         except KmerStringAlreadySeen:
-            self.kmer_string = prev_kmer_string
+            self._set_kmer_int(prev_kmer_int, prev_kmer_string)
             raise
         self.prev_kmer_string = prev_kmer_string
 
+    def _jump_through_unitig(self):
+        """Add the kmers that follow the current kmer in its unitig to the graph
+
+        Returns False if no kmer follows the current kmer in the traversal orientation.
+        """
+        if self.unitig_index is None:
+            return False
+        record_idx = self.ra_parser.index_of(self.kmer.kmer)
+        same_direction = self.is_lexlo == bool(self.unitig_index.forward[record_idx])
+        ascending = same_direction == (self.orientation == EdgeTraversalOrientation.original)
+        next_record_indices = self.unitig_index.records_after(record_idx, ascending)
+        if len(next_record_indices) == 0:
+            return False
+        for next_record_idx in next_record_indices.tolist():
+            kmer = self.ra_parser.get_kmer_at(next_record_idx)
+            if same_direction == bool(self.unitig_index.forward[next_record_idx]):
+                kmer_string = kmer.kmer
+            else:
+                kmer_string = revcomp(kmer.kmer)
+            if kmer_string in self.graph or kmer_string in self.parent_graph:
+                raise KmerStringAlreadySeen
+            self.prev_kmer_string = self.kmer_string
+            self.prev_kmer = self.kmer
+            self.kmer = kmer
+            self._set_kmer_int(self.kmer_int_converter.to_int(kmer_string), kmer_string)
+            self.graph.add_node(kmer_string, kmer=kmer)
+        return True
+
     def _get_kmer(self):
         if self.kmer_string in self.graph or self.kmer_string in self.parent_graph:
             raise KmerStringAlreadySeen
+        if self.is_lexlo:
+            lexlo_string = self.kmer_string
+        else:
+            lexlo_string = self.kmer_int_converter.to_string(
+                self.kmer_int_converter.revcomp(self.kmer_int))
         prev_kmer = self.kmer
-        self.kmer = self.ra_parser.get_kmer_for_string(self.kmer_string)
+        self.kmer = self.ra_parser[lexlo_string]
         self.prev_kmer = prev_kmer
 
     def _get_kmer_and_add_kmer_string_to_graph(self):
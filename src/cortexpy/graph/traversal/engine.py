@@ -1,22 +1,37 @@
 import collections
 import copy
+import itertools
 import logging
+import math
+import multiprocessing
 
 import attr
+import numpy as np
 
 from cortexpy.constants import EdgeTraversalOrientation, EngineTraversalOrientation
 from cortexpy.graph.cortex import build_empty_cortex_graph_from_ra_parser, CortexDiGraph
 from cortexpy.graph.parser.kmer import EmptyKmerBuilder
-from cortexpy.utils import lexlo, IntervalLogger, kmerize_contig, kmerize_fasta
+from cortexpy.utils import lexlo, lexlo_many, IntervalLogger, kmerize_contig, kmerize_fasta
 from cortexpy.graph.traversal import branch
 from cortexpy.graph.interactor import Interactor
 
 logger = logging.getLogger(__name__)
 
+START_KMER_BATCH_SIZE = 10000
+
 
 @attr.s(slots=True)
 class Engine(object):
-    """This engine creates subgraphs of Cortex graphs"""
+    """This engine creates subgraphs of Cortex graphs
+
+    If n_workers is not 1 and a ra_factory is given, then the start kmers of a FASTA file are
+    traversed by a pool of n_workers processes (0 or None: number of CPUs), each of which opens
+    its own graph parsers by calling ra_factory (see :py:class:`RandomAccessFactory`).
+
+    If jump_unitigs is True and the graph parser of a single-color graph has a unitig index
+    (see :py:class:`~cortexpy.graph.parser.unitigs.UnitigIndex`), then branches jump over the
+    unitigs of the graph instead of stepping through them one kmer at a time.
+    """
     ra_parser = attr.ib()
     traversal_colors = attr.ib((0,))
     orientation = attr.ib(EngineTraversalOrientation.original)
@@ -28,6 +43,9 @@ class Engine(object):
     queuer = attr.ib(init=False)
     branch_traverser = attr.ib(init=False)
     logger = attr.ib(init=False)
+    n_workers = attr.ib(1)
+    ra_factory = attr.ib(None)
+    jump_unitigs = attr.ib(False)
 
     def __attrs_post_init__(self):
         self.graph = build_empty_cortex_graph_from_ra_parser(self.ra_parser)
@@ -36,7 +54,10 @@ class Engine(object):
 
     def traverse_from_each_kmer_in_fasta(self, fasta):
         kmer_generator = kmerize_fasta(fasta, self.ra_parser.kmer_size)
-        self._traverse_from_each_kmer_in(kmer_generator)
+        if self.n_workers != 1 and self.ra_factory is not None:
+            self._traverse_from_each_kmer_in_parallel(kmer_generator)
+        else:
+            self._traverse_from_each_kmer_in(kmer_generator)
         self._post_process_graph()
         return self
 
@@ -46,7 +67,7 @@ class Engine(object):
         return self
 
     def _traverse_from_each_kmer_in(self, kmer_generator):
-        for start_kmer in kmer_generator:
+        for start_kmer in self._start_kmers_in_graph(kmer_generator):
             try:
                 Interactor.from_graph(self.graph) \
                     .compose_in_graph(self._traverse_from(start_kmer).graph)
@@ -58,6 +79,48 @@ class Engine(object):
                                  " because max node limit is reached").format(start_kmer))
         return self
 
+    def _traverse_from_each_kmer_in_parallel(self, kmer_generator):
+        """Traverse chunks of start kmers in worker processes and merge their subgraphs
+
+        Workers skip start kmers that are already part of the subgraph of another start kmer if
+        the engine traverses both orientations and the graph parser returns record indices.
+        """
+        start_kmers = list(self._start_kmers_in_graph(kmer_generator))
+        n_records = None
+        if self.orientation == EngineTraversalOrientation.both and start_kmers:
+            if self.ra_parser.get_many(start_kmers[:1]).indices is not None:
+                n_records = len(self.ra_parser)
+        engine_args = {'traversal_colors': self.traversal_colors,
+                       'orientation': self.orientation,
+                       'max_nodes': self.max_nodes,
+                       'jump_unitigs': self.jump_unitigs}
+        kmer_strings = set()
+        for chunk_kmer_strings in traverse_in_parallel(self.ra_factory, engine_args, start_kmers,
+                                                       n_workers=self.n_workers,
+                                                       n_records=n_records):
+            kmer_strings.update(lexlo_many(chunk_kmer_strings))
+            if self.max_nodes and len(kmer_strings) > self.max_nodes:
+                raise Exception("Max nodes ({}) exceeded: {} nodes found".format(
+                    self.max_nodes, len(kmer_strings)))
+        kmer_strings = sorted(kmer_strings)
+        for start in range(0, len(kmer_strings), START_KMER_BATCH_SIZE):
+            lexlo_strings = kmer_strings[start:(start + START_KMER_BATCH_SIZE)]
+            batch = self.ra_parser.get_many(lexlo_strings)
+            for idx, lexlo_string in enumerate(lexlo_strings):
+                if batch.found[idx]:
+                    self.graph.add_node(lexlo_string, kmer=batch[idx])
+        self.log_graph_size()
+
+    def _start_kmers_in_graph(self, kmer_generator):
+        """Filter start kmers that do not exist in the graph using batch lookups"""
+        component_index = component_index_bounding_traversal(
+            self.ra_parser, self.traversal_colors, self.orientation, self.max_nodes)
+        for start_kmers, batch in start_kmer_batches(self.ra_parser, kmer_generator,
+                                                     component_index, self.max_nodes):
+            for start_kmer, found in zip(start_kmers, batch.found):
+                if found:
+                    yield start_kmer
+
     def traverse_from_each_kmer_in_iterable(self, iterable):
         for kmer in iterable:
             self._traverse_from(kmer)
@@ -71,10 +134,12 @@ class Engine(object):
 
     def _traverse_from(self, start_string):
         assert len(start_string) == self.ra_parser.kmer_size
+        unitig_index = self._unitig_index()
         self.branch_traverser = {
             color: branch.Traverser(self.ra_parser,
                                     traversal_color=color,
-                                    other_stopping_colors=set(self.traversal_colors) - {color})
+                                    other_stopping_colors=set(self.traversal_colors) - {color},
+                                    unitig_index=unitig_index)
             for color in self.traversal_colors
         }
         self.queuer = branch.Queuer(self.branch_queue,
@@ -91,6 +156,12 @@ class Engine(object):
                                                                              len(self.graph)))
         return self
 
+    def _unitig_index(self):
+        """Return the unitig index to jump over unitigs with or None"""
+        if not self.jump_unitigs or self.ra_parser.num_colors != 1:
+            return None
+        return getattr(self.ra_parser, 'unitig_index', None)
+
     def _post_process_graph(self):
         self.graph = annotate_kmer_graph_edges(self.graph)
 
@@ -190,6 +261,145 @@ class Engine(object):
             self.logger.info('current graph size: {}'.format(self.last_graph_size))
 
 
+@attr.s(slots=True)
+class RandomAccessFactory(object):
+    """Opens random access parsers of graph files in a worker process
+
+    The graph files stay open for the lifetime of the process. Multiple graphs are joined into
+    a :py:class:`RandomAccessCollection`.
+    """
+    graph_paths = attr.ib()
+    ra_constructor = attr.ib(None)
+    ra_parser_args = attr.ib(attr.Factory(dict))
+
+    def __call__(self):
+        from cortexpy.graph.parser.random_access import RandomAccess
+        from cortexpy.graph.parser.random_access_collection import RandomAccessCollection
+        ra_constructor = self.ra_constructor or RandomAccess
+        ra_parsers = [ra_constructor(open(graph_path, 'rb'), **self.ra_parser_args)
+                      for graph_path in self.graph_paths]
+        if len(ra_parsers) == 1:
+            return ra_parsers[0]
+        return RandomAccessCollection(ra_parsers)
+
+
+@attr.s(slots=True)
+class TraversalWorker(object):
+    """Traverses chunks of start kmers with an engine for each chunk
+
+    seen_records is a bitmap of the graph records that are already part of a traversed subgraph,
+    or None. Start kmers whose records are in the bitmap are skipped.
+    """
+    ra_parser = attr.ib()
+    engine_args = attr.ib()
+    seen_records = attr.ib(None)
+
+    def traverse(self, start_kmers):
+        """Return the kmer strings of the subgraph of a chunk of start kmers"""
+        engine = Engine(self.ra_parser, **self.engine_args)
+        batch = self.ra_parser.get_many(start_kmers)
+        for idx, start_kmer in enumerate(start_kmers):
+            if not batch.found[idx] or self._is_seen(batch.indices, idx):
+                continue
+            n_nodes = len(engine.graph)
+            try:
+                engine._traverse_from(start_kmer)
+            except KeyError:
+                pass
+            self._mark_seen(list(itertools.islice(engine.graph, n_nodes, None)))
+        return list(engine.graph)
+
+    def _is_seen(self, indices, idx):
+        if self.seen_records is None:
+            return False
+        record_idx = indices[idx]
+        return bool(self.seen_records[record_idx >> 3] & (1 << (record_idx & 7)))
+
+    def _mark_seen(self, kmer_strings):
+        if self.seen_records is None or not kmer_strings:
+            return
+        batch = self.ra_parser.get_many(kmer_strings)
+        record_indices = np.asarray(batch.indices)[np.asarray(batch.found, dtype=bool)]
+        np.bitwise_or.at(self.seen_records, record_indices >> 3,
+                         np.left_shift(1, record_indices & 7).astype(np.uint8))
+
+
+_worker = None
+
+
+def _init_traversal_worker(ra_factory, engine_args, seen_records):
+    global _worker
+    if seen_records is not None:
+        seen_records = np.frombuffer(seen_records, dtype=np.uint8)
+    _worker = TraversalWorker(ra_factory(), engine_args, seen_records)
+
+
+def _traverse_chunk(start_kmers):
+    return _worker.traverse(start_kmers)
+
+
+def traverse_in_parallel(ra_factory, engine_args, start_kmers, n_workers=None, n_records=None):
+    """Traverse chunks of consecutive start kmers in a pool of n_workers processes
+
+    The kmer strings of the subgraph of each chunk are yielded in the order of the chunks. If
+    n_records is given, then workers share a bitmap of n_records graph records that are part of
+    a traversed subgraph, so that start kmers that another worker has reached are skipped.
+    Concurrent updates of the bitmap may lose bits, which only means that a start kmer is
+    traversed again. An n_workers of 0 or None starts one process per CPU.
+    """
+    if not n_workers:
+        n_workers = multiprocessing.cpu_count()
+    if n_workers == 1:
+        worker = TraversalWorker(ra_factory(), engine_args)
+        yield worker.traverse(start_kmers)
+        return
+    seen_records = None
+    if n_records is not None:
+        seen_records = multiprocessing.Array('B', (n_records + 7) // 8, lock=False)
+    n_chunks = 4 * n_workers
+    chunk_size = max(1, math.ceil(len(start_kmers) / n_chunks))
+    chunks = [start_kmers[start:(start + chunk_size)]
+              for start in range(0, len(start_kmers), chunk_size)]
+    with multiprocessing.Pool(n_workers, initializer=_init_traversal_worker,
+                              initargs=(ra_factory, engine_args, seen_records)) as pool:
+        yield from pool.imap(_traverse_chunk, chunks)
+
+
+def start_kmer_batches(ra_parser, kmer_generator, component_index=None, max_nodes=None):
+    """Look up start kmers in batches and yield each batch of kmer strings with its lookup
+
+    If a component index is given, then each batch of start kmers is rejected before it is
+    yielded if their components contain more than max_nodes kmers.
+    """
+    start_components = set()
+    while True:
+        start_kmers = list(itertools.islice(kmer_generator, START_KMER_BATCH_SIZE))
+        if not start_kmers:
+            return
+        batch = ra_parser.get_many(start_kmers)
+        if component_index is not None:
+            start_components.update(
+                component_index.component_ids[batch.indices[batch.found]].tolist())
+            n_reachable = int(component_index.component_sizes[list(start_components)].sum())
+            if n_reachable > max_nodes:
+                raise Exception(("Max nodes ({}) exceeded: components of start kmers contain"
+                                 " {} nodes").format(max_nodes, n_reachable))
+        yield start_kmers, batch
+
+
+def component_index_bounding_traversal(ra_parser, traversal_colors, orientation, max_nodes):
+    """Return the component index of the graph if it bounds the size of the traversal
+
+    Traversals in both orientations of all colors reach every kmer in the components of
+    their start kmers.
+    """
+    if not max_nodes or orientation != EngineTraversalOrientation.both:
+        return None
+    if set(traversal_colors) != set(range(ra_parser.num_colors)):
+        return None
+    return getattr(ra_parser, 'component_index', None)
+
+
 def annotate_kmer_graph_edges(graph):
     """Adds nodes to graph for kmer_strings that only exist as edges in a node's kmer."""
     colors = graph.graph['colors']
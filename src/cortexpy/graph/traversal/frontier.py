@@ -0,0 +1,144 @@
+"""Level-synchronous traversal
+=============================
+
+A :py:class:`FrontierEngine` creates the same kind of subgraph as
+:py:class:`~cortexpy.graph.traversal.engine.Engine`, but instead of walking one branch and one
+kmer at a time, it expands a whole level of the traversal at once. The neighbors of all kmers
+in the current frontier are collected from their edges, deduplicated against the kmers that have
+already been visited, and looked up with a single batched lookup
+(:py:meth:`~cortexpy.graph.parser.random_access.RandomAccess.get_many`). The kmers that are found
+form the next frontier.
+
+The cost of a traversal is then dominated by one batched lookup per level instead of one lookup
+per kmer, which makes wide and branchy subgraphs much cheaper to traverse.
+
+Start kmers of a contig or FASTA file are looked up and traversed in batches, so that all start
+kmers of a batch share the lookups of each level.
+"""
+import logging
+
+import attr
+
+from cortexpy.constants import EngineTraversalOrientation
+from cortexpy.edge_set import INCOMING_LETTERS, OUTGOING_LETTERS
+from cortexpy.graph.cortex import build_empty_cortex_graph_from_ra_parser
+from cortexpy.utils import IntervalLogger, kmerize_contig, kmerize_fasta, lexlo_many
+from .engine import (
+    annotate_kmer_graph_edges, component_index_bounding_traversal, start_kmer_batches,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@attr.s(slots=True)
+class FrontierEngine(object):
+    """This engine creates subgraphs of Cortex graphs one traversal level at a time
+
+    Kmers are followed along the edges of all traversal colors in the engine orientation. Unlike
+    :py:class:`~cortexpy.graph.traversal.engine.Engine`, the traversal does not stop at the
+    max_nodes limit, but raises as soon as a level has taken the subgraph beyond it. Neighbors
+    that are not in the graph are skipped instead of ending the traversal of a start kmer.
+    """
+    ra_parser = attr.ib()
+    traversal_colors = attr.ib((0,))
+    orientation = attr.ib(EngineTraversalOrientation.original)
+    max_nodes = attr.ib(None)
+    logging_interval = attr.ib(0)
+    graph = attr.ib(init=False)
+    logger = attr.ib(init=False)
+    _visited = attr.ib(attr.Factory(set), init=False)
+
+    def __attrs_post_init__(self):
+        self.graph = build_empty_cortex_graph_from_ra_parser(self.ra_parser)
+        self.graph.graph['colors'] = self.ra_parser.colors
+        self.graph.graph['sample_names'] = [n.decode() for n in self.ra_parser.sample_names]
+        self.logger = IntervalLogger(logger, min_log_interval_seconds=self.logging_interval)
+
+    def traverse_from_each_kmer_in_fasta(self, fasta):
+        self._traverse_from_each_kmer_in(kmerize_fasta(fasta, self.ra_parser.kmer_size))
+        self._post_process_graph()
+        return self
+
+    def traverse_from_each_kmer_in(self, contig):
+        self._traverse_from_each_kmer_in(kmerize_contig(contig, self.ra_parser.kmer_size))
+        self._post_process_graph()
+        return self
+
+    def traverse_from_each_kmer_in_iterable(self, iterable):
+        self._traverse_from_frontier(
+            [(kmer_string, self.ra_parser.get_kmer_for_string(kmer_string))
+             for kmer_string in iterable])
+        self._post_process_graph()
+        return self
+
+    def traverse_from(self, start_string):
+        assert len(start_string) == self.ra_parser.kmer_size
+        self._traverse_from_frontier(
+            [(start_string, self.ra_parser.get_kmer_for_string(start_string))])
+        self._post_process_graph()
+        return self
+
+    def _traverse_from_each_kmer_in(self, kmer_generator):
+        component_index = component_index_bounding_traversal(
+            self.ra_parser, self.traversal_colors, self.orientation, self.max_nodes)
+        for start_kmers, batch in start_kmer_batches(self.ra_parser, kmer_generator,
+                                                     component_index, self.max_nodes):
+            self._traverse_from_frontier([(start_kmer, batch[idx])
+                                          for idx, start_kmer in enumerate(start_kmers)
+                                          if batch.found[idx]])
+
+    def _traverse_from_frontier(self, frontier):
+        """Add the kmers of a frontier to the graph and expand it until no new kmers are found"""
+        start_frontier = frontier
+        frontier = []
+        for kmer_string, kmer in start_frontier:
+            if kmer.kmer not in self._visited:
+                self._visited.add(kmer.kmer)
+                self.graph.add_node(kmer.kmer, kmer=kmer)
+                frontier.append((kmer_string, kmer))
+        while frontier:
+            if self.max_nodes and len(self.graph) > self.max_nodes:
+                raise Exception("Max nodes ({}) exceeded: {} nodes found".format(self.max_nodes,
+                                                                                 len(self.graph)))
+            self.logger.info('current graph size: {}'.format(len(self.graph)))
+            frontier = self._next_frontier(frontier)
+
+    def _next_frontier(self, frontier):
+        """Look up all unvisited neighbors of a frontier in one batch"""
+        neighbor_strings = []
+        for kmer_string, kmer in frontier:
+            neighbor_strings.extend(self._neighbor_strings(kmer_string, kmer))
+        candidates = {}
+        for neighbor_string, lexlo_string in zip(neighbor_strings, lexlo_many(neighbor_strings)):
+            if lexlo_string not in self._visited and lexlo_string not in candidates:
+                candidates[lexlo_string] = neighbor_string
+        if not candidates:
+            return []
+        self._visited.update(candidates)
+        lexlo_strings = list(candidates)
+        batch = self.ra_parser.get_many(lexlo_strings)
+        next_frontier = []
+        for idx, lexlo_string in enumerate(lexlo_strings):
+            if batch.found[idx]:
+                kmer = batch[idx]
+                self.graph.add_node(lexlo_string, kmer=kmer)
+                next_frontier.append((candidates[lexlo_string], kmer))
+        return next_frontier
+
+    def _neighbor_strings(self, kmer_string, kmer):
+        """Return the oriented kmer strings of the neighbors of a kmer in the traversal colors"""
+        is_lexlo = kmer_string == kmer.kmer
+        prefix, suffix = kmer_string[:-1], kmer_string[1:]
+        neighbor_strings = []
+        for color in self.traversal_colors:
+            edge_byte = kmer.edges[color].byte
+            if self.orientation != EngineTraversalOrientation.reverse:
+                neighbor_strings.extend(suffix + letter
+                                        for letter in OUTGOING_LETTERS[is_lexlo][edge_byte])
+            if self.orientation != EngineTraversalOrientation.original:
+                neighbor_strings.extend(letter + prefix
+                                        for letter in INCOMING_LETTERS[is_lexlo][edge_byte])
+        return neighbor_strings
+
+    def _post_process_graph(self):
+        self.graph = annotate_kmer_graph_edges(self.graph)
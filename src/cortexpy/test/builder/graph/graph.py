@@ -5,6 +5,7 @@ from Bio.Seq import Seq
 
 from cortexpy.test.builder.graph.body import as_edge_set, KmerRecord, Body
 from cortexpy.test.builder.graph.header import Header
+from cortexpy.utils import lexlo
 
 
 @attr.s
@@ -63,6 +64,24 @@ class Graph:
         return self.with_kmer_record(
             KmerRecord(kmer_string, color_coverage, tuple([as_edge_set(e) for e in edges])))
 
+    def with_kmers(self, *kmer_strings):
+        for kmer_string in kmer_strings:
+            self.with_kmer(kmer_string)
+        return self
+
+    def with_linked_kmers_of(self, *sequences):
+        """Add the kmers of sequences with edges between all kmers that overlap"""
+        assert self.kmer_size_is_set
+        kmer_strings = {lexlo(sequence[start:(start + self.kmer_size)]) for sequence in sequences
+                        for start in range(len(sequence) - self.kmer_size + 1)}
+        for kmer_string in sorted(kmer_strings):
+            incoming = ''.join(letter if lexlo(letter.upper() + kmer_string[:-1]) in kmer_strings
+                               else '.' for letter in 'acgt')
+            outgoing = ''.join(letter if lexlo(kmer_string[1:] + letter) in kmer_strings
+                               else '.' for letter in 'ACGT')
+            self.with_kmer('{} 1 {}{}'.format(kmer_string, incoming, outgoing))
+        return self
+
     def with_kmer_record(self, record):
         assert any(c > 0 for c in record.coverage)
         assert len(record.coverage) == self.header.num_colors
@@ -16,6 +16,7 @@ class EngineTestDriver(object):
     traverser = attr.ib(None)
     traversal_colors = attr.ib((0,))
     ra_constructor = attr.ib(RandomAccess)
+    engine_class = attr.ib(Engine)
 
     def with_kmer(self, *args):
         self.graph_builder.with_kmer(*args)
@@ -55,10 +56,10 @@ class EngineTestDriver(object):
 
     def run(self):
         random_access_parser = self.ra_constructor(self.graph_builder.build())
-        self.traverser = Engine(random_access_parser,
-                                traversal_colors=self.traversal_colors,
-                                max_nodes=self.max_nodes,
-                                orientation=self.traversal_orientation)
+        self.traverser = self.engine_class(random_access_parser,
+                                           traversal_colors=self.traversal_colors,
+                                           max_nodes=self.max_nodes,
+                                           orientation=self.traversal_orientation)
         assert (self.start_string is None) != (self.start_kmer_string is None)
         if self.start_string:
             self.traverser.traverse_from_each_kmer_in(self.start_string)
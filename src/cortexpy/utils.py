@@ -6,25 +6,85 @@ These functions may also be useful outside of cortexpy.
 """
 
 from datetime import datetime
-from functools import lru_cache
 
 import attr
 from Bio import SeqIO
 from Bio.Seq import reverse_complement, complement
 
+DNA_COMPLEMENT_TABLE = str.maketrans('ACGTMRWSYKVHDBNacgtmrwsykvhdbn',
+                                     'TGCAKYWSRMBDHVNtgcakywsrmbdhvn')
+DEFAULT_LEXLO_CACHE_SIZE = 2 ** 16
+
+
+@attr.s(slots=True)
+class CanonicalizationCache(object):
+    """A size-bounded cache of kmer strings and their lexicographically-lowest versions
+
+    The cache is a plain dict. Once maxsize strings are cached, the oldest string is evicted for
+    each new string. A maxsize of 0 disables the cache.
+    """
+    maxsize = attr.ib(DEFAULT_LEXLO_CACHE_SIZE)
+    hits = attr.ib(0)
+    misses = attr.ib(0)
+    _cache = attr.ib(attr.Factory(dict))
+
+    def __call__(self, kmer_string):
+        try:
+            lexlo_string = self._cache[kmer_string]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return lexlo_string
+        self.misses += 1
+        lexlo_string = _lexlo(kmer_string)
+        if self.maxsize > 0:
+            if len(self._cache) >= self.maxsize:
+                del self._cache[next(iter(self._cache))]
+            self._cache[kmer_string] = lexlo_string
+        return lexlo_string
+
+    def __len__(self):
+        return len(self._cache)
+
+    def resize(self, maxsize):
+        """Change the maximum number of cached strings and clear the cache"""
+        self.maxsize = maxsize
+        self.clear()
+
+    def clear(self):
+        """Clear the cache and reset the hit and miss counters"""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+LEXLO_CACHE = CanonicalizationCache()
+
 
-@lru_cache(typed=True)
 def revcomp(dna_string):
-    """Return the reverse complement of a string"""
-    return reverse_complement(dna_string)
+    """Return the reverse complement of a string
+
+    >>> revcomp('AACG')
+    'CGTT'
+    """
+    if not isinstance(dna_string, str):
+        return reverse_complement(dna_string)
+    return dna_string.translate(DNA_COMPLEMENT_TABLE)[::-1]
+
+
+def _lexlo(kmer_string):
+    alt_kmer_string = revcomp(kmer_string)
+    if alt_kmer_string < kmer_string:
+        return alt_kmer_string
+    return kmer_string
 
 
-@lru_cache(typed=True)
 def lexlo(kmer_string):
     """Return lexicographically lowest version of a kmer string and its reverse complement
 
     The reverse complement of a kmer string is generated and the lexicographically-lowest
-    kmer string is returned.
+    kmer string is returned. Results are cached in :py:data:`LEXLO_CACHE`.
 
     >>> lexlo('AAA')
     'AAA'
@@ -32,10 +92,35 @@ def lexlo(kmer_string):
     >>> lexlo('TTT')
     'AAA'
     """
-    alt_kmer_string = revcomp(kmer_string)
-    if alt_kmer_string < kmer_string:
-        return alt_kmer_string
-    return kmer_string
+    return LEXLO_CACHE(kmer_string)
+
+
+def lexlo_many(kmer_strings):
+    """Return the lexicographically lowest versions of many kmer strings
+
+    Kmer strings of equal length are reverse complemented together in a single translation.
+    The cache of :py:func:`lexlo` is not used.
+
+    >>> lexlo_many(['AAC', 'TTT', 'ACG'])
+    ['AAC', 'AAA', 'ACG']
+    """
+    kmer_strings = [str(kmer_string) for kmer_string in kmer_strings]
+    if not kmer_strings:
+        return []
+    kmer_size = len(kmer_strings[0])
+    if any(len(kmer_string) != kmer_size for kmer_string in kmer_strings):
+        return [_lexlo(kmer_string) for kmer_string in kmer_strings]
+    revcomps = ''.join(kmer_strings).translate(DNA_COMPLEMENT_TABLE)[::-1]
+    end = len(revcomps)
+    lexlo_strings = []
+    for kmer_string in kmer_strings:
+        alt_kmer_string = revcomps[end - kmer_size:end]
+        end -= kmer_size
+        if alt_kmer_string < kmer_string:
+            lexlo_strings.append(alt_kmer_string)
+        else:
+            lexlo_strings.append(kmer_string)
+    return lexlo_strings
 
 
 @attr.s(slots=True)
@@ -1,5 +1,8 @@
+from unittest import mock
+
 import pytest
 
+from cortexpy.graph.cortex import EdgeView
 from cortexpy.graph.interactor import Interactor
 from cortexpy.test.builder.graph.cortex import get_cortex_builder
 
@@ -48,3 +51,59 @@ class Test(object):
         assert ['ACT'] == list(graph.pred['CTG'])
         assert [] == list(graph.out_edges('CTG'))
         assert [('ACT', 'CTG')] == list(graph.in_edges('CTG'))
+
+    def test_degrees_and_edge_count_follow_removed_edge(self):
+        # given
+        b = get_cortex_builder()
+        b.with_kmer('AAC 1 .......T')
+        b.with_kmer('ACT 1 a.....G.')
+        b.with_kmer('CAG 1 .......T')
+        graph = Interactor(b.build()).make_graph_nodes_consistent(['AAC']).graph
+        assert (1, 1) == (graph.out_degree('ACT'), graph.in_degree('ACT'))
+        assert 2 == len(graph.edges)
+
+        # when
+        graph.remove_edge('ACT', 'CTG', 0)
+
+        # then
+        assert (0, 1) == (graph.out_degree('ACT'), graph.in_degree('ACT'))
+        assert 0 == graph.in_degree('CTG')
+        assert 1 == len(graph.edges)
+
+    def test_edge_count_follows_added_node(self):
+        # given
+        b = get_cortex_builder()
+        b.with_kmer('AAC 1 .......T')
+        b.with_kmer('ACT 1 a.....G.')
+        b.with_kmer('CAG 1 .......T')
+        graph = Interactor(b.build()).make_graph_nodes_consistent(['AAC']).graph
+        kmers = get_cortex_builder()
+        kmers.with_kmer('ACT 1 ........')
+        kmers = kmers.build()
+        assert 2 == len(graph.edges)
+
+        # when
+        graph.add_node('ACT', kmer=kmers.node['ACT'])
+
+        # then
+        assert 1 == len(graph.edges)
+        assert 1 == len(list(graph.edges()))
+
+    def test_edge_count_follows_removed_edges_without_counting_all_edges(self):
+        # given
+        b = get_cortex_builder()
+        b.with_kmer('AAC 1 .......T')
+        b.with_kmer('ACT 1 a.....G.')
+        b.with_kmer('CAG 1 .......T')
+        graph = Interactor(b.build()).make_graph_nodes_consistent(['AAC']).graph
+        assert 2 == len(graph.edges)
+
+        for first, second, n_edges in [('ACT', 'CTG', 1), ('AAC', 'ACT', 0)]:
+            # when
+            with mock.patch.object(EdgeView, '_edge_iter_consistent') as edge_iter:
+                graph.remove_edge(first, second, 0)
+
+                # then
+                assert n_edges == graph.number_of_edges()
+                assert 0 == edge_iter.call_count
+            assert n_edges == len(list(graph.edges()))
@@ -1,5 +1,8 @@
+from unittest import mock
+
 from hypothesis import given, strategies as s
 
+from cortexpy.graph.cortex import EdgeView
 from cortexpy.graph.interactor import make_multi_graph
 from cortexpy.test.builder.graph.cortex import get_cortex_builder
 
@@ -116,3 +119,89 @@ class TestInOutEdges(object):
         # when / then
         assert [('CTT', 'TTT')] == list(cdb.in_edges(seed))
         assert [] == list(cdb.out_edges(seed))
+
+
+class TestDegrees(object):
+    def test_degrees_of_kmer_and_revcomp(self):
+        # given
+        b = get_cortex_builder()
+        b.with_kmer('AAA 1 1 .....C.. .....C..')
+        b.with_kmer('AAC 1 1 a....... a.......')
+        cdb = b.build()
+
+        # when / then
+        assert (2, 0) == (cdb.out_degree('AAA'), cdb.in_degree('AAA'))
+        assert (0, 2) == (cdb.out_degree('TTT'), cdb.in_degree('TTT'))
+        assert (0, 2) == (cdb.out_degree('AAC'), cdb.in_degree('AAC'))
+        assert 2 == len(cdb.edges)
+
+    def test_degrees_and_edge_count_follow_added_and_removed_edges(self):
+        # given
+        b = get_cortex_builder()
+        b.with_kmer('AAA 1 .....C..')
+        b.with_kmer('AAC 1 a.......')
+        b.with_kmer('ACC 1 ........')
+        cdb = b.build()
+        assert 1 == len(cdb.edges)
+        assert 0 == cdb.out_degree('AAC')
+
+        # when
+        cdb.add_edge('AAC', 'ACC', key=0)
+
+        # then
+        assert 1 == cdb.out_degree('AAC')
+        assert 1 == cdb.in_degree('ACC')
+        assert 2 == len(cdb.edges)
+        assert 2 == len(list(cdb.edges()))
+
+        # when
+        cdb.remove_node('AAA')
+
+        # then
+        assert 0 == cdb.in_degree('AAC')
+        assert 1 == len(cdb.edges)
+        assert 1 == len(list(cdb.edges()))
+
+    def test_edge_count_follows_added_and_replaced_kmers(self):
+        # given
+        b = get_cortex_builder()
+        b.with_kmer('AAA 1 .....C..')
+        cdb = b.build()
+        kmers = get_cortex_builder()
+        kmers.with_kmer('AAA 1 ........')
+        kmers.with_kmer('AAC 1 a.......')
+        kmers = kmers.build()
+        assert 0 == len(cdb.edges)
+
+        # when
+        cdb.add_node('AAC', kmer=kmers.node['AAC'])
+
+        # then
+        assert 1 == len(cdb.edges)
+        assert 1 == len(list(cdb.edges()))
+
+        # when
+        cdb.add_node('AAA', kmer=kmers.node['AAA'])
+
+        # then
+        assert 0 == len(cdb.edges)
+        assert 0 == len(list(cdb.edges()))
+
+    def test_edge_count_follows_removed_edges_without_counting_all_edges(self):
+        # given
+        b = get_cortex_builder()
+        b.with_kmer('AAA 1 a...AC..')
+        b.with_kmer('AAC 1 a.....G.')
+        b.with_kmer('ACG 1 a.......')
+        cdb = b.build()
+        assert 3 == len(cdb.edges)
+
+        for node, n_edges in [('ACG', 2), ('AAA', 0)]:
+            # when
+            with mock.patch.object(EdgeView, '_edge_iter') as edge_iter:
+                cdb.remove_node(node)
+
+                # then
+                assert n_edges == cdb.number_of_edges()
+                assert 0 == edge_iter.call_count
+            assert n_edges == len(list(cdb.edges()))
@@ -0,0 +1,120 @@
+import networkx as nx
+import numpy as np
+
+from cortexpy.constants import EdgeTraversalOrientation
+from cortexpy.graph.csr import (
+    CSRGraph, breadth_first_order, connected_component_labels, depth_first_order, edges_to_csr,
+)
+from cortexpy.graph.interactor import Interactor
+from cortexpy.test.builder.graph.cortex import get_cortex_builder
+
+
+LINEAR_KMERS = ['AAC 1 .......T', 'ACT 1 a.....G.', 'CAG 1 .......T']
+
+
+class TestArrayRoutines(object):
+    def test_match_networkx_on_random_graph(self):
+        # given
+        nx_graph = nx.gnm_random_graph(50, 80, seed=1, directed=True)
+        sources, targets = zip(*nx_graph.edges())
+
+        # when
+        indptr, indices = edges_to_csr(sources, targets, len(nx_graph))
+        both_indptr, both_indices = edges_to_csr(sources + targets, targets + sources,
+                                                 len(nx_graph))
+        labels = connected_component_labels(both_indptr, both_indices)
+
+        # then
+        assert list(nx_graph.out_degree(range(50))) == list(enumerate(np.diff(indptr)))
+        assert list(nx.dfs_preorder_nodes(nx_graph, 0)) == list(
+            depth_first_order(indptr, indices, 0))
+        assert set(nx.descendants(nx_graph, 0)) | {0} == set(
+            breadth_first_order(indptr, indices, [0]))
+        for component in nx.weakly_connected_components(nx_graph):
+            assert 1 == len({labels[n] for n in component})
+        assert nx.number_weakly_connected_components(nx_graph) == len(set(labels))
+
+    def test_breadth_first_order_visits_levels_in_order(self):
+        # given
+        indptr, indices = edges_to_csr([0, 0, 1, 2, 3], [1, 2, 3, 3, 0], 5)
+
+        # when
+        order = breadth_first_order(indptr, indices, [0])
+
+        # then
+        assert [0, 1, 2, 3] == list(order)
+
+
+class TestCSRGraph(object):
+    def test_exports_lexlo_nodes_of_cortex_graph(self):
+        # given
+        b = get_cortex_builder()
+        b.with_kmers(*LINEAR_KMERS)
+        graph = b.build()
+
+        # when
+        csr = CSRGraph.from_graph(graph)
+
+        # then
+        assert 3 == len(csr)
+        assert 3 == csr.num_edges
+        assert {'AAC', 'ACT', 'CAG'} == set(csr.nodes)
+        for node in graph:
+            idx = csr.node_index[node]
+            assert graph.out_degree(node) == csr.out_degree()[idx]
+            assert graph.in_degree(node) == csr.in_degree()[idx]
+        assert [0, 0, 0] == list(csr.components())
+
+    def test_exports_consistent_graph(self):
+        # given
+        b = get_cortex_builder()
+        b.with_kmers(*LINEAR_KMERS)
+        graph = Interactor(b.build()).make_graph_nodes_consistent(['AAC']).graph
+
+        # when
+        csr = CSRGraph.from_graph(graph)
+
+        # then
+        assert ['AAC', 'ACT', 'CTG'] == csr.node_strings(csr.bfs('AAC'))
+        assert ['AAC', 'ACT', 'CTG'] == csr.node_strings(csr.dfs('AAC'))
+        assert ['CTG', 'ACT', 'AAC'] == csr.node_strings(
+            csr.bfs('CTG', orientation=EdgeTraversalOrientation.reverse))
+        assert ['ACT'] == csr.node_strings(csr.bfs('ACT', orientation=None)[:1])
+
+    def test_separates_colors_and_components(self):
+        # given
+        b = get_cortex_builder()
+        b.with_num_colors(2)
+        b.with_kmer('AAA 1 1 .....C.. ........')
+        b.with_kmer('AAC 1 1 a....... ........')
+        b.with_kmer('AGA 1 1 ........ .....C..')
+        b.with_kmer('GAC 1 1 ........ a.......')
+        graph = b.build()
+
+        # when
+        csr = CSRGraph.from_graph(graph)
+
+        # then
+        assert 2 == csr.num_colors
+        assert 1 == len(csr.edges(0)[0])
+        assert 1 == len(csr.edges(1, EdgeTraversalOrientation.reverse)[0])
+        labels = dict(zip(csr.nodes, csr.components()))
+        assert labels['AAA'] == labels['AAC']
+        assert labels['AGA'] == labels['GAC']
+        assert labels['AAA'] != labels['AGA']
+        assert 3 == len(set(csr.components(color=0)))
+
+    def test_finds_edge_nodes_from_edge_bytes_of_kmers(self):
+        # given
+        b = get_cortex_builder()
+        b.with_kmer('AAC 1 c......T')
+        b.with_kmer('ACT 1 a.....G.')
+        b.with_kmer('CAG 1 .......T')
+        graph = b.build()
+
+        # when
+        csr = CSRGraph.from_graph(graph)
+
+        # then
+        assert [0, 1, 0] == [csr.in_degree()[csr.node_index[n]] for n in ['AAC', 'ACT', 'CAG']]
+        assert [('CAG', EdgeTraversalOrientation.reverse)] == csr.edge_nodes()
@@ -1,3 +1,4 @@
+import pytest
 from hypothesis import given, strategies as strat
 
 from cortexpy.graph.interactor import Interactor
@@ -88,3 +89,24 @@ def test_keys_y_graph():
 
             # then
             expect.has_nodes(*expected_nodes)
+
+
+@pytest.mark.parametrize('n_workers', [0, 2])
+@pytest.mark.parametrize('seeds', [None, ['CTG'], ['GCT', 'GTT'], ['GGC', 'AAG']])
+def test_components_made_consistent_in_parallel_match_serial_result(seeds, n_workers):
+    # given
+    b = get_cortex_builder()
+    b.with_kmers('AAC 1 .......T', 'ACT 1 a.....G.', 'CAG 1 .......T', 'CGC 1 .......T',
+                 'AGC 1 a....CG.', 'AAG 1 .....C..', 'GCC 1 a.......')
+    serial_graph = Interactor(b.build()) \
+        .make_graph_nodes_consistent(seeds).graph
+
+    # when
+    parallel_graph = Interactor(b.build()) \
+        .make_graph_nodes_consistent(seeds, n_workers=n_workers).graph
+
+    # then
+    assert list(serial_graph) == list(parallel_graph)
+    assert set(serial_graph.edges(keys=True)) == set(parallel_graph.edges(keys=True))
+    for node in serial_graph:
+        assert serial_graph.node[node].kmer == parallel_graph.node[node].kmer
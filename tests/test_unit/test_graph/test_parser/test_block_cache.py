@@ -0,0 +1,128 @@
+import io
+from unittest import mock
+
+import cortexpy.graph.parser.block_cache as block_cache
+import cortexpy.graph.parser.random_access as parser
+import cortexpy.test.builder as builder
+from cortexpy.graph.parser.block_cache import BlockCache, file_identity
+
+KMERS = ['AAA 1 .....C..', 'AAC 2 a.......', 'ACA 3 ........', 'CAA 4 ........',
+         'CCA 5 ........']
+
+
+def write_graph(tmpdir, graph, name='graph.ctx'):
+    graph_path = tmpdir / name
+    graph_path.write_binary(graph.getvalue())
+    return str(graph_path)
+
+
+class TestBlockCache(object):
+    def test_reads_ranges_across_blocks(self, tmpdir):
+        # given
+        data = bytes(range(256)) * 4
+        path = tmpdir / 'data'
+        path.write_binary(data)
+        cache = BlockCache(10 ** 6, block_size=100)
+
+        with open(str(path), 'rb') as fh:
+            file_key = file_identity(fh)
+
+            # when/then
+            for offset, length in [(0, 10), (95, 10), (150, 300), (1000, 100), (1024, 10)]:
+                assert data[offset:(offset + length)] == cache.read(fh, file_key, offset, length)
+
+    def test_shares_blocks_between_handles_of_same_file(self, tmpdir):
+        # given
+        path = tmpdir / 'data'
+        path.write_binary(bytes(range(256)))
+        cache = BlockCache(10 ** 6, block_size=16)
+        with open(str(path), 'rb') as fh:
+            cache.read(fh, file_identity(fh), 20, 4)
+
+        with open(str(path), 'rb') as fh:
+            # when
+            with mock.patch.object(fh, 'read', side_effect=AssertionError):
+                data = cache.read(fh, file_identity(fh), 18, 6)
+
+        # then
+        assert bytes(range(18, 24)) == data
+        assert 1 == cache.stats['hits']
+
+    def test_evicts_blocks_over_budget(self, tmpdir):
+        # given
+        path = tmpdir / 'data'
+        path.write_binary(bytes(256))
+        cache = BlockCache(32, block_size=16)
+
+        with open(str(path), 'rb') as fh:
+            # when
+            cache.read(fh, file_identity(fh), 0, 64)
+
+        # then
+        assert 2 == cache.stats['entries']
+        assert 2 == cache.stats['evictions']
+
+    def test_reads_handles_without_file_descriptor_directly(self):
+        # given
+        cache = BlockCache(10 ** 6)
+        handle = io.BytesIO(b'abcdef')
+
+        # when
+        data = cache.read(handle, file_identity(handle), 2, 3)
+
+        # then
+        assert b'cde' == data
+        assert 0 == cache.stats['entries']
+
+
+class TestSharedBlockCache(object):
+    def test_returns_one_cache_and_resizes_it(self):
+        with mock.patch.object(block_cache, '_shared_block_cache', None):
+            # when
+            cache = block_cache.shared_block_cache(1000)
+
+            # then
+            assert cache is block_cache.shared_block_cache()
+            assert cache is block_cache.shared_block_cache(10)
+            assert 10 == cache.stats['max_bytes']
+
+
+class TestRandomAccess(object):
+    def test_graphs_of_same_file_share_reads(self, tmpdir):
+        # given
+        graph_path = write_graph(tmpdir, builder.Graph().with_kmers(*KMERS).build())
+        cache = BlockCache(10 ** 6)
+        with open(graph_path, 'rb') as fh:
+            ra = parser.RandomAccess(fh, block_cache=cache)
+            expected = [tuple(ra[k].coverage) for k in ['AAA', 'AAC', 'ACA', 'CAA', 'CCA']]
+        n_hits = cache.stats['hits']
+
+        with open(graph_path, 'rb') as fh:
+            # when
+            ra = parser.RandomAccess(fh, block_cache=cache)
+            with mock.patch.object(fh, 'read', side_effect=AssertionError):
+                coverages = [tuple(ra[k].coverage) for k in ['AAA', 'AAC', 'ACA', 'CAA', 'CCA']]
+                assert 'ACC' not in ra
+
+        # then
+        assert [(1,), (2,), (3,), (4,), (5,)] == expected == coverages
+        assert 1 == cache.stats['entries']
+        assert cache.stats['hits'] > n_hits
+
+    def test_caches_blocks_of_different_files_separately(self, tmpdir):
+        # given
+        graphs = [builder.Graph().with_kmers('AAA 1 ........').build(),
+                  builder.Graph().with_kmers('AAA 2 ........').build()]
+        paths = [write_graph(tmpdir, graph, name=name)
+                 for graph, name in zip(graphs, ['a.ctx', 'b.ctx'])]
+        cache = BlockCache(10 ** 6)
+
+        # when
+        coverages = []
+        for path in paths:
+            with open(path, 'rb') as fh:
+                coverages.append(tuple(parser.RandomAccess(fh, block_cache=cache)['AAA'].coverage))
+
+        # then
+        assert [(1,), (2,)] == coverages
+        assert 2 == cache.stats['entries']
@@ -0,0 +1,175 @@
+import gzip
+import io
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as s
+
+import cortexpy.graph.parser.random_access as parser
+import cortexpy.test.builder as builder
+from cortexpy.command.compress import compress
+from cortexpy.graph.parser.block_compressed import compress_graph, is_block_compressed
+from cortexpy.graph.parser.streaming import kmer_generator_from_stream
+from cortexpy.graph.serializer.kmer import Kmers
+from cortexpy.test.builder.graph.kmer import kmer_records
+from cortexpy.utils import lexlo
+
+
+class TestCompressGraph(object):
+    def test_gunzips_to_original_graph(self):
+        # given
+        graph = builder.Graph().with_kmers('AAA', 'AAC', 'ACA', 'CAA', 'CCA').build()
+        compressed = io.BytesIO()
+
+        # when
+        compress_graph(graph, compressed, records_per_block=2)
+        compressed.seek(0)
+
+        # then
+        assert is_block_compressed(compressed)
+        assert not is_block_compressed(graph)
+        assert graph.getvalue() == gzip.decompress(compressed.getvalue())
+
+    def test_raises_on_unsorted_graph(self):
+        # given
+        graph_builder = builder.Graph().with_kmer_size(3).without_sorted_kmers()
+        for kmer_string in ['CAA', 'AAA']:
+            graph_builder.with_kmer(kmer_string)
+
+        # when/then
+        with pytest.raises(ValueError):
+            compress_graph(graph_builder.build(), io.BytesIO(), records_per_block=1)
+
+    def test_streams_kmers_of_compressed_graph(self):
+        # given
+        compressed = io.BytesIO()
+        compress_graph(builder.Graph().with_kmers('AAA', 'AAC', 'ACA', 'CAA', 'CCA').build(),
+                       compressed, records_per_block=2)
+        compressed.seek(0)
+
+        # when
+        kmers = list(kmer_generator_from_stream(compressed))
+
+        # then
+        assert ['AAA', 'AAC', 'ACA', 'CAA', 'CCA'] == [k.kmer for k in kmers]
+
+
+class TestRandomAccessOfCompressedGraph(object):
+    @given(data=s.data(),
+           records_per_block=s.integers(min_value=1, max_value=3),
+           n_kmers=s.integers(min_value=0, max_value=4),
+           n_missing_kmers=s.integers(min_value=0, max_value=2))
+    def test_finds_kmers_and_missing_kmers(self, data, records_per_block, n_kmers,
+                                           n_missing_kmers):
+        # given
+        kmer_size = 5
+        graph_builder = builder.Graph().with_kmer_size(kmer_size)
+        kmers = data.draw(s.lists(kmer_records(kmer_size, 1),
+                                  min_size=n_kmers + n_missing_kmers,
+                                  max_size=n_kmers + n_missing_kmers,
+                                  unique_by=lambda r: lexlo(r.kmer)))
+        expected_kmers = {}
+        for kmer in kmers:
+            kmer.kmer = lexlo(kmer.kmer)
+            expected_kmers[kmer.kmer] = kmer
+        present_kmers = list(expected_kmers.values())[:n_kmers]
+        for kmer in present_kmers:
+            graph_builder.with_kmer_record(kmer)
+        compressed = io.BytesIO()
+        compress_graph(graph_builder.build(), compressed, records_per_block=records_per_block)
+
+        # when
+        ra = parser.RandomAccess(compressed)
+        batch = ra.get_many(list(expected_kmers))
+
+        # then
+        assert n_kmers == len(ra)
+        assert sorted(k.kmer for k in present_kmers) == list(ra)
+        for kmer in present_kmers:
+            assert kmer.kmer in ra
+            assert tuple(kmer.coverage) == tuple(ra[kmer.kmer].coverage)
+        for kmer_string, found in zip(expected_kmers, batch.found):
+            assert (kmer_string in {k.kmer for k in present_kmers}) == found
+        for kmer_string in list(expected_kmers)[n_kmers:]:
+            assert kmer_string not in ra
+
+    def test_iterates_kmers_and_values(self):
+        # given
+        compressed = io.BytesIO()
+        compress_graph(builder.Graph().with_kmers('AAA', 'AAC', 'ACA', 'CAA', 'CCA').build(),
+                       compressed, records_per_block=2)
+        ra = parser.RandomAccess(compressed)
+
+        # when
+        items = list(ra.items())
+
+        # then
+        assert ['AAA', 'AAC', 'ACA', 'CAA', 'CCA'] == [k_string for k_string, _ in items]
+        assert [k.kmer for _, k in items] == [k.kmer for k in ra.values()]
+        assert 'CAA' == ra.get_kmer_for_string('TTG').kmer
+
+    def test_iterates_all_kmers_while_looking_up_kmers(self):
+        # given
+        kmer_strings = ['AAA', 'AAC', 'ACA', 'CAA', 'CCA']
+        compressed = io.BytesIO()
+        compress_graph(builder.Graph().with_kmers(*kmer_strings).build(), compressed,
+                       records_per_block=2)
+        ra = parser.RandomAccess(compressed)
+
+        # when
+        iterated = []
+        for kmer_string in ra:
+            iterated.append(kmer_string)
+            assert 'CCA' in ra
+
+        # then
+        assert kmer_strings == iterated
+
+    def test_raises_when_memory_mapped(self):
+        # given
+        compressed = io.BytesIO()
+        compress_graph(builder.Graph().with_kmers('AAA').build(), compressed, records_per_block=2)
+
+        # when/then
+        with pytest.raises(ValueError):
+            parser.RandomAccess(compressed, memory_map=True)
+
+
+class TestKmersDump(object):
+    def test_writes_block_compressed_graph(self):
+        # given
+        ra = parser.RandomAccess(builder.Graph().with_kmers('AAA', 'AAC', 'ACA', 'CAA').build())
+        kmers = Kmers(keys=list(ra),
+                      val_callable=lambda k: ra[k],
+                      sample_names=ra.sample_names,
+                      kmer_size=ra.kmer_size,
+                      num_colors=ra.num_colors)
+        buffer = io.BytesIO()
+
+        # when
+        kmers.dump(buffer, block_compressed=True)
+
+        # then
+        compressed_ra = parser.RandomAccess(buffer)
+        assert compressed_ra.block_compressed_graph is not None
+        assert list(ra) == list(compressed_ra)
+        assert [tuple(k.coverage) for k in ra.values()] == \
+               [tuple(k.coverage) for k in compressed_ra.values()]
+
+
+class TestCompressCommand(object):
+    def test_compresses_gzipped_graph(self, tmpdir):
+        # given
+        graph_path = tmpdir / 'graph.ctx.gz'
+        graph = builder.Graph().with_kmers('AAA', 'AAC', 'ACA').build()
+        graph_path.write_binary(gzip.compress(graph.getvalue()))
+        out_path = tmpdir / 'graph.bctx'
+
+        # when
+        compress(['--records-per-block', '2', '-o', str(out_path), str(graph_path)])
+
+        # then
+        with open(str(out_path), 'rb') as fh:
+            ra = parser.RandomAccess(fh)
+            assert ['AAA', 'AAC', 'ACA'] == list(ra)
+            assert 2 == ra.fence_index.interval
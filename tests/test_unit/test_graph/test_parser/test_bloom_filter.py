@@ -0,0 +1,184 @@
+import io
+from unittest import mock
+
+import numpy as np
+from hypothesis import given
+from hypothesis import strategies as s
+
+import cortexpy.graph.parser.random_access as parser
+import cortexpy.test.builder as builder
+from cortexpy.command.index import index
+from cortexpy.graph.parser.block_compressed import compress_graph
+from cortexpy.graph.parser.bloom_filter import BloomFilter
+from cortexpy.graph.parser.kmer import StringKmerConverter
+from cortexpy.test.builder.graph.kmer import kmer_records
+from cortexpy.utils import lexlo
+
+
+def dump_and_load(bloom_filter, tmpdir):
+    bloom_path = tmpdir / 'graph.ctx.bloom'
+    with open(str(bloom_path), 'wb') as fh:
+        bloom_filter.dump(fh)
+    return BloomFilter.from_path(str(bloom_path))
+
+
+class TestBloomFilter(object):
+    @given(s.data(), s.integers(min_value=0, max_value=20))
+    def test_contains_all_kmers_of_graph(self, data, half_kmer_size):
+        # given
+        kmer_size = 2 * half_kmer_size + 1
+        kmers = data.draw(s.lists(kmer_records(kmer_size, 1),
+                                  unique_by=lambda r: lexlo(r.kmer)))
+        graph_builder = builder.Graph().with_kmer_size(kmer_size)
+        for kmer in kmers:
+            kmer.kmer = lexlo(kmer.kmer)
+            graph_builder.with_kmer_record(kmer)
+        converter = StringKmerConverter(kmer_size)
+        kmer_strings = [kmer.kmer for kmer in kmers]
+
+        # when
+        bloom_filter = BloomFilter.from_graph_handle(graph_builder.build())
+
+        # then
+        for kmer_string in kmer_strings:
+            assert bloom_filter.might_contain(converter.to_uints(kmer_string))
+        if kmer_strings:
+            assert all(bloom_filter.might_contain_many(converter.to_uint_matrix(kmer_strings)))
+
+    def test_single_and_batch_probes_agree(self):
+        # given
+        converter = StringKmerConverter(33)
+        bloom_filter = BloomFilter.empty(4, bits_per_kmer=2)
+        bloom_filter.add_many(converter.to_uint_matrix(['A' * 33, 'C' * 33]))
+        kmer_strings = [lexlo(''.join('ACGT'[(i * j) % 4] for j in range(33)))
+                        for i in range(50)]
+
+        # when
+        maybe = bloom_filter.might_contain_many(converter.to_uint_matrix(kmer_strings))
+
+        # then
+        assert [bloom_filter.might_contain(converter.to_uints(k)) for k in kmer_strings] == \
+            maybe.tolist()
+
+    def test_rejects_most_absent_kmers(self):
+        # given
+        converter = StringKmerConverter(5)
+        present = [lexlo(''.join('ACGT'[(i >> (2 * j)) & 3] for j in range(5)))
+                   for i in range(0, 1024, 4)]
+        absent = [lexlo(''.join('ACGT'[(i >> (2 * j)) & 3] for j in range(5)))
+                  for i in range(1024)]
+        absent = sorted(set(absent) - set(present))
+        bloom_filter = BloomFilter.empty(len(present))
+        bloom_filter.add_many(converter.to_uint_matrix(present))
+
+        # when
+        maybe = bloom_filter.might_contain_many(converter.to_uint_matrix(absent))
+
+        # then
+        assert np.mean(maybe) < 0.1
+
+    def test_memory_maps_dumped_filter(self, tmpdir):
+        # given
+        graph = builder.Graph().with_kmers('AAA', 'ACA').build()
+        bloom_filter = BloomFilter.from_graph_handle(graph)
+
+        # when
+        loaded = dump_and_load(bloom_filter, tmpdir)
+
+        # then
+        assert bloom_filter.n_hashes == loaded.n_hashes
+        assert bloom_filter.header_checksum == loaded.header_checksum
+        assert bloom_filter.bits.tolist() == loaded.bits.tolist()
+        assert not loaded.bits.flags.writeable
+
+    def test_builds_filter_of_block_compressed_graph(self):
+        # given
+        graph = builder.Graph().with_kmers('AAA', 'AAC', 'ACA', 'CAA', 'CCA').build()
+        compressed = io.BytesIO()
+        compress_graph(graph, compressed, records_per_block=2)
+
+        # when
+        bloom_filter = BloomFilter.from_graph_handle(compressed)
+
+        # then
+        expected = BloomFilter.from_graph_handle(graph)
+        assert expected.header_checksum == bloom_filter.header_checksum
+        assert expected.body_size == bloom_filter.body_size
+        assert expected.bits.tolist() == bloom_filter.bits.tolist()
+
+
+class TestRandomAccess(object):
+    def test_does_not_search_for_rejected_kmers(self):
+        # given
+        graph = builder.Graph().with_kmers('AAA', 'ACA').build()
+        bloom_filter = BloomFilter.from_graph_handle(graph)
+        ra = parser.RandomAccess(graph, bloom_filter=bloom_filter)
+
+        # when
+        with mock.patch.object(BloomFilter, 'might_contain', return_value=False), \
+                mock.patch.object(parser.KmerUintSequence, 'index_uint_vector') as mocked_index:
+            # then
+            assert 'AAC' not in ra
+            assert 0 == mocked_index.call_count
+
+    def test_filters_batch_lookups(self):
+        # given
+        graph = builder.Graph().with_kmers('AAA', 'AAC', 'ACA', 'CAA').build()
+        ra = parser.RandomAccess(graph, bloom_filter=BloomFilter.from_graph_handle(graph))
+
+        # when
+        batch = ra.get_many(['TTG', 'AAA', 'CCC', 'ACA'])
+
+        # then
+        assert [True, True, False, True] == list(batch.found)
+        assert ['CAA', 'AAA', 'ACA'] == [batch[i].kmer for i in [0, 1, 3]]
+
+    def test_ignores_filter_of_other_graph(self):
+        # given
+        bloom_filter = BloomFilter.from_graph_handle(builder.Graph().with_kmers('AAA').build())
+
+        # when
+        ra = parser.RandomAccess(builder.Graph().with_kmers('AAA', 'ACA').build(),
+                                 bloom_filter=bloom_filter)
+
+        # then
+        assert ra.bloom_filter is None
+        assert 'ACA' in ra
+
+
+class TestIndexCommand(object):
+    def test_writes_sidecar_filter_that_random_access_loads(self, tmpdir):
+        # given
+        graph_path = tmpdir / 'graph.ctx'
+        graph = builder.Graph().with_kmers('AAA', 'AAC', 'ACA', 'CAA').build()
+        graph_path.write_binary(graph.getvalue())
+
+        # when
+        index(['--bloom', str(graph_path)])
+
+        # then
+        with open(str(graph_path), 'rb') as fh:
+            ra = parser.RandomAccess(fh)
+            assert ra.bloom_filter is not None
+            assert ra.fence_index is not None
+            assert 'CAA' == ra.get_kmer_for_string('TTG').kmer
+            assert 'ACC' not in ra
+
+    def test_only_writes_filter_of_block_compressed_graph(self, tmpdir):
+        # given
+        graph = builder.Graph().with_kmers('AAA', 'AAC', 'ACA', 'CAA').build()
+        compressed = io.BytesIO()
+        compress_graph(graph, compressed, records_per_block=2)
+        graph_path = tmpdir / 'graph.ctx'
+        graph_path.write_binary(compressed.getvalue())
+
+        # when
+        index(['--bloom', str(graph_path)])
+
+        # then
+        assert not (tmpdir / 'graph.ctx.idx').exists()
+        with open(str(graph_path), 'rb') as fh:
+            ra = parser.RandomAccess(fh)
+            assert ra.bloom_filter is not None
+            assert ['AAA', 'AAC', 'ACA', 'CAA'] == [ra[k].kmer for k in ra]
+            assert 'ACC' not in ra
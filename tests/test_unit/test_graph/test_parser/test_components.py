@@ -0,0 +1,141 @@
+import io
+
+import networkx as nx
+import numpy as np
+from hypothesis import given
+from hypothesis import strategies as s
+
+import cortexpy.graph.parser.random_access as parser
+import cortexpy.test.builder as builder
+from cortexpy.command.index import index
+from cortexpy.graph.csr import CSRGraph
+from cortexpy.graph.parser.block_compressed import compress_graph
+from cortexpy.graph.parser.components import ComponentIndex, find_roots, union_many
+from cortexpy.graph.parser.streaming import load_cortex_graph
+from cortexpy.utils import lexlo
+
+
+TWO_COMPONENT_KMERS = ['AAA 1 1 .....C.. ........',
+                       'AAC 1 1 a....... ........',
+                       'AGA 1 1 ........ .....C..',
+                       'CCC 1 1 ........ ........',
+                       'GAC 1 1 ........ a.......']
+
+
+class TestUnionMany(object):
+    @given(s.lists(s.tuples(s.integers(0, 29), s.integers(0, 29)), max_size=40))
+    def test_matches_networkx_components(self, edges):
+        # given
+        nx_graph = nx.Graph()
+        nx_graph.add_nodes_from(range(30))
+        nx_graph.add_edges_from(edges)
+        parents = np.arange(30)
+        first, second = (np.array(nodes, dtype=np.int64) for nodes in zip(*edges)) \
+            if edges else (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+        # when
+        union_many(parents, first, second)
+        roots = find_roots(parents, np.arange(30))
+
+        # then
+        for component in nx.connected_components(nx_graph):
+            assert {min(component)} == {roots[node] for node in component}
+
+
+class TestComponentIndex(object):
+    def test_labels_components_of_all_colors(self):
+        # given
+        graph = builder.Graph().with_kmers(*TWO_COMPONENT_KMERS).build()
+
+        # when
+        component_index = ComponentIndex.from_graph_handle(graph)
+
+        # then
+        assert [0, 0, 1, 2, 1] == component_index.component_ids.tolist()
+        assert [2, 2, 1] == component_index.component_sizes.tolist()
+        assert 3 == component_index.n_records_in_components_of([0, 1, 3])
+        assert [[0, 1], [2, 4], [3]] == [
+            records.tolist() for records in component_index.records_of_components()]
+
+    def test_matches_csr_graph_components_of_random_graph(self):
+        # given
+        rng = np.random.RandomState(1)
+        kmer_strings = sorted({lexlo(''.join(rng.choice(list('ACGT'), 5))) for _ in range(200)})
+        graph_builder = builder.Graph().with_kmer_size(5)
+        for kmer_string in kmer_strings:
+            edges = ''.join(letter if rng.rand() < 0.05 else '.' for letter in 'acgtACGT')
+            graph_builder.with_kmer('{} 1 {}'.format(kmer_string, edges))
+        graph = graph_builder.build()
+        csr = CSRGraph.from_graph(load_cortex_graph(graph))
+
+        # when
+        component_index = ComponentIndex.from_graph_handle(graph, chunk_size=64)
+
+        # then
+        csr_labels = csr.components()
+        ra = parser.RandomAccess(graph)
+        expected = {}
+        for kmer_string, label in zip(csr.nodes, csr_labels):
+            record_idx = ra.get_many([kmer_string]).indices[0]
+            expected.setdefault(label, set()).add(component_index.component_ids[record_idx])
+        assert all(len(ids) == 1 for ids in expected.values())
+        assert len(set(csr_labels)) == component_index.n_components
+
+    def test_labels_block_compressed_graph(self):
+        # given
+        graph = builder.Graph().with_kmers(*TWO_COMPONENT_KMERS).build()
+        compressed = io.BytesIO()
+        compress_graph(graph, compressed, records_per_block=2)
+
+        # when
+        component_index = ComponentIndex.from_graph_handle(compressed)
+
+        # then
+        expected = ComponentIndex.from_graph_handle(graph)
+        assert expected.header_checksum == component_index.header_checksum
+        assert expected.component_ids.tolist() == component_index.component_ids.tolist()
+
+    def test_memory_maps_dumped_index(self, tmpdir):
+        # given
+        graph = builder.Graph().with_kmers(*TWO_COMPONENT_KMERS).build()
+        component_index = ComponentIndex.from_graph_handle(graph)
+        index_path = str(tmpdir / 'graph.ctx.components')
+        with open(index_path, 'wb') as fh:
+            component_index.dump(fh)
+
+        # when
+        loaded = ComponentIndex.from_path(index_path)
+
+        # then
+        assert component_index.body_size == loaded.body_size
+        assert component_index.header_checksum == loaded.header_checksum
+        assert component_index.component_ids.tolist() == loaded.component_ids.tolist()
+        assert component_index.component_sizes.tolist() == loaded.component_sizes.tolist()
+
+    def test_random_access_ignores_index_of_other_graph(self):
+        # given
+        other_graph = builder.Graph().with_kmers('AAA 1 ........').build()
+        component_index = ComponentIndex.from_graph_handle(other_graph)
+
+        # when
+        ra = parser.RandomAccess(builder.Graph().with_kmers(*TWO_COMPONENT_KMERS).build(),
+                                 component_index=component_index)
+
+        # then
+        assert ra.component_index is None
+
+
+class TestIndexCommand(object):
+    def test_writes_sidecar_index_that_random_access_loads(self, tmpdir):
+        # given
+        graph_path = tmpdir / 'graph.ctx'
+        graph_path.write_binary(builder.Graph().with_kmers(*TWO_COMPONENT_KMERS).build().getvalue())
+
+        # when
+        index(['--components', str(graph_path)])
+
+        # then
+        with open(str(graph_path), 'rb') as fh:
+            ra = parser.RandomAccess(fh)
+            assert ra.component_index is not None
+            assert [2, 2, 1] == ra.component_index.component_sizes.tolist()
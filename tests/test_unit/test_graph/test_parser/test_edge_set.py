@@ -1,7 +1,11 @@
+import io
+
 import numpy as np
 import pytest
 
 from cortexpy.edge_set import EdgeSet
+from cortexpy.graph.parser.kmer import IntKmerConverter
+from cortexpy.graph.parser.kmer_ext import raw_edges_to_list
 
 
 class TestIsEdge(object):
@@ -84,6 +88,22 @@ class TestIncomingOutgoingKmers(object):
         es.add_edge('G')
         assert ['CGG'] == list(es.get_outgoing_kmer_strings('ACG'))
 
+    @pytest.mark.parametrize('kmer_string', ('ACG', 'AAC', 'GTT'))
+    def test_int_kmers_match_kmer_strings(self, kmer_string):
+        converter = IntKmerConverter(3)
+        kmer_int = converter.to_int(kmer_string)
+        for letters in ('a', 'cG', 'acgtACGT', 'T'):
+            es = EdgeSet(np.zeros(8))
+            for letter in letters:
+                es.add_edge(letter)
+            for is_lexlo in (True, False):
+                assert list(es.get_outgoing_kmer_strings(kmer_string, is_lexlo=is_lexlo)) == \
+                    [converter.to_string(k) for k in
+                     es.get_outgoing_kmer_ints(kmer_int, converter, is_lexlo=is_lexlo)]
+                assert list(es.get_incoming_kmer_strings(kmer_string, is_lexlo=is_lexlo)) == \
+                    [converter.to_string(k) for k in
+                     es.get_incoming_kmer_ints(kmer_int, converter, is_lexlo=is_lexlo)]
+
     def test_raises_on_non_lexlo_kmer(self):
         es = EdgeSet(np.zeros(8))
         with pytest.raises(AssertionError):
@@ -104,3 +124,32 @@ class TestStr(object):
         es.add_edge('c')
         assert '.c..A...' == es.to_str()
         assert '...T..g.' == es.to_str(as_revcomp=True)
+
+
+class TestEdgeByte(object):
+    def test_data_matches_decoded_edge_byte(self):
+        for edge_byte in range(256):
+            es = EdgeSet(edge_byte)
+            assert [tuple(raw_edges_to_list(bytes([edge_byte]))[0])] == [es.data]
+            assert es == EdgeSet(np.array(es.data))
+            assert sum(es.incoming) == es.num_incoming()
+            assert sum(es.outgoing) == es.num_outgoing()
+
+    def test_dumps_edge_byte(self):
+        # given
+        es = EdgeSet(np.zeros(8))
+        es.add_edge('c')
+        es.add_edge('A')
+        buffer = io.BytesIO()
+
+        # when
+        es.dump(buffer)
+
+        # then
+        assert bytes([0b01000001]) == buffer.getvalue()
+        assert es.byte == 0b01000001
+
+    def test_removes_only_one_edge(self):
+        es = EdgeSet(0xFF)
+        es.remove_edge('g')
+        assert 'ac.tACGT' == str(es)
@@ -0,0 +1,140 @@
+import io
+from unittest import mock
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as s
+
+import cortexpy.graph.parser.random_access as parser
+import cortexpy.test.builder as builder
+from cortexpy.command.index import index
+from cortexpy.graph.parser.fence_index import FenceIndex
+from cortexpy.test.builder.graph.kmer import kmer_records
+from cortexpy.utils import lexlo
+
+
+class TestFenceIndex(object):
+    def test_stores_every_nth_kmer(self):
+        # given
+        fh = builder.Graph().with_kmers('AAA', 'AAC', 'ACA', 'CAA', 'CCA').build()
+        ra = parser.RandomAccess(fh)
+
+        # when
+        fence_index = FenceIndex.from_graph_handle(fh, interval=2)
+
+        # then
+        assert 2 == fence_index.interval
+        assert [ra.graph_kmer_sequence[i].kmer_uints.tolist() for i in (0, 2, 4)] == \
+               fence_index.fence_kmers.tolist()
+
+    def test_round_trips_through_stream(self):
+        # given
+        graph = builder.Graph().with_kmers('AAA', 'AAC', 'ACA').build()
+        fence_index = FenceIndex.from_graph_handle(graph, interval=2)
+        buffer = io.BytesIO()
+
+        # when
+        fence_index.dump(buffer)
+        buffer.seek(0)
+        loaded_index = FenceIndex.from_stream(buffer)
+
+        # then
+        assert fence_index.interval == loaded_index.interval
+        assert fence_index.body_size == loaded_index.body_size
+        assert fence_index.header_checksum == loaded_index.header_checksum
+        assert fence_index.fence_kmers.tolist() == loaded_index.fence_kmers.tolist()
+
+    def test_raises_on_unsorted_graph(self):
+        # given
+        graph_builder = builder.Graph().with_kmer_size(3).without_sorted_kmers()
+        for kmer_string in ['CAA', 'AAA']:
+            graph_builder.with_kmer(kmer_string)
+
+        # when/then
+        with pytest.raises(ValueError):
+            FenceIndex.from_graph_handle(graph_builder.build(), interval=1)
+
+
+class TestRandomAccessWithFenceIndex(object):
+    @given(data=s.data(),
+           interval=s.integers(min_value=1, max_value=3),
+           n_kmers=s.integers(min_value=0, max_value=4),
+           n_missing_kmers=s.integers(min_value=0, max_value=2))
+    def test_finds_kmers_and_missing_kmers(self, data, interval, n_kmers, n_missing_kmers):
+        # given
+        kmer_size = 5
+        graph_builder = builder.Graph().with_kmer_size(kmer_size)
+        kmers = data.draw(s.lists(kmer_records(kmer_size, 1),
+                                  min_size=n_kmers + n_missing_kmers,
+                                  max_size=n_kmers + n_missing_kmers,
+                                  unique_by=lambda r: lexlo(r.kmer)))
+        expected_kmers = {}
+        for kmer in kmers:
+            kmer.kmer = lexlo(kmer.kmer)
+            expected_kmers[kmer.kmer] = kmer
+        present_kmers = list(expected_kmers.values())[:n_kmers]
+        for kmer in present_kmers:
+            graph_builder.with_kmer_record(kmer)
+        fh = graph_builder.build()
+        fence_index = FenceIndex.from_graph_handle(fh, interval=interval)
+
+        # when
+        ra = parser.RandomAccess(fh, fence_index=fence_index)
+        batch = ra.get_many(list(expected_kmers))
+
+        # then
+        assert fence_index is ra.fence_index
+        for kmer in present_kmers:
+            assert kmer.kmer in ra
+            assert tuple(kmer.coverage) == tuple(ra[kmer.kmer].coverage)
+        for kmer_string, found in zip(expected_kmers, batch.found):
+            assert (kmer_string in {k.kmer for k in present_kmers}) == found
+        for kmer_string in list(expected_kmers)[n_kmers:]:
+            assert kmer_string not in ra
+
+    def test_reads_from_handle_once_per_lookup(self):
+        # given
+        kmer_strings = ['AAA', 'AAC', 'ACA', 'CAA', 'CCA', 'GAA']
+        fh = builder.Graph().with_kmers(*kmer_strings).build()
+        fence_index = FenceIndex.from_graph_handle(fh, interval=2)
+        ra = parser.RandomAccess(fh, kmer_cache_size=0, fence_index=fence_index)
+
+        for kmer_string in ['ACA', 'GAA', 'AAA']:
+            with mock.patch.object(fh, 'read', wraps=fh.read) as mocked_read:
+                # when
+                assert kmer_string == ra[kmer_string].kmer
+
+                # then
+                assert 1 == mocked_read.call_count
+
+    def test_ignores_index_of_other_graph(self):
+        # given
+        other_graph = builder.Graph().with_kmers('AAA', 'AAC').build()
+        fence_index = FenceIndex.from_graph_handle(other_graph, interval=1)
+
+        # when
+        ra = parser.RandomAccess(builder.Graph().with_kmers('AAA', 'ACA').build(),
+                                 fence_index=fence_index)
+
+        # then
+        assert ra.fence_index is None
+        assert 'ACA' in ra
+        assert isinstance(ra.graph_kmer_sequence, parser.KmerUintSequence)
+
+
+class TestIndexCommand(object):
+    def test_writes_sidecar_index_that_random_access_loads(self, tmpdir):
+        # given
+        graph_path = tmpdir / 'graph.ctx'
+        graph = builder.Graph().with_kmers('AAA', 'AAC', 'ACA', 'CAA').build()
+        graph_path.write_binary(graph.getvalue())
+
+        # when
+        index(['--interval', '2', str(graph_path)])
+
+        # then
+        with open(str(graph_path), 'rb') as fh:
+            ra = parser.RandomAccess(fh)
+            assert 2 == ra.fence_index.interval
+            assert 'CAA' == ra.get_kmer_for_string('TTG').kmer
+            assert 'ACC' not in ra
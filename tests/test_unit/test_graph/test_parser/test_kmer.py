@@ -1,16 +1,21 @@
 import itertools
 import math
 
+import numpy as np
 import pytest
 from Bio.Seq import reverse_complement, Seq
 from hypothesis import given, assume, settings, strategies as s
 
 from cortexpy import edge_set
 from cortexpy.graph.parser.kmer import (
-    EmptyKmerBuilder, connect_kmers, StringKmerConverter, Kmer,
+    EmptyKmerBuilder, connect_kmers, StringKmerConverter, IntKmerConverter, Kmer,
     KmerData,
     disconnect_kmers,
 )
+from cortexpy.graph.parser.kmer_ext import (
+    raw_kmer_to_string, raw_to_coverage, raw_edges_to_list, raw_records_to_kmer_bytes,
+    raw_records_to_coverage, raw_records_to_edge_bytes,
+)
 from cortexpy.test.builder.graph.body import KmerRecord
 from cortexpy.test.builder.graph.kmer import dna_sequences, kmer_strings, kmer_records
 
@@ -78,6 +83,36 @@ class TestBuildKmer(object):
             kmer.kmer = reverse_complement(kmer.kmer)
 
 
+class TestRawRecordsDecoding(object):
+    @given(s.data(),
+           s.sampled_from((3, 31, 33, 63, 65)),
+           s.integers(min_value=1, max_value=3),
+           s.integers(min_value=0, max_value=4))
+    def test_matches_single_record_decoding(self, data, kmer_size, num_colors, n_records):
+        # given
+        records = [data.draw(kmer_records(kmer_size, num_colors)).to_bytestring()
+                   for _ in range(n_records)]
+        record_size = math.ceil(kmer_size / 32) * 8 + 5 * num_colors
+        raw_records = np.frombuffer(b''.join(records), dtype=np.uint8).reshape(n_records,
+                                                                               record_size)
+        kmer_bytes = record_size - 5 * num_colors
+
+        # when
+        kmers = raw_records_to_kmer_bytes(kmer_size, raw_records)
+        coverage = raw_records_to_coverage(raw_records, kmer_bytes, num_colors)
+        edges = raw_records_to_edge_bytes(raw_records, kmer_bytes + 4 * num_colors, num_colors)
+
+        # then
+        assert (n_records,) == kmers.shape
+        assert (n_records, num_colors) == coverage.shape
+        assert (n_records, num_colors) == edges.shape
+        for record, kmer, record_coverage, record_edges in zip(records, kmers, coverage, edges):
+            assert raw_kmer_to_string(kmer_size, record[:kmer_bytes]) == kmer.decode()
+            assert raw_to_coverage(record, kmer_bytes, num_colors) == tuple(record_coverage)
+            assert raw_edges_to_list(record[(kmer_bytes + 4 * num_colors):]) == \
+                raw_edges_to_list(record_edges.tobytes())
+
+
 class TestAddColor(object):
     @given(s.data(), s.integers(min_value=1, max_value=7), s.integers(min_value=0, max_value=10))
     @settings(max_examples=10)
@@ -365,3 +400,69 @@ class TestStringKmerConverter(object):
 
         # then
         assert kmer.get_raw_kmer() == raw_kmer
+
+    @given(s.integers(min_value=1, max_value=129),
+           s.lists(s.text(alphabet='ACGT', min_size=129, max_size=129), min_size=0, max_size=4))
+    def test_converts_many_kmers_to_uint_matrix(self, kmer_size, long_strings):
+        # given
+        kmer_strings = [string[:kmer_size] for string in long_strings]
+        converter = StringKmerConverter(kmer_size=kmer_size)
+
+        # when
+        uint_matrix = converter.to_uint_matrix(kmer_strings)
+
+        # then
+        assert (len(kmer_strings), math.ceil(kmer_size / 32)) == uint_matrix.shape
+        for kmer_string, uints in zip(kmer_strings, uint_matrix):
+            assert list(converter.to_uints(kmer_string)) == list(uints)
+
+
+class TestIntKmerConverter(object):
+    @given(s.integers(min_value=1, max_value=129),
+           s.text(alphabet='ACGT', min_size=129, max_size=129))
+    def test_round_trips_kmer_string(self, kmer_size, long_string):
+        # given
+        kmer_string = long_string[:kmer_size]
+        converter = IntKmerConverter(kmer_size)
+
+        # when
+        kmer_int = converter.to_int(kmer_string)
+
+        # then
+        assert kmer_string == converter.to_string(kmer_int)
+        assert list(StringKmerConverter(kmer_size).to_uints(kmer_string)) == \
+            list(converter.to_uints(kmer_int))
+        assert kmer_int == converter.from_uints(converter.to_uints(kmer_int))
+
+    @given(s.integers(min_value=1, max_value=129),
+           s.text(alphabet='ACGT', min_size=129, max_size=129))
+    def test_computes_revcomp_and_lexlo(self, kmer_size, long_string):
+        # given
+        kmer_string = long_string[:kmer_size]
+        converter = IntKmerConverter(kmer_size)
+        kmer_int = converter.to_int(kmer_string)
+
+        # when
+        revcomp_int = converter.revcomp(kmer_int)
+
+        # then
+        assert reverse_complement(kmer_string) == converter.to_string(revcomp_int)
+        assert min(kmer_string, reverse_complement(kmer_string)) == \
+            converter.to_string(converter.lexlo(kmer_int))
+        assert (kmer_string <= reverse_complement(kmer_string)) == converter.is_lexlo(kmer_int)
+
+    @given(s.integers(min_value=1, max_value=129),
+           s.text(alphabet='ACGT', min_size=129, max_size=129),
+           s.sampled_from('ACGT'))
+    def test_appends_and_prepends_letters(self, kmer_size, long_string, letter):
+        # given
+        kmer_string = long_string[:kmer_size]
+        converter = IntKmerConverter(kmer_size)
+        kmer_int = converter.to_int(kmer_string)
+        letter_num = 'ACGT'.index(letter)
+
+        # when/then
+        assert kmer_string[1:] + letter == converter.to_string(
+            converter.append(kmer_int, letter_num))
+        assert letter + kmer_string[:-1] == converter.to_string(
+            converter.prepend(kmer_int, letter_num))
@@ -0,0 +1,138 @@
+import gzip
+
+import numpy as np
+import pytest
+
+import cortexpy.test.builder as builder
+from cortexpy.command.view import view_graph
+from cortexpy.graph.parser import parallel
+
+
+def write_graph(tmpdir, kmers, num_colors=1):
+    graph_builder = builder.Graph().with_kmer_size(3).with_num_colors(num_colors)
+    for kmer in kmers:
+        graph_builder.with_kmer(kmer)
+    graph_path = tmpdir / 'graph.ctx'
+    graph_path.write_binary(graph_builder.build().getvalue())
+    return str(graph_path)
+
+
+def coverage_above_one(record_array):
+    return record_array.coverage[:, 0] > 1
+
+
+def kmer_strings(record_array):
+    return record_array.kmer_strings()
+
+
+KMERS = ['AAA 1 ........', 'AAC 2 ........', 'ACA 2 ........', 'CAA 3 ........',
+         'CCA 1 ........']
+
+
+class TestGraphRanges(object):
+    def test_splits_body_into_ranges_of_records(self, tmpdir):
+        # given
+        graph_path = write_graph(tmpdir, KMERS)
+
+        # when
+        header, ranges = parallel.graph_ranges(graph_path, records_per_range=2)
+
+        # then
+        assert 3 == header.kmer_size
+        assert [(0, 2), (2, 4), (4, 5)] == [(r.start, r.stop) for r in ranges]
+        assert ['CCA'] == ranges[-1].record_array().kmer_strings()
+
+    def test_raises_on_compressed_graph(self, tmpdir):
+        # given
+        graph_path = tmpdir / 'graph.ctx.gz'
+        graph_path.write_binary(gzip.compress(builder.Graph().with_kmer_size(3).build().getvalue()))
+
+        # when/then
+        with pytest.raises(ValueError):
+            parallel.graph_ranges(str(graph_path))
+
+
+@pytest.mark.parametrize('n_workers', [1, 2])
+class TestScan(object):
+    def test_counts_kmers(self, tmpdir, n_workers):
+        graph_path = write_graph(tmpdir, KMERS)
+        assert 5 == parallel.scan(graph_path, parallel.KmerCounter(), n_workers=n_workers,
+                                  records_per_range=2)
+
+    def test_counts_coverage(self, tmpdir, n_workers):
+        # given
+        graph_path = write_graph(tmpdir, ['AAA 1 4 ........ ........', 'AAC 2 4 ........ ........',
+                                          'ACA 2 5 ........ ........'], num_colors=2)
+
+        # when
+        histogram = parallel.scan(graph_path, parallel.CoverageHistogram(color=1),
+                                  n_workers=n_workers, records_per_range=2)
+
+        # then
+        assert {4: 2, 5: 1} == histogram
+
+    def test_filters_records(self, tmpdir, n_workers):
+        # given
+        graph_path = write_graph(tmpdir, KMERS)
+
+        # when
+        record_array = parallel.scan(graph_path, parallel.RecordFilter(coverage_above_one),
+                                     n_workers=n_workers, records_per_range=2)
+
+        # then
+        assert ['AAC', 'ACA', 'CAA'] == record_array.kmer_strings()
+        assert [2, 2, 3] == record_array.coverage[:, 0].tolist()
+
+    def test_filters_all_records_of_empty_graph(self, tmpdir, n_workers):
+        # given
+        graph_path = write_graph(tmpdir, [])
+
+        # when
+        record_array = parallel.scan(graph_path, parallel.RecordFilter(coverage_above_one),
+                                     n_workers=n_workers)
+
+        # then
+        assert 0 == len(record_array)
+
+    def test_combines_results_of_function(self, tmpdir, n_workers):
+        # given
+        graph_path = write_graph(tmpdir, KMERS)
+        reducer = parallel.FunctionReducer(kmer_strings, combine=np.concatenate)
+
+        # when
+        kmers = parallel.scan(graph_path, reducer, n_workers=n_workers, records_per_range=2)
+
+        # then
+        assert ['AAA', 'AAC', 'ACA', 'CAA', 'CCA'] == list(kmers)
+
+
+class TestViewGraphInParallel(object):
+    def test_prints_same_graph_as_serial_view(self, tmpdir, capsys):
+        # given
+        graph_path = write_graph(tmpdir, ['AAA 1 2 a......T ........', 'AAC 2 4 .c..A... c.......'],
+                                 num_colors=2)
+        view_graph([graph_path])
+        expected = capsys.readouterr().out
+
+        # when
+        view_graph(['--jobs', '2', graph_path])
+
+        # then
+        assert expected == capsys.readouterr().out
+        assert 2 == len(expected.splitlines())
+
+    def test_prints_compressed_graph_with_one_process(self, tmpdir, capsys):
+        # given
+        graph_path = write_graph(tmpdir, KMERS)
+        view_graph([graph_path])
+        expected = capsys.readouterr().out
+        with open(graph_path, 'rb') as fh:
+            body = fh.read()
+        with gzip.open(graph_path, 'wb') as fh:
+            fh.write(body)
+
+        # when
+        view_graph(['--jobs', '2', graph_path])
+
+        # then
+        assert expected == capsys.readouterr().out
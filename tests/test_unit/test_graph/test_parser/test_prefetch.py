@@ -0,0 +1,132 @@
+import io
+import os
+from unittest import mock
+
+import cortexpy.graph.parser.random_access as parser
+import cortexpy.test.builder as builder
+from cortexpy.graph.parser.block_compressed import compress_graph
+from cortexpy.graph.parser.fence_index import FenceIndex
+from cortexpy.graph.parser.prefetch import NeighborPrefetcher, neighbor_kmer_strings
+
+KMERS = ['AAA 1 .....C..', 'AAC 1 a.......', 'ACA 1 ........', 'CAA 1 ........',
+         'CCA 1 ........']
+
+
+def write_graph(tmpdir, graph):
+    graph_path = tmpdir / 'graph.ctx'
+    graph_path.write_binary(graph.getvalue())
+    return str(graph_path)
+
+
+class TestNeighborKmerStrings(object):
+    def test_returns_lexlo_neighbors(self):
+        # given
+        ra = parser.RandomAccess(builder.Graph().with_kmers(*KMERS).build())
+
+        # then
+        assert {'AAC'} == neighbor_kmer_strings(ra['AAA'])
+        assert {'AAA'} == neighbor_kmer_strings(ra['AAC'])
+        assert set() == neighbor_kmer_strings(ra['ACA'])
+
+
+class TestNeighborPrefetcher(object):
+    def test_finds_records_with_positional_reads(self, tmpdir):
+        # given
+        graph_path = write_graph(tmpdir, builder.Graph().with_kmers(*KMERS).build())
+        with open(graph_path, 'rb') as fh:
+            ra = parser.RandomAccess(fh, prefetch_workers=1)
+            prefetcher = ra.prefetcher
+            converter = prefetcher.kmer_string_converter
+
+            # when/then
+            for index, kmer_string in enumerate(['AAA', 'AAC', 'ACA', 'CAA', 'CCA']):
+                assert index == prefetcher._search(converter.to_uints(kmer_string))
+            assert 5 == prefetcher._search(converter.to_uints('TTT'))
+            prefetcher.close()
+
+    def test_stops_prefetcher_at_end_of_with_block(self, tmpdir):
+        # given
+        graph_path = write_graph(tmpdir, builder.Graph().with_kmers(*KMERS).build())
+        with open(graph_path, 'rb') as fh:
+            # when
+            with parser.RandomAccess(fh, prefetch_workers=1) as ra:
+                prefetcher = ra.prefetcher
+                ra['AAA']
+
+            # then
+            assert ra.prefetcher is None
+            assert prefetcher._executor._shutdown
+            assert 'AAC' == ra['AAC'].kmer
+
+    def test_prefetches_neighbors_of_returned_kmers_once(self, tmpdir):
+        # given
+        graph_path = write_graph(tmpdir, builder.Graph().with_kmers(*KMERS).build())
+        with open(graph_path, 'rb') as fh:
+            ra = parser.RandomAccess(fh, prefetch_workers=1)
+            with mock.patch.object(ra.prefetcher, '_executor') as mocked_executor:
+                # when
+                ra['AAA']
+                ra['AAA']
+                ra['ACA']
+
+                # then
+                assert 1 == mocked_executor.submit.call_count
+                _, uints = mocked_executor.submit.call_args[0]
+                converter = ra.prefetcher.kmer_string_converter
+                assert list(converter.to_uints('AAC')) == list(uints)
+
+    def test_does_not_prefetch_from_graph_without_file_descriptor(self):
+        ra = parser.RandomAccess(builder.Graph().with_kmers(*KMERS).build(), prefetch_workers=1)
+        assert ra.prefetcher is None
+        assert 'AAA' == ra['AAA'].kmer
+
+    def test_advises_kernel_of_fenced_block(self, tmpdir):
+        # given
+        graph = builder.Graph().with_kmers(*KMERS).build()
+        graph_path = write_graph(tmpdir, graph)
+        fence_index = FenceIndex.from_graph_handle(graph, interval=2)
+        with open(graph_path, 'rb') as fh:
+            ra = parser.RandomAccess(fh, fence_index=fence_index, prefetch_workers=1)
+            with mock.patch.object(os, 'posix_fadvise') as mocked_fadvise:
+                # when
+                ra['AAA']
+
+                # then
+                offset, length = ra.graph_kmer_sequence.block_reader.location_of_block(0)
+                mocked_fadvise.assert_called_once_with(fh.fileno(), offset, length,
+                                                       os.POSIX_FADV_WILLNEED)
+
+    def test_advises_kernel_of_compressed_block(self, tmpdir):
+        # given
+        compressed = io.BytesIO()
+        compress_graph(builder.Graph().with_kmers(*KMERS).build(), compressed, records_per_block=2)
+        graph_path = write_graph(tmpdir, compressed)
+        with open(graph_path, 'rb') as fh:
+            ra = parser.RandomAccess(fh, prefetch_workers=1)
+            block_offsets = ra.block_compressed_graph.block_offsets
+            with mock.patch.object(os, 'posix_fadvise') as mocked_fadvise:
+                # when
+                ra['AAC']
+
+                # then
+                mocked_fadvise.assert_called_once_with(fh.fileno(), block_offsets[0],
+                                                       block_offsets[1] - block_offsets[0],
+                                                       os.POSIX_FADV_WILLNEED)
+            assert ['AAA', 'AAC', 'ACA', 'CAA', 'CCA'] == [ra[k].kmer for k in list(ra)]
+
+    def test_limits_pending_prefetches(self, tmpdir):
+        # given
+        graph = builder.Graph().with_kmers(*KMERS).build()
+        with open(write_graph(tmpdir, graph), 'rb') as fh:
+            prefetcher = NeighborPrefetcher.from_graph_handle(fh,
+                                                              header=parser.RandomAccess(
+                                                                  graph).header,
+                                                              body_start=0,
+                                                              n_records=5,
+                                                              max_pending=1)
+            with mock.patch.object(prefetcher, '_executor') as mocked_executor:
+                # when
+                prefetcher.prefetch(['AAA', 'AAC'])
+
+                # then
+                assert 1 == mocked_executor.submit.call_count
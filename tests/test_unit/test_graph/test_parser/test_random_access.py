@@ -1,5 +1,6 @@
 import io
 import random
+from functools import partial
 from unittest import mock
 
 import numpy as np
@@ -78,9 +79,19 @@ class TestSlurpedDunderGetitemDunder(TestDunderGetitemDunder):
     RAClass = parser.SlurpedRandomAccess.from_handle
 
 
+class TestMemoryMappedDunderGetitemDunder(TestDunderGetitemDunder):
+    RAClass = partial(parser.RandomAccess, memory_map=True)
+
+
+class TestColumnarDunderGetitemDunder(TestDunderGetitemDunder):
+    RAClass = parser.ColumnarRandomAccess.from_handle
+
+
 class TestGetKmerForString(object):
     @pytest.mark.parametrize('RAClass',
-                             (parser.RandomAccess, parser.SlurpedRandomAccess.from_handle))
+                             (parser.RandomAccess,
+                              parser.SlurpedRandomAccess.from_handle,
+                              parser.ColumnarRandomAccess.from_handle))
     def test_gets_aaa_for_ttt_query(self, RAClass):
         # given
         graph_builder = builder.Graph()
@@ -97,6 +108,72 @@ class TestGetKmerForString(object):
         assert expected_kmer.kmer == cg.get_kmer_for_string('TTT').kmer
 
 
+class TestGetMany(object):
+    @pytest.mark.parametrize('RAClass',
+                             (parser.RandomAccess,
+                              partial(parser.RandomAccess, memory_map=True),
+                              parser.SlurpedRandomAccess.from_handle,
+                              parser.ColumnarRandomAccess.from_handle))
+    @given(data=s.data(),
+           kmer_size=s.sampled_from([3, 5, 33]),
+           n_kmers=s.integers(min_value=0, max_value=4),
+           n_missing_kmers=s.integers(min_value=0, max_value=2))
+    def test_finds_kmers_and_missing_kmers(self, RAClass, data, kmer_size, n_kmers,
+                                           n_missing_kmers):
+        # given
+        num_colors = 2
+        graph_builder = (builder.Graph()
+                         .with_kmer_size(kmer_size)
+                         .with_num_colors(num_colors))
+        kmers = data.draw(s.lists(kmer_records(kmer_size, num_colors),
+                                  min_size=n_kmers + n_missing_kmers,
+                                  max_size=n_kmers + n_missing_kmers,
+                                  unique_by=lambda r: lexlo(r.kmer)))
+        expected_kmers = {}
+        for kmer in kmers:
+            kmer.kmer = lexlo(kmer.kmer)
+            expected_kmers[kmer.kmer] = kmer
+        present_kmers = list(expected_kmers.values())[:n_kmers]
+        for kmer in present_kmers:
+            graph_builder.with_kmer_record(kmer)
+        ra = RAClass(graph_builder.build())
+        query_strings = data.draw(s.permutations(list(expected_kmers)))
+
+        # when
+        batch = ra.get_many(query_strings)
+
+        # then
+        assert len(query_strings) == len(batch)
+        for query_string, found, kmer in zip(query_strings, batch.found, batch):
+            if query_string in {k.kmer for k in present_kmers}:
+                assert found
+                assert query_string == kmer.kmer
+                assert tuple(expected_kmers[query_string].coverage) == tuple(kmer.coverage)
+                assert list(expected_kmers[query_string].edges) == kmer.edges
+            else:
+                assert not found
+                assert kmer is None
+
+    @pytest.mark.parametrize('RAClass',
+                             (parser.RandomAccess,
+                              partial(parser.RandomAccess, memory_map=True),
+                              parser.ColumnarRandomAccess.from_handle))
+    def test_returns_record_indices_of_revcomp_queries(self, RAClass):
+        # given
+        graph_builder = builder.Graph().with_kmer_size(3)
+        for kmer_string in ['AAA', 'AAC', 'ACA', 'CAA']:
+            graph_builder.with_kmer(kmer_string)
+        ra = RAClass(graph_builder.build())
+
+        # when
+        batch = ra.get_many(['TTG', 'AAA', 'CCC', 'TGT'])
+
+        # then
+        assert ['CAA', 'AAA', 'CCC', 'ACA'] == batch.kmer_strings
+        assert [True, True, False, True] == list(batch.found)
+        assert [3, 0, 2] == list(batch.indices[batch.found])
+
+
 class TestDunderIterDunder:
     RAClass = parser.RandomAccess
 
@@ -182,11 +259,125 @@ class TestDunderIterDunder:
         # when/then
         assert list(cg) == []
 
+    def test_iterates_all_kmers_while_looking_up_kmers(self):
+        # given
+        graph_builder = builder.Graph().with_kmer_size(3)
+        kmer_strings = ['AAA', 'AAC', 'ACA', 'CAA']
+        for kmer_string in kmer_strings:
+            graph_builder.with_kmer('{} 1 ........'.format(kmer_string))
+        cg = self.RAClass(graph_builder.build())
+
+        # when
+        iterated = []
+        for kmer_string in cg:
+            iterated.append(kmer_string)
+            assert 'AAA' in cg
+            assert 'CCC' not in cg
+
+        # then
+        assert kmer_strings == iterated
+
 
 class TestSlurpedDunderIterDunder(TestDunderIterDunder):
     RAClass = parser.SlurpedRandomAccess.from_handle
 
 
+class TestMemoryMappedDunderIterDunder(TestDunderIterDunder):
+    RAClass = partial(parser.RandomAccess, memory_map=True)
+
+
+class TestColumnarDunderIterDunder(TestDunderIterDunder):
+    RAClass = parser.ColumnarRandomAccess.from_handle
+
+
+class TestColumnarRandomAccess(object):
+    def test_sorts_unsorted_graph(self):
+        # given
+        graph_builder = (builder.Graph()
+                         .with_kmer_size(3)
+                         .with_num_colors(2)
+                         .without_sorted_kmers())
+        for kmer_string in ['CAA', 'AAA', 'ACA']:
+            graph_builder.with_kmer('{} 1 2 ........ ........'.format(kmer_string))
+
+        # when
+        ra = parser.ColumnarRandomAccess.from_handle(graph_builder.build())
+
+        # then
+        assert ['AAA', 'ACA', 'CAA'] == list(ra)
+        assert [[1, 2], [1, 2], [1, 2]] == ra.graph_sequence.coverage.tolist()
+        assert (1, 2) == tuple(ra['CAA'].coverage)
+        with pytest.raises(KeyError):
+            ra['AAC']
+
+    def test_iterates_over_kmers_in_batches(self):
+        # given
+        graph_builder = builder.Graph().with_kmer_size(3)
+        kmer_strings = ['AAA', 'AAC', 'ACA', 'CAA']
+        for kmer_string in kmer_strings:
+            graph_builder.with_kmer(kmer_string)
+        ra = parser.ColumnarRandomAccess.from_handle(graph_builder.build())
+        ra.iter_batch_size = 3
+
+        # when/then
+        assert kmer_strings == list(ra)
+        assert kmer_strings == [k.kmer for k in ra.values()]
+
+
+class TestMemoryMap(object):
+    def test_maps_graph_file(self, tmpdir):
+        # given
+        graph_builder = (builder.Graph()
+                         .with_kmer_size(3)
+                         .with_num_colors(2))
+        graph_builder.with_kmer('AAA 1 2 ........ ....A...')
+        graph_builder.with_kmer('AAC 3 4 .c...... ........')
+        graph_path = tmpdir / 'graph.ctx'
+        graph_path.write_binary(graph_builder.build().getvalue())
+
+        # when
+        with open(str(graph_path), 'rb') as fh:
+            ra = parser.RandomAccess(fh, memory_map=True)
+            kmer = ra.get_kmer_for_string('GTT')
+
+            # then
+            assert 'AAC' == kmer.kmer
+            assert (3, 4) == kmer.coverage
+            assert [as_edge_set('.c......'), as_edge_set('........')] == kmer.edges
+            assert 'AAA' in ra
+            assert 'ACC' not in ra
+
+    def test_does_not_read_from_handle_on_lookup(self):
+        # given
+        graph_builder = builder.Graph().with_kmer_size(3)
+        for kmer_string in ['AAA', 'AAC', 'ACA', 'CAA']:
+            graph_builder.with_kmer(kmer_string)
+        fh = graph_builder.build()
+        ra = parser.RandomAccess(fh, memory_map=True)
+
+        with mock.patch.object(fh, 'read', wraps=fh.read) as mocked_read:
+            # when
+            for kmer_string in ['AAA', 'AAC', 'ACA', 'CAA']:
+                assert kmer_string == ra[kmer_string].kmer
+
+            # then
+            assert 0 == mocked_read.call_count
+
+    def test_raises_on_unmappable_handle(self):
+        # given
+        graph_builder = builder.Graph().with_kmer_size(3)
+        graph_builder.with_kmer('AAA')
+        graph_bytes = graph_builder.build().getvalue()
+
+        class UnmappableHandle(io.BufferedReader):
+            def fileno(self):
+                raise io.UnsupportedOperation
+
+        # when/then
+        with pytest.raises(ValueError):
+            parser.RandomAccess(UnmappableHandle(io.BytesIO(graph_bytes)), memory_map=True)
+
+
 class TestKmerUintSequence(object):
     @given(s.data(),
            s.integers(min_value=1, max_value=129),
@@ -283,14 +474,16 @@ class TestCacheComplexity:
 
         fh.seek(0)
         num_header_reads = 10
+        num_chunk_reads = 1 if num_kmers else 0
         num_eof_reads = 1
+        expected_num_reads = num_chunk_reads + num_eof_reads + num_header_reads
         with mock.patch.object(fh, 'read', wraps=fh.read) as mocked_read:
             # when
             ra = parser.SlurpedRandomAccess.from_handle(fh)
 
             # then
-            assert num_kmers + num_eof_reads + num_header_reads == mocked_read.call_count
+            assert expected_num_reads == mocked_read.call_count
 
             for seen_kmer in sorted(seen_kmers):
                 ra[seen_kmer]
-            assert num_kmers + num_eof_reads + num_header_reads == mocked_read.call_count
+            assert expected_num_reads == mocked_read.call_count
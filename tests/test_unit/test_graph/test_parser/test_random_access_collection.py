@@ -111,6 +111,29 @@ class TestDunderGetitemDunder(object):
         assert ('........', '........', '...t....') == tuple(str(e) for e in kmer2.edges)
 
 
+class TestGetMany(object):
+    def test_combines_kmers_and_finds_partially_missing_kmers(self):
+        # given
+        collection_builder = GraphCollection(n_colors_per_graph=[1, 2],
+                                             kmer_size=3)
+        collection_builder.with_kmer_for_graph(0, 'AAA', color_coverage=1, edges='....A...')
+        collection_builder.with_kmer_for_graph(1, 'CCC', color_coverage=(2, 3),
+                                               edges=('........', '...t....'))
+        collection = collection_builder.build()
+
+        # when
+        batch = collection.get_many(['TTT', 'ACA', 'CCC'])
+
+        # then
+        assert [True, False, True] == list(batch.found)
+        assert batch[1] is None
+        assert 'AAA' == batch[0].kmer
+        assert (1, 0, 0) == tuple(batch[0].coverage)
+        assert ('....A...', '........', '........') == tuple(str(e) for e in batch[0].edges)
+        assert 'CCC' == batch[2].kmer
+        assert (0, 2, 3) == tuple(batch[2].coverage)
+
+
 class TestGetKmerForString(object):
     def test_gets_aaa_for_ttt_query(self):
         # given
@@ -126,3 +149,63 @@ class TestGetKmerForString(object):
         # when
         assert expected_kmer.kmer == cg.get_kmer_for_string('AAA').kmer
         assert expected_kmer.kmer == cg.get_kmer_for_string('TTT').kmer
+
+
+class TestIter(object):
+    @given(s.data(),
+           s.lists(s.integers(min_value=1, max_value=2), min_size=1, max_size=3),
+           s.integers(min_value=0, max_value=4))
+    def test_iterates_union_of_kmers_in_sorted_order(self, data, num_colors_per_graph, n_kmers):
+        # given
+        kmer_size = 3
+        collection_builder = GraphCollection(n_colors_per_graph=num_colors_per_graph,
+                                             kmer_size=kmer_size)
+        expected_kmers = {}
+        for _ in range(n_kmers):
+            kmer = data.draw(kmer_records(kmer_size, sum(num_colors_per_graph)))
+            while kmer.kmer in expected_kmers:
+                kmer = data.draw(kmer_records(kmer_size, sum(num_colors_per_graph)))
+            expected_kmers[kmer.kmer] = kmer
+            collection_builder.with_kmer_record(kmer)
+        collection = collection_builder.build()
+
+        # when
+        items = list(collection.items())
+
+        # then
+        assert sorted(expected_kmers) == list(collection)
+        assert sorted(expected_kmers) == [kmer_string for kmer_string, _ in items]
+        for kmer_string, kmer in items:
+            assert expected_kmers[kmer_string].coverage == kmer.coverage
+            assert expected_kmers[kmer_string].edges == kmer.edges
+
+    def test_aligns_colors_of_partially_missing_kmers(self):
+        # given
+        collection_builder = GraphCollection(n_colors_per_graph=[1, 2],
+                                             kmer_size=3)
+        collection_builder.with_kmer_for_graph(0, 'AAA', color_coverage=1, edges='....A...')
+        collection_builder.with_kmer_for_graph(0, 'ACA', color_coverage=4)
+        collection_builder.with_kmer_for_graph(1, 'AAC', color_coverage=(2, 3),
+                                               edges=('........', '........'))
+        collection_builder.with_kmer_for_graph(1, 'ACA', color_coverage=(5, 6),
+                                               edges=('........', '...t....'))
+        collection = collection_builder.build()
+
+        # when
+        kmers = list(collection.values())
+
+        # then
+        assert ['AAA', 'AAC', 'ACA'] == [k.kmer for k in kmers]
+        assert [(1, 0, 0), (0, 2, 3), (4, 5, 6)] == [tuple(k.coverage) for k in kmers]
+        assert ('........', '........', '...t....') == tuple(str(e) for e in kmers[2].edges)
+
+    def test_raises_on_unsorted_graph(self):
+        # given
+        graph_builder = builder.Graph().with_kmer_size(3).without_sorted_kmers()
+        for kmer_string in ['CAA', 'AAA']:
+            graph_builder.with_kmer(kmer_string)
+        collection = RandomAccessCollection([parser.RandomAccess(graph_builder.build())])
+
+        # when/then
+        with pytest.raises(ValueError):
+            list(collection)
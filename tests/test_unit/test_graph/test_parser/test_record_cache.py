@@ -0,0 +1,117 @@
+import pytest
+
+import cortexpy.graph.parser.random_access as parser
+import cortexpy.test.builder as builder
+from cortexpy.graph.parser.record_cache import RecordCache, kmer_record_entry_size
+
+
+class TestRecordCache(object):
+    def test_evicts_least_recently_used_values_over_budget(self):
+        # given
+        cache = RecordCache(max_bytes=10)
+        cache.put('a', 1, 4)
+        cache.put('b', 2, 4)
+
+        # when
+        assert 1 == cache.get('a')
+        cache.put('c', 3, 4)
+
+        # then
+        assert 'b' not in cache
+        assert 1 == cache.get('a')
+        assert 3 == cache.get('c')
+        assert cache.get('b') is None
+        assert {'hits': 3, 'misses': 1, 'evictions': 1, 'entries': 2, 'bytes': 8,
+                'max_bytes': 10} == cache.stats
+
+    def test_does_not_store_values_larger_than_budget(self):
+        # given
+        cache = RecordCache(max_bytes=10)
+        cache.put('a', 1, 4)
+
+        # when
+        cache.put('b', 2, 11)
+
+        # then
+        assert ['a'] == [key for key in ['a', 'b'] if key in cache]
+        assert 0 == cache.evictions
+
+    def test_replaces_value_of_existing_key(self):
+        # given
+        cache = RecordCache(max_bytes=10)
+        cache.put('a', 1, 4)
+
+        # when
+        cache.put('a', 2, 6)
+
+        # then
+        assert 2 == cache.get('a')
+        assert 6 == cache.n_bytes
+
+    def test_raises_on_negative_budget(self):
+        with pytest.raises(ValueError):
+            RecordCache(max_bytes=-1)
+
+
+class TestRandomAccess(object):
+    def test_serves_repeated_lookups_from_cache(self):
+        # given
+        graph = builder.Graph().with_kmers('AAA 1 .....C..', 'AAC 2 a.......').build()
+        ra = parser.RandomAccess(graph, record_cache_bytes=10 ** 6)
+        ra['AAA']
+
+        # when
+        ra.graph_handle.close()
+        kmer = ra['AAA']
+
+        # then
+        assert 'AAA' == kmer.kmer
+        assert (1,) == tuple(kmer.coverage)
+        assert ['.....C..'] == [str(e) for e in kmer.edges]
+        assert 1 == ra.record_cache_stats['hits']
+        assert 1 == ra.record_cache_stats['misses']
+
+    def test_caches_missing_kmers(self):
+        # given
+        graph = builder.Graph().with_kmers('AAA 1 ........').build()
+        ra = parser.RandomAccess(graph, record_cache_bytes=10 ** 6)
+        assert 'ACA' not in ra
+
+        # when
+        ra.graph_handle.close()
+
+        # then
+        assert 'ACA' not in ra
+        assert 0 == ra.kmer_cache_size
+
+    def test_returns_independent_kmers_from_cache(self):
+        # given
+        graph = builder.Graph().with_kmers('AAA 1 .....C..', 'AAC 2 a.......').build()
+        ra = parser.RandomAccess(graph, record_cache_bytes=10 ** 6)
+
+        # when
+        ra['AAA'].edges[0].add_edge('G')
+
+        # then
+        assert ['.....C..'] == [str(e) for e in ra['AAA'].edges]
+
+    def test_keeps_records_within_budget(self):
+        # given
+        graph = builder.Graph() \
+            .with_kmers('AAA 1 ........', 'AAC 2 ........', 'ACA 3 ........') \
+            .build()
+        ra = parser.RandomAccess(graph, record_cache_bytes=0)
+        ra.record_cache.max_bytes = 2 * kmer_record_entry_size(ra.header)
+
+        # when
+        coverages = [ra[kmer_string].coverage for kmer_string in ['AAA', 'AAC', 'ACA', 'AAA']]
+
+        # then
+        assert [(1,), (2,), (3,), (1,)] == [tuple(c) for c in coverages]
+        assert 2 == len(ra.record_cache)
+        assert 2 == ra.record_cache_stats['evictions']
+        assert ra.record_cache.n_bytes <= ra.record_cache.max_bytes
+
+    def test_does_not_report_stats_without_cache(self):
+        graph = builder.Graph().with_kmers('AAA 1 ........').build()
+        assert parser.RandomAccess(graph).record_cache_stats is None
@@ -0,0 +1,101 @@
+import random
+from bisect import bisect_left
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as s
+
+import cortexpy.graph.parser.random_access as parser
+import cortexpy.test.builder as builder
+from cortexpy.graph.parser.kmer import StringKmerConverter
+from cortexpy.graph.parser.search import (
+    SearchStrategy, interpolation_search_left, kmer_key, max_kmer_key,
+)
+from cortexpy.utils import lexlo
+
+
+class TestKmerKey(object):
+    def test_orders_kmers_like_kmer_words(self):
+        # given
+        converter = StringKmerConverter(33)
+        kmer_strings = sorted(['A' * 33, 'A' * 32 + 'C', 'C' + 'A' * 32, 'G' + 'T' * 32])
+
+        # when
+        keys = [kmer_key(converter.to_uints(k).tolist()) for k in kmer_strings]
+
+        # then
+        assert sorted(keys) == keys
+        assert keys[-1] < max_kmer_key(33)
+
+
+class TestInterpolationSearchLeft(object):
+    @given(s.lists(s.integers(min_value=0, max_value=2 ** 10), max_size=100),
+           s.integers(min_value=0, max_value=2 ** 10 + 1))
+    def test_finds_same_index_as_bisect(self, values, target):
+        # given
+        values = sorted(set(values))
+
+        # when
+        index = interpolation_search_left(lambda i: [values[i]], [target], 0, len(values),
+                                          float(2 ** 10 + 2))
+
+        # then
+        assert bisect_left(values, target) == index
+
+    def test_needs_few_probes_for_uniform_kmers(self):
+        # given
+        values = list(range(0, 2 ** 20, 7))
+        probes = []
+
+        def kmer_words_at(index):
+            probes.append(index)
+            return [values[index]]
+
+        # when
+        index = interpolation_search_left(kmer_words_at, [values[12345]], 0, len(values),
+                                          float(2 ** 20))
+
+        # then
+        assert 12345 == index
+        assert len(probes) <= 3
+
+    def test_bounds_probes_for_skewed_kmers(self):
+        # given
+        values = list(range(2 ** 12)) + [2 ** 40]
+        probes = []
+
+        def kmer_words_at(index):
+            probes.append(index)
+            return [values[index]]
+
+        # when
+        index = interpolation_search_left(kmer_words_at, [4000], 0, len(values), float(2 ** 41))
+
+        # then
+        assert 4000 == index
+        assert len(probes) <= 2 * 4 + 13
+
+
+class TestRandomAccess(object):
+    @pytest.mark.parametrize('kmer_size', [3, 5, 33])
+    def test_finds_kmers_and_missing_kmers(self, kmer_size):
+        # given
+        rng = random.Random(kmer_size)
+        kmer_strings = sorted({lexlo(''.join(rng.choice('ACGT') for _ in range(kmer_size)))
+                               for _ in range(40)})
+        present_kmers = kmer_strings[::2]
+        graph_builder = builder.Graph().with_kmer_size(kmer_size)
+        for coverage, kmer_string in enumerate(present_kmers):
+            graph_builder.with_kmer('{} {} ........'.format(kmer_string, coverage + 1))
+
+        # when
+        ra = parser.RandomAccess(graph_builder.build(),
+                                 search_strategy=SearchStrategy.interpolation)
+        batch = ra.get_many(kmer_strings)
+
+        # then
+        for coverage, kmer_string in enumerate(present_kmers):
+            assert (coverage + 1,) == tuple(ra[kmer_string].coverage)
+        assert [k in present_kmers for k in kmer_strings] == list(batch.found)
+        for kmer_string in kmer_strings[1::2]:
+            assert kmer_string not in ra
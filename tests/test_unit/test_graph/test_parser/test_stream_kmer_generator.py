@@ -1,6 +1,7 @@
 import random
 from unittest import mock
 
+import pytest
 from hypothesis import given, assume
 from hypothesis import strategies as s
 
@@ -8,6 +9,8 @@ from cortexpy.edge_set import empty
 from cortexpy.graph.parser.streaming import (
     kmer_generator_from_stream_and_header,
     kmer_list_generator_from_stream_and_header,
+    kmer_record_array_generator_from_stream_and_header,
+    kmer_string_generator_from_stream_and_header,
 )
 from cortexpy.test.builder.graph.body import Body, KmerRecord
 from cortexpy.test.builder.graph.kmer import kmer_records
@@ -48,12 +51,44 @@ class TestStreamKmerGenerator(object):
             else:
                 assert expected_kmer.kmer == ''.join(val)
 
+    @given(s.data(),
+           s.integers(min_value=1, max_value=65),
+           s.integers(min_value=1, max_value=3),
+           s.integers(min_value=0, max_value=8),
+           s.integers(min_value=1, max_value=100))
+    def test_parses_records_across_chunks(self, data, kmer_size, num_colors, n_kmers, chunk_size):
+        # given
+        assume(kmer_size % 2 == 1)
+        builder = Body(sort_kmers=False, kmer_size=kmer_size)
+
+        expected_kmers = []
+        for _ in range(n_kmers):
+            kmer = data.draw(kmer_records(kmer_size, num_colors))
+            builder.with_kmer_record(kmer)
+            expected_kmers.append(kmer)
+
+        header = Header(kmer_size, builder.kmer_container_size, num_colors)
+
+        # when
+        kmers = list(kmer_generator_from_stream_and_header(builder.build(), header,
+                                                           chunk_size=chunk_size))
+        kmer_strings = list(kmer_string_generator_from_stream_and_header(builder.build(), header,
+                                                                         chunk_size=chunk_size))
+
+        # then
+        assert [k.kmer for k in expected_kmers] == [k.kmer for k in kmers]
+        assert [k.coverage for k in expected_kmers] == [k.coverage for k in kmers]
+        assert [k.edges for k in expected_kmers] == [k.edges for k in kmers]
+        assert [k.kmer for k in expected_kmers] == kmer_strings
+
     @given(s.integers(min_value=0, max_value=16))
     def test_complexity(self, n_kmers):
         # given
         num_colors = 1
         kmer_size = 11
-        expected_num_calls = n_kmers + 1
+        num_chunk_reads = 1 if n_kmers else 0
+        num_eof_reads = 1
+        expected_num_calls = num_chunk_reads + num_eof_reads
         builder = Body(kmer_size=kmer_size)
 
         for _ in range(n_kmers):
@@ -87,3 +122,38 @@ class TestStreamKmerGenerator(object):
         assert expected_kmer.kmer == kmer.kmer
         assert list(expected_kmer.coverage) == list(kmer.coverage)
         assert expected_kmer.edges == kmer.edges
+
+
+class TestKmerRecordArrayGenerator(object):
+    def test_yields_record_array_per_chunk(self):
+        # given
+        kmer_size = 3
+        num_colors = 2
+        builder = Body(kmer_size=kmer_size)
+        for kmer_string in ['AAA', 'AAC', 'AAG']:
+            builder.with_kmer_record(KmerRecord(kmer_string, [1, 2], [empty(), empty()]))
+        header = Header(kmer_size, builder.kmer_container_size, num_colors)
+        record_size = 8 + 5 * num_colors
+
+        # when
+        record_arrays = list(kmer_record_array_generator_from_stream_and_header(
+            builder.build(), header, chunk_size=2 * record_size))
+
+        # then
+        assert [2, 1] == [len(ra) for ra in record_arrays]
+        assert ['AAA', 'AAC'] == record_arrays[0].kmer_strings()
+        assert [[1, 2], [1, 2]] == record_arrays[0].coverage.tolist()
+
+    def test_raises_on_truncated_record(self):
+        # given
+        kmer_size = 3
+        num_colors = 1
+        builder = Body(kmer_size=kmer_size)
+        builder.with_kmer_record(KmerRecord('AAA', [1], [empty()]))
+        header = Header(kmer_size, builder.kmer_container_size, num_colors)
+        fh = builder.build()
+        fh.truncate(len(fh.getvalue()) - 1)
+
+        # when/then
+        with pytest.raises(ValueError):
+            list(kmer_record_array_generator_from_stream_and_header(fh, header))
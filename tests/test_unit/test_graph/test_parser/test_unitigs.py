@@ -0,0 +1,126 @@
+import io
+
+import numpy as np
+
+import cortexpy.graph.parser.random_access as parser
+import cortexpy.test.builder as builder
+from cortexpy.command.index import index
+from cortexpy.graph.parser.block_compressed import compress_graph
+from cortexpy.graph.parser.unitigs import UnitigIndex
+from cortexpy.utils import revcomp
+
+
+# CAG -> AGT -> GTT -> TTC
+LINEAR_KMERS = ['AAC 1 ..g....T', 'ACT 1 a.....G.', 'CAG 1 .......T', 'GAA 1 .....C..']
+# CAG -> AGT -> GTT -> TTC and CAG -> AGA
+BRANCHING_KMERS = ['AAC 1 ..g....T', 'ACT 1 a.....G.', 'AGA 1 .c......', 'CAG 1 ....A..T',
+                   'GAA 1 .....C..']
+
+
+class TestUnitigIndex(object):
+    def test_finds_unitig_of_linear_graph(self):
+        # given
+        graph = builder.Graph().with_kmers(*LINEAR_KMERS).build()
+
+        # when
+        unitig_index = UnitigIndex.from_graph_handle(graph)
+
+        # then
+        assert 1 == unitig_index.n_unitigs
+        assert [2, 1, 0, 3] == unitig_index.record_order.tolist()
+        assert [False, False, True, False] == unitig_index.forward.tolist()
+        assert [2, 1, 0, 3] == unitig_index.positions.tolist()
+        assert [4] == unitig_index.lengths.tolist()
+        assert [0, 3] == unitig_index.records_after(1, ascending=True).tolist()
+        assert [2] == unitig_index.records_after(1, ascending=False).tolist()
+
+    def test_stops_unitigs_at_branches(self):
+        # given
+        graph = builder.Graph().with_kmers(*BRANCHING_KMERS).build()
+
+        # when
+        unitig_index = UnitigIndex.from_graph_handle(graph)
+
+        # then
+        assert [3, 1, 1] == unitig_index.lengths.tolist()
+        assert [1, 2, 3] == unitig_index.start_records.tolist()
+        assert [4, 2, 3] == unitig_index.end_records.tolist()
+        assert [0, 0, 1, 2, 0] == unitig_index.unitig_ids.tolist()
+
+    def test_unitigs_of_random_graph_are_paths(self):
+        # given
+        rng = np.random.RandomState(1)
+        graph = builder.Graph().with_kmer_size(5).with_linked_kmers_of(
+            *(''.join(rng.choice(list('ACGT'), 5)) for _ in range(200))).build()
+        kmer_strings = list(parser.RandomAccess(graph))
+
+        # when
+        unitig_index = UnitigIndex.from_graph_handle(graph, chunk_size=64)
+
+        # then
+        assert list(range(len(kmer_strings))) == sorted(unitig_index.record_order.tolist())
+        for start, end in zip(unitig_index.unitig_offsets[:-1], unitig_index.unitig_offsets[1:]):
+            oriented = [kmer_strings[record] if unitig_index.forward[record]
+                        else revcomp(kmer_strings[record])
+                        for record in unitig_index.record_order[start:end]]
+            for first, second in zip(oriented[:-1], oriented[1:]):
+                assert first[1:] == second[:-1]
+
+    def test_finds_unitigs_of_block_compressed_graph(self):
+        # given
+        graph = builder.Graph().with_kmers(*BRANCHING_KMERS).build()
+        compressed = io.BytesIO()
+        compress_graph(graph, compressed, records_per_block=2)
+
+        # when
+        unitig_index = UnitigIndex.from_graph_handle(compressed)
+
+        # then
+        expected = UnitigIndex.from_graph_handle(graph)
+        assert expected.header_checksum == unitig_index.header_checksum
+        assert expected.record_order.tolist() == unitig_index.record_order.tolist()
+
+    def test_memory_maps_dumped_index(self, tmpdir):
+        # given
+        graph = builder.Graph().with_kmers(*BRANCHING_KMERS).build()
+        unitig_index = UnitigIndex.from_graph_handle(graph)
+        index_path = str(tmpdir / 'graph.ctx.unitigs')
+        with open(index_path, 'wb') as fh:
+            unitig_index.dump(fh)
+
+        # when
+        loaded = UnitigIndex.from_path(index_path)
+
+        # then
+        assert unitig_index.body_size == loaded.body_size
+        assert unitig_index.header_checksum == loaded.header_checksum
+        for name in ('unitig_ids', 'positions', 'forward', 'record_order', 'unitig_offsets'):
+            assert getattr(unitig_index, name).tolist() == getattr(loaded, name).tolist()
+
+    def test_random_access_ignores_index_of_other_graph(self):
+        # given
+        other_graph = builder.Graph().with_kmers('AAA 1 ........').build()
+        unitig_index = UnitigIndex.from_graph_handle(other_graph)
+
+        # when
+        ra = parser.RandomAccess(builder.Graph().with_kmers(*BRANCHING_KMERS).build(),
+                                 unitig_index=unitig_index)
+
+        # then
+        assert ra.unitig_index is None
+
+
+class TestIndexCommand(object):
+    def test_writes_sidecar_index_that_random_access_loads(self, tmpdir):
+        # given
+        graph_path = tmpdir / 'graph.ctx'
+        graph_path.write_binary(builder.Graph().with_kmers(*BRANCHING_KMERS).build().getvalue())
+
+        # when
+        index(['--unitigs', str(graph_path)])
+
+        # then
+        with open(str(graph_path), 'rb') as fh:
+            ra = parser.RandomAccess(fh)
+            assert ra.unitig_index is not None
+            assert [3, 1, 1] == ra.unitig_index.lengths.tolist()
@@ -0,0 +1,153 @@
+import gzip
+import io
+from unittest import mock
+
+import pytest
+
+import cortexpy.graph.parser.random_access as parser
+import cortexpy.test.builder as builder
+from cortexpy.command.merge import merge
+from cortexpy.graph.parser.header import Header
+from cortexpy.graph.serializer.merge import merge_graph_files, merge_graph_streams
+
+
+def write_graphs(tmpdir, graphs):
+    paths = []
+    for graph_idx, graph in enumerate(graphs):
+        path = tmpdir / 'graph_{}.ctx'.format(graph_idx)
+        path.write_binary(graph.getvalue())
+        paths.append(str(path))
+    return paths
+
+
+class TestMergeGraphStreams(object):
+    def test_merges_colors_of_kmers_in_sorted_order(self):
+        # given
+        graphs = [builder.Graph()
+                  .with_color_names('a')
+                  .with_kmers('AAA 1 ....A...', 'ACA 4 ........')
+                  .build(),
+                  builder.Graph()
+                  .with_color_names('b', 'c')
+                  .with_kmers('AAC 2 3 ........ ........', 'ACA 5 6 ........ ...t....')
+                  .build()]
+        output = io.BytesIO()
+
+        # when
+        n_kmers = merge_graph_streams(graphs, output)
+
+        # then
+        output.seek(0)
+        ra = parser.RandomAccess(output)
+        assert 3 == n_kmers
+        assert (b'a', b'b', b'c') == tuple(ra.sample_names)
+        assert ['AAA', 'AAC', 'ACA'] == list(ra)
+        assert [(1, 0, 0), (0, 2, 3), (4, 5, 6)] == [tuple(k.coverage) for k in ra.values()]
+        assert ['....A...', '........', '........'] == [str(e) for e in ra['AAA'].edges]
+        assert ['........', '........', '...t....'] == [str(e) for e in ra['ACA'].edges]
+
+    def test_keeps_header_of_single_graph(self):
+        # given
+        graph = builder.Graph().with_color_names('a').with_kmers('AAA 1 ........').build()
+        output = io.BytesIO()
+
+        # when
+        merge_graph_streams([graph], output)
+
+        # then
+        assert graph.getvalue() == output.getvalue()
+
+    def test_raises_on_different_kmer_sizes(self):
+        with pytest.raises(ValueError):
+            merge_graph_streams([builder.Graph().with_kmer_size(3).build(),
+                                 builder.Graph().with_kmer_size(5).build()], io.BytesIO())
+
+    def test_raises_on_unsorted_graph(self):
+        # given
+        graph_builder = builder.Graph().with_kmer_size(3).without_sorted_kmers()
+        for kmer_string in ['CAA', 'AAA']:
+            graph_builder.with_kmer(kmer_string)
+
+        # when/then
+        with pytest.raises(ValueError):
+            merge_graph_streams([graph_builder.build(), builder.Graph().with_kmer_size(3).build()],
+                                io.BytesIO())
+
+
+class TestMergeGraphFiles(object):
+    @pytest.mark.parametrize('max_open_files', [4, 5, 10])
+    def test_merges_through_temporary_graphs(self, tmpdir, max_open_files):
+        # given
+        kmer_strings = ['AAA', 'AAC', 'ACA', 'CAA', 'CCA']
+        graphs = [builder.Graph()
+                  .with_color_names('sample_{}'.format(graph_idx))
+                  .with_kmers('{} {} ........'.format(kmer_string, graph_idx + 1))
+                  .build()
+                  for graph_idx, kmer_string in enumerate(kmer_strings)]
+        paths = write_graphs(tmpdir, graphs)
+        output = io.BytesIO()
+
+        # when
+        merge_graph_files(paths, output, max_open_files=max_open_files, temp_dir=str(tmpdir))
+
+        # then
+        output.seek(0)
+        ra = parser.RandomAccess(output)
+        assert ['sample_{}'.format(i).encode() for i in range(5)] == list(ra.sample_names)
+        assert kmer_strings == list(ra)
+        for graph_idx, kmer_string in enumerate(kmer_strings):
+            expected_coverage = [0 for _ in range(5)]
+            expected_coverage[graph_idx] = graph_idx + 1
+            assert expected_coverage == list(ra[kmer_string].coverage)
+        assert sorted(paths) == sorted(str(p) for p in tmpdir.listdir())
+
+    @pytest.mark.parametrize('max_open_files', [4, 5])
+    def test_keeps_at_most_max_open_files_open(self, tmpdir, max_open_files):
+        # given
+        graphs = [builder.Graph().with_kmers('{} 1 ........'.format(kmer_string)).build()
+                  for kmer_string in ['AAA', 'AAC', 'ACA', 'CAA', 'CCA', 'CCC', 'GAA']]
+        paths = write_graphs(tmpdir, graphs)
+        opened = []
+        n_open = []
+
+        def open_and_track(*args, **kwargs):
+            fh = open(*args, **kwargs)
+            opened.append(fh)
+            n_open.append(sum(not f.closed for f in opened))
+            return fh
+
+        # when
+        with open(str(tmpdir / 'out.ctx'), 'wb') as output, \
+                mock.patch('cortexpy.graph.serializer.merge.open', open_and_track, create=True):
+            merge_graph_files(paths, output, max_open_files=max_open_files, temp_dir=str(tmpdir))
+
+        # then
+        assert max_open_files - 1 == max(n_open)
+
+    def test_raises_on_fewer_than_four_open_files(self, tmpdir):
+        with pytest.raises(ValueError):
+            merge_graph_files(write_graphs(tmpdir, [builder.Graph().with_kmer_size(3).build()]),
+                              io.BytesIO(), max_open_files=3)
+
+
+class TestMergeCommand(object):
+    def test_merges_gzipped_graphs_into_block_compressed_graph(self, tmpdir):
+        # given
+        graphs = [builder.Graph().with_color_names('a').with_kmers('AAA 1 ........').build(),
+                  builder.Graph().with_color_names('b').with_kmers('AAC 2 ........').build()]
+        paths = write_graphs(tmpdir, graphs)
+        gzipped_path = tmpdir / 'graph_1.ctx.gz'
+        gzipped_path.write_binary(gzip.compress((tmpdir / 'graph_1.ctx').read_binary()))
+        out_path = tmpdir / 'merged.ctx'
+
+        # when
+        merge(['--block-compress', '-o', str(out_path), paths[0], str(gzipped_path)])
+
+        # then
+        with open(str(out_path), 'rb') as fh:
+            ra = parser.RandomAccess(fh)
+            assert ra.block_compressed_graph is not None
+            assert ['AAA', 'AAC'] == list(ra)
+            assert (0, 2) == tuple(ra['AAC'].coverage)
+        with gzip.open(str(out_path), 'rb') as fh:
+            assert 2 == Header.from_stream(fh).num_colors
@@ -1,19 +1,35 @@
+from unittest import mock
+
+import numpy as np
 import pytest
 
 import cortexpy.graph
 import cortexpy.graph.parser
-from cortexpy.graph.parser.random_access import SlurpedRandomAccess
+import cortexpy.test.builder
+from cortexpy.constants import EngineTraversalOrientation
+from cortexpy.graph.parser.components import ComponentIndex
+from cortexpy.graph.parser.random_access import RandomAccess, SlurpedRandomAccess
+from cortexpy.graph.parser.unitigs import UnitigIndex
+from cortexpy.graph.traversal.engine import Engine, RandomAccessFactory, TraversalWorker
+from cortexpy.graph.traversal.frontier import FrontierEngine
 from cortexpy.test.driver.graph.traversal import EngineTestDriver
 from cortexpy.test.expectation import KmerGraphExpectation
+from cortexpy.utils import lexlo
 
 
 @pytest.fixture(params=('slurped', 'not_slurped'))
-def driver(request):
+def engine_driver(request):
     if request.param == 'slurped':
         return EngineTestDriver(ra_constructor=SlurpedRandomAccess.from_handle)
     return EngineTestDriver()
 
 
+@pytest.fixture(params=(Engine, FrontierEngine))
+def driver(request, engine_driver):
+    engine_driver.engine_class = request.param
+    return engine_driver
+
+
 class Test:
     def test_raises_on_empty(self, driver):
         # given
@@ -409,8 +425,9 @@ class TestTraverseFromEachKmerIn:
 
 
 class TestMaxNodes(object):
-    def test_of_two_returns_with_two_nodes_plus_edges(self, driver):
+    def test_of_two_returns_with_two_nodes_plus_edges(self, engine_driver):
         # given
+        driver = engine_driver
         (driver
          .with_kmer_size(3)
          .with_max_nodes(2)
@@ -429,6 +446,23 @@ class TestMaxNodes(object):
          .has_nodes('AAA', 'AAT', 'ATC', 'ATG')
          .has_n_edges(3))
 
+    def test_of_two_raises_after_frontier_exceeds_two_nodes(self, engine_driver):
+        # given
+        (engine_driver
+         .with_kmer_size(3)
+         .with_max_nodes(2)
+         .with_kmer('AAA 1 .......T')
+         .with_kmer('AAT 1 a....CG.')
+         .with_kmer('ATC 1 a......T')
+         .with_kmer('ATG 1 a.......')
+         .with_kmer('AGA 1 .......T')
+         .with_start_kmer_string('AAA'))
+        engine_driver.engine_class = FrontierEngine
+
+        # when/then
+        with pytest.raises(Exception, match='Max nodes'):
+            engine_driver.run()
+
 
 class TestStartStringSize:
     def test_raises_when_string_wrong_size(self, driver):
@@ -506,3 +540,127 @@ class TestFixture:
         expect.has_node('GGATCTG').has_coverages('0 1')
         expect.has_n_nodes(4)
         # expect.has_edges('AAA AAC 1', 'CAA AAA 1')
+
+
+class TestComponentIndex(object):
+    def test_rejects_start_kmers_in_components_larger_than_max_nodes(self):
+        # given
+        graph = (cortexpy.test.builder.Graph()
+                 .with_kmer_size(3)
+                 .with_kmer('AAA 1 .......T')
+                 .with_kmer('AAT 1 a....C..')
+                 .with_kmer('ATC 1 a.......')
+                 .build())
+        ra = RandomAccess(graph, component_index=ComponentIndex.from_graph_handle(graph))
+        engine = Engine(ra, orientation=EngineTraversalOrientation.both, max_nodes=2)
+
+        # when/then
+        with mock.patch.object(Engine, '_traverse_from') as traverse_from:
+            with pytest.raises(Exception, match='components of start kmers contain 3 nodes'):
+                engine.traverse_from_each_kmer_in('AAAT')
+            assert 0 == traverse_from.call_count
+
+    @pytest.mark.parametrize('engine_class', (Engine, FrontierEngine))
+    def test_traverses_start_kmers_in_components_within_max_nodes(self, engine_class):
+        # given
+        graph = (cortexpy.test.builder.Graph()
+                 .with_kmer_size(3)
+                 .with_kmer('AAA 1 .......T')
+                 .with_kmer('AAT 1 a....C..')
+                 .with_kmer('ATC 1 a.......')
+                 .build())
+        ra = RandomAccess(graph, component_index=ComponentIndex.from_graph_handle(graph))
+        engine = engine_class(ra, orientation=EngineTraversalOrientation.both, max_nodes=3)
+
+        # when
+        engine.traverse_from_each_kmer_in('AAAT')
+
+        # then
+        assert {'AAA', 'AAT', 'ATC'} == set(engine.graph)
+
+
+TWO_TRANSCRIPT_KMERS = ['AAA 1 .......T', 'AAT 1 a....C..', 'ATC 1 a.......', 'ACC 1 ......G.',
+                        'CCG 1 a.......']
+
+
+class TestParallelTraversal(object):
+    @pytest.mark.parametrize('n_workers', [0, 2])
+    @pytest.mark.parametrize('orientation', list(EngineTraversalOrientation))
+    def test_traverses_fasta_like_sequential_engine(self, tmpdir, orientation, n_workers):
+        # given
+        graph_path = str(tmpdir / 'graph.ctx')
+        with open(graph_path, 'wb') as fh:
+            fh.write(cortexpy.test.builder.Graph()
+                     .with_kmers(*TWO_TRANSCRIPT_KMERS)
+                     .build()
+                     .getvalue())
+        fasta_path = str(tmpdir / 'seeds.fa')
+        with open(fasta_path, 'w') as fh:
+            fh.write('>first\nAAATC\n>second\nACCG\n>third\nAATC\n')
+        ra_factory = RandomAccessFactory([graph_path])
+
+        # when
+        expected = Engine(ra_factory(), orientation=orientation) \
+            .traverse_from_each_kmer_in_fasta(fasta_path)
+        engine = Engine(ra_factory(), orientation=orientation, n_workers=n_workers,
+                        ra_factory=ra_factory).traverse_from_each_kmer_in_fasta(fasta_path)
+
+        # then
+        assert {lexlo(k) for k in expected.graph} == set(engine.graph)
+
+    def test_worker_skips_start_kmers_in_seen_records(self):
+        # given
+        ra = RandomAccess(cortexpy.test.builder.Graph().with_kmers(*TWO_TRANSCRIPT_KMERS).build())
+        worker = TraversalWorker(ra, {'orientation': EngineTraversalOrientation.both},
+                                 seen_records=np.zeros(1, dtype=np.uint8))
+
+        # when
+        with mock.patch.object(Engine, '_traverse_from', autospec=True,
+                               side_effect=lambda engine, start: engine) as traverse_from:
+            worker._mark_seen(['AAA', 'AAT', 'ATC'])
+            worker.traverse(['AAA', 'ACC', 'ATC'])
+
+        # then
+        assert [(mock.ANY, 'ACC')] == [c[0] for c in traverse_from.call_args_list]
+
+
+class TestJumpUnitigs(object):
+    @pytest.mark.parametrize('orientation', list(EngineTraversalOrientation))
+    def test_traverses_like_engine_that_steps_through_unitigs(self, orientation):
+        # given
+        rng = np.random.RandomState(0)
+        sequences = [''.join(rng.choice(list('ACGT'), 40)) for _ in range(3)]
+        sequences.append(sequences[0][10:30] + sequences[1][5:25])
+        graph = cortexpy.test.builder.Graph() \
+            .with_kmer_size(7) \
+            .with_linked_kmers_of(*sequences) \
+            .build()
+        ra = RandomAccess(graph, unitig_index=UnitigIndex.from_graph_handle(graph))
+
+        for start_string in (sequences[0][:7], sequences[1][17:24], sequences[3][12:19]):
+            # when
+            expected = Engine(ra, orientation=orientation).traverse_from(start_string)
+            engine = Engine(ra, orientation=orientation, jump_unitigs=True) \
+                .traverse_from(start_string)
+
+            # then
+            assert set(expected.graph.nodes) == set(engine.graph.nodes)
+            assert set(expected.graph.edges) == set(engine.graph.edges)
+
+    def test_reads_unitig_kmers_by_record_index(self):
+        # given
+        graph = cortexpy.test.builder.Graph() \
+            .with_kmer_size(5) \
+            .with_linked_kmers_of('ACCGTTAGGCTA') \
+            .build()
+        ra = RandomAccess(graph, unitig_index=UnitigIndex.from_graph_handle(graph))
+        engine = Engine(ra, orientation=EngineTraversalOrientation.both, jump_unitigs=True)
+
+        # when
+        with mock.patch.object(RandomAccess, 'get_kmer_at', autospec=True,
+                               side_effect=RandomAccess.get_kmer_at) as get_kmer_at:
+            engine.traverse_from('ACCGT')
+
+        # then
+        assert 8 == len(engine.graph)
+        assert 7 == get_kmer_at.call_count
@@ -0,0 +1,64 @@
+from Bio.Seq import reverse_complement
+from hypothesis import given, strategies as s
+
+from cortexpy.utils import CanonicalizationCache, lexlo, lexlo_many, revcomp
+
+
+class TestRevcomp(object):
+    @given(s.text(alphabet='ACGTNacgtn.', max_size=20))
+    def test_matches_biopython(self, dna_string):
+        assert reverse_complement(dna_string) == revcomp(dna_string)
+
+
+class TestLexloMany(object):
+    @given(s.integers(min_value=1, max_value=9),
+           s.lists(s.text(alphabet='ACGT', min_size=9, max_size=9), max_size=5))
+    def test_matches_lexlo(self, kmer_size, long_strings):
+        # given
+        kmer_strings = [string[:kmer_size] for string in long_strings]
+
+        # when/then
+        assert [lexlo(k) for k in kmer_strings] == lexlo_many(kmer_strings)
+
+    def test_with_kmers_of_different_lengths(self):
+        assert ['AAA', 'AC'] == lexlo_many(['TTT', 'GT'])
+
+
+class TestCanonicalizationCache(object):
+    def test_counts_hits_and_misses(self):
+        # given
+        cache = CanonicalizationCache(maxsize=2)
+
+        # when
+        for kmer_string in ['TTT', 'TTT', 'AAC', 'TTT']:
+            assert lexlo(kmer_string) == cache(kmer_string)
+
+        # then
+        assert 2 == cache.hits
+        assert 2 == cache.misses
+        assert 2 == len(cache)
+
+    def test_evicts_oldest_string_when_full(self):
+        # given
+        cache = CanonicalizationCache(maxsize=2)
+
+        # when
+        for kmer_string in ['TTT', 'AAC', 'ACG', 'TTT']:
+            cache(kmer_string)
+
+        # then
+        assert 0 == cache.hits
+        assert 4 == cache.misses
+        assert 2 == len(cache)
+
+    def test_does_not_cache_with_maxsize_zero(self):
+        # given
+        cache = CanonicalizationCache(maxsize=0)
+
+        # when
+        assert 'AAA' == cache('TTT')
+        assert 'AAA' == cache('TTT')
+
+        # then
+        assert 0 == cache.hits
+        assert 0 == len(cache)